@@ -0,0 +1,131 @@
+"""
+Benchmark building models from a list of row dictionaries.
+
+Run it from the repository root with `python -m benchmarks.batch`, optionally passing the number of rows. The rows are
+converted with a `from_primitives` loop and with `BaseModel.from_primitives_many`, printing the rows per second of each.
+"""
+
+from __future__ import annotations
+
+from sys import argv
+from time import perf_counter
+from typing import Any, Callable
+
+from value_object_pattern import BaseModel
+from value_object_pattern.usables import PositiveIntegerValueObject, StringValueObject
+
+
+class Line(BaseModel):
+    """
+    Model nested in `Order`.
+    """
+
+    def __init__(self, sku: StringValueObject, quantity: PositiveIntegerValueObject) -> None:
+        """
+        Create an order line.
+
+        Args:
+            sku (StringValueObject): The product reference.
+            quantity (PositiveIntegerValueObject): The ordered quantity.
+        """
+        self.sku = sku
+        self.quantity = quantity
+
+
+class Order(BaseModel):
+    """
+    Model converted by the batch benchmark.
+    """
+
+    def __init__(
+        self,
+        reference: StringValueObject,
+        customer: StringValueObject,
+        priority: PositiveIntegerValueObject,
+        line: Line,
+        tags: list[StringValueObject],
+        channel: str,
+    ) -> None:
+        """
+        Create an order.
+
+        Args:
+            reference (StringValueObject): The order reference.
+            customer (StringValueObject): The customer reference.
+            priority (PositiveIntegerValueObject): The order priority.
+            line (Line): The order line.
+            tags (list[StringValueObject]): The order tags.
+            channel (str): The sales channel.
+        """
+        self.reference = reference
+        self.customer = customer
+        self.priority = priority
+        self.line = line
+        self.tags = tags
+        self.channel = channel
+
+
+def build_rows(*, size: int) -> list[dict[str, Any]]:
+    """
+    Return `size` order rows, one row in every hundred is invalid.
+
+    Args:
+        size (int): Number of rows.
+
+    Returns:
+        list[dict[str, Any]]: The rows.
+    """
+    return [
+        {
+            'reference': f'order-{index}',
+            'customer': f'customer-{index % 1000}',
+            'priority': 0 if index % 100 == 99 else index % 5 + 1,
+            'line': {'sku': f'sku-{index % 50}', 'quantity': index % 10 + 1},
+            'tags': ['web', 'priority'],
+            'channel': 'web',
+        }
+        for index in range(size)
+    ]
+
+
+def convert_rows(rows: list[dict[str, Any]]) -> list[Order]:
+    """
+    Convert `rows` with a `from_primitives` loop, dropping the rejected rows.
+
+    Args:
+        rows (list[dict[str, Any]]): The rows.
+
+    Returns:
+        list[Order]: The orders.
+    """
+    orders = []
+    for row in rows:
+        try:
+            orders.append(Order.from_primitives(primitives=row))
+
+        except (TypeError, ValueError):
+            continue
+
+    return orders
+
+
+def main() -> None:
+    """
+    Print the rows per second of each conversion.
+    """
+    size = int(argv[1]) if len(argv) > 1 else 1000000
+    rows = build_rows(size=size)
+    converters: dict[str, Callable[[], Any]] = {
+        'from_primitives loop': lambda: convert_rows(rows),
+        'from_primitives_many': lambda: Order.from_primitives_many(rows=rows, errors='skip'),
+    }
+
+    for name, convert in converters.items():
+        convert()  # warm up caches and compiled schemas
+        begin = perf_counter()
+        convert()
+        print(f'{name:25} {size / (perf_counter() - begin):12.0f} rows/s')
+
+
+if __name__ == '__main__':
+    main()
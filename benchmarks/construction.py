@@ -0,0 +1,42 @@
+"""
+Benchmark value object construction for every reusable value object.
+
+Run it from the repository root with `python -m benchmarks.construction`.
+"""
+
+from __future__ import annotations
+
+from timeit import repeat
+from typing import Any
+
+from benchmarks.corpus import VALID_VALUES, usable_classes
+from value_object_pattern.models import ValueObject
+
+
+def benchmark_construction(*, cls: type[ValueObject[Any]], value: Any, number: int = 2000) -> float:
+    """
+    Return the best construction time of `cls` in nanoseconds per instance.
+
+    Args:
+        cls (type[ValueObject[Any]]): The value object class to construct.
+        value (Any): A valid raw value for the class.
+        number (int, optional): Constructions per measurement. Defaults to 2000.
+
+    Returns:
+        float: Nanoseconds per construction.
+    """
+    timings = repeat(stmt=lambda: cls(value=value), number=number, repeat=5)
+
+    return min(timings) / number * 1e9
+
+
+def main() -> None:
+    """
+    Print the construction cost of every reusable value object.
+    """
+    for name, cls in usable_classes().items():
+        print(f'{name:55} {benchmark_construction(cls=cls, value=VALID_VALUES[name]):10.0f} ns')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+"""
+Deterministic inputs for every value object shipped in `value_object_pattern.usables`.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from importlib import import_module
+from inspect import isabstract, isclass
+from pkgutil import walk_packages
+from typing import Any
+from uuid import UUID
+
+from value_object_pattern import ValueObject, usables
+
+VALID_VALUES: dict[str, Any] = {
+    'AdministrativeTechnicianVehiclePlateValueObject': 'TA-123-456',
+    'AirForceVehiclePlateValueObject': 'EA-123431',
+    'AlphaStringValueObject': 'abcd',
+    'AlphanumericStringValueObject': 'abcd1234',
+    'AmexCreditCardValueObject': '346093248751578',
+    'ArmyVehiclePlateValueObject': 'ET-123456',
+    'AwsCloudRegionValueObject': 'us-east-1',
+    'Base16StringValueObject': 'DEADBEEF',
+    'Base32StringValueObject': 'NBSWY3DP',
+    'Base36StringValueObject': 'HELLO123',
+    'Base56StringValueObject': '5EKAKz6H',
+    'Base58StringValueObject': '3mJr7AoU',
+    'Base64StringValueObject': 'aGVsbG8gd29ybGQ=',
+    'BooleanValueObject': True,
+    'BytesValueObject': b'aad30be7ce99fb0fe411',
+    'CamelCaseStringValueObject': 'abcd1234Word',
+    'CanariasPoliceVehiclePlateValueObject': 'CGPC-1234',
+    'CatalanPoliceVehiclePlateValueObject': 'CME-1234',
+    'CiscoMacAddressValueObject': 'D5B9.EB4D.C2CC',
+    'CivilGuardVehiclePlateValueObject': 'PGC-12345E',
+    'ConsularCorpsVehiclePlateValueObject': 'CC-123-456',
+    'CountryTldValueObject': '.es',
+    'CreditCardValueObject': '4545537331205356',
+    'DateValueObject': date(2024, 1, 1),
+    'DatetimeValueObject': datetime(2024, 1, 1, 12, 0, tzinfo=UTC),
+    'DigitStringValueObject': '1234',
+    'DiplomaticCorpsVehiclePlateValueObject': 'CD-123-456',
+    'DiscoverCreditCardValueObject': '6011442769137926',
+    'DniValueObject': '87654321X',
+    'DomainOrLocalhostValueObject': 'localhost',
+    'DomainValueObject': 'github.com',
+    'EmailAddressValueObject': 'user.name+tag@EXAMPLE.com',
+    'EspecialVehiclePlateValueObject': 'E-1234-ABC',
+    'EvenIntegerValueObject': 2,
+    'FalseValueObject': False,
+    'FloatValueObject': 0.5,
+    'HexadecimalStringValueObject': '64e9740a',
+    'HistoricalVehiclePlateValueObject': 'H-1234-ABC',
+    'HostValueObject': 'github.com',
+    'HttpHttpsUrlValueObject': 'https://github.com/adriamontoto/value-object-pattern',
+    'HttpUrlValueObject': 'http://github.com/adriamontoto/value-object-pattern',
+    'HttpsUrlValueObject': 'https://github.com/adriamontoto/value-object-pattern',
+    'IbanValueObject': 'GB82WEST12345698765432',
+    'ImeiValueObject': '490154203237518',
+    'IntegerValueObject': 1,
+    'InternationalOrganizationVehiclePlateValueObject': 'OI-123-456',
+    'IpAddressValueObject': '192.168.1.1',
+    'Ipv4AddressValueObject': '66.162.207.81',
+    'Ipv4NetworkValueObject': '66.162.207.81',
+    'Ipv6AddressValueObject': 'e8f5:bbcf:f16d:8fc1:ab49:a3ae:36eb:b254',
+    'Ipv6NetworkValueObject': 'e8f5:bbcf:f16d:8fc1:ab49:a3ae:36eb:b254',
+    'Iso3166Alpha2CodeValueObject': 'ES',
+    'Iso3166Alpha3CodeValueObject': 'ESP',
+    'Iso3166NumericCodeValueObject': 724,
+    'KebabCaseKeyValueObject': 'organization.api-keys.rotate-after-days',
+    'KebabCaseStringValueObject': 'abcd-1234',
+    'LowercaseStringValueObject': 'abcd1234',
+    'MacAddressValueObject': 'D5:B9:EB:4D:C2:CC',
+    'MastercardCreditCardValueObject': '5189876610072287',
+    'MinistryDevelopmentVehiclePlateValueObject': 'MMA-12345-A',
+    'MinistryEnvironmentVehiclePlateValueObject': 'MF-12345-A',
+    'NationalPoliceVehiclePlateValueObject': 'CNP-1234-AA',
+    'NavyVehiclePlateValueObject': 'FN-12345',
+    'NegativeFloatValueObject': -1.5,
+    'NegativeIntegerValueObject': -1,
+    'NegativeOrZeroFloatValueObject': 0.0,
+    'NegativeOrZeroIntegerValueObject': 0,
+    'NieValueObject': 'X1234567L',
+    'NifValueObject': 'A58818501',
+    'NoneValueObject': None,
+    'NotEmptyStringValueObject': 'abcd1234',
+    'NotNoneValueObject': 'test',
+    'NussValueObject': '27/76556913/07',
+    'OddIntegerValueObject': 3,
+    'OrdinaryTruckVehiclePlateValueObject': 'R-1234-BCD',
+    'OrdinaryVehiclePlateValueObject': '1234-BCD',
+    'PascalCaseStringValueObject': 'Abcd1234Word',
+    'PassportValueObject': 'ABC123456',
+    'PhoneCodeValueObject': '+34',
+    'PhoneNumberValueObject': '+34 612 345 678',
+    'PortValueObject': 443,
+    'PositiveFloatValueObject': 1.5,
+    'PositiveIntegerValueObject': 1,
+    'PositiveOrZeroFloatValueObject': 0.0,
+    'PositiveOrZeroIntegerValueObject': 0,
+    'PrintableStringValueObject': 'abcd1234',
+    'ProvincialSystemVehiclePlateValueObject': 'M-0000-A',
+    'RawMacAddressValueObject': 'D5B9EB4DC2CC',
+    'ScreamingSnakeCaseStringValueObject': 'ABCD_1234',
+    'SlugValueObject': 'summer-release-2026',
+    'SnakeCaseKeyValueObject': 'organization.api_keys.rotate_after_days',
+    'SnakeCaseStringValueObject': 'abcd_1234',
+    'SpaceMacAddressValueObject': 'D5 B9 EB 4D C2 CC',
+    'StateMotorPoolVehiclePlateValueObject': 'PME-1234-A',
+    'StringDateValueObject': '2024-01-01',
+    'StringDatetimeValueObject': '2024-01-01T12:00:00+00:00',
+    'StringTimezoneValueObject': 'UTC',
+    'StringUuidV1ValueObject': '53734b8c-d517-11f0-a57a-452bbcae0235',
+    'StringUuidV3ValueObject': '9073926b-929f-31c2-abc9-fad77ae3e8eb',
+    'StringUuidV4ValueObject': '3e9e0f3a-64a3-474f-9127-368e723f389f',
+    'StringUuidV5ValueObject': 'cfbff0d1-9375-5685-968c-48ce8b15ae17',
+    'StringUuidV6ValueObject': '1f0d455c-76e5-6210-b032-46ef6b2a93e1',
+    'StringUuidV7ValueObject': '019afedd-025c-7f00-b22f-796d93c9b9cb',
+    'StringUuidV8ValueObject': '3e9e0f3a-64a3-874f-9127-368e723f389f',
+    'StringUuidValueObject': '3e9e0f3a-64a3-474f-9127-368e723f389f',
+    'StringValueObject': 'abcd1234',
+    'TemporalCompanyNotRegisteredVehiclePlateValueObject': 'S-1234-BCD',
+    'TemporalCompanyRegisteredVehiclePlateValueObject': 'V-1234-BCD',
+    'TemporalPrivateIndividualVehiclePlateValueObject': 'T-1234-BCD',
+    'TimezoneValueObject': UTC,
+    'TrimmedStringValueObject': 'abcd1234',
+    'TrueValueObject': True,
+    'TwoWheelsVehiclePlateValueObject': 'C-1234-BBB',
+    'UniversalMacAddressValueObject': 'D5:B9:EB:4D:C2:CC',
+    'UppercaseStringValueObject': 'ABCD1234',
+    'UrlValueObject': 'https://github.com/adriamontoto/value-object-pattern?tab=readme-ov-file#table-of-contents',
+    'UserAgentValueObject': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15',
+    'UuidV1ValueObject': UUID('53734b8c-d517-11f0-a57a-452bbcae0235'),
+    'UuidV3ValueObject': UUID('9073926b-929f-31c2-abc9-fad77ae3e8eb'),
+    'UuidV4ValueObject': UUID('3e9e0f3a-64a3-474f-9127-368e723f389f'),
+    'UuidV5ValueObject': UUID('cfbff0d1-9375-5685-968c-48ce8b15ae17'),
+    'UuidV6ValueObject': UUID('1f0d455c-76e5-6210-b032-46ef6b2a93e1'),
+    'UuidV7ValueObject': UUID('019afedd-025c-7f00-b22f-796d93c9b9cb'),
+    'UuidV8ValueObject': UUID('3e9e0f3a-64a3-874f-9127-368e723f389f'),
+    'UuidValueObject': UUID('3e9e0f3a-64a3-474f-9127-368e723f389f'),
+    'VehiclePlateValueObject': '1234-BCD',
+    'VinValueObject': '1HGBH41JXMN109186',
+    'VisaCreditCardValueObject': '4408040603838265',
+    'WindowsMacAddressValueObject': 'D5-B9-EB-4D-C2-CC',
+}
+
+# tried in order, the first one rejected by a class is its failure path input, so content validators run when they can
+INVALID_CANDIDATES: tuple[Any, ...] = ('invalid value!', '', -1, None)
+
+
+def usable_classes() -> dict[str, type[ValueObject[Any]]]:
+    """
+    Return every concrete value object class defined in `value_object_pattern.usables`, sorted by name.
+
+    Raises:
+        KeyError: If a class has no entry in `VALID_VALUES`.
+
+    Returns:
+        dict[str, type[ValueObject[Any]]]: The classes by name.
+    """
+    classes: dict[str, type[ValueObject[Any]]] = {}
+    for module_info in walk_packages(path=usables.__path__, prefix=f'{usables.__name__}.'):
+        module = import_module(name=module_info.name)
+        classes.update(
+            (name, value)
+            for name, value in vars(module).items()
+            if isclass(value) and issubclass(value, ValueObject) and value.__module__ == module.__name__ and not isabstract(value)  # noqa: E501
+        )  # fmt: skip
+
+    missing = sorted(set(classes) - set(VALID_VALUES))
+    if missing:
+        raise KeyError(f'Benchmark corpus has no valid value for <<<{", ".join(missing)}>>>.')
+
+    return dict(sorted(classes.items()))
+
+
+def invalid_value(*, cls: type[ValueObject[Any]]) -> Any:
+    """
+    Return the first value of `INVALID_CANDIDATES` rejected by `cls`.
+
+    Args:
+        cls (type[ValueObject[Any]]): The value object class.
+
+    Raises:
+        ValueError: If `cls` accepts every candidate.
+
+    Returns:
+        Any: The invalid value.
+    """
+    for candidate in INVALID_CANDIDATES:
+        try:
+            cls(value=candidate)
+
+        except (TypeError, ValueError):
+            return candidate
+
+    raise ValueError(f'{cls.__name__} accepts every invalid benchmark candidate.')
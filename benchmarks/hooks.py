@@ -0,0 +1,103 @@
+"""
+Benchmark the cost of calling `@validation` and `@process` hooks, against the `functools.wraps` wrappers the decorators
+used to return.
+
+Run it from the repository root with `python -m benchmarks.hooks`.
+"""
+
+from __future__ import annotations
+
+from functools import wraps
+from timeit import repeat
+from typing import Any, Callable
+
+from value_object_pattern import ValueObject, process, validation
+from value_object_pattern.usables import TrimmedStringValueObject
+
+
+def wrap(*, function: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Return a wrapper forwarding every call to `function`, as the decorators used to do.
+
+    Args:
+        function (Callable[..., Any]): The hook.
+
+    Returns:
+        Callable[..., Any]: The wrapper.
+    """
+
+    @wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return function(*args, **kwargs)
+
+    return wrapper
+
+
+class HookedStringValueObject(TrimmedStringValueObject):
+    """
+    String value object with one more validation and process hook than `TrimmedStringValueObject`.
+    """
+
+    __slots__ = ()
+
+    @validation(order=0)
+    def _ensure_value_is_short(self, value: str) -> None:
+        if len(value) > 64:
+            raise ValueError(f'HookedStringValueObject value <<<{value}>>> is too long.')
+
+    @process(order=0)
+    def _lower(self, value: str) -> str:
+        return value.lower()
+
+
+def benchmark(*, function: Callable[[], Any], number: int = 200000) -> float:
+    """
+    Return the best time of `function` in nanoseconds per call.
+
+    Args:
+        function (Callable[[], Any]): The benchmarked function.
+        number (int, optional): Calls per measurement. Defaults to 200000.
+
+    Returns:
+        float: Nanoseconds per call.
+    """
+    return min(repeat(stmt=function, number=number, repeat=5)) / number * 1e9
+
+
+def count_hooks(*, cls: type[ValueObject[Any]]) -> int:
+    """
+    Return the number of hooks run by a construction of `cls`.
+
+    Args:
+        cls (type[ValueObject[Any]]): The value object class.
+
+    Returns:
+        int: The number of validation and process hooks.
+    """
+    plan = cls._resolve_hook_plan()
+
+    return len(plan.validations) + len(plan.processes)
+
+
+def main() -> None:
+    """
+    Print the cost of a direct and a wrapped hook call, and the construction cost of a class with several hooks.
+    """
+    instance = HookedStringValueObject(value='hello')
+    hook = HookedStringValueObject._ensure_value_is_short
+    wrapped = wrap(function=hook)
+
+    direct_call = benchmark(function=lambda: hook(instance, value='hello'))
+    wrapped_call = benchmark(function=lambda: wrapped(instance, value='hello'))
+    hooks = count_hooks(cls=HookedStringValueObject)
+    construction = benchmark(function=lambda: HookedStringValueObject(value='hello'))
+
+    print(f'{"direct hook call":40} {direct_call:10.0f} ns')
+    print(f'{"functools.wraps hook call":40} {wrapped_call:10.0f} ns')
+    print(f'{"saved per hook":40} {wrapped_call - direct_call:10.0f} ns')
+    print(f'{f"HookedStringValueObject ({hooks} hooks)":40} {construction:10.0f} ns')
+    print(f'{"saved per construction":40} {(wrapped_call - direct_call) * hooks:10.0f} ns')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark building models from a JSON Lines file.
+
+Run it from the repository root with `python -m benchmarks.jsonl`, optionally passing the number of lines. The file is
+read with a hand-written `json.loads` and `from_primitives` loop and with `BaseModel.iter_from_jsonl`, from a text file,
+a binary file and a memory map, printing the lines per second and the peak memory of each reader.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from json import dumps, loads
+from os import unlink
+from sys import argv
+from tempfile import NamedTemporaryFile
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any, Callable
+
+from benchmarks.suite import CUSTOMER_PRIMITIVES, Customer
+
+
+def write_file(*, size: int) -> str:
+    """
+    Write a JSON Lines file with `size` customers, one line in every hundred is invalid.
+
+    Args:
+        size (int): Number of lines.
+
+    Returns:
+        str: The file path.
+    """
+    invalid = {**CUSTOMER_PRIMITIVES, 'age': -1}
+    with NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False, encoding='utf-8') as file:
+        for index in range(size):
+            file.write(dumps(invalid if index % 100 == 99 else CUSTOMER_PRIMITIVES) + '\n')
+
+    return file.name
+
+
+def manual(path: str) -> Iterator[Any]:
+    """
+    Yield the customers of `path` with a hand-written loop.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        Iterator[Any]: The customers, and None for every rejected line.
+    """
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            try:
+                yield Customer.from_primitives(primitives=loads(line))
+
+            except (TypeError, ValueError):
+                yield None
+
+
+def streamed(path: str, *, mode: str, memory_map: bool = False) -> Iterator[Any]:
+    """
+    Yield the records of `path` with `BaseModel.iter_from_jsonl`.
+
+    Args:
+        path (str): The file path.
+        mode (str): The file mode, 'r' or 'rb'.
+        memory_map (bool, optional): Whether to read the lines through a memory map. Defaults to False.
+
+    Returns:
+        Iterator[Any]: The customers and the rejected lines.
+    """
+    with open(path, mode=mode) as file:  # noqa: PLW1514
+        yield from Customer.iter_from_jsonl(file, memory_map=memory_map)
+
+
+def benchmark(*, reader: Callable[[], Iterator[Any]], size: int) -> tuple[float, float]:
+    """
+    Return the lines per second of `reader` and its peak memory.
+
+    Args:
+        reader (Callable[[], Iterator[Any]]): Function returning the records of the file.
+        size (int): Number of lines.
+
+    Returns:
+        tuple[float, float]: Lines per second and peak memory in kilobytes.
+    """
+    begin = perf_counter()
+    for _ in reader():
+        pass
+
+    elapsed = perf_counter() - begin
+
+    start()
+    for _ in reader():
+        pass
+
+    _, peak = get_traced_memory()
+    stop()
+
+    return size / elapsed, peak / 1024
+
+
+def main() -> None:
+    """
+    Print the lines per second and the peak memory of each reader.
+    """
+    size = int(argv[1]) if len(argv) > 1 else 100000
+    path = write_file(size=size)
+    readers: dict[str, Callable[[], Iterator[Any]]] = {
+        'json.loads + from_primitives': lambda: manual(path),
+        'iter_from_jsonl text': lambda: streamed(path, mode='r'),
+        'iter_from_jsonl binary': lambda: streamed(path, mode='rb'),
+        'iter_from_jsonl memory map': lambda: streamed(path, mode='rb', memory_map=True),
+    }
+
+    try:
+        for name, reader in readers.items():
+            benchmark(reader=reader, size=size)  # warm up caches and compiled schemas
+            throughput, peak = benchmark(reader=reader, size=size)
+            print(f'{name:30} {throughput:12.0f} lines/s {peak:10.1f} KiB peak')
+
+    finally:
+        unlink(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark rehydrating an aggregate and reading one of its fields.
+
+Run it from the repository root with `python -m benchmarks.lazy`, optionally passing the number of aggregates. The
+aggregates are built with `from_primitives` and with `from_primitives(lazy=True)`, reading one field of each and then
+serializing them back, printing the aggregates per second of each.
+"""
+
+from __future__ import annotations
+
+from sys import argv
+from time import perf_counter
+from typing import Any, Callable
+
+from value_object_pattern import BaseModel
+from value_object_pattern.usables import PositiveIntegerValueObject, StringValueObject
+
+
+class Line(BaseModel):
+    """
+    Model nested in `Order`.
+    """
+
+    def __init__(self, sku: StringValueObject, quantity: PositiveIntegerValueObject) -> None:
+        """
+        Create an order line.
+
+        Args:
+            sku (StringValueObject): The product reference.
+            quantity (PositiveIntegerValueObject): The ordered quantity.
+        """
+        self.sku = sku
+        self.quantity = quantity
+
+
+class Order(BaseModel):
+    """
+    Model rehydrated by the lazy benchmark.
+    """
+
+    def __init__(
+        self,
+        reference: StringValueObject,
+        customer: StringValueObject,
+        priority: PositiveIntegerValueObject,
+        lines: list[Line],
+        tags: list[StringValueObject],
+        channel: StringValueObject,
+    ) -> None:
+        """
+        Create an order.
+
+        Args:
+            reference (StringValueObject): The order reference.
+            customer (StringValueObject): The customer reference.
+            priority (PositiveIntegerValueObject): The order priority.
+            lines (list[Line]): The order lines.
+            tags (list[StringValueObject]): The order tags.
+            channel (StringValueObject): The sales channel.
+        """
+        self.reference = reference
+        self.customer = customer
+        self.priority = priority
+        self.lines = lines
+        self.tags = tags
+        self.channel = channel
+
+
+ORDER_PRIMITIVES: dict[str, Any] = {
+    'reference': 'order-1',
+    'customer': 'customer-1',
+    'priority': 3,
+    'lines': [{'sku': f'sku-{index}', 'quantity': index + 1} for index in range(10)],
+    'tags': ['web', 'priority', 'gift'],
+    'channel': 'web',
+}
+
+
+def rehydrate(*, size: int, lazy: bool, serialize: bool) -> None:
+    """
+    Build `size` orders, read their reference and optionally serialize them back.
+
+    Args:
+        size (int): Number of orders.
+        lazy (bool): Whether to build the orders lazily.
+        serialize (bool): Whether to serialize the orders back to primitives.
+    """
+    for _ in range(size):
+        order = Order.from_primitives(primitives=ORDER_PRIMITIVES, lazy=lazy)
+        order.reference  # noqa: B018
+        if serialize:
+            order.to_primitives()
+
+
+def main() -> None:
+    """
+    Print the aggregates per second of each rehydration.
+    """
+    size = int(argv[1]) if len(argv) > 1 else 10000
+    rehydrations: dict[str, Callable[[], Any]] = {
+        'eager read': lambda: rehydrate(size=size, lazy=False, serialize=False),
+        'lazy read': lambda: rehydrate(size=size, lazy=True, serialize=False),
+        'eager read + to_primitives': lambda: rehydrate(size=size, lazy=False, serialize=True),
+        'lazy read + to_primitives': lambda: rehydrate(size=size, lazy=True, serialize=True),
+    }
+
+    for name, rehydration in rehydrations.items():
+        rehydration()  # warm up caches and compiled schemas
+        begin = perf_counter()
+        rehydration()
+        print(f'{name:30} {size / (perf_counter() - begin):12.0f} aggregates/s')
+
+
+if __name__ == '__main__':
+    main()
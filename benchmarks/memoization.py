@@ -0,0 +1,90 @@
+"""
+Benchmark memoized validation on repetitive inputs for the value objects with expensive validations.
+
+Run it from the repository root with `python -m benchmarks.memoization`, optionally passing the number of distinct
+inputs per class.
+"""
+
+from __future__ import annotations
+
+from sys import argv
+from timeit import repeat
+from typing import Any, Callable, cast
+
+from value_object_pattern.models import ValueObject
+from value_object_pattern.usables.dates import StringDatetimeValueObject
+from value_object_pattern.usables.identifiers.world.europe.spain import VehiclePlateValueObject
+from value_object_pattern.usables.internet import DomainValueObject, EmailAddressValueObject, UrlValueObject
+
+
+def build_corpus(*, cls: type[ValueObject[Any]], distinct: int, size: int = 10000) -> list[str]:
+    """
+    Return `size` deterministic inputs for `cls` cycling through `distinct` different values.
+
+    Args:
+        cls (type[ValueObject[Any]]): The value object class.
+        distinct (int): Number of different inputs.
+        size (int, optional): Number of inputs. Defaults to 10000.
+
+    Returns:
+        list[str]: The inputs.
+    """
+    generators: dict[type[ValueObject[Any]], Callable[[int], str]] = {
+        DomainValueObject: lambda index: f'host-{index}.example.com',
+        EmailAddressValueObject: lambda index: f'user.{index}@example.com',
+        StringDatetimeValueObject: lambda index: f'2024-01-01T{index // 60 % 24:02}:{index % 60:02}:00',
+        UrlValueObject: lambda index: f'https://example.com/path/{index}?query={index}',
+        VehiclePlateValueObject: lambda index: f'{index % 10000:04}BCD',
+    }
+    values = [generators[cls](index) for index in range(distinct)]
+
+    return [values[index % distinct] for index in range(size)]
+
+
+def benchmark_corpus(*, cls: type[ValueObject[Any]], corpus: list[str]) -> float:
+    """
+    Return the best time to construct every input of `corpus` with `cls`, in nanoseconds per instance.
+
+    Args:
+        cls (type[ValueObject[Any]]): The value object class to construct.
+        corpus (list[str]): The inputs.
+
+    Returns:
+        float: Nanoseconds per construction.
+    """
+
+    def construct() -> None:
+        for value in corpus:
+            cls(value=value)
+
+    timings = repeat(stmt=construct, number=1, repeat=5)
+
+    return min(timings) / len(corpus) * 1e9
+
+
+def main() -> None:
+    """
+    Print the construction cost of each class with and without memoization, and the memoized hit rate.
+    """
+    distinct = int(argv[1]) if len(argv) > 1 else 100
+
+    for cls in (
+        DomainValueObject,
+        EmailAddressValueObject,
+        StringDatetimeValueObject,
+        UrlValueObject,
+        VehiclePlateValueObject,
+    ):
+        memoized = cast(type[ValueObject[Any]], type(cls.__name__, (cls,), {'__slots__': ()}, memoize=True))
+        corpus = build_corpus(cls=cls, distinct=distinct)
+
+        plain_timing = benchmark_corpus(cls=cls, corpus=corpus)
+        memoized_timing = benchmark_corpus(cls=memoized, corpus=corpus)
+        statistics = memoized.validation_cache().statistics()  # type: ignore[union-attr]
+        hit_rate = statistics['hits'] / (statistics['hits'] + statistics['misses'])
+
+        print(f'{cls.__name__:30} {plain_timing:10.0f} ns {memoized_timing:10.0f} ns memoized {hit_rate:7.2%} hits')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark the memory held by value object and model instances.
+
+Run it from the repository root with `python -m benchmarks.memory`, optionally passing the number of instances.
+"""
+
+from __future__ import annotations
+
+from sys import argv
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any, Callable
+
+from value_object_pattern.models import BaseModel, FrozenBaseModel
+from value_object_pattern.usables import IntegerValueObject, StringValueObject
+
+
+class Line(BaseModel):
+    """
+    Model stored in a `__dict__`.
+    """
+
+    def __init__(self, sku: StringValueObject, quantity: IntegerValueObject, price: IntegerValueObject) -> None:
+        """
+        Create a line.
+
+        Args:
+            sku (StringValueObject): The product sku.
+            quantity (IntegerValueObject): The quantity.
+            price (IntegerValueObject): The unit price.
+        """
+        self.sku = sku
+        self.quantity = quantity
+        self.price = price
+
+
+class FrozenLine(FrozenBaseModel):
+    """
+    The same model stored in slots.
+    """
+
+    sku: StringValueObject
+    quantity: IntegerValueObject
+    price: IntegerValueObject
+
+
+def benchmark_memory(*, cls: Callable[..., Any], count: int = 1000000, **kwargs: Any) -> float:
+    """
+    Return the bytes allocated per instance when holding `count` instances of `cls` built from the same arguments.
+
+    The arguments are shared, so only the instance itself and its per-instance state are measured.
+
+    Args:
+        cls (Callable[..., Any]): The value object or model class to construct.
+        count (int, optional): Number of instances to hold. Defaults to 1000000.
+        **kwargs (Any): Constructor arguments, `value` included.
+
+    Returns:
+        float: Bytes per instance.
+    """
+    cls(**kwargs)  # resolve the hook plan outside the measurement
+
+    start()
+    instances = [cls(**kwargs) for _ in range(count)]
+    current, _ = get_traced_memory()
+    stop()
+
+    _ = instances
+    return current / count
+
+
+def main() -> None:
+    """
+    Print the bytes per instance of `IntegerValueObject` with default and custom metadata, and of a three field model
+    stored in a `__dict__` and in slots.
+    """
+    count = int(argv[1]) if len(argv) > 1 else 1000000
+
+    default = benchmark_memory(cls=IntegerValueObject, count=count, value=1000)
+    custom = benchmark_memory(cls=IntegerValueObject, count=count, value=1000, title='Age', parameter='years')
+
+    print(f'{"IntegerValueObject default metadata":40} {default:10.1f} bytes/instance')
+    print(f'{"IntegerValueObject custom metadata":40} {custom:10.1f} bytes/instance')
+
+    fields = {'sku': StringValueObject(value='sku'), 'quantity': IntegerValueObject(value=1), 'price': IntegerValueObject(value=100)}  # noqa: E501  # fmt: skip
+    model = benchmark_memory(cls=Line, count=count, **fields)
+    frozen = benchmark_memory(cls=FrozenLine, count=count, **fields)
+
+    print(f'{"BaseModel 3 fields":40} {model:10.1f} bytes/instance')
+    print(f'{"FrozenBaseModel 3 fields":40} {frozen:10.1f} bytes/instance')
+
+
+if __name__ == '__main__':
+    main()
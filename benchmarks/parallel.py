@@ -0,0 +1,94 @@
+"""
+Benchmark parallel batch validation on 1 to N worker processes.
+
+Run it from the repository root with `python -m benchmarks.parallel`, optionally passing the number of values and the
+maximum number of workers.
+"""
+
+from __future__ import annotations
+
+from os import cpu_count
+from sys import argv
+from time import perf_counter
+from typing import Any
+
+from value_object_pattern.models import ValueObject
+from value_object_pattern.usables.internet import UrlValueObject
+from value_object_pattern.usables.money import IbanValueObject
+
+
+def build_ibans(*, size: int) -> list[str]:
+    """
+    Return `size` distinct deterministic Spanish IBANs with valid check digits.
+
+    Args:
+        size (int): Number of IBANs.
+
+    Returns:
+        list[str]: The IBANs.
+    """
+    ibans = []
+    for index in range(size):
+        bban = f'21000418{index:012}'
+        # move the country code and 00 check digits to the end, letters become numbers (E=14, S=28)
+        check_digits = 98 - int(f'{bban}142800') % 97
+        ibans.append(f'ES{check_digits:02}{bban}')
+
+    return ibans
+
+
+def build_urls(*, size: int) -> list[str]:
+    """
+    Return `size` distinct deterministic URLs.
+
+    Args:
+        size (int): Number of URLs.
+
+    Returns:
+        list[str]: The URLs.
+    """
+    return [f'https://host-{index % 97}.example.com/path/{index}?query={index}' for index in range(size)]
+
+
+def benchmark_parallel(*, cls: type[ValueObject[Any]], values: list[str], workers: int) -> float:
+    """
+    Return the values validated per second by `validate_many_parallel` with `workers` processes.
+
+    Args:
+        cls (type[ValueObject[Any]]): The value object class.
+        values (list[str]): Valid raw values.
+        workers (int): Number of worker processes.
+
+    Returns:
+        float: Values per second.
+    """
+    chunk_size = max(1, len(values) // (workers * 8))
+
+    start = perf_counter()
+    result = cls.validate_many_parallel(values=values, chunk_size=chunk_size, max_workers=workers)
+    elapsed = perf_counter() - start
+
+    assert not result.errors  # noqa: S101
+    return len(values) / elapsed
+
+
+def main() -> None:
+    """
+    Print the serial throughput and the parallel throughput and speedup of each class for 1 to N workers.
+    """
+    size = int(argv[1]) if len(argv) > 1 else 100000
+    max_workers = int(argv[2]) if len(argv) > 2 else cpu_count() or 1
+
+    for cls, values in ((IbanValueObject, build_ibans(size=size)), (UrlValueObject, build_urls(size=size))):
+        start = perf_counter()
+        cls.validate_many(values=values)
+        serial = size / (perf_counter() - start)
+        print(f'{cls.__name__:20} serial      {serial:12.0f} values/s')
+
+        for workers in range(1, max_workers + 1):
+            throughput = benchmark_parallel(cls=cls, values=values, workers=workers)
+            print(f'{cls.__name__:20} {workers:2} workers {throughput:12.0f} values/s {throughput / serial:6.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark value object and model pickling, alone and through a `multiprocessing` round trip.
+
+Run it from the repository root with `python -m benchmarks.pickling`, optionally passing the number of objects.
+"""
+
+from __future__ import annotations
+
+from multiprocessing import Pool
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+from sys import argv
+from time import perf_counter
+from typing import Any
+
+from value_object_pattern import BaseModel
+from value_object_pattern.usables import PositiveIntegerValueObject
+from value_object_pattern.usables.internet import EmailAddressValueObject
+
+
+class User(BaseModel):
+    """
+    Model shipped between processes by the benchmark.
+    """
+
+    email: EmailAddressValueObject
+    age: PositiveIntegerValueObject
+
+    def __init__(self, email: EmailAddressValueObject, age: PositiveIntegerValueObject) -> None:
+        """
+        Create a user.
+
+        Args:
+            email (EmailAddressValueObject): The user email.
+            age (PositiveIntegerValueObject): The user age.
+        """
+        self.email = email
+        self.age = age
+
+
+def echo(objects: list[Any]) -> list[Any]:
+    """
+    Return `objects` unchanged, so the pool only measures the round trip.
+
+    Args:
+        objects (list[Any]): The objects received by the worker.
+
+    Returns:
+        list[Any]: The same objects.
+    """
+    return objects
+
+
+def build_users(*, size: int) -> list[User]:
+    """
+    Return `size` deterministic users.
+
+    Args:
+        size (int): Number of users.
+
+    Returns:
+        list[User]: The users.
+    """
+    return [
+        User(email=EmailAddressValueObject(value=f'user.{index}@example.com'), age=PositiveIntegerValueObject(value=index + 1))  # noqa: E501
+        for index in range(size)
+    ]  # fmt: skip
+
+
+def benchmark_pickle(*, objects: list[Any]) -> tuple[float, float]:
+    """
+    Return the pickled bytes and the dumps and loads time per object, in nanoseconds.
+
+    Args:
+        objects (list[Any]): The objects to pickle.
+
+    Returns:
+        tuple[float, float]: Bytes per object and nanoseconds per object.
+    """
+    start = perf_counter()
+    payload = dumps(objects, protocol=HIGHEST_PROTOCOL)
+    loads(payload)  # noqa: S301
+    elapsed = perf_counter() - start
+
+    return len(payload) / len(objects), elapsed / len(objects) * 1e9
+
+
+def benchmark_round_trip(*, pool: Any, chunks: list[list[Any]]) -> float:
+    """
+    Return the time to send `chunks` to the pool workers and back, in nanoseconds per object.
+
+    Args:
+        pool (Any): The `multiprocessing` pool.
+        chunks (list[list[Any]]): The objects, split in chunks.
+
+    Returns:
+        float: Nanoseconds per object.
+    """
+    start = perf_counter()
+    pool.map(echo, chunks)
+    elapsed = perf_counter() - start
+
+    return elapsed / sum(len(chunk) for chunk in chunks) * 1e9
+
+
+def main() -> None:
+    """
+    Print the pickled size, the pickling cost and the round trip cost of value objects and models, next to shipping
+    primitives and validating them again.
+    """
+    size = int(argv[1]) if len(argv) > 1 else 100000
+    users = build_users(size=size)
+    emails = [user.email for user in users]
+    primitives = [user.to_primitives() for user in users]
+
+    for name, objects in (('EmailAddressValueObject', emails), ('User', users), ('User primitives', primitives)):
+        size_per_object, pickling = benchmark_pickle(objects=objects)
+        print(f'{name:25} {size_per_object:8.1f} bytes/object {pickling:10.0f} ns pickle+unpickle')
+
+    with Pool(processes=2) as pool:
+        for name, objects in (('EmailAddressValueObject', emails), ('User', users), ('User primitives', primitives)):
+            chunks = [objects[index : index + 1000] for index in range(0, len(objects), 1000)]
+            print(f'{name:25} {benchmark_round_trip(pool=pool, chunks=chunks):10.0f} ns round trip')
+
+    start = perf_counter()
+    for primitive in primitives:
+        User.from_primitives(primitives=primitive)
+
+    revalidation = (perf_counter() - start) / size * 1e9
+    print(f'{"User from_primitives":25} {revalidation:10.0f} ns validating received primitives again')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,434 @@
+"""
+Benchmark every shipped value object and model path, emitting JSON results and comparing them against a baseline.
+
+Run it from the repository root:
+
+```bash
+python -m benchmarks.suite run --output benchmarks/results.json
+python -m benchmarks.suite compare benchmarks/baseline.json benchmarks/results.json --threshold 0.1
+```
+
+`compare` exits with status 1 when a benchmark is slower than the baseline by more than the threshold.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+from functools import partial
+from json import dump, load
+from platform import platform, python_implementation, python_version
+from subprocess import run  # noqa: S404
+from sys import executable, stdout
+from time import perf_counter
+from typing import Any, Callable
+
+from benchmarks.corpus import VALID_VALUES, invalid_value, usable_classes
+from value_object_pattern import BaseModel
+from value_object_pattern.models.collections import DictValueObject, ListValueObject
+from value_object_pattern.usables import PositiveIntegerValueObject, StringValueObject
+from value_object_pattern.usables.identifiers.world import Iso3166Alpha2CodeValueObject
+from value_object_pattern.usables.internet import EmailAddressValueObject
+
+
+class IntegerList(ListValueObject[int]):
+    """
+    List of integers used by the collection benchmarks.
+    """
+
+
+class StringIntegerDict(DictValueObject[str, int]):
+    """
+    Dictionary of integers by string used by the collection benchmarks.
+    """
+
+
+class Address(BaseModel):
+    """
+    Model nested in `Customer`.
+    """
+
+    street: StringValueObject
+    country: Iso3166Alpha2CodeValueObject
+
+    def __init__(self, street: StringValueObject, country: Iso3166Alpha2CodeValueObject) -> None:
+        """
+        Create an address.
+
+        Args:
+            street (StringValueObject): The street.
+            country (Iso3166Alpha2CodeValueObject): The country code.
+        """
+        self.street = street
+        self.country = country
+
+
+class Customer(BaseModel):
+    """
+    Model used by the `from_primitives` and `to_primitives` benchmarks.
+    """
+
+    email: EmailAddressValueObject
+    age: PositiveIntegerValueObject
+    address: Address
+
+    def __init__(self, email: EmailAddressValueObject, age: PositiveIntegerValueObject, address: Address) -> None:
+        """
+        Create a customer.
+
+        Args:
+            email (EmailAddressValueObject): The customer email.
+            age (PositiveIntegerValueObject): The customer age.
+            address (Address): The customer address.
+        """
+        self.email = email
+        self.age = age
+        self.address = address
+
+
+class Aggregate(BaseModel):
+    """
+    Model with 20 fields used by the `from_primitives` and `to_primitives` benchmarks of wide models.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        field_0: StringValueObject,
+        field_1: StringValueObject,
+        field_2: StringValueObject,
+        field_3: StringValueObject,
+        field_4: StringValueObject,
+        field_5: PositiveIntegerValueObject,
+        field_6: PositiveIntegerValueObject,
+        field_7: PositiveIntegerValueObject,
+        field_8: PositiveIntegerValueObject,
+        field_9: PositiveIntegerValueObject,
+        field_10: EmailAddressValueObject,
+        field_11: Iso3166Alpha2CodeValueObject,
+        field_12: Address,
+        field_13: list[StringValueObject],
+        field_14: str,
+        field_15: int,
+        field_16: float,
+        field_17: bool,
+        field_18: StringValueObject | None = None,
+        field_19: int | str = 0,
+    ) -> None:
+        """
+        Create an aggregate.
+        """
+        self.field_0 = field_0
+        self.field_1 = field_1
+        self.field_2 = field_2
+        self.field_3 = field_3
+        self.field_4 = field_4
+        self.field_5 = field_5
+        self.field_6 = field_6
+        self.field_7 = field_7
+        self.field_8 = field_8
+        self.field_9 = field_9
+        self.field_10 = field_10
+        self.field_11 = field_11
+        self.field_12 = field_12
+        self.field_13 = field_13
+        self.field_14 = field_14
+        self.field_15 = field_15
+        self.field_16 = field_16
+        self.field_17 = field_17
+        self.field_18 = field_18
+        self.field_19 = field_19
+
+
+CUSTOMER_PRIMITIVES: dict[str, Any] = {
+    'email': 'customer@example.com',
+    'age': 42,
+    'address': {'street': 'Gran Via 1', 'country': 'ES'},
+}
+
+
+AGGREGATE_PRIMITIVES: dict[str, Any] = {
+    **{f'field_{index}': f'text {index}' for index in range(5)},
+    **{f'field_{index}': index for index in range(5, 10)},
+    'field_10': 'customer@example.com',
+    'field_11': 'ES',
+    'field_12': {'street': 'Gran Via 1', 'country': 'ES'},
+    'field_13': ['first', 'second'],
+    'field_14': 'text',
+    'field_15': 15,
+    'field_16': 16.5,
+    'field_17': True,
+    'field_18': 'optional',
+    'field_19': 'nineteen',
+}
+
+
+def measure(*, function: Callable[[], Any], min_time: float, repeat: int = 5) -> float:
+    """
+    Return the best time of `function` in nanoseconds per call.
+
+    The number of calls per measurement is doubled until a measurement lasts `min_time` seconds, then the best of
+    `repeat` measurements is kept.
+
+    Args:
+        function (Callable[[], Any]): The benchmarked function.
+        min_time (float): Minimum duration of a measurement, in seconds.
+        repeat (int, optional): Number of measurements. Defaults to 5.
+
+    Returns:
+        float: Nanoseconds per call.
+    """
+
+    def time_calls(number: int) -> float:
+        start = perf_counter()
+        for _ in range(number):
+            function()
+
+        return perf_counter() - start
+
+    number = 1
+    while time_calls(number) < min_time:
+        number *= 2
+
+    return min(time_calls(number) for _ in range(repeat)) / number * 1e9
+
+
+def expect_failure(*, cls: type[Any], value: Any) -> Callable[[], None]:
+    """
+    Return a function constructing `cls` with a value it rejects.
+
+    Args:
+        cls (type[Any]): The value object class.
+        value (Any): The rejected value.
+
+    Returns:
+        Callable[[], None]: The failing construction.
+    """
+
+    def construct() -> None:
+        try:
+            cls(value=value)
+
+        except (TypeError, ValueError):
+            return
+
+    return construct
+
+
+def benchmark_usables(*, min_time: float) -> dict[str, float]:
+    """
+    Return the construction and failure path cost of every value object of `value_object_pattern.usables`.
+
+    Args:
+        min_time (float): Minimum duration of a measurement, in seconds.
+
+    Returns:
+        dict[str, float]: Nanoseconds per construction, by benchmark name.
+    """
+    results: dict[str, float] = {}
+    for name, cls in usable_classes().items():
+        valid, invalid = VALID_VALUES[name], invalid_value(cls=cls)
+        results[f'construction.{name}'] = measure(function=partial(cls, value=valid), min_time=min_time)
+        results[f'failure.{name}'] = measure(function=expect_failure(cls=cls, value=invalid), min_time=min_time)
+
+    return results
+
+
+def benchmark_models(*, min_time: float) -> dict[str, float]:
+    """
+    Return the cost of `BaseModel.from_primitives`, `to_primitives` and their round trip.
+
+    Args:
+        min_time (float): Minimum duration of a measurement, in seconds.
+
+    Returns:
+        dict[str, float]: Nanoseconds per call, by benchmark name.
+    """
+    customer = Customer.from_primitives(primitives=CUSTOMER_PRIMITIVES)
+    aggregate = Aggregate.from_primitives(primitives=AGGREGATE_PRIMITIVES)
+
+    benchmarks: dict[str, Callable[[], Any]] = {
+        'model.from_primitives': lambda: Customer.from_primitives(primitives=CUSTOMER_PRIMITIVES),
+        'model.to_primitives': customer.to_primitives,
+        'model.round_trip': lambda: Customer.from_primitives(primitives=customer.to_primitives()),
+        'model.from_primitives_20_fields': lambda: Aggregate.from_primitives(primitives=AGGREGATE_PRIMITIVES),
+        'model.to_primitives_20_fields': aggregate.to_primitives,
+    }
+
+    return {name: measure(function=function, min_time=min_time) for name, function in benchmarks.items()}
+
+
+def benchmark_collections(*, min_time: float) -> dict[str, float]:
+    """
+    Return the cost of the `ListValueObject` and `DictValueObject` operations on 100 items.
+
+    Args:
+        min_time (float): Minimum duration of a measurement, in seconds.
+
+    Returns:
+        dict[str, float]: Nanoseconds per call, by benchmark name.
+    """
+    items = list(range(100))
+    mapping = {f'key-{index}': index for index in range(100)}
+    integers = IntegerList(value=items)
+    dictionary = StringIntegerDict(value=mapping)
+
+    benchmarks: dict[str, Callable[[], Any]] = {
+        'list.construction': lambda: IntegerList(value=items),
+        'list.from_primitives': lambda: IntegerList.from_primitives(value=items),
+        'list.to_primitives': integers.to_primitives,
+        'list.contains': lambda: 99 in integers,
+        'list.iterate': lambda: list(integers),
+        'list.add': lambda: integers.add(item=100),
+        'list.extend': lambda: integers.extend(items=[100, 101]),
+        'list.delete': lambda: integers.delete(item=50),
+        'dict.construction': lambda: StringIntegerDict(value=mapping),
+        'dict.from_primitives': lambda: StringIntegerDict.from_primitives(value=mapping),
+        'dict.to_primitives': dictionary.to_primitives,
+        'dict.contains': lambda: 'key-99' in dictionary,
+        'dict.get': lambda: dictionary.get(key='key-99'),
+        'dict.items': lambda: list(dictionary.items()),
+    }
+
+    return {name: measure(function=function, min_time=min_time) for name, function in benchmarks.items()}
+
+
+def benchmark_imports(*, repeat: int = 5) -> dict[str, float]:
+    """
+    Return the best import time of the package and of its usables in a fresh interpreter, in nanoseconds.
+
+    Args:
+        repeat (int, optional): Number of interpreters started per module. Defaults to 5.
+
+    Returns:
+        dict[str, float]: Nanoseconds per import, by benchmark name.
+    """
+    results: dict[str, float] = {}
+    for module in ('value_object_pattern', 'value_object_pattern.usables'):
+        code = f'from time import perf_counter; start = perf_counter(); import {module}; print(perf_counter() - start)'
+        timings = [
+            float(run([executable, '-c', code], capture_output=True, check=True, text=True).stdout)  # noqa: S603
+            for _ in range(repeat)
+        ]
+        results[f'import.{module}'] = min(timings) * 1e9
+
+    return results
+
+
+def run_suite(*, min_time: float) -> dict[str, Any]:
+    """
+    Run every benchmark.
+
+    Args:
+        min_time (float): Minimum duration of a measurement, in seconds.
+
+    Returns:
+        dict[str, Any]: The environment and the nanoseconds per call of every benchmark.
+    """
+    results: dict[str, float] = {}
+    results.update(benchmark_usables(min_time=min_time))
+    results.update(benchmark_models(min_time=min_time))
+    results.update(benchmark_collections(min_time=min_time))
+    results.update(benchmark_imports())
+
+    return {
+        'environment': {
+            'implementation': python_implementation(),
+            'python': python_version(),
+            'platform': platform(),
+        },
+        'unit': 'ns',
+        'results': results,
+    }
+
+
+def compare(*, baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> list[str]:
+    """
+    Print the ratio of every benchmark against the baseline and return the regressed ones.
+
+    Args:
+        baseline (dict[str, Any]): The stored baseline results.
+        current (dict[str, Any]): The current results.
+        threshold (float): Tolerated slowdown, 0.1 means 10% slower than the baseline.
+
+    Returns:
+        list[str]: The names of the benchmarks slower than the baseline by more than `threshold`.
+    """
+    regressions = []
+    baseline_results, current_results = baseline['results'], current['results']
+    for name in sorted(set(baseline_results) | set(current_results)):
+        if name not in current_results or name not in baseline_results:
+            status = 'missing in current' if name not in current_results else 'new'
+            print(f'{name:75} {status}')
+            continue
+
+        ratio = current_results[name] / baseline_results[name]
+        status = ''
+        if ratio > 1 + threshold:
+            status = 'REGRESSION'
+            regressions.append(name)
+
+        elif ratio < 1 - threshold:
+            status = 'improvement'
+
+        print(f'{name:75} {baseline_results[name]:12.0f} {current_results[name]:12.0f} {ratio:6.2f}x {status}')
+
+    return regressions
+
+
+def parse_arguments() -> Namespace:
+    """
+    Parse the command line arguments.
+
+    Returns:
+        Namespace: The parsed arguments.
+    """
+    parser = ArgumentParser(prog='python -m benchmarks.suite', description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Run every benchmark and write the results as JSON.')
+    run_parser.add_argument('--output', help='File the results are written to. Defaults to the standard output.')
+    run_parser.add_argument('--min-time', type=float, default=0.05, help='Minimum seconds per measurement.')
+
+    compare_parser = commands.add_parser('compare', help='Compare results against a baseline.')
+    compare_parser.add_argument('baseline', help='Baseline results file.')
+    compare_parser.add_argument('current', help='Current results file.')
+    compare_parser.add_argument('--threshold', type=float, default=0.1, help='Tolerated slowdown ratio.')
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    """
+    Run the `run` or `compare` command.
+
+    Returns:
+        int: The exit status, 1 if `compare` found regressions.
+    """
+    arguments = parse_arguments()
+    if arguments.command == 'run':
+        results = run_suite(min_time=arguments.min_time)
+        if arguments.output is None:
+            dump(results, stdout, indent=2)
+            print()
+            return 0
+
+        with open(arguments.output, 'w', encoding='utf-8') as file:
+            dump(results, file, indent=2)
+
+        return 0
+
+    with open(arguments.baseline, encoding='utf-8') as file:
+        baseline = load(file)
+
+    with open(arguments.current, encoding='utf-8') as file:
+        current = load(file)
+
+    regressions = compare(baseline=baseline, current=current, threshold=arguments.threshold)
+    if regressions:
+        print(f'{len(regressions)} benchmarks regressed by more than {arguments.threshold:.0%}.')
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,106 @@
+"""
+Benchmark value object construction throughput on 1 to N threads.
+
+Run it from the repository root with `python -m benchmarks.threads`, optionally passing the number of constructions per
+thread and the maximum number of threads. Throughput only scales with the threads on free-threaded builds (`python3.13t`
+and later), with the GIL the threads take turns and the speedup stays close to 1x.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from os import cpu_count
+from sys import argv
+from threading import Barrier, Thread
+from time import perf_counter
+from typing import Any, Callable
+
+from benchmarks.parallel import build_ibans, build_urls
+from value_object_pattern.models.collections import ListValueObject
+from value_object_pattern.usables.identifiers.world import Iso3166Alpha2CodeValueObject
+from value_object_pattern.usables.internet import UrlValueObject, UserAgentValueObject
+from value_object_pattern.usables.money import IbanValueObject
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15'
+
+
+def construct_all(*, cls: Any, values: list[Any]) -> None:
+    """
+    Construct a `cls` value object for every value.
+
+    Args:
+        cls (Any): The value object class or inline alias.
+        values (list[Any]): Valid raw values.
+    """
+    for value in values:
+        cls(value=value)
+
+
+def workloads(*, size: int) -> dict[str, Callable[[], Any]]:
+    """
+    Return the benchmarked workloads, each one constructs `size` value objects.
+
+    Args:
+        size (int): Number of constructions per call.
+
+    Returns:
+        dict[str, Callable[[], Any]]: The workloads by name.
+    """
+    inputs: dict[str, tuple[Any, list[Any]]] = {
+        'UserAgentValueObject': (UserAgentValueObject, [USER_AGENT] * size),
+        'Iso3166Alpha2CodeValueObject': (Iso3166Alpha2CodeValueObject, ['ES'] * size),
+        'IbanValueObject': (IbanValueObject, build_ibans(size=size)),
+        'UrlValueObject': (UrlValueObject, build_urls(size=size)),
+        'ListValueObject[int]': (ListValueObject[int], [[index] for index in range(size)]),
+    }
+
+    return {name: partial(construct_all, cls=cls, values=values) for name, (cls, values) in inputs.items()}
+
+
+def benchmark_threads(*, workload: Callable[[], Any], size: int, threads: int) -> float:
+    """
+    Return the constructions per second of `threads` threads running `workload` at the same time.
+
+    Args:
+        workload (Callable[[], Any]): Function constructing `size` value objects.
+        size (int): Number of constructions made by `workload`.
+        threads (int): Number of threads.
+
+    Returns:
+        float: Constructions per second.
+    """
+    barrier = Barrier(parties=threads + 1)
+
+    def run() -> None:
+        barrier.wait()
+        workload()
+
+    workers = [Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+    start = perf_counter()
+    for worker in workers:
+        worker.join()
+
+    return size * threads / (perf_counter() - start)
+
+
+def main() -> None:
+    """
+    Print the throughput and speedup of each workload for 1 to N threads.
+    """
+    size = int(argv[1]) if len(argv) > 1 else 20000
+    max_threads = int(argv[2]) if len(argv) > 2 else cpu_count() or 1
+
+    for name, workload in workloads(size=size).items():
+        workload()  # warm up caches and compiled constructors
+        single = benchmark_threads(workload=workload, size=size, threads=1)
+        for threads in range(1, max_threads + 1):
+            throughput = single if threads == 1 else benchmark_threads(workload=workload, size=size, threads=threads)
+            print(f'{name:30} {threads:2} threads {throughput:12.0f} constructions/s {throughput / single:6.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+Test cached_classproperty decorator.
+"""
+
+from gc import collect
+from threading import Barrier, Thread
+from time import sleep
+from weakref import ref
+
+from object_mother_pattern.models import BaseMother
+from pytest import mark, raises as assert_raises
+
+from value_object_pattern.decorators import cached_classproperty
+
+
+class CachedClassPropertySample:
+    """
+    Class used to test the cached_classproperty decorator.
+    """
+
+    prefix = 'hello'
+    computations = 0
+
+    @cached_classproperty
+    def greeting(cls) -> str:  # noqa: N805
+        """Cached classproperty docstring."""
+        CachedClassPropertySample.computations += 1
+        return cls.prefix.upper()
+
+
+class CachedClassPropertySubSample(CachedClassPropertySample):
+    """
+    Subclass used to test that each owner class gets its own value.
+    """
+
+    prefix = 'bye'
+
+
+@mark.unit_testing
+def test_cached_classproperty_computes_value_once_per_class() -> None:
+    """
+    Test that a cached_classproperty computes its value once per owner class, also when read from instances.
+    """
+    CachedClassPropertySample.__dict__['greeting'].invalidate()
+    CachedClassPropertySample.computations = 0
+
+    assert CachedClassPropertySample.greeting == 'HELLO'
+    assert CachedClassPropertySample().greeting == 'HELLO'
+    assert CachedClassPropertySubSample.greeting == 'BYE'
+    assert CachedClassPropertySubSample().greeting == 'BYE'
+    assert CachedClassPropertySample.computations == 2
+
+
+@mark.unit_testing
+def test_cached_classproperty_invalidate_discards_class_and_subclasses() -> None:
+    """
+    Test that invalidating a class discards its value and its subclasses values, but no other class value.
+    """
+    descriptor = CachedClassPropertySample.__dict__['greeting']
+    assert CachedClassPropertySample.greeting == 'HELLO'
+    assert CachedClassPropertySubSample.greeting == 'BYE'
+    CachedClassPropertySample.computations = 0
+
+    descriptor.invalidate(owner=CachedClassPropertySubSample)
+    assert CachedClassPropertySample.greeting == 'HELLO'
+    assert CachedClassPropertySubSample.greeting == 'BYE'
+    assert CachedClassPropertySample.computations == 1
+
+    descriptor.invalidate(owner=CachedClassPropertySample)
+    assert CachedClassPropertySample.greeting == 'HELLO'
+    assert CachedClassPropertySubSample.greeting == 'BYE'
+    assert CachedClassPropertySample.computations == 3
+
+
+@mark.unit_testing
+def test_cached_classproperty_does_not_keep_owner_classes_alive() -> None:
+    """
+    Test that classes created at runtime can be garbage collected after their value is computed.
+    """
+    descriptor = CachedClassPropertySample.__dict__['greeting']
+
+    class RuntimeSample(CachedClassPropertySample):
+        prefix = 'runtime'
+
+    reference = ref(RuntimeSample)
+
+    assert RuntimeSample.greeting == 'RUNTIME'
+    assert RuntimeSample in descriptor._values
+
+    del RuntimeSample
+    collect()
+
+    assert reference() is None
+
+
+@mark.unit_testing
+def test_cached_classproperty_computes_value_once_under_concurrent_first_access() -> None:
+    """
+    Test that threads reading a cached_classproperty for the first time at once compute its value only once.
+    """
+    calls: list[object] = []
+
+    class SlowSample:
+        @cached_classproperty
+        def value(cls) -> object:  # noqa: N805
+            calls.append(cls)
+            sleep(0.01)
+            return object()
+
+    barrier = Barrier(parties=8)
+    values = []
+
+    def read() -> None:
+        barrier.wait()
+        values.append(SlowSample.value)
+
+    threads = [Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert calls == [SlowSample]
+    assert all(value is values[0] for value in values)
+
+
+@mark.unit_testing
+def test_cached_classproperty_preserves_docstring() -> None:
+    """
+    Test that a cached_classproperty copies the wrapped function docstring.
+    """
+    descriptor = CachedClassPropertySample.__dict__['greeting']
+
+    assert descriptor.__doc__ == 'Cached classproperty docstring.'
+
+
+@mark.unit_testing
+def test_cached_classproperty_raises_type_error_when_not_callable() -> None:
+    """
+    Test that cached_classproperty raises a TypeError when wrapping a non-callable object.
+    """
+    with assert_raises(
+        expected_exception=TypeError,
+        match=r'Wrapped function must be callable\. Got <<<.*>>> instead\.',
+    ):
+        cached_classproperty(function=BaseMother.invalid_type())
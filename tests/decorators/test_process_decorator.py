@@ -78,3 +78,18 @@ def test_process_raises_value_error_when_order_is_negative_random() -> None:
         @process(order=IntegerMother.negative())
         def _(_: str) -> None:  # pragma: no cover
             pass
+
+
+@mark.unit_testing
+def test_process_marks_the_function_in_place() -> None:
+    """
+    Test that process decorator returns the decorated function itself instead of a wrapper.
+    """
+
+    def ensure_something(value: str) -> None:  # pragma: no cover
+        pass
+
+    decorated = process()(ensure_something)
+
+    assert decorated is ensure_something
+    assert decorated._is_process  # type: ignore[attr-defined]
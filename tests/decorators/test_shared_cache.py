@@ -0,0 +1,124 @@
+"""
+Test shared_cache decorator.
+"""
+
+from threading import Barrier, Thread
+from typing import Any
+
+from pytest import mark, raises as assert_raises
+
+from value_object_pattern.decorators import shared_cache
+from value_object_pattern.decorators.shared_cache import CacheInfo
+
+
+@mark.unit_testing
+def test_shared_cache_computes_each_key_once() -> None:
+    """
+    Test that a shared_cache computes the result once per arguments, however they are passed.
+    """
+    calls: list[tuple[int, int]] = []
+
+    @shared_cache()
+    def add(first: int, second: int = 0) -> int:
+        """Add two numbers."""
+        calls.append((first, second))
+        return first + second
+
+    assert add(1, 2) == 3
+    assert add(1, 2) == 3
+    assert add(first=1, second=2) == 3
+    assert add(1) == 1
+    assert add(first=1, second=0) == 1
+    assert calls == [(1, 2), (1, 0)]
+    assert add.__doc__ == 'Add two numbers.'
+
+
+@mark.unit_testing
+def test_shared_cache_clears_when_full() -> None:
+    """
+    Test that a bounded shared_cache starts over when it reaches its maximum size, reports its statistics and can be
+    cleared explicitly.
+    """
+    calls: list[int] = []
+
+    @shared_cache(maxsize=2)
+    def double(number: int) -> int:
+        calls.append(number)
+        return number * 2
+
+    double(1)
+    double(2)
+    double(2)
+    double(3)
+    double(2)
+
+    assert double.cache_info() == CacheInfo(hits=1, misses=4, maxsize=2, currsize=2)
+
+    double.cache_clear()
+    double(3)
+
+    assert calls == [1, 2, 3, 2, 3]
+    assert double.cache_info() == (0, 1, 2, 1)
+
+
+@mark.unit_testing
+def test_shared_cache_publishes_a_single_result_to_concurrent_callers() -> None:
+    """
+    Test that threads missing the same key at the same time all get the same result object.
+    """
+    barrier = Barrier(parties=8)
+    results: list[object] = []
+
+    @shared_cache()
+    def create() -> object:
+        barrier.wait()
+        return object()
+
+    threads = [Thread(target=lambda: results.append(create())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len({id(result) for result in results}) == 1
+
+
+@mark.unit_testing
+@mark.parametrize(
+    'maxsize, exception, message',
+    [
+        (0, ValueError, 'shared_cache maxsize <<<0>>> must be a positive integer.'),
+        ('16', TypeError, 'shared_cache maxsize <<<16>>> must be an integer. Got <<<str>>> type.'),
+    ],
+)
+def test_shared_cache_rejects_invalid_maxsize(maxsize: Any, exception: type[Exception], message: str) -> None:
+    """
+    Test that invalid maximum sizes are rejected.
+    """
+    with assert_raises(expected_exception=exception, match=message):
+        shared_cache(maxsize=maxsize)
+
+
+@mark.unit_testing
+def test_shared_cache_rejects_variadic_parameters() -> None:
+    """
+    Test that functions with variadic parameters are rejected.
+    """
+    with assert_raises(
+        expected_exception=TypeError,
+        match='shared_cache function <<<.*>>> parameter <<<values>>> must be a named parameter.',
+    ):
+        shared_cache()(lambda *values: values)
+
+
+@mark.unit_testing
+def test_shared_cache_rejects_non_callable() -> None:
+    """
+    Test that decorating a non callable object raises a TypeError.
+    """
+    with assert_raises(
+        expected_exception=TypeError,
+        match='shared_cache function <<<1>>> must be callable. Got <<<int>>> type.',
+    ):
+        shared_cache()(1)  # type: ignore[arg-type]
@@ -120,3 +120,18 @@ def test_validation_raises_type_error_when_early_process_is_not_boolean() -> Non
         @validation(early_process=BooleanMother.invalid_type())
         def _(_: str) -> None:  # pragma: no cover
             pass
+
+
+@mark.unit_testing
+def test_validation_marks_the_function_in_place() -> None:
+    """
+    Test that validation decorator returns the decorated function itself instead of a wrapper.
+    """
+
+    def ensure_something(value: str) -> None:  # pragma: no cover
+        pass
+
+    decorated = validation(early_process=True)(ensure_something)
+
+    assert decorated is ensure_something
+    assert decorated._is_validation  # type: ignore[attr-defined]
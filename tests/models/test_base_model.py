@@ -5,6 +5,7 @@ Test BaseModel model.
 from __future__ import annotations
 
 from copy import copy, deepcopy
+from pickle import dumps, loads
 from typing import Any, ForwardRef
 
 from pytest import MonkeyPatch, mark, raises as assert_raises
@@ -119,6 +120,19 @@ def test_base_model_deepcopy() -> None:
     assert deep_clone is not profile
 
 
+@mark.unit_testing
+def test_base_model_pickle_restores_attributes_without_constructor() -> None:
+    """
+    Test BaseModel pickling restores every attribute, private ones included, without calling the constructor.
+    """
+    profile = Profile(name='Ada', age=37, private_note='marker')
+
+    unpickled = loads(dumps(profile))  # noqa: S301
+
+    assert unpickled == profile
+    assert unpickled._to_dict(ignore_private=False) == profile._to_dict(ignore_private=False)
+
+
 @mark.unit_testing
 def test_base_model_deepcopy_returns_memoized_value() -> None:
     """
@@ -217,3 +231,147 @@ def test_base_model_type_label_forward_ref() -> None:
     Test BaseModel type label for ForwardRef.
     """
     assert BaseModel._type_label(type=ForwardRef('Later')) == "ForwardRef('Later')"
+
+
+@mark.unit_testing
+def test_base_model_from_primitives_schema_is_resolved_once_per_class() -> None:
+    """
+    Test BaseModel.from_primitives resolves the constructor schema once and stores it on each model class.
+    """
+
+    class Employee(Profile):
+        def __init__(self, name: str, age: int, team: str) -> None:
+            """
+            Initialize the employee model.
+            """
+            super().__init__(name=name, age=age)
+            self.team = team
+
+    Profile.from_primitives(primitives={'name': 'Ada', 'age': 37})
+    employee = Employee.from_primitives(primitives={'name': 'Ada', 'age': 37, 'team': 'core'})
+    schema = Employee._resolve_primitives_schema()
+
+    assert employee.team == 'core'
+    assert Employee.__dict__['_primitives_schema'] is schema
+    assert Profile.__dict__['_primitives_schema'] is not schema
+    assert schema.names == {'name', 'age', 'team'}
+    assert schema.required == {'name', 'age', 'team'}
+
+
+@mark.unit_testing
+def test_base_model_from_primitives_schema_is_not_cached_until_annotations_resolve() -> None:
+    """
+    Test BaseModel.from_primitives keeps resolving the schema while a forward reference is not defined yet.
+    """
+
+    class Order(BaseModel):
+        def __init__(self, line: OrderLine) -> None:  # type: ignore[name-defined]  # noqa: F821
+            """
+            Initialize the order model.
+            """
+            self.line = line
+
+    assert Order.from_primitives(primitives={'line': 'raw'}).line == 'raw'
+    assert '_primitives_schema' not in Order.__dict__
+
+
+@mark.unit_testing
+def test_base_model_to_primitives_serializer_is_resolved_once_per_class() -> None:
+    """
+    Test BaseModel.to_primitives resolves the attribute serializer once and stores it on each model class.
+    """
+
+    class Employee(Profile):
+        def __init__(self, name: str, age: int, team: str) -> None:
+            """
+            Initialize the employee model.
+            """
+            super().__init__(name=name, age=age)
+            self.team = team
+
+    profile = Profile(name='Ada', age=37)
+    employee = Employee(name='Ada', age=37, team='core')
+
+    assert profile.to_primitives() == {'name': 'Ada', 'age': 37}
+    assert employee.to_primitives()['team'] == 'core'
+
+    serializer = Employee._resolve_primitives_serializer()
+    assert Employee.__dict__['_primitives_serializer'] is serializer
+    assert Profile.__dict__['_primitives_serializer'] is not serializer
+    assert Profile._resolve_primitives_serializer().fields['_Profile__private_note'] is None
+
+
+@mark.unit_testing
+def test_base_model_to_primitives_serializer_is_not_cached_until_annotations_resolve() -> None:
+    """
+    Test BaseModel.to_primitives keeps resolving the serializer while a forward reference is not defined yet.
+    """
+
+    class Order(BaseModel):
+        line: OrderLine  # type: ignore[name-defined]  # noqa: F821
+
+        def __init__(self, line: Any) -> None:
+            """
+            Initialize the order model.
+            """
+            self.line = line
+
+    assert Order(line='raw').to_primitives() == {'line': 'raw'}
+    assert '_primitives_serializer' not in Order.__dict__
+
+
+@mark.unit_testing
+def test_base_model_attribute_layout_is_resolved_once_per_class() -> None:
+    """
+    Test BaseModel stores the public key of each attribute and the sorted order of each attribute layout on the class.
+    """
+    profile = Profile(name='Ada', age=37, private_note='marker')
+    repr(profile)
+    layout = Profile._resolve_attribute_layout()
+
+    assert Profile.__dict__['_attribute_layout'] is layout
+    assert layout.keys['name'] == ('name', False)
+    assert layout.keys['_age'] == ('age', False)
+    assert layout.keys['_Profile__private_note'] == ('private_note', True)
+    assert layout.orders[('name', '_age', '_Profile__private_note')] == (('age', '_age'), ('name', 'name'))
+
+
+@mark.unit_testing
+def test_base_model_equality_compares_each_public_attribute() -> None:
+    """
+    Test BaseModel equality compares public attributes one by one, stopping at the first difference.
+    """
+    profile = Profile(name='Ada', age=37)
+
+    assert profile == Profile(name='Ada', age=37, private_note='another-marker')
+    assert profile != Profile(name='Ada', age=38)
+    assert profile != Profile(name='Grace', age=37)
+    assert Profile(name='Ada', age=float('nan')) != Profile(name='Ada', age=float('nan'))  # type: ignore[arg-type]
+
+
+@mark.unit_testing
+def test_base_model_equality_and_hash_ignore_attribute_order() -> None:
+    """
+    Test BaseModel equality and hash do not depend on the order attributes were set in.
+    """
+    profile = Profile(name='Ada', age=37)
+    reordered = Profile.__new__(Profile)
+    reordered._age = 37
+    reordered.name = 'Ada'
+
+    assert profile == reordered
+    assert hash(profile) == hash(reordered)
+    assert repr(profile) == repr(reordered)
+
+
+@mark.unit_testing
+def test_base_model_layout_keeps_last_attribute_of_a_shared_public_key() -> None:
+    """
+    Test BaseModel representation uses the last attribute set when two attributes share a public key, like _to_dict.
+    """
+    profile = Profile(name='Ada', age=37)
+    profile.age = 38  # type: ignore[attr-defined]
+
+    assert profile._to_dict() == {'name': 'Ada', 'age': 38}
+    assert repr(profile) == "Profile(age=38, name='Ada')"
+    assert profile == Profile(name='Ada', age=38)
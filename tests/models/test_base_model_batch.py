@@ -0,0 +1,136 @@
+"""
+Test BaseModel batch construction.
+"""
+
+from typing import Any
+
+from pytest import mark, raises as assert_raises
+
+from value_object_pattern import BaseModel, BatchResult
+from value_object_pattern.usables import PositiveIntegerValueObject, StringValueObject
+
+
+class Tag(BaseModel):
+    """
+    Model nested in `Order`.
+    """
+
+    def __init__(self, name: StringValueObject) -> None:
+        """
+        Initialize the tag model.
+        """
+        self.name = name
+
+
+class Order(BaseModel):
+    """
+    Model with value object, nested model, list, union and defaulted parameters.
+    """
+
+    def __init__(
+        self,
+        quantity: PositiveIntegerValueObject,
+        tag: Tag,
+        labels: list[StringValueObject],
+        code: int | str = 0,
+        note: str = '',
+    ) -> None:
+        """
+        Initialize the order model.
+        """
+        if note == 'invalid':
+            raise ValueError('Order note <<<invalid>>> is not allowed.')
+
+        self.quantity = quantity
+        self.tag = tag
+        self.labels = labels
+        self.code = code
+        self.note = note
+
+
+def order(**overrides: Any) -> dict[str, Any]:
+    """
+    Return the primitives of a valid order, updated with `overrides`.
+    """
+    return {'quantity': 1, 'tag': {'name': 'a'}, 'labels': ['x', 'y'], **overrides}
+
+
+TAG = Tag(name=StringValueObject(value='b'))
+ROWS: list[dict[str, Any]] = [
+    order(),
+    order(quantity=-1, tag={'name': 1}),
+    order(tag={'name': 1}),
+    order(labels=['x', 2, 3]),
+    'order',  # type: ignore[list-item]
+    {'quantity': 1},
+    order(code=1.5),
+    order(note='invalid'),
+    order(quantity=PositiveIntegerValueObject(value=2), tag=TAG, labels=[], code='A', note='note'),
+]
+
+
+@mark.unit_testing
+def test_base_model_from_primitives_many_matches_from_primitives() -> None:
+    """
+    Test BaseModel.from_primitives_many builds the same instances and rejects the rows with the same errors as
+    BaseModel.from_primitives, in row order.
+    """
+    result = Order.from_primitives_many(rows=iter(ROWS))
+
+    assert isinstance(result, BatchResult)
+    assert result.indexes == [0, 8]
+    assert result.instances == [Order.from_primitives(primitives=ROWS[0]), Order.from_primitives(primitives=ROWS[8])]
+    assert list(result.errors) == [1, 2, 3, 4, 5, 6, 7]
+    for index, error in result.errors.items():
+        with assert_raises(expected_exception=type(error)) as expected_error:
+            Order.from_primitives(primitives=ROWS[index])
+
+        assert str(error) == str(expected_error.value)
+        assert error.__traceback__ is None
+
+
+@mark.unit_testing
+def test_base_model_from_primitives_many_notes_rejected_parameter() -> None:
+    """
+    Test BaseModel.from_primitives_many rejects a row with its first rejected parameter, noting its name and the names
+    of the nested parameters.
+    """
+    errors = Order.from_primitives_many(rows=ROWS).errors
+
+    assert errors[1].__notes__ == ['Order parameter <<<quantity>>>']
+    assert errors[2].__notes__ == ['Tag parameter <<<name>>>', 'Order parameter <<<tag>>>']
+    assert errors[3].__notes__ == ['Order parameter <<<labels>>>']
+    assert not hasattr(errors[6], '__notes__')
+
+
+@mark.unit_testing
+def test_base_model_from_primitives_many_raises_first_error_with_its_index() -> None:
+    """
+    Test BaseModel.from_primitives_many raises the error of the first rejected row with a note telling its index.
+    """
+    with assert_raises(expected_exception=ValueError, match='PositiveIntegerValueObject value <<<-1>>> must be a positive integer.') as error:  # noqa: E501  # fmt: skip
+        Order.from_primitives_many(rows=ROWS, errors='raise')
+
+    assert error.value.__notes__ == ['Order parameter <<<quantity>>>', 'Order batch index <<<1>>>']
+
+
+@mark.unit_testing
+def test_base_model_from_primitives_many_skips_rejected_rows() -> None:
+    """
+    Test BaseModel.from_primitives_many drops rejected rows with errors='skip' and skips validation of trusted rows.
+    """
+    skipped = Order.from_primitives_many(rows=ROWS, errors='skip')
+    trusted = Order.from_primitives_many(rows=[order(quantity=-1, labels=[''])], trusted=True)
+
+    assert skipped.indexes == [0, 8]
+    assert skipped.errors == {}
+    assert trusted.instances[0].quantity.value == -1
+
+
+@mark.unit_testing
+def test_base_model_from_primitives_many_rejects_invalid_errors_mode() -> None:
+    """
+    Test BaseModel.from_primitives_many rejects an unknown errors mode.
+    """
+    with assert_raises(expected_exception=ValueError, match='Order errors <<<ignore>>> must be one of <<<raise, collect, skip>>>.'):  # noqa: E501  # fmt: skip
+        Order.from_primitives_many(rows=[], errors='ignore')  # type: ignore[arg-type]
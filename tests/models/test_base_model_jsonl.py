@@ -0,0 +1,134 @@
+"""
+Test BaseModel.iter_from_jsonl.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO, StringIO
+from json import JSONDecodeError
+from pathlib import Path
+from typing import Any
+
+from pytest import mark, raises as assert_raises
+
+from value_object_pattern import BaseModel
+from value_object_pattern.usables import PositiveIntegerValueObject
+
+LINES = '{"quantity": 1}\n\n{"quantity": -2}\nnot json\n[3]\n{"quantity": 4}\n'
+
+
+class Item(BaseModel):
+    """
+    Base model built from JSON Lines.
+    """
+
+    def __init__(self, quantity: PositiveIntegerValueObject) -> None:
+        """
+        Initialize the item model.
+        """
+        self.quantity = quantity
+
+
+def quantities(records: list[Any]) -> list[Any]:
+    """
+    Return the quantity of each model and the line number and error type of each rejected line.
+    """
+    return [record.quantity.value if isinstance(record, Item) else (record[0], type(record[1])) for record in records]
+
+
+@mark.unit_testing
+def test_base_model_iter_from_jsonl_collects_errors_by_line_number() -> None:
+    """
+    Test BaseModel.iter_from_jsonl yields models and the line number and error of rejected lines, skipping blank lines.
+    """
+    records = list(Item.iter_from_jsonl(StringIO(LINES)))
+
+    assert quantities(records=records) == [1, (3, ValueError), (4, JSONDecodeError), (5, TypeError), 4]
+    assert records[1][1].__traceback__ is None
+
+
+@mark.unit_testing
+def test_base_model_iter_from_jsonl_skips_errors() -> None:
+    """
+    Test BaseModel.iter_from_jsonl drops rejected lines with errors='skip'.
+    """
+    assert quantities(records=list(Item.iter_from_jsonl(StringIO(LINES), errors='skip'))) == [1, 4]
+
+
+@mark.unit_testing
+def test_base_model_iter_from_jsonl_raises_first_error_with_line_number() -> None:
+    """
+    Test BaseModel.iter_from_jsonl raises the first error with a note telling its line number, after yielding the
+    previous models.
+    """
+    records = Item.iter_from_jsonl(StringIO(LINES), errors='raise')
+
+    assert next(records).quantity.value == 1
+
+    with assert_raises(expected_exception=ValueError) as error:
+        next(records)
+
+    assert error.value.__notes__ == ['Item JSON Lines line <<<3>>>']
+
+
+@mark.unit_testing
+def test_base_model_iter_from_jsonl_yields_batches() -> None:
+    """
+    Test BaseModel.iter_from_jsonl yields lists of at most batch_size records.
+    """
+    batches = list(Item.iter_from_jsonl(StringIO(LINES), batch_size=2))
+
+    assert [quantities(records=batch) for batch in batches] == [[1, (3, ValueError)], [(4, JSONDecodeError), (5, TypeError)], [4]]  # noqa: E501  # fmt: skip
+
+
+@mark.unit_testing
+def test_base_model_iter_from_jsonl_reads_bytes_lines() -> None:
+    """
+    Test BaseModel.iter_from_jsonl reads binary files and skips validation of trusted primitives.
+    """
+    records = list(Item.iter_from_jsonl(BytesIO(LINES.encode()), errors='skip', trusted=True))
+
+    assert quantities(records=records) == [1, -2, 4]
+
+
+@mark.unit_testing
+def test_base_model_iter_from_jsonl_memory_map(tmp_path: Path) -> None:
+    """
+    Test BaseModel.iter_from_jsonl reads a memory mapped file from its current position.
+    """
+    path = tmp_path / 'items.jsonl'
+    path.write_text(data=LINES, encoding='utf-8')
+    empty_path = tmp_path / 'empty.jsonl'
+    empty_path.write_bytes(data=b'')
+
+    with path.open(mode='rb') as file:
+        assert quantities(records=list(Item.iter_from_jsonl(file, memory_map=True))) == [1, (3, ValueError), (4, JSONDecodeError), (5, TypeError), 4]  # noqa: E501  # fmt: skip
+
+    with path.open(mode='rb') as file:
+        file.readline()
+        assert quantities(records=list(Item.iter_from_jsonl(file, errors='skip', memory_map=True))) == [4]
+
+    with empty_path.open(mode='rb') as file:
+        assert list(Item.iter_from_jsonl(file, memory_map=True)) == []
+
+
+@mark.unit_testing
+@mark.parametrize(
+    'kwargs, exception, message',
+    [
+        ({'errors': 'ignore'}, ValueError, 'Item errors <<<ignore>>> must be one of <<<raise, collect, skip>>>.'),
+        ({'batch_size': 1.5}, TypeError, 'Item batch_size <<<1.5>>> must be an integer. Got <<<float>>> type.'),
+        ({'batch_size': 0}, ValueError, 'Item batch_size <<<0>>> must be a positive integer.'),
+        ({'memory_map': True}, TypeError, 'must be a file object backed by a file descriptor to be memory mapped.'),
+    ],
+)  # fmt: skip
+def test_base_model_iter_from_jsonl_rejects_invalid_arguments(
+    kwargs: dict[str, Any],
+    exception: type[Exception],
+    message: str,
+) -> None:
+    """
+    Test BaseModel.iter_from_jsonl validates its arguments when it is called, before reading any line.
+    """
+    with assert_raises(expected_exception=exception, match=message):
+        Item.iter_from_jsonl([], **kwargs)
@@ -0,0 +1,235 @@
+"""
+Test BaseModel.from_primitives lazy mode.
+"""
+
+from copy import copy, deepcopy
+from pickle import dumps, loads
+from typing import Any
+
+from pytest import mark, raises as assert_raises
+
+from value_object_pattern import BaseModel, FrozenBaseModel
+from value_object_pattern.usables import PositiveIntegerValueObject, StringValueObject
+from value_object_pattern.usables.internet import EmailAddressValueObject
+
+
+class Address(BaseModel):
+    """
+    Model nested in `User`.
+    """
+
+    def __init__(self, street: StringValueObject) -> None:
+        """
+        Initialize the address model.
+        """
+        self.street = street
+
+
+class User(BaseModel):
+    """
+    Model with public, single-underscore, private, nested, union and defaulted parameters.
+    """
+
+    def __init__(
+        self,
+        name: StringValueObject,
+        age: PositiveIntegerValueObject,
+        address: Address,
+        note: str,
+        code: int | str = 0,
+    ) -> None:
+        """
+        Initialize the user model.
+        """
+        self.name = name
+        self._age = age
+        self.address = address
+        self.__note = note
+        self.code = code
+
+
+class Contact(BaseModel):
+    """
+    Model with a parameter normalized by its value object.
+    """
+
+    def __init__(self, email: EmailAddressValueObject) -> None:
+        """
+        Initialize the contact model.
+        """
+        self.email = email
+
+
+class UpperName(BaseModel):
+    """
+    Model whose constructor does not store its parameter as it is.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize the upper name model.
+        """
+        self.name = name.upper()
+
+
+class Point(FrozenBaseModel):
+    """
+    Frozen model, always created eagerly.
+    """
+
+    x: PositiveIntegerValueObject
+
+
+PRIMITIVES: dict[str, Any] = {'name': 'Ada', 'age': 42, 'address': {'street': 'Main'}, 'note': 'text'}
+
+
+def lazy_user(**overrides: Any) -> User:
+    """
+    Return a lazy user, the first lazy user of the class being created eagerly.
+    """
+    User.from_primitives(primitives=PRIMITIVES, lazy=True)
+    return User.from_primitives(primitives={**PRIMITIVES, **overrides}, lazy=True)
+
+
+@mark.unit_testing
+def test_base_model_lazy_converts_fields_on_first_access() -> None:
+    """
+    Test lazy instances convert each field the first time it is read and keep the converted value.
+    """
+    user = lazy_user()
+
+    assert isinstance(user, User)
+    assert type(user) is not User
+    assert type(user).__name__ == 'User'
+    assert user.__dict__ == {'code': 0}
+
+    name = user.name
+
+    assert name == StringValueObject(value='Ada')
+    assert user.name is name
+    assert user._age == PositiveIntegerValueObject(value=42)
+    assert set(user.__dict__) == {'name', '_age', 'code'}
+
+    with assert_raises(expected_exception=AttributeError, match='User object has no attribute "email".'):
+        user.email  # type: ignore[attr-defined]  # noqa: B018
+
+
+@mark.unit_testing
+def test_base_model_lazy_validates_fields_on_first_access() -> None:
+    """
+    Test lazy instances run the validations of a field when it is read, the trusted ones skip them.
+    """
+    user = lazy_user(age=-1, code=1.5)
+    trusted_user = User.from_primitives(primitives={**PRIMITIVES, 'age': -1}, trusted=True, lazy=True)
+
+    assert user.name == StringValueObject(value='Ada')
+    assert trusted_user._age.value == -1
+
+    with assert_raises(expected_exception=ValueError, match='PositiveIntegerValueObject value <<<-1>>> must be a positive integer.'):  # noqa: E501  # fmt: skip
+        user._age  # noqa: B018
+
+    with assert_raises(expected_exception=TypeError, match='User parameter <<<code>>> value <<<1.5>>> must be of type <<<int | str>>> type.'):  # noqa: E501  # fmt: skip
+        user.code  # noqa: B018
+
+
+@mark.unit_testing
+def test_base_model_lazy_primitives_and_equality_use_stored_primitives() -> None:
+    """
+    Test to_primitives of lazy instances, and equality of lazy instances with equal primitives, use the stored
+    primitives without converting them.
+    """
+    user = lazy_user()
+    eager_user = User.from_primitives(primitives=PRIMITIVES)
+
+    assert user.to_primitives() == eager_user.to_primitives() == {'name': 'Ada', 'age': 42, 'address': {'street': 'Main'}, 'code': 0}  # noqa: E501  # fmt: skip
+    assert user == lazy_user(note='another-text')
+    assert user.__dict__ == {'code': 0}
+
+    user.address  # noqa: B018
+
+    assert user.to_primitives() == eager_user.to_primitives()
+    assert user == eager_user
+    assert eager_user == user
+    assert user != lazy_user(name='Grace')
+    assert user != User.from_primitives(primitives={**PRIMITIVES, 'age': 43})
+
+
+@mark.unit_testing
+def test_base_model_lazy_equality_does_not_depend_on_read_fields() -> None:
+    """
+    Test equality of lazy instances converts the fields not converted yet when the primitives differ or the other
+    field is converted, so it matches the equality of eager instances whatever fields were read.
+    """
+    primitives = {'email': 'Ada@Example.COM'}
+    Contact.from_primitives(primitives=primitives, lazy=True)
+    eager_contact = Contact.from_primitives(primitives=primitives)
+    lowercase_contact = Contact.from_primitives(primitives={'email': 'ada@example.com'}, lazy=True)
+
+    assert Contact.from_primitives(primitives=primitives, lazy=True) == eager_contact
+    assert eager_contact == Contact.from_primitives(primitives=primitives, lazy=True)
+    assert Contact.from_primitives(primitives=primitives, lazy=True) == lowercase_contact
+
+    contact = Contact.from_primitives(primitives=primitives, lazy=True)
+    contact.email  # noqa: B018
+
+    assert contact == eager_contact
+    assert contact == Contact.from_primitives(primitives=primitives, lazy=True)
+
+
+@mark.unit_testing
+def test_base_model_lazy_converts_every_field_for_hash_and_representations() -> None:
+    """
+    Test hashing and representations of lazy instances match the eager instance.
+    """
+    eager_user = User.from_primitives(primitives=PRIMITIVES)
+
+    assert hash(lazy_user()) == hash(eager_user)
+    assert repr(lazy_user()) == repr(eager_user)
+    assert str(lazy_user()) == str(eager_user)
+    assert lazy_user()._to_dict(ignore_private=False) == eager_user._to_dict(ignore_private=False)
+
+
+@mark.unit_testing
+def test_base_model_lazy_nested_models_are_lazy() -> None:
+    """
+    Test nested models of lazy instances are created lazily as well.
+    """
+    lazy_user().address  # noqa: B018
+    address = lazy_user().address
+
+    assert isinstance(address, Address)
+    assert address.__dict__ == {}
+    assert address.street == StringValueObject(value='Main')
+
+
+@mark.unit_testing
+def test_base_model_lazy_copy_and_pickle() -> None:
+    """
+    Test copies of lazy instances are equal to them and pickling restores an eager instance.
+    """
+    user = lazy_user()
+    unpickled = loads(dumps(lazy_user()))  # noqa: S301
+
+    assert copy(user) == user
+    assert deepcopy(user) == user
+    assert type(unpickled) is User
+    assert unpickled == user
+
+
+@mark.unit_testing
+@mark.parametrize(
+    'cls, primitives',
+    [
+        (UpperName, {'name': 'ada'}),
+        (Point, {'x': 1}),
+    ],
+)  # fmt: skip
+def test_base_model_lazy_falls_back_to_eager_construction(cls: type[BaseModel], primitives: dict[str, Any]) -> None:
+    """
+    Test models whose constructor does not only store its parameters, and frozen models, are always created eagerly.
+    """
+    cls.from_primitives(primitives=primitives, lazy=True)
+    model = cls.from_primitives(primitives=primitives, lazy=True)
+
+    assert type(model) is cls
+    assert model == cls.from_primitives(primitives=primitives)
@@ -118,3 +118,22 @@ def test_enumeration_value_object_requires_enum_subclass() -> None:
 
         class _InvalidTypeEnumerationValueObject(EnumerationValueObject[int]):  # type: ignore[type-var]  # pragma: no cover
             pass
+
+
+@mark.unit_testing
+def test_enumeration_value_object_processes_unhashable_raw_values() -> None:
+    """
+    Test that raw values are matched against unhashable enumeration member values and unhashable inputs.
+    """
+
+    class Shape(Enum):
+        POINT = (0,)
+        LINE = [0, 1]  # noqa: RUF012
+
+    class ShapeValueObject(EnumerationValueObject[Shape]):
+        pass
+
+    assert ShapeValueObject(value=[0, 1]).value is Shape.LINE
+    assert ShapeValueObject(value=(0,)).value is Shape.POINT
+    with assert_raises(expected_exception=TypeError, match=r'must be from the enumeration <<<Shape>>>'):
+        ShapeValueObject(value=[1])
@@ -0,0 +1,243 @@
+"""
+Test FrozenBaseModel.
+"""
+
+from __future__ import annotations
+
+from copy import copy, deepcopy
+from inspect import signature
+from pickle import dumps, loads
+from typing import Any, ClassVar
+
+from pytest import mark, raises as assert_raises
+
+from value_object_pattern import BaseModel, FrozenBaseModel, frozen_field
+from value_object_pattern.usables import PositiveIntegerValueObject, StringValueObject
+
+
+class Account(FrozenBaseModel):
+    """
+    Frozen model with public, single-underscore, private and defaulted fields.
+    """
+
+    name: StringValueObject
+    _age: PositiveIntegerValueObject = frozen_field(alias='age')
+    __note: str = frozen_field(alias='note')
+    active: bool = True
+    kind: ClassVar[str] = 'account'
+
+
+class AdminAccount(Account):
+    """
+    Frozen model inheriting the fields of its parent.
+    """
+
+    level: int = 1
+
+
+class Team(FrozenBaseModel):
+    """
+    Frozen model nesting other frozen models.
+    """
+
+    owner: Account
+    members: list[Account]
+
+
+def build_account(*, note: str = 'note', age: int = 42) -> Account:
+    """
+    Build an account.
+    """
+    return Account(name=StringValueObject(value='Ada'), age=PositiveIntegerValueObject(value=age), note=note)
+
+
+@mark.unit_testing
+def test_frozen_base_model_generates_keyword_only_constructor() -> None:
+    """
+    Test FrozenBaseModel generates a keyword-only constructor named after the public key of each field.
+    """
+    assert str(signature(Account.__init__)) == '(self, *, name, age, note, active=True)'
+    assert str(signature(AdminAccount.__init__)) == '(self, *, name, age, note, active=True, level=1)'
+
+    with assert_raises(expected_exception=TypeError):
+        Account(StringValueObject(value='Ada'))  # type: ignore[call-arg]
+
+
+@mark.unit_testing
+def test_frozen_base_model_field_alias_and_default() -> None:
+    """
+    Test frozen_field renames the constructor parameter and public key of a field and sets its default value.
+    """
+
+    class Setting(FrozenBaseModel):
+        key: str = frozen_field(alias='name')
+        amount: int = frozen_field(default=1)
+
+    setting = Setting(name='timeout')
+
+    assert str(signature(Setting.__init__)) == '(self, *, name, amount=1)'
+    assert setting.key == 'timeout'
+    assert setting.to_primitives() == {'name': 'timeout', 'amount': 1}
+    assert Setting.from_primitives(primitives={'name': 'timeout'}) == setting
+
+
+@mark.unit_testing
+def test_frozen_base_model_stores_fields_in_slots() -> None:
+    """
+    Test FrozenBaseModel stores fields in slots, without an instance dictionary, and ClassVar annotations stay on the
+    class.
+    """
+    account = build_account()
+
+    assert Account.__dict__['__slots__'] == ('name', '_age', '_Account__note', 'active')
+    assert AdminAccount.__dict__['__slots__'] == ('level',)
+    assert not hasattr(account, '__dict__')
+    assert account.kind == 'account'
+    assert account.active is True
+
+
+@mark.unit_testing
+def test_frozen_base_model_cannot_be_modified() -> None:
+    """
+    Test FrozenBaseModel fields can't be reassigned, added or deleted.
+    """
+    account = build_account()
+
+    with assert_raises(expected_exception=AttributeError, match='Cannot modify attribute "name" of immutable instance.'):  # noqa: E501  # fmt: skip
+        account.name = StringValueObject(value='Grace')
+
+    with assert_raises(expected_exception=AttributeError, match='Account object has no attribute "email".'):
+        account.email = 'ada@example.com'
+
+    with assert_raises(expected_exception=AttributeError, match='Cannot delete attribute "name" of immutable instance.'):  # noqa: E501  # fmt: skip
+        del account.name
+
+
+@mark.unit_testing
+def test_frozen_base_model_excludes_private_fields() -> None:
+    """
+    Test FrozenBaseModel excludes double-underscore private fields from equality, hashing and representations.
+    """
+    account = build_account(note='note')
+    same_public_account = build_account(note='another-note')
+
+    assert account == same_public_account
+    assert hash(account) == hash(same_public_account)
+    assert account != build_account(age=43)
+    assert account != object()
+    assert repr(account) == "Account(active=True, age=PositiveIntegerValueObject(value=42), name=StringValueObject(value='Ada'))"  # noqa: E501  # fmt: skip
+    assert str(account) == 'Account(active=True, age=42, name=Ada)'
+    assert account.to_primitives() == {'name': 'Ada', 'age': 42, 'active': True}
+    assert account._to_dict(ignore_private=False)['note'] == 'note'
+
+
+@mark.unit_testing
+def test_frozen_base_model_caches_hash() -> None:
+    """
+    Test FrozenBaseModel computes the hash once and stores it in the instance.
+    """
+    account = build_account()
+
+    assert hash(account) == hash(account) == account._frozen_hash
+
+
+@mark.unit_testing
+def test_frozen_base_model_subclass_keeps_parent_private_fields_private() -> None:
+    """
+    Test FrozenBaseModel subclasses keep the private fields of their parents out of representations and primitives.
+    """
+    admin = AdminAccount(name=StringValueObject(value='Ada'), age=PositiveIntegerValueObject(value=42), note='pw')
+
+    assert admin.to_primitives() == {'name': 'Ada', 'age': 42, 'active': True, 'level': 1}
+    assert str(admin) == 'AdminAccount(active=True, age=42, level=1, name=Ada)'
+    assert admin != build_account()
+
+
+@mark.unit_testing
+def test_frozen_base_model_primitives_round_trip() -> None:
+    """
+    Test FrozenBaseModel converts to primitives and back, including nested frozen models.
+    """
+    team = Team(owner=build_account(), members=[build_account(age=30)])
+    primitives = {
+        'owner': {'name': 'Ada', 'age': 42, 'note': 'note', 'active': True},
+        'members': [{'name': 'Ada', 'age': 30, 'note': 'note', 'active': True}],
+    }
+
+    assert team.to_primitives() == {
+        'owner': {'name': 'Ada', 'age': 42, 'active': True},
+        'members': [{'name': 'Ada', 'age': 30, 'active': True}],
+    }
+    assert Team.from_primitives(primitives=primitives) == team
+    assert Team.__dict__['_compiled_to_primitives'] is not None
+
+
+@mark.unit_testing
+def test_frozen_base_model_copy_and_pickle() -> None:
+    """
+    Test FrozenBaseModel shallow copies return the instance and deep copies and pickling rebuild it.
+    """
+    team = Team(owner=build_account(), members=[build_account()])
+    clone = deepcopy(team)
+    unpickled = loads(dumps(team))  # noqa: S301
+
+    assert copy(team) is team
+    assert clone == team
+    assert clone.members is not team.members
+    assert unpickled == team
+    assert unpickled.owner._to_dict(ignore_private=False)['note'] == 'note'
+
+
+@mark.unit_testing
+def test_frozen_base_model_custom_constructor() -> None:
+    """
+    Test FrozenBaseModel keeps a constructor defined by the class.
+    """
+
+    class Point(FrozenBaseModel):
+        x: int
+        y: int
+
+        def __init__(self, x: int, y: int) -> None:
+            object.__setattr__(self, 'x', x)
+            object.__setattr__(self, 'y', y)
+
+    point = Point(1, 2)
+
+    assert not Point._generated_init
+    assert point == Point.from_primitives(primitives={'x': 1, 'y': 2})
+    assert point.to_primitives() == {'x': 1, 'y': 2}
+
+
+@mark.unit_testing
+def test_frozen_base_model_is_a_base_model() -> None:
+    """
+    Test FrozenBaseModel instances are BaseModel instances and FrozenBaseModel itself is abstract.
+    """
+    assert isinstance(build_account(), BaseModel)
+
+    with assert_raises(expected_exception=TypeError):
+        FrozenBaseModel()  # type: ignore[abstract]
+
+
+@mark.unit_testing
+@mark.parametrize(
+    'namespace, message',
+    [
+        ({'__slots__': ('x',), '__annotations__': {'x': 'int'}}, 'FrozenBaseModel <<<Invalid>>> must not declare __slots__, they are derived from its annotations.'),  # noqa: E501
+        ({'__annotations__': {'x': 'int', '_x': 'int'}}, 'FrozenBaseModel <<<Invalid>>> field <<<_x>>> constructor parameter <<<x>>> is already used by another field.'),  # noqa: E501
+        ({'__annotations__': {'x': 'int', 'y': 'int'}, 'y': frozen_field(alias='x')}, 'FrozenBaseModel <<<Invalid>>> field <<<y>>> constructor parameter <<<x>>> is already used by another field.'),  # noqa: E501
+        ({'__annotations__': {'_x': 'int'}, '_x': frozen_field(alias='class')}, 'FrozenBaseModel <<<Invalid>>> field <<<_x>>> alias <<<class>>> must be a valid identifier.'),  # noqa: E501
+        ({'__annotations__': {'x': 'dict'}, 'x': {}}, 'FrozenBaseModel <<<Invalid>>> field <<<x>>> default <<<{}>>> is mutable, it would be shared between instances.'),  # noqa: E501
+        ({'__annotations__': {'x': 'list'}, 'x': frozen_field(default=[])}, 'FrozenBaseModel <<<Invalid>>> field <<<x>>> default <<<\\[\\]>>> is mutable, it would be shared between instances.'),  # noqa: E501
+    ],
+)  # fmt: skip
+def test_frozen_base_model_rejects_invalid_declarations(namespace: dict[str, Any], message: str) -> None:
+    """
+    Test FrozenBaseModel rejects classes declaring their own slots, fields sharing a constructor parameter, invalid
+    aliases or mutable default values.
+    """
+    metaclass: type = type(FrozenBaseModel)
+
+    with assert_raises(expected_exception=TypeError, match=message):
+        metaclass('Invalid', (FrozenBaseModel,), namespace)
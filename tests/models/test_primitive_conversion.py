@@ -11,13 +11,14 @@ if version_info >= (3, 12):
 else:
     from typing_extensions import override  # pragma: no cover
 
-from enum import Enum
+from enum import Enum, IntEnum
+from typing import Any
 
 from pytest import mark, raises as assert_raises
 
 from value_object_pattern import BaseModel, UnionValueObject, ValueObject
 from value_object_pattern.models.collections import DictValueObject, ListValueObject
-from value_object_pattern.models.primitive_conversion import from_primitive, to_primitive
+from value_object_pattern.models.primitive_conversion import compile_to_primitive, from_primitive, to_primitive
 
 
 class SelfToPrimitives:
@@ -123,6 +124,15 @@ class Status(Enum):
     OFF = 'off'
 
 
+class Priority(IntEnum):
+    """
+    Integer enumeration whose members are primitives themselves.
+    """
+
+    LOW = 1
+    HIGH = 2
+
+
 class Tag(BaseModel):
     """
     Simple model used in union from_primitives tests.
@@ -705,3 +715,36 @@ def test_from_primitive_to_primitives_fallback_returns_raw_value_when_conversion
     source = ToPrimitivesInvalidPayload()
 
     assert from_primitive(value=source, expected_type=ClassWithStrictFromPrimitives) is source
+
+
+@mark.unit_testing
+@mark.parametrize(
+    'expected_type, value',
+    [
+        (Number, Number(value=1)),
+        (Number, 'raw'),
+        (Status, Status.ON),
+        (Priority, Priority.HIGH),
+        (LeafModel, LeafModel(code=Number(value=2))),
+        (LeafModel, SelfValueAttribute()),
+        (NumberList, NumberList(value=[Number(value=3)])),
+        (list[Number], [Number(value=4), 'raw']),
+        (list[Number], (Number(value=5),)),
+        (tuple[Number, ...], (Number(value=6),)),
+        (tuple[Number, str], (Number(value=7), 'raw')),
+        (set[Number], {Number(value=8)}),
+        (frozenset[Number], frozenset((Number(value=9),))),
+        (dict[str, list[LeafModel]], {'a': [LeafModel(code=Number(value=10))]}),
+        (Number | None, None),
+        (Number | None, Number(value=11)),
+        (Number | str, Number(value=12)),
+        ('Number', Number(value=13)),
+        (str, 'raw'),
+    ],
+)  # fmt: skip
+def test_compile_to_primitive_matches_to_primitive(expected_type: Any, value: Any) -> None:
+    """
+    Test compiled converters return the same primitives as to_primitive, including for values that do not match their
+    annotation.
+    """
+    assert compile_to_primitive(expected_type=expected_type)(value) == to_primitive(value=value)
@@ -0,0 +1,86 @@
+"""
+Test ValidationFailure structured validation errors.
+"""
+
+from json import dumps as dumps_json
+from pickle import dumps, loads
+
+from pytest import mark, raises as assert_raises
+
+from value_object_pattern import ValidationFailure
+from value_object_pattern.usables import PositiveIntegerValueObject, TrimmedStringValueObject
+
+
+@mark.unit_testing
+def test_validation_failure_carries_structured_fields() -> None:
+    """
+    Test that a failing validation stores the class, title, parameter, raw value and code of the failure.
+    """
+    with assert_raises(expected_exception=ValueError) as error:
+        PositiveIntegerValueObject(value=-1, title='Age', parameter='years')
+
+    failure = error.value.validation_failure  # type: ignore[attr-defined]
+
+    assert isinstance(failure, ValidationFailure)
+    assert failure.value_object_class is PositiveIntegerValueObject
+    assert failure.title == 'Age'
+    assert failure.parameter == 'years'
+    assert failure.value == -1
+    assert failure.code == '_ensure_value_is_positive_integer'
+
+
+@mark.unit_testing
+def test_validation_failure_keeps_the_message_as_the_error_argument() -> None:
+    """
+    Test that the error argument is the rendered message string and the failure carries the same message.
+    """
+    with assert_raises(expected_exception=ValueError) as error:
+        TrimmedStringValueObject(value=' a ', title='User', parameter='name')
+
+    message = 'User name <<< a >>> contains leading or trailing whitespaces. Only trimmed values are allowed.'
+
+    assert error.value.args == (message,)
+    assert type(error.value.args[0]) is str
+    assert dumps_json(error.value.args) == dumps_json([message])
+    assert str(error.value) == message
+    assert error.value.validation_failure.message == message  # type: ignore[attr-defined]
+    assert str(error.value.validation_failure) == message  # type: ignore[attr-defined]
+
+
+@mark.unit_testing
+def test_validation_failure_replaces_overlapping_class_names_once() -> None:
+    """
+    Test that class names contained in other class names of the hierarchy are not replaced twice.
+    """
+    with assert_raises(expected_exception=ValueError) as error:
+        PositiveIntegerValueObject(value=-1)
+
+    assert str(error.value) == 'PositiveIntegerValueObject value <<<-1>>> must be a positive integer.'
+
+
+@mark.unit_testing
+def test_validation_failure_representation() -> None:
+    """
+    Test that the failure representation shows its class, code and message.
+    """
+    with assert_raises(expected_exception=TypeError) as error:
+        PositiveIntegerValueObject(value='a')  # type: ignore[arg-type]
+
+    message = 'PositiveIntegerValueObject value <<<a>>> must be an integer. Got <<<str>>> type.'
+
+    assert repr(error.value) == f'TypeError({message!r})'
+    assert repr(error.value.validation_failure) == f"ValidationFailure(value_object_class=PositiveIntegerValueObject, code='_ensure_value_is_integer', message={message!r})"  # type: ignore[attr-defined]  # noqa: E501  # fmt: skip
+
+
+@mark.unit_testing
+def test_validation_failure_survives_pickling() -> None:
+    """
+    Test that errors carrying a failure can cross process boundaries.
+    """
+    with assert_raises(expected_exception=ValueError) as error:
+        PositiveIntegerValueObject(value=-1, title='Age')
+
+    unpickled = loads(dumps(error.value))  # noqa: S301
+
+    assert str(unpickled) == 'Age value <<<-1>>> must be a positive integer.'
+    assert unpickled.validation_failure.code == '_ensure_value_is_positive_integer'
@@ -1219,18 +1219,29 @@ def test_value_object_d_validation_order() -> None:
 
 
 @mark.unit_testing
-def test_value_object_copy_returns_new_instance_with_same_metadata() -> None:
+def test_value_object_copy_returns_same_instance_for_immutable_values() -> None:
     """
-    Test that __copy__ creates a new instance preserving value, title and parameter.
+    Test that __copy__ and __deepcopy__ return the value object itself when its value is immutable.
     """
     value_object = IntegerValueObject(value=7, title='NumberTitle', parameter='number')
 
+    assert copy(value_object) is value_object
+    assert deepcopy(value_object) is value_object
+
+
+@mark.unit_testing
+def test_value_object_copy_returns_new_instance_with_same_metadata_for_mutable_values() -> None:
+    """
+    Test that __copy__ creates a new instance sharing the mutable value and preserving title and parameter.
+    """
+    value_object = ListValueObject(value=[1, 2], title='ListTitle', parameter='items')
+
     clone = copy(value_object)
 
     assert clone is not value_object
-    assert clone.value == 7
-    assert clone.title == 'NumberTitle'
-    assert clone.parameter == 'number'
+    assert clone.value is value_object.value
+    assert clone.title == 'ListTitle'
+    assert clone.parameter == 'items'
 
 
 @mark.unit_testing
@@ -1285,10 +1296,10 @@ def test_value_object_type_returns_any_when_no_generic_arguments_are_available()
         pass
 
     original_bases = NoArgsValueObject.__orig_bases__  # type: ignore[attr-defined]
-    NoArgsValueObject.__orig_bases__ = (_Placeholder,)  # type: ignore[attr-defined]
+    NoArgsValueObject.__orig_bases__ = (_Placeholder,)
 
     try:
         assert NoArgsValueObject.type() is Any  # type: ignore[comparison-overlap]
 
     finally:
-        NoArgsValueObject.__orig_bases__ = original_bases  # type: ignore[attr-defined]
+        NoArgsValueObject.__orig_bases__ = original_bases
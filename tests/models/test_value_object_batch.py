@@ -0,0 +1,98 @@
+"""
+Test ValueObject batch construction.
+"""
+
+from typing import Any
+
+from pytest import mark, raises as assert_raises
+
+from value_object_pattern import BatchResult, ValidationFailure
+from value_object_pattern.usables import IntegerValueObject, PositiveIntegerValueObject, StringValueObject
+
+
+@mark.unit_testing
+def test_value_object_validate_many_collects_errors_by_index() -> None:
+    """
+    Test that valid instances keep their input order and every rejected value is reported by index.
+    """
+    result = PositiveIntegerValueObject.validate_many(values=iter([1, -2, 3, 'a']), title='Age')
+
+    assert isinstance(result, BatchResult)
+    assert result.instances == [PositiveIntegerValueObject(value=1), PositiveIntegerValueObject(value=3)]
+    assert result.instances[0].title == 'Age'
+    assert result.indexes == [0, 2]
+    assert sorted(result.errors) == [1, 3]
+    assert type(result.errors[1]) is ValueError
+    assert type(result.errors[3]) is TypeError
+    assert str(result.errors[1]) == 'Age value <<<-2>>> must be a positive integer.'
+    assert isinstance(result.errors[1].validation_failure, ValidationFailure)  # type: ignore[attr-defined]
+    assert result.errors[1].validation_failure.value == -2  # type: ignore[attr-defined]
+    assert result.errors[1].__traceback__ is None
+    assert repr(result) == 'BatchResult(instances=2, errors=2)'
+
+
+@mark.unit_testing
+def test_value_object_from_many_raises_first_error_with_its_index() -> None:
+    """
+    Test that the default mode raises the first rejected value with a note telling its index.
+    """
+    with assert_raises(expected_exception=ValueError, match='PositiveIntegerValueObject value <<<-2>>> must be a positive integer.') as error:  # noqa: E501  # fmt: skip
+        PositiveIntegerValueObject.from_many(values=[1, -2, -3])
+
+    assert error.value.__notes__ == ['PositiveIntegerValueObject batch index <<<1>>>']
+
+
+@mark.unit_testing
+def test_value_object_from_many_skips_rejected_values() -> None:
+    """
+    Test that the skip mode only returns the valid instances.
+    """
+    integers = PositiveIntegerValueObject.from_many(values=[1, -2, 3], errors='skip')
+    result = PositiveIntegerValueObject.validate_many(values=[1, -2], errors='skip')
+
+    assert integers == [PositiveIntegerValueObject(value=1), PositiveIntegerValueObject(value=3)]
+    assert result.errors == {}
+
+
+@mark.unit_testing
+def test_value_object_validate_many_uses_class_caches_and_custom_constructors() -> None:
+    """
+    Test that interned classes and classes with their own constructor are built through the class call.
+    """
+
+    class Port(IntegerValueObject, intern=True):
+        pass
+
+    class Name(StringValueObject):
+        def __init__(self, *, value: str, title: str | None = None, parameter: str | None = None) -> None:
+            super().__init__(value=value.strip(), title=title, parameter=parameter)
+
+    ports = Port.from_many(values=[80, 80])
+
+    assert ports[0] is ports[1]
+    assert Name.from_many(values=[' a ']) == [Name(value='a')]
+
+
+@mark.unit_testing
+@mark.parametrize(
+    'keywords, message',
+    [
+        ({'errors': 'ignore'}, 'ValueObject errors <<<ignore>>> must be one of <<<raise, collect, skip>>>.'),
+        ({'title': ''}, 'ValueObject title <<<>>> must not be an empty string.'),
+    ],
+)
+def test_value_object_validate_many_rejects_invalid_arguments_once(keywords: dict[str, Any], message: str) -> None:
+    """
+    Test that invalid modes and metadata are raised before any value is constructed.
+    """
+    with assert_raises(expected_exception=ValueError, match=message):
+        IntegerValueObject.validate_many(values=[1, 2], **keywords)
+
+
+@mark.unit_testing
+def test_value_object_from_many_rejects_collect_mode() -> None:
+    """
+    Test that `from_many` only accepts the modes that return a list of instances.
+    """
+    with assert_raises(expected_exception=ValueError, match='ValueObject errors <<<collect>>> must be one of <<<raise, skip>>>.'):  # noqa: E501  # fmt: skip
+        IntegerValueObject.from_many(values=[1], errors='collect')  # type: ignore[arg-type]
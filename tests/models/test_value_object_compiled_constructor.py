@@ -0,0 +1,224 @@
+"""
+Test ValueObject generated straight-line constructors.
+"""
+
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+from typing import Any
+
+from pytest import MonkeyPatch, mark, raises as assert_raises
+
+from value_object_pattern import ValueObject, process, validation
+from value_object_pattern.usables import IntegerValueObject, TrimmedStringValueObject
+
+
+class RecordingValueObject(ValueObject[str]):
+    """
+    Value object that records the order in which its hooks are executed.
+    """
+
+    calls: list[str] = []  # noqa: RUF012
+
+    @validation(order=0)
+    def _first_validation(self, value: str) -> None:
+        self.calls.append(f'validation-0:{value}')
+
+    @validation(order=1, early_process=True)
+    def _early_validation(self, value: str, processed_value: str) -> None:
+        self.calls.append(f'validation-1:{value}:{processed_value}')
+
+    @validation(order=2, early_process=True)
+    def _second_early_validation(self, value: str, processed_value: str) -> None:
+        self.calls.append(f'validation-2:{value}:{processed_value}')
+
+    @process(order=0)
+    def _upper(self, value: str) -> str:
+        self.calls.append(f'process-0:{value}')
+        return value.upper()
+
+
+class GenericConstructorValueObject(ValueObject[int], compiled=False):
+    """
+    Value object that opts out of the generated constructor.
+    """
+
+
+class CustomInitValueObject(ValueObject[int]):
+    """
+    Value object that defines its own constructor.
+    """
+
+    def __init__(self, *, value: int) -> None:
+        """
+        Double the value before constructing.
+        """
+        super().__init__(value=value * 2)
+
+
+class CustomInitChildValueObject(CustomInitValueObject):
+    """
+    Value object that inherits a custom constructor.
+    """
+
+
+class CustomEarlyProcessValueObject(ValueObject[str]):
+    """
+    Value object that overrides early_process.
+    """
+
+    @validation(order=0, early_process=True)
+    def _ensure_processed_value_is_marked(self, value: str, processed_value: str) -> None:
+        if not processed_value.endswith('-early'):
+            raise ValueError(f'CustomEarlyProcessValueObject value <<<{value}>>> was not early processed.')
+
+    @override
+    def early_process(self, value: str) -> str:
+        return value + '-early'
+
+
+@mark.unit_testing
+def test_value_object_compiled_constructor_is_installed_on_first_construction() -> None:
+    """
+    Test that a generated constructor is installed on the concrete class after the first construction.
+    """
+    IntegerValueObject(value=1)
+
+    constructor = IntegerValueObject.__dict__['__init__']
+
+    assert constructor._is_compiled_constructor is True
+    assert constructor.__qualname__ == 'IntegerValueObject.__init__'
+    assert IntegerValueObject(value=2).value == 2
+
+
+@mark.unit_testing
+def test_value_object_compiled_constructor_keeps_hook_order_and_early_process_wiring() -> None:
+    """
+    Test that the generated constructor processes once, right before the first early process validation.
+    """
+    RecordingValueObject.calls = []
+
+    value_object = RecordingValueObject(value='a')
+
+    assert value_object.value == 'A'
+    assert RecordingValueObject.calls == [
+        'validation-0:a',
+        'process-0:a',
+        'validation-1:a:A',
+        'validation-2:a:A',
+    ]
+
+
+@mark.unit_testing
+def test_value_object_compiled_constructor_rewrites_errors_with_title_and_parameter() -> None:
+    """
+    Test that the generated constructor rewrites validation errors with the custom title and parameter.
+    """
+    with assert_raises(
+        expected_exception=ValueError,
+        match=r'User name <<< a >>> contains leading or trailing whitespaces. Only trimmed values are allowed.',
+    ):
+        TrimmedStringValueObject(value=' a ', title='User', parameter='name')
+
+
+@mark.unit_testing
+def test_value_object_compiled_constructor_validates_metadata() -> None:
+    """
+    Test that the generated constructor validates custom titles.
+    """
+    TrimmedStringValueObject(value='a')
+
+    with assert_raises(
+        expected_exception=ValueError,
+        match=r'ValueObject title <<<.*>>> must not be an empty string.',
+    ):
+        TrimmedStringValueObject(value='a', title='')
+
+
+@mark.unit_testing
+def test_value_object_compiled_constructor_can_be_disabled() -> None:
+    """
+    Test that `compiled=False` keeps the generic constructor.
+    """
+    value_object = GenericConstructorValueObject(value=1)
+
+    assert value_object.value == 1
+    assert '__init__' not in GenericConstructorValueObject.__dict__
+    assert GenericConstructorValueObject._resolve_hook_plan().constructor is None
+
+
+@mark.unit_testing
+def test_value_object_compiled_constructor_raises_type_error_when_compiled_is_not_boolean() -> None:
+    """
+    Test that the `compiled` class keyword must be a boolean.
+    """
+    compiled: Any = 'yes'
+
+    with assert_raises(
+        expected_exception=TypeError,
+        match=r'ValueObject compiled <<<yes>>> must be a boolean. Got <<<str>>> type.',
+    ):
+
+        class _InvalidValueObject(ValueObject[int], compiled=compiled):
+            pass
+
+
+@mark.unit_testing
+def test_value_object_compiled_constructor_honors_custom_init() -> None:
+    """
+    Test that classes defining or inheriting a custom `__init__` keep it.
+    """
+    assert CustomInitValueObject(value=2).value == 4
+    assert CustomInitChildValueObject(value=3).value == 6
+    assert CustomInitChildValueObject.__dict__.get('__init__') is None
+
+
+@mark.unit_testing
+def test_value_object_compiled_constructor_delegates_subclasses_reaching_it_through_super() -> None:
+    """
+    Test that a parent generated constructor reached through `super()` runs the subclass hooks.
+    """
+    IntegerValueObject(value=1)
+
+    class DoubledIntegerValueObject(IntegerValueObject):
+        def __init__(self, *, value: int) -> None:
+            super().__init__(value=value)
+
+        @process(order=0)
+        def _double(self, value: int) -> int:
+            return value * 2
+
+    assert DoubledIntegerValueObject(value=2).value == 4
+
+    with assert_raises(expected_exception=TypeError, match=r'DoubledIntegerValueObject value <<<a>>>'):
+        DoubledIntegerValueObject(value='a')  # type: ignore[arg-type]
+
+
+@mark.unit_testing
+def test_value_object_compiled_constructor_uses_overridden_early_process() -> None:
+    """
+    Test that an overridden `early_process` is still called by the generated constructor.
+    """
+    assert CustomEarlyProcessValueObject(value='a').value == 'a-early'
+
+
+@mark.unit_testing
+def test_value_object_compiled_constructor_is_regenerated_after_monkeypatching(monkeypatch: MonkeyPatch) -> None:
+    """
+    Test that monkeypatching a hook drops the generated constructor.
+    """
+    RecordingValueObject(value='a')
+    constructor = RecordingValueObject.__dict__['__init__']
+
+    @process(order=0)
+    def _upper(self: RecordingValueObject, value: str) -> str:
+        return value + '-patched'
+
+    monkeypatch.setattr(RecordingValueObject, '_upper', _upper)
+
+    assert RecordingValueObject(value='a').value == 'a-patched'
+    assert RecordingValueObject.__dict__['__init__'] is not constructor
@@ -0,0 +1,204 @@
+"""
+Test ValueObject constraint fusion.
+"""
+
+from re import Pattern, compile as re_compile
+from typing import Any
+
+from pytest import mark, raises as assert_raises
+
+from value_object_pattern import ValueObject, disable_instrumentation, enable_instrumentation, validation
+from value_object_pattern.decorators import Constraint
+from value_object_pattern.usables import SnakeCaseStringValueObject
+from value_object_pattern.usables.internet import UserAgentValueObject
+
+
+class ShortCodeValueObject(ValueObject[str]):
+    """
+    Value object whose constraints are fused, except the last one that uses early processing.
+    """
+
+    @validation(order=0, constraint=Constraint.exact_type(expected=str))
+    def _ensure_value_is_string(self, value: str) -> None:
+        if type(value) is not str:
+            raise TypeError(f'ShortCodeValueObject value <<<{value}>>> must be a string.')
+
+    @validation(order=1, constraint=Constraint.length(minimum=2, maximum=4))
+    def _ensure_value_length(self, value: str) -> None:
+        if not 2 <= len(value) <= 4:
+            raise ValueError(f'ShortCodeValueObject value <<<{value}>>> must have between 2 and 4 characters.')
+
+    @validation(order=2, early_process=True, constraint=Constraint.not_empty())
+    def _ensure_processed_value_is_not_empty(self, value: str, processed_value: str) -> None:
+        if not processed_value:  # pragma: no cover
+            raise ValueError(f'ShortCodeValueObject value <<<{value}>>> is empty.')
+
+
+class StrictConstraintValueObject(ValueObject[str]):
+    """
+    Value object whose constraints are stricter than its hooks.
+    """
+
+    @validation(order=0, constraint=Constraint.exact_type(expected=str))
+    def _ensure_value_is_string(self, value: str) -> None:
+        if type(value) is not str:  # pragma: no cover
+            raise TypeError(f'StrictConstraintValueObject value <<<{value}>>> must be a string.')
+
+    @validation(order=1, constraint=Constraint.charset(characters='abc'))
+    def _ensure_value_is_not_numeric(self, value: str) -> None:
+        if value.isdigit():  # pragma: no cover
+            raise ValueError(f'StrictConstraintValueObject value <<<{value}>>> must not be numeric.')
+
+
+class DottedSnakeCaseValueObject(SnakeCaseStringValueObject):
+    """
+    Snake case value object overriding the pattern of its parent.
+    """
+
+    _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'^[a-z0-9]+(?:[_.][a-z0-9]+)*$')
+
+
+@mark.unit_testing
+def test_value_object_constraints_are_fused_into_one_validation() -> None:
+    """
+    Test that consecutive validations with a constraint are fused into one hook that keeps their names.
+    """
+    plan = UserAgentValueObject._resolve_hook_plan()
+
+    assert len(plan.validations) == 1
+    assert plan.validation_names == {
+        '_ensure_value_is_string',
+        '_ensure_value_is_not_empty_string',
+        '_ensure_value_is_printable',
+        '_ensure_value_is_trimmed',
+    }
+
+
+@mark.unit_testing
+@mark.parametrize(
+    'value, exception, code, message',
+    [
+        (5, TypeError, '_ensure_value_is_string', 'UserAgentValueObject value <<<5>>> must be a string. Got <<<int>>> type.'),  # noqa: E501
+        ('', ValueError, '_ensure_value_is_not_empty_string', 'UserAgentValueObject value <<<>>> is an empty string. Only non-empty strings are allowed.'),  # noqa: E501
+        (' agent', ValueError, '_ensure_value_is_trimmed', 'UserAgentValueObject value <<< agent>>> contains leading or trailing whitespaces. Only trimmed values are allowed.'),  # noqa: E501
+        ('agent\x00', ValueError, '_ensure_value_is_printable', 'UserAgentValueObject value <<<agent\x00>>> contains invalid characters. Only printable characters are allowed.'),  # noqa: E501
+    ],
+)  # fmt: skip
+def test_value_object_fused_constraints_report_the_failing_hook(
+    value: Any,
+    exception: type[Exception],
+    code: str,
+    message: str,
+) -> None:
+    """
+    Test that a fused validation raises the error and failure code of the first failing hook.
+    """
+    with assert_raises(expected_exception=exception) as error:
+        UserAgentValueObject(value=value)
+
+    assert str(error.value) == message
+    assert error.value.validation_failure.code == code  # type: ignore[attr-defined]
+
+
+@mark.unit_testing
+def test_value_object_fused_constraints_keep_unfused_hooks_in_order() -> None:
+    """
+    Test that early process validations are not fused and still run after the fused hook.
+    """
+    plan = ShortCodeValueObject._resolve_hook_plan()
+
+    assert [early_process for _, early_process in plan.validations] == [False, True]
+    assert ShortCodeValueObject(value='ab').value == 'ab'
+
+    with assert_raises(
+        expected_exception=ValueError,
+        match='ShortCodeValueObject value <<<abcde>>> must have between 2 and 4 characters.',
+    ) as error:
+        ShortCodeValueObject(value='abcde')
+
+    assert error.value.validation_failure.code == '_ensure_value_length'  # type: ignore[attr-defined]
+
+
+@mark.unit_testing
+def test_value_object_single_constraint_is_not_fused() -> None:
+    """
+    Test that a single validation with a constraint is called directly.
+    """
+
+    class NamedValueObject(ValueObject[str]):
+        @validation(constraint=Constraint.length(maximum=8))
+        def _ensure_value_is_short(self, value: str) -> None:
+            if len(value) > 8:  # pragma: no cover
+                raise ValueError(f'NamedValueObject value <<<{value}>>> is too long.')
+
+    [(hook, _)] = NamedValueObject._resolve_hook_plan().validations
+
+    assert hook is NamedValueObject.__dict__['_ensure_value_is_short']
+
+
+@mark.unit_testing
+def test_value_object_constraint_stricter_than_hook_falls_back_to_hooks() -> None:
+    """
+    Test that a value rejected by a constraint but accepted by its hook is accepted.
+    """
+    assert StrictConstraintValueObject(value='xyz').value == 'xyz'
+
+
+@mark.unit_testing
+def test_value_object_regex_constraint_reads_the_subclass_pattern() -> None:
+    """
+    Test that regex constraints use the pattern of the concrete class.
+    """
+    assert DottedSnakeCaseValueObject(value='organization.api_keys').value == 'organization.api_keys'
+
+    with assert_raises(expected_exception=ValueError):
+        SnakeCaseStringValueObject(value='organization.api_keys')
+
+
+@mark.unit_testing
+def test_value_object_constraints_are_not_fused_while_instrumented() -> None:
+    """
+    Test that every hook is kept on its own while instrumentation is enabled, so it is timed by name.
+    """
+    enable_instrumentation()
+    try:
+        assert len(UserAgentValueObject._resolve_hook_plan().validations) == 4
+
+    finally:
+        disable_instrumentation()
+
+    assert len(UserAgentValueObject._resolve_hook_plan().validations) == 1
+
+
+@mark.unit_testing
+@mark.parametrize(
+    'factory, exception, message',
+    [
+        (lambda: Constraint.exact_type(expected='str'), TypeError, 'Constraint expected <<<str>>> must be a type. Got <<<str>>> type.'),  # type: ignore[arg-type]  # noqa: E501
+        (lambda: Constraint.character_class(method='strip'), ValueError, 'Constraint method <<<strip>>> must be one of'),  # noqa: E501
+        (lambda: Constraint.length(), ValueError, 'Constraint length must have a minimum or a maximum.'),
+        (lambda: Constraint.length(minimum=1.5), TypeError, 'Constraint length bound <<<1.5>>> must be an integer. Got <<<float>>> type.'),  # type: ignore[arg-type]  # noqa: E501
+        (lambda: validation(constraint='trimmed')(lambda self, value: None), TypeError, 'Validation constraint <<<trimmed>>> must be a Constraint. Got <<<str>>> type.'),  # type: ignore[arg-type]  # noqa: E501
+    ],
+)  # fmt: skip
+def test_value_object_constraint_rejects_invalid_arguments(
+    factory: Any,
+    exception: type[Exception],
+    message: str,
+) -> None:
+    """
+    Test that invalid constraint arguments are rejected.
+    """
+    with assert_raises(expected_exception=exception, match=message):
+        factory()
+
+
+@mark.unit_testing
+def test_value_object_constraint_rejects_unknown_kind() -> None:
+    """
+    Test that rendering a constraint of an unknown kind raises a ValueError instead of falling back to a regex.
+    """
+    constraint = Constraint(kind='uppercase')
+
+    with assert_raises(expected_exception=ValueError, match='Constraint kind <<<uppercase>>> is not supported.'):
+        constraint.render(owner=str, name='constraint_0', namespace={})
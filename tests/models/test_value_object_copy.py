@@ -0,0 +1,111 @@
+"""
+Test ValueObject copy and deepcopy without validation.
+"""
+
+from copy import copy, deepcopy
+from typing import Any
+
+from pytest import mark
+
+from value_object_pattern import BaseModel, ValueObject, validation
+from value_object_pattern.usables import PositiveIntegerValueObject, StringValueObject
+
+
+class CountingValueObject(ValueObject[Any]):
+    """
+    Value object that counts its validations.
+    """
+
+    validations = 0
+
+    @validation(order=0)
+    def _count(self, value: Any) -> None:
+        CountingValueObject.validations += 1
+
+
+class Team(BaseModel):
+    """
+    Model holding immutable and mutable value objects.
+    """
+
+    def __init__(self, size: PositiveIntegerValueObject, members: CountingValueObject) -> None:
+        """
+        Create a team.
+        """
+        self.size = size
+        self.members = members
+
+
+@mark.unit_testing
+@mark.parametrize(
+    'value, immutable',
+    [
+        (1, True),
+        ('a', True),
+        ((1, ('a', None)), True),
+        (frozenset((1, 2)), True),
+        (PositiveIntegerValueObject(value=1), True),
+        ((1, [2]), False),
+        ([1], False),
+        ({'a': 1}, False),
+        (bytearray(b'a'), False),
+    ],
+)
+def test_value_object_copy_shares_only_immutable_values(value: Any, immutable: bool) -> None:
+    """
+    Test that only value objects wrapping immutable values are returned as they are.
+    """
+    value_object = CountingValueObject(value=value)
+
+    assert (copy(value_object) is value_object) is immutable
+    assert (deepcopy(value_object) is value_object) is immutable
+
+
+@mark.unit_testing
+def test_value_object_deepcopy_clones_mutable_values_without_validation() -> None:
+    """
+    Test that deep copies of mutable values do not run the validations again.
+    """
+    value_object = CountingValueObject(value=[[1]], title='Matrix')
+    CountingValueObject.validations = 0
+
+    clone = deepcopy(value_object)
+
+    assert CountingValueObject.validations == 0
+    assert clone == value_object
+    assert clone.value[0] is not value_object.value[0]
+    assert clone.title == 'Matrix'
+
+
+@mark.unit_testing
+def test_value_object_copy_reconstructs_classes_with_custom_constructor() -> None:
+    """
+    Test that clones of classes with their own constructor are built by that constructor.
+    """
+
+    class TaggedValueObject(CountingValueObject):
+        def __init__(self, *, value: Any, title: str | None = None, parameter: str | None = None) -> None:
+            super().__init__(value=value, title=title, parameter=parameter)
+
+    value_object = TaggedValueObject(value=[1])
+    CountingValueObject.validations = 0
+
+    clone = copy(value_object)
+
+    assert clone == value_object
+    assert CountingValueObject.validations == 1
+
+
+@mark.unit_testing
+def test_base_model_deepcopy_shares_immutable_value_objects() -> None:
+    """
+    Test that deep copies of models share immutable value objects and clone mutable ones.
+    """
+    team = Team(size=PositiveIntegerValueObject(value=2), members=CountingValueObject(value=[StringValueObject(value='a')]))  # noqa: E501  # fmt: skip
+
+    clone = deepcopy(team)
+
+    assert clone == team
+    assert clone.size is team.size
+    assert clone.members is not team.members
+    assert clone.members.value[0] is team.members.value[0]
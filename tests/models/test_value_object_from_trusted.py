@@ -0,0 +1,265 @@
+"""
+Test ValueObject trusted construction.
+"""
+
+from __future__ import annotations
+
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+from enum import Enum, unique
+from json import dumps
+from typing import Any
+
+from pytest import mark, raises as assert_raises
+
+from value_object_pattern import BaseModel, EnumerationValueObject, ValueObject, process, validation
+from value_object_pattern.models.collections import ListValueObject
+from value_object_pattern.usables import PositiveIntegerValueObject
+from value_object_pattern.usables.dates import StringDateValueObject
+from value_object_pattern.usables.internet import EmailAddressValueObject, Ipv4AddressValueObject
+
+
+@unique
+class ColorEnumeration(Enum):
+    """
+    Color enumeration.
+    """
+
+    RED = 1
+    GREEN = 2
+
+
+class ColorValueObject(EnumerationValueObject[ColorEnumeration]):
+    """
+    Color value object.
+    """
+
+
+class RejectingValueObject(ValueObject[str]):
+    """
+    Value object whose validation always fails and whose processing is recorded.
+    """
+
+    @validation(order=0)
+    def _reject(self, value: str) -> None:
+        raise ValueError(f'RejectingValueObject value <<<{value}>>> is always rejected.')
+
+    @process(order=0)
+    def _upper(self, value: str) -> str:
+        return value.upper()
+
+
+class PositiveIntegerListValueObject(ListValueObject[PositiveIntegerValueObject]):
+    """
+    List of positive integers.
+    """
+
+
+class ShortIntegerListValueObject(ListValueObject[int]):
+    """
+    List of integers that adds its own validation.
+    """
+
+    @validation(order=2)
+    def _ensure_list_is_short(self, value: list[int]) -> None:
+        if len(value) > 2:
+            raise ValueError(f'ShortIntegerListValueObject value <<<{value}>>> must have at most 2 items.')
+
+
+class Account(BaseModel):
+    """
+    Account model.
+    """
+
+    def __init__(
+        self,
+        identifier: PositiveIntegerValueObject,
+        color: ColorValueObject,
+        addresses: PositiveIntegerListValueObject,
+    ) -> None:
+        """
+        Create an account.
+        """
+        self.identifier = identifier
+        self.color = color
+        self.addresses = addresses
+
+
+class Owner(BaseModel):
+    """
+    Model whose `from_primitives` override does not accept `trusted`.
+    """
+
+    def __init__(self, identifier: PositiveIntegerValueObject) -> None:
+        """
+        Create an owner.
+        """
+        self.identifier = identifier
+
+    @classmethod
+    @override
+    def from_primitives(cls, primitives: dict[str, Any]) -> Owner:  # type: ignore[override]
+        """
+        Create an owner from its identifier.
+        """
+        return cls(identifier=PositiveIntegerValueObject(value=primitives['identifier']))
+
+
+class Vault(BaseModel):
+    """
+    Model with a nested `Owner`.
+    """
+
+    def __init__(self, owner: Owner) -> None:
+        """
+        Create a vault.
+        """
+        self.owner = owner
+
+
+@mark.unit_testing
+def test_value_object_from_trusted_skips_validation() -> None:
+    """
+    Test that `from_trusted` stores the value without running validations nor processes.
+    """
+    value_object = RejectingValueObject.from_trusted(value='a')
+
+    assert type(value_object) is RejectingValueObject
+    assert value_object.value == 'a'
+    assert value_object.title == 'RejectingValueObject'
+    assert value_object.parameter == 'value'
+
+
+@mark.unit_testing
+def test_value_object_from_trusted_runs_processes_when_requested() -> None:
+    """
+    Test that `from_trusted` runs only the process hooks when `process=True`.
+    """
+    assert RejectingValueObject.from_trusted(value='a', process=True).value == 'A'
+    assert ColorValueObject.from_trusted(value=1, process=True).value is ColorEnumeration.RED
+
+
+@mark.unit_testing
+def test_value_object_from_trusted_is_immutable_and_equal_to_constructed_instance() -> None:
+    """
+    Test that a trusted value object behaves like a constructed one.
+    """
+    value_object = PositiveIntegerValueObject.from_trusted(value=5, title='Age', parameter='years')
+
+    assert value_object == PositiveIntegerValueObject(value=5)
+    assert hash(value_object) == hash(PositiveIntegerValueObject(value=5))
+    assert value_object.title == 'Age'
+    assert value_object.parameter == 'years'
+
+    with assert_raises(expected_exception=AttributeError, match=r'Cannot modify attribute "_value"'):
+        value_object._value = 6
+
+
+@mark.unit_testing
+def test_value_object_from_trusted_validates_metadata() -> None:
+    """
+    Test that `from_trusted` still validates custom titles and parameters.
+    """
+    with assert_raises(expected_exception=ValueError, match=r'ValueObject title <<<>>> must not be an empty string.'):
+        PositiveIntegerValueObject.from_trusted(value=5, title='')
+
+    parameter: Any = 1
+    with assert_raises(expected_exception=TypeError, match=r'ValueObject parameter <<<1>>> must be a string.'):
+        PositiveIntegerValueObject.from_trusted(value=5, parameter=parameter)
+
+
+@mark.unit_testing
+def test_value_object_from_trusted_restores_internal_state() -> None:
+    """
+    Test that value objects caching derived objects during validation restore them when created trusted.
+    """
+    assert Ipv4AddressValueObject.from_trusted(value='127.0.0.1').is_loopback()
+    assert StringDateValueObject.from_trusted(value='1900-01-01').is_in_range(
+        start_date=StringDateValueObject(value='1899-01-01')._internal_date_object,
+        end_date=StringDateValueObject(value='1901-01-01')._internal_date_object,
+    )
+    assert EmailAddressValueObject.from_trusted(value='John@example.com', process=True).value == 'john@example.com'
+
+
+@mark.unit_testing
+def test_list_value_object_operations_only_validate_new_items() -> None:
+    """
+    Test that add, extend and delete keep rejecting invalid new items and return regular instances.
+    """
+    sequence = PositiveIntegerListValueObject(value=[PositiveIntegerValueObject(value=1)])
+
+    added = sequence.add(item=PositiveIntegerValueObject(value=2))
+    extended = added.extend(items=[PositiveIntegerValueObject(value=3)])
+    deleted = extended.delete(item=PositiveIntegerValueObject(value=1))
+
+    assert type(deleted) is PositiveIntegerListValueObject
+    assert deleted.to_primitives() == [2, 3]
+
+    with assert_raises(
+        expected_exception=TypeError,
+        match=r'PositiveIntegerListValueObject value <<<1>>> must be of type <<<PositiveIntegerValueObject>>> type.',
+    ):
+        sequence.add(item=1)  # type: ignore[arg-type]
+
+
+@mark.unit_testing
+def test_list_value_object_operations_run_subclass_validations() -> None:
+    """
+    Test that list subclasses with their own validations are still fully validated by add and extend.
+    """
+    sequence = ShortIntegerListValueObject(value=[1, 2])
+
+    with assert_raises(
+        expected_exception=ValueError,
+        match=r'ShortIntegerListValueObject value <<<\[1, 2, 3\]>>> must have at most 2 items.',
+    ):
+        sequence.add(item=3)
+
+
+@mark.unit_testing
+def test_base_model_from_primitives_trusted_round_trip() -> None:
+    """
+    Test that `to_primitives` output is rehydrated through the trusted path into an equal model.
+    """
+    account = Account(
+        identifier=PositiveIntegerValueObject(value=1),
+        color=ColorValueObject(value=ColorEnumeration.GREEN),
+        addresses=PositiveIntegerListValueObject(value=[PositiveIntegerValueObject(value=2)]),
+    )
+
+    rehydrated = Account.from_primitives(primitives=account.to_primitives(), trusted=True)
+
+    assert rehydrated == account
+    assert rehydrated.color.value is ColorEnumeration.GREEN
+    assert type(rehydrated.addresses.value[0]) is PositiveIntegerValueObject
+
+
+@mark.unit_testing
+def test_base_model_from_primitives_trusted_skips_value_object_validation() -> None:
+    """
+    Test that trusted rehydration does not validate nested value objects, unlike the default path.
+    """
+    primitives = {'identifier': -1, 'color': 1, 'addresses': []}
+
+    with assert_raises(expected_exception=ValueError):
+        Account.from_primitives(primitives=primitives)
+
+    assert Account.from_primitives(primitives=primitives, trusted=True).identifier.value == -1
+
+
+@mark.unit_testing
+def test_base_model_from_primitives_trusted_calls_nested_overrides_without_trusted() -> None:
+    """
+    Test that trusted rehydration calls a nested `from_primitives` override that does not accept `trusted` without it.
+    """
+    vault = Vault(owner=Owner(identifier=PositiveIntegerValueObject(value=1)))
+    primitives = vault.to_primitives()
+
+    assert Vault.from_primitives(primitives=primitives, trusted=True) == vault
+    assert Vault.from_primitives_many(rows=[primitives], trusted=True).instances == [vault]
+    assert list(Vault.iter_from_jsonl([dumps(primitives)], trusted=True)) == [vault]
@@ -0,0 +1,137 @@
+"""
+Test ValueObject per-class hook plan caching.
+"""
+
+from functools import partial
+from typing import Callable
+
+from pytest import MonkeyPatch, mark, raises as assert_raises
+
+from value_object_pattern import ValueObject, process, validation
+from value_object_pattern.usables import IntegerValueObject, PositiveIntegerValueObject
+
+
+class PlanStringValueObject(ValueObject[str]):
+    """
+    Value object used to exercise hook plan caching.
+    """
+
+    @validation(order=0)
+    def _ensure_value_is_string(self, value: str) -> None:
+        if type(value) is not str:
+            raise TypeError(f'PlanStringValueObject value <<<{value}>>> must be a string.')
+
+    @process(order=0)
+    def _append_suffix(self, value: str) -> str:
+        return value + '-plan'
+
+
+class PlanChildStringValueObject(PlanStringValueObject):
+    """
+    Child value object used to exercise hook plan invalidation through parents.
+    """
+
+    @process(order=1)
+    def _append_child_suffix(self, value: str) -> str:
+        return value + '-child'
+
+
+@mark.unit_testing
+def test_value_object_hook_plan_is_reused_between_instances() -> None:
+    """
+    Test that the hook plan is resolved once and shared by every instance of the class.
+    """
+    IntegerValueObject(value=1)
+    plan = IntegerValueObject._resolve_hook_plan()
+    IntegerValueObject(value=2)
+
+    assert IntegerValueObject._resolve_hook_plan() is plan
+    assert plan.owner is IntegerValueObject
+
+
+@mark.unit_testing
+def test_value_object_hook_plan_is_resolved_per_subclass() -> None:
+    """
+    Test that subclasses do not reuse the hook plan of their parents.
+    """
+    parent_plan = IntegerValueObject._resolve_hook_plan()
+    child_plan = PositiveIntegerValueObject._resolve_hook_plan()
+
+    assert child_plan is not parent_plan
+    assert child_plan.owner is PositiveIntegerValueObject
+    assert len(child_plan.validations) > len(parent_plan.validations)
+
+
+@mark.unit_testing
+def test_value_object_hook_plan_is_invalidated_when_a_hook_is_monkeypatched(monkeypatch: MonkeyPatch) -> None:
+    """
+    Test that monkeypatching a hook drops the cached plan of the class.
+    """
+    assert PlanStringValueObject(value='a').value == 'a-plan'
+
+    @process(order=0)
+    def _append_suffix(self: PlanStringValueObject, value: str) -> str:
+        return value + '-patched'
+
+    monkeypatch.setattr(PlanStringValueObject, '_append_suffix', _append_suffix)
+
+    assert PlanStringValueObject(value='a').value == 'a-patched'
+
+
+@mark.unit_testing
+def test_value_object_hook_plan_of_subclass_is_invalidated_when_parent_is_monkeypatched(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """
+    Test that monkeypatching a parent hook drops the cached plan of its subclasses.
+    """
+    assert PlanChildStringValueObject(value='a').value == 'a-plan-child'
+
+    @validation(order=0)
+    def _ensure_value_is_string(self: PlanStringValueObject, value: str) -> None:
+        raise ValueError(f'PlanStringValueObject value <<<{value}>>> is always rejected.')
+
+    monkeypatch.setattr(PlanStringValueObject, '_ensure_value_is_string', _ensure_value_is_string)
+
+    with assert_raises(
+        expected_exception=ValueError,
+        match=r'PlanChildStringValueObject value <<<a>>> is always rejected.',
+    ):
+        PlanChildStringValueObject(value='a')
+
+
+@mark.unit_testing
+def test_value_object_hook_plan_is_invalidated_when_a_hook_is_removed(monkeypatch: MonkeyPatch) -> None:
+    """
+    Test that removing a hook from the class drops the cached plan of the class.
+    """
+    assert PlanChildStringValueObject(value='a').value == 'a-plan-child'
+
+    monkeypatch.delattr(PlanChildStringValueObject, '_append_child_suffix')
+
+    assert PlanChildStringValueObject(value='a').value == 'a-plan'
+
+
+@mark.unit_testing
+def test_value_object_hook_plan_binds_non_function_hooks() -> None:
+    """
+    Test that hooks stored as descriptors other than plain functions keep descriptor binding semantics.
+    """
+
+    class SuffixHook:
+        _is_process = True
+        _order = '0'
+
+        def __init__(self) -> None:
+            self.__qualname__ = 'DescriptorHookValueObject._append_descriptor'
+
+        def __call__(self, instance: ValueObject[str], value: str) -> str:
+            return value + '-descriptor'
+
+        def __get__(self, instance: ValueObject[str], owner: type) -> Callable[..., str]:
+            return partial(self, instance)
+
+    class DescriptorHookValueObject(ValueObject[str]):
+        _append_descriptor = SuffixHook()
+
+    assert DescriptorHookValueObject(value='a').value == 'a-descriptor'
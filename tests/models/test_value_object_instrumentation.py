@@ -0,0 +1,164 @@
+"""
+Test ValueObject opt-in instrumentation.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+from pytest import fixture, mark, raises as assert_raises
+
+from value_object_pattern import (
+    InstrumentationRegistry,
+    ValueObject,
+    disable_instrumentation,
+    enable_instrumentation,
+    get_instrumentation,
+    process,
+    validation,
+)
+from value_object_pattern.usables import PositiveIntegerValueObject
+
+
+class LowerCodeValueObject(ValueObject[str]):
+    """
+    Value object with one validation and one process hook.
+    """
+
+    @validation(order=0)
+    def _ensure_value_is_short(self, value: str) -> None:
+        if len(value) > 3:
+            raise ValueError(f'LowerCodeValueObject value <<<{value}>>> is too long.')
+
+    @process(order=0)
+    def _lower(self, value: str) -> str:
+        return value.lower()
+
+
+class TaggedValueObject(LowerCodeValueObject):
+    """
+    Value object with its own constructor, built through the generic constructor.
+    """
+
+    def __init__(self, *, value: Any, title: str | None = None, parameter: str | None = None) -> None:
+        """
+        Create a tagged value object.
+        """
+        super().__init__(value=value, title=title, parameter=parameter)
+
+
+@fixture
+def registry() -> Iterator[InstrumentationRegistry]:
+    """
+    Enable instrumentation for one test.
+    """
+    registry = enable_instrumentation(sample_size=8)
+    yield registry
+    disable_instrumentation()
+
+
+@mark.unit_testing
+def test_instrumentation_records_constructions_failures_and_hooks(registry: InstrumentationRegistry) -> None:
+    """
+    Test that constructions, failures by validator and hook times are recorded per concrete class.
+    """
+    LowerCodeValueObject(value='AB')
+    with assert_raises(expected_exception=ValueError):
+        LowerCodeValueObject(value='ABCD')
+
+    statistics = registry.to_dict()[f'{__name__}.LowerCodeValueObject']
+
+    assert statistics['constructions'] == 2
+    assert statistics['failures'] == 1
+    assert statistics['failures_by_validator'] == {'_ensure_value_is_short': 1}
+    assert statistics['construction']['count'] == 2
+    assert statistics['hooks']['_ensure_value_is_short']['kind'] == 'validation'
+    assert statistics['hooks']['_ensure_value_is_short']['count'] == 2
+    assert statistics['hooks']['_lower']['kind'] == 'process'
+    assert statistics['hooks']['_lower']['count'] == 1
+    assert 0 < statistics['hooks']['_lower']['p50_seconds'] <= statistics['hooks']['_lower']['total_seconds']
+
+
+@mark.unit_testing
+def test_instrumentation_records_generic_constructor_classes_once(registry: InstrumentationRegistry) -> None:
+    """
+    Test that classes with their own constructor are recorded once per construction, under their own class.
+    """
+    TaggedValueObject(value='AB')
+    TaggedValueObject.validate_many(values=['A', 'B'])
+
+    statistics = registry.to_dict()
+
+    assert statistics[f'{__name__}.TaggedValueObject']['constructions'] == 3
+    assert f'{__name__}.LowerCodeValueObject' not in statistics
+
+
+@mark.unit_testing
+def test_instrumentation_exports_prometheus_text(registry: InstrumentationRegistry) -> None:
+    """
+    Test that the statistics are exported in the Prometheus text format.
+    """
+    with assert_raises(expected_exception=ValueError):
+        LowerCodeValueObject(value='ABCD')
+
+    lines = registry.to_prometheus().splitlines()
+    labels = f'class="{__name__}.LowerCodeValueObject"'
+
+    assert '# TYPE value_object_constructions_total counter' in lines
+    assert f'value_object_constructions_total{{{labels}}} 1' in lines
+    assert f'value_object_failures_total{{{labels},validator="_ensure_value_is_short"}} 1' in lines
+    assert f'value_object_construction_seconds_count{{{labels}}} 1' in lines
+    assert f'value_object_hook_seconds_count{{{labels},hook="_ensure_value_is_short",kind="validation"}} 1' in lines
+
+
+@mark.unit_testing
+def test_instrumentation_clear_forgets_recorded_statistics(registry: InstrumentationRegistry) -> None:
+    """
+    Test that clearing the registry forgets the statistics but keeps recording.
+    """
+    LowerCodeValueObject(value='AB')
+    registry.clear()
+
+    assert registry.to_dict() == {}
+
+    LowerCodeValueObject(value='AB')
+
+    assert registry.to_dict()[f'{__name__}.LowerCodeValueObject']['constructions'] == 1
+
+
+@mark.unit_testing
+def test_instrumentation_disabled_restores_plain_constructors() -> None:
+    """
+    Test that disabling instrumentation regenerates the constructors without timing calls.
+    """
+    registry = enable_instrumentation()
+    PositiveIntegerValueObject(value=1)
+
+    assert get_instrumentation() is registry
+    assert hasattr(PositiveIntegerValueObject.__init__, '__wrapped__')
+
+    disable_instrumentation()
+    PositiveIntegerValueObject(value=1)
+
+    assert get_instrumentation() is None
+    assert not hasattr(PositiveIntegerValueObject.__init__, '__wrapped__')
+    assert registry.to_dict()[f'{PositiveIntegerValueObject.__module__}.PositiveIntegerValueObject']['constructions'] == 1  # noqa: E501  # fmt: skip
+
+
+@mark.unit_testing
+@mark.parametrize(
+    'sample_size, exception, message',
+    [
+        (0, ValueError, 'InstrumentationRegistry sample_size <<<0>>> must be a positive integer.'),
+        (1.5, TypeError, 'InstrumentationRegistry sample_size <<<1.5>>> must be an integer. Got <<<float>>> type.'),
+    ],
+)
+def test_instrumentation_registry_rejects_invalid_sample_size(
+    sample_size: Any,
+    exception: type[Exception],
+    message: str,
+) -> None:
+    """
+    Test that invalid sample sizes are rejected.
+    """
+    with assert_raises(expected_exception=exception, match=message):
+        InstrumentationRegistry(sample_size=sample_size)
@@ -0,0 +1,153 @@
+"""
+Test ValueObject interning.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from pytest import mark, raises as assert_raises
+
+from value_object_pattern import ValueObject, process
+from value_object_pattern.usables import IntegerValueObject, PositiveIntegerValueObject
+
+
+class InternedValueObject(ValueObject[Any], intern=2):
+    """
+    Interned value object that records every processed value.
+    """
+
+    processed: list[Any] = []  # noqa: RUF012
+
+    @process(order=0)
+    def _record(self, value: Any) -> Any:
+        self.processed.append(value)
+        return value
+
+
+@mark.unit_testing
+def test_value_object_intern_returns_canonical_instance_without_running_hooks() -> None:
+    """
+    Test that repeated raw inputs return the stored instance and count hits and misses.
+    """
+    InternedValueObject.intern_pool().clear()  # type: ignore[union-attr]
+    InternedValueObject.processed = []
+
+    first = InternedValueObject(value='a')
+    second = InternedValueObject(value='a')
+    titled = InternedValueObject(value='a', title='Letter')
+
+    assert first is second
+    assert titled is not first
+    assert titled.title == 'Letter'
+    assert InternedValueObject.processed == ['a', 'a']
+    assert InternedValueObject.intern_pool().statistics() == {'hits': 1, 'misses': 2, 'size': 2, 'max_size': 2}  # type: ignore[union-attr]  # noqa: E501  # fmt: skip
+
+
+@mark.unit_testing
+def test_value_object_intern_pool_is_bounded_and_keyed_by_value_type() -> None:
+    """
+    Test that the least recently used instance is evicted and equal values of different types are kept apart.
+    """
+    InternedValueObject.intern_pool().clear()  # type: ignore[union-attr]
+
+    integer = InternedValueObject(value=1)
+    floating = InternedValueObject(value=1.0)
+    InternedValueObject(value=1)
+    InternedValueObject(value=2)
+
+    assert type(floating.value) is float
+    assert integer is InternedValueObject(value=1)
+    assert len(InternedValueObject.intern_pool()) == 2  # type: ignore[arg-type]
+
+
+@mark.unit_testing
+def test_value_object_intern_skips_failures_and_unhashable_values() -> None:
+    """
+    Test that failed constructions are not stored and unhashable values bypass the pool.
+    """
+    InternedValueObject.intern_pool().clear()  # type: ignore[union-attr]
+
+    class InternedPositiveInteger(PositiveIntegerValueObject, intern=True):
+        pass
+
+    with assert_raises(expected_exception=ValueError, match='InternedPositiveInteger value <<<-1>>> must be a positive integer.'):  # noqa: E501  # fmt: skip
+        InternedPositiveInteger(value=-1)
+
+    assert len(InternedPositiveInteger.intern_pool()) == 0  # type: ignore[arg-type]
+    assert InternedValueObject(value=[1]) is not InternedValueObject(value=[1])
+    assert len(InternedValueObject.intern_pool()) == 0  # type: ignore[arg-type]
+
+
+@mark.unit_testing
+def test_value_object_intern_is_inherited_with_a_pool_per_class() -> None:
+    """
+    Test that subclasses get their own pool and can opt out.
+    """
+
+    class Port(IntegerValueObject, intern=True):
+        pass
+
+    class HttpPort(Port):
+        pass
+
+    class RawPort(Port, intern=False):
+        pass
+
+    assert HttpPort(value=80) is HttpPort(value=80)
+    assert type(HttpPort(value=80)) is HttpPort
+    assert Port.intern_pool() is not HttpPort.intern_pool()
+    assert RawPort.intern_pool() is None
+    assert RawPort(value=80) is not RawPort(value=80)
+    assert IntegerValueObject.intern_pool() is None
+
+
+@mark.unit_testing
+def test_value_object_intern_pool_is_cleared_when_the_class_is_modified() -> None:
+    """
+    Test that modifying a class drops the instances interned with the previous hooks.
+    """
+
+    class Port(IntegerValueObject, intern=True):
+        pass
+
+    Port(value=80)
+    Port.custom_attribute = True
+
+    assert len(Port.intern_pool()) == 0  # type: ignore[arg-type]
+
+
+@mark.unit_testing
+def test_value_object_intern_converges_across_threads() -> None:
+    """
+    Test that concurrent constructions of the same raw input share one canonical instance.
+    """
+
+    class Port(IntegerValueObject, intern=True):
+        pass
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        instances = list(executor.map(lambda _: Port(value=443), range(1000)))
+
+    statistics = Port.intern_pool().statistics()  # type: ignore[union-attr]
+
+    assert len({id(instance) for instance in instances[100:]}) == 1
+    assert statistics['hits'] + statistics['misses'] == 1000
+    assert statistics['size'] == 1
+
+
+@mark.unit_testing
+@mark.parametrize(
+    'intern, exception, message',
+    [
+        ('yes', TypeError, 'ValueObject intern <<<yes>>> must be a boolean or an integer. Got <<<str>>> type.'),
+        (0, ValueError, 'ValueObject intern <<<0>>> must be a positive integer.'),
+    ],
+)
+def test_value_object_intern_rejects_invalid_setting(intern: Any, exception: type[Exception], message: str) -> None:
+    """
+    Test that the intern class keyword must be a boolean or a positive integer.
+    """
+    with assert_raises(expected_exception=exception, match=message):
+
+        class InvalidValueObject(IntegerValueObject, intern=intern):
+            pass
@@ -0,0 +1,181 @@
+"""
+Test ValueObject memoized validation.
+"""
+
+from time import sleep
+from typing import Any
+
+from pytest import mark, raises as assert_raises
+
+from value_object_pattern import ValidationFailure, ValueObject, process, validation
+from value_object_pattern.usables import IntegerValueObject
+from value_object_pattern.usables.internet import Ipv4AddressValueObject
+
+
+class MemoizedValueObject(ValueObject[str], memoize=2):
+    """
+    Memoized value object that records every validated value.
+    """
+
+    validated: list[str] = []  # noqa: RUF012
+
+    @validation(order=0)
+    def _ensure_value_is_not_empty(self, value: str) -> None:
+        self.validated.append(value)
+        if not value:
+            raise ValueError(f'MemoizedValueObject value <<<{value}>>> is empty.')
+
+    @process(order=0)
+    def _upper(self, value: str) -> str:
+        return value.upper()
+
+
+@mark.unit_testing
+def test_value_object_memoize_builds_new_instances_from_cached_values() -> None:
+    """
+    Test that repeated raw inputs skip the hooks and build a new instance from the cached processed value.
+    """
+    MemoizedValueObject.validation_cache().clear()  # type: ignore[union-attr]
+    MemoizedValueObject.validated = []
+
+    first = MemoizedValueObject(value='a', title='Letter')
+    second = MemoizedValueObject(value='a', title='Letter')
+
+    assert first == second
+    assert first is not second
+    assert second.value == 'A'
+    assert second.title == 'Letter'
+    assert MemoizedValueObject.validated == ['a']
+    assert MemoizedValueObject.validation_cache().statistics() == {  # type: ignore[union-attr]
+        'hits': 1,
+        'misses': 1,
+        'evictions': 0,
+        'expirations': 0,
+        'size': 1,
+        'max_size': 2,
+        'ttl': None,
+    }
+
+
+@mark.unit_testing
+def test_value_object_memoize_raises_a_copy_of_the_cached_error() -> None:
+    """
+    Test that a cached failure is raised again without running the hooks, with its structured fields.
+    """
+    MemoizedValueObject.validation_cache().clear()  # type: ignore[union-attr]
+    MemoizedValueObject.validated = []
+
+    with assert_raises(expected_exception=ValueError, match='MemoizedValueObject value <<<>>> is empty.') as error:
+        MemoizedValueObject(value='')
+
+    with assert_raises(expected_exception=ValueError, match='MemoizedValueObject value <<<>>> is empty.') as cached_error:  # noqa: E501  # fmt: skip
+        MemoizedValueObject(value='')
+
+    assert cached_error.value is not error.value
+    assert isinstance(cached_error.value.validation_failure, ValidationFailure)  # type: ignore[attr-defined]
+    assert cached_error.value.validation_failure.code == '_ensure_value_is_not_empty'  # type: ignore[attr-defined]
+    assert MemoizedValueObject.validated == ['']
+
+
+@mark.unit_testing
+def test_value_object_memoize_raises_errors_that_can_not_be_copied() -> None:
+    """
+    Test that a validation error that can not be rebuilt from its arguments is raised as it is and is not cached.
+    """
+
+    class KeywordError(ValueError):
+        def __init__(self, *, value: str) -> None:
+            super().__init__(f'KeywordValueObject value <<<{value}>>> is invalid.')
+
+    class KeywordValueObject(ValueObject[str], memoize=True):
+        @validation(order=0)
+        def _ensure_value_is_valid(self, value: str) -> None:
+            raise KeywordError(value=value)
+
+    for _ in range(2):
+        with assert_raises(expected_exception=KeywordError, match='KeywordValueObject value <<<a>>> is invalid.'):
+            KeywordValueObject(value='a')
+
+    assert KeywordValueObject.validation_cache().statistics()['size'] == 0  # type: ignore[union-attr]
+
+
+@mark.unit_testing
+def test_value_object_memoize_evicts_least_recently_used_and_expired_entries() -> None:
+    """
+    Test that the cache is bounded and that entries expire after the configured time to live.
+    """
+    MemoizedValueObject.validation_cache().clear()  # type: ignore[union-attr]
+
+    for value in ('a', 'b', 'a', 'c'):
+        MemoizedValueObject(value=value)
+
+    class ExpiringValueObject(IntegerValueObject, memoize=True, memoize_ttl=0.01):
+        pass
+
+    ExpiringValueObject(value=1)
+    sleep(0.02)
+    ExpiringValueObject(value=1)
+
+    assert MemoizedValueObject.validation_cache().statistics()['evictions'] == 1  # type: ignore[union-attr]
+    assert MemoizedValueObject(value='a').value == 'A'
+    assert MemoizedValueObject.validation_cache().statistics()['hits'] == 2  # type: ignore[union-attr]
+    assert ExpiringValueObject.validation_cache().statistics()['expirations'] == 1  # type: ignore[union-attr]
+
+
+@mark.unit_testing
+def test_value_object_memoize_restores_internal_state() -> None:
+    """
+    Test that memoized instances rebuild the `_internal_` attributes set during validation.
+    """
+
+    class Address(Ipv4AddressValueObject, memoize=True):
+        pass
+
+    Address(value='127.0.0.1')
+    address = Address(value='127.0.0.1')
+
+    assert Address.validation_cache().statistics()['hits'] == 1  # type: ignore[union-attr]
+    assert address.is_loopback()
+
+
+@mark.unit_testing
+def test_value_object_memoize_is_disabled_for_custom_constructors_and_opt_outs() -> None:
+    """
+    Test that classes defining their own constructor, and classes opting out, do not get a validation cache.
+    """
+
+    class CustomConstructorValueObject(IntegerValueObject, memoize=True):
+        def __init__(self, *, value: int, title: str | None = None, parameter: str | None = None) -> None:
+            super().__init__(value=value, title=title, parameter=parameter)
+
+    class OptedOutValueObject(MemoizedValueObject, memoize=False):
+        pass
+
+    assert CustomConstructorValueObject.validation_cache() is None
+    assert OptedOutValueObject.validation_cache() is None
+    assert MemoizedValueObject.validation_cache() is not None
+    assert IntegerValueObject.validation_cache() is None
+
+
+@mark.unit_testing
+@mark.parametrize(
+    'keywords, exception, message',
+    [
+        ({'memoize': 1.5}, TypeError, 'ValueObject memoize <<<1.5>>> must be a boolean or an integer. Got <<<float>>>'),
+        ({'memoize': -1}, ValueError, 'ValueObject memoize <<<-1>>> must be a positive integer.'),
+        ({'memoize_ttl': '1'}, TypeError, 'ValueObject memoize_ttl <<<1>>> must be a number. Got <<<str>>> type.'),
+        ({'memoize_ttl': 0}, ValueError, 'ValueObject memoize_ttl <<<0>>> must be a positive number.'),
+    ],
+)
+def test_value_object_memoize_rejects_invalid_settings(
+    keywords: dict[str, Any],
+    exception: type[Exception],
+    message: str,
+) -> None:
+    """
+    Test that the memoize class keywords are validated.
+    """
+    with assert_raises(expected_exception=exception, match=message):
+
+        class InvalidValueObject(IntegerValueObject, **keywords):
+            pass
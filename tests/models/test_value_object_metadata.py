@@ -0,0 +1,85 @@
+"""
+Test ValueObject per-instance metadata storage.
+"""
+
+from copy import copy
+
+from pytest import mark
+
+from value_object_pattern import ValueObject, process, validation
+from value_object_pattern.models import value_object as value_object_module
+from value_object_pattern.usables import IntegerValueObject
+
+
+class GenericEarlyProcessValueObject(ValueObject[str], compiled=False):
+    """
+    Value object that uses the generic constructor with early processing validations.
+    """
+
+    processed: list[str] = []  # noqa: RUF012
+
+    @validation(order=0, early_process=True)
+    def _ensure_processed_value_is_upper(self, value: str, processed_value: str) -> None:
+        if processed_value != value.upper():
+            raise ValueError(f'GenericEarlyProcessValueObject value <<<{value}>>> was not processed.')
+
+    @validation(order=1, early_process=True)
+    def _ensure_processed_value_is_not_empty(self, value: str, processed_value: str) -> None:
+        if not processed_value:
+            raise ValueError(f'GenericEarlyProcessValueObject value <<<{value}>>> is empty.')
+
+    @process(order=0)
+    def _upper(self, value: str) -> str:
+        self.processed.append(value)
+        return value.upper()
+
+
+@mark.unit_testing
+def test_value_object_instances_only_hold_value_and_metadata_slots() -> None:
+    """
+    Test that the base value object only declares the value and metadata slots, and the weak reference slot.
+    """
+    assert ValueObject.__slots__ == ('__weakref__', '_metadata', '_value')
+
+
+@mark.unit_testing
+def test_value_object_default_metadata_is_not_stored_per_instance() -> None:
+    """
+    Test that default titles and parameters are resolved from the class.
+    """
+    default = IntegerValueObject(value=1)
+    explicit_default = IntegerValueObject(value=1, title='IntegerValueObject', parameter='value')
+
+    assert default._metadata is None
+    assert explicit_default._metadata is None
+    assert default.title == 'IntegerValueObject'
+    assert default.parameter == 'value'
+
+
+@mark.unit_testing
+def test_value_object_custom_metadata_is_shared_between_instances() -> None:
+    """
+    Test that instances with the same custom metadata share the stored tuple.
+    """
+    first = IntegerValueObject(value=1, title='Age', parameter='years')
+    second = IntegerValueObject(value=2, title='Age', parameter='years')
+
+    assert first._metadata == ('Age', 'years')
+    assert first._metadata is second._metadata
+    assert copy(first).title == 'Age'
+
+
+@mark.unit_testing
+def test_value_object_early_processed_value_only_lives_during_construction() -> None:
+    """
+    Test that the generic constructor processes once and drops the early processed value after construction.
+    """
+    GenericEarlyProcessValueObject.processed = []
+
+    value_object = GenericEarlyProcessValueObject(value='a')
+
+    assert value_object.value == 'A'
+    assert GenericEarlyProcessValueObject.processed == ['a']
+    assert value_object_module._early_processed.values == {}
+    assert value_object.early_process(value='b') == 'B'
+    assert value_object_module._early_processed.values == {}
@@ -0,0 +1,100 @@
+"""
+Test ValueObject parallel batch validation.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from pytest import mark, raises as assert_raises
+
+from value_object_pattern.usables import PositiveIntegerValueObject
+from value_object_pattern.usables.internet import Ipv4AddressValueObject
+from value_object_pattern.usables.money import IbanValueObject
+
+
+class InternedIpv4Address(Ipv4AddressValueObject, intern=True):
+    """
+    Interned value object validated in worker processes.
+    """
+
+
+@mark.unit_testing
+def test_value_object_validate_many_parallel_keeps_input_order_across_processes() -> None:
+    """
+    Test that chunks validated in worker processes are rebuilt in input order with their global indexes.
+    """
+    values = ['ES9121000418450200051332', 'ES00', 'GB82WEST12345698765432', 'ES9121000418450200051332', 'x']
+
+    result = IbanValueObject.validate_many_parallel(values=values, chunk_size=2, max_workers=2)
+
+    assert [iban.value for iban in result.instances] == ['ES9121000418450200051332', 'GB82WEST12345698765432', 'ES9121000418450200051332']  # noqa: E501  # fmt: skip
+    assert result.indexes == [0, 2, 3]
+    assert sorted(result.errors) == [1, 4]
+    assert str(result.errors[1]) == 'IbanValueObject value <<<ES00>>> is not a valid International Bank Account Number.'
+    assert result.errors[1].validation_failure.value == 'ES00'  # type: ignore[attr-defined]
+
+
+@mark.unit_testing
+def test_value_object_validate_many_parallel_rebuilds_internal_state_and_primitives() -> None:
+    """
+    Test that rebuilt instances restore their `_internal_` attributes and that primitives can be returned instead.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        instances = Ipv4AddressValueObject.validate_many_parallel(values=['127.0.0.1'], executor=executor)
+        primitives = PositiveIntegerValueObject.validate_many_parallel(values=[1, 2, -3], primitives=True, chunk_size=1, executor=executor)  # noqa: E501  # fmt: skip
+
+    assert instances.instances[0].is_loopback()
+    assert primitives.instances == [1, 2]
+    assert primitives.indexes == [0, 1]
+    assert sorted(primitives.errors) == [2]
+
+
+@mark.unit_testing
+def test_value_object_validate_many_parallel_returns_interned_instances() -> None:
+    """
+    Test that instances rebuilt in the parent process are the canonical instances of the class intern pool.
+    """
+    InternedIpv4Address.intern_pool().clear()  # type: ignore[union-attr]
+    canonical = InternedIpv4Address(value='10.0.0.1')
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = InternedIpv4Address.validate_many_parallel(values=['10.0.0.1', '10.0.0.2', '10.0.0.2'], chunk_size=1, executor=executor)  # noqa: E501  # fmt: skip
+
+    assert result.instances[0] is canonical
+    assert result.instances[1] is result.instances[2]
+    assert result.instances[1] is InternedIpv4Address(value='10.0.0.2')
+
+
+@mark.unit_testing
+def test_value_object_validate_many_parallel_raises_first_error_in_input_order() -> None:
+    """
+    Test that the raise mode raises the first rejected value of the input with its global index.
+    """
+    with (
+        ThreadPoolExecutor(max_workers=2) as executor,
+        assert_raises(expected_exception=ValueError, match='PositiveIntegerValueObject value <<<-3>>> must be a positive integer.') as error,  # noqa: E501
+    ):  # fmt: skip
+        PositiveIntegerValueObject.validate_many_parallel(values=[1, 2, -3, -4], errors='raise', chunk_size=2, executor=executor)  # noqa: E501  # fmt: skip
+
+    assert error.value.__notes__ == ['PositiveIntegerValueObject batch index <<<2>>>']
+
+
+@mark.unit_testing
+@mark.parametrize(
+    'keywords, exception, message',
+    [
+        ({'chunk_size': 0}, ValueError, 'ValueObject chunk_size <<<0>>> must be a positive integer.'),
+        ({'chunk_size': 1.5}, TypeError, 'ValueObject chunk_size <<<1.5>>> must be an integer. Got <<<float>>> type.'),
+        ({'errors': 'ignore'}, ValueError, 'ValueObject errors <<<ignore>>> must be one of'),
+    ],
+)
+def test_value_object_validate_many_parallel_rejects_invalid_arguments(
+    keywords: dict[str, Any],
+    exception: type[Exception],
+    message: str,
+) -> None:
+    """
+    Test that invalid chunk sizes and modes are rejected before any worker is started.
+    """
+    with assert_raises(expected_exception=exception, match=message):
+        PositiveIntegerValueObject.validate_many_parallel(values=[1], **keywords)
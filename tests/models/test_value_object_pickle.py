@@ -0,0 +1,82 @@
+"""
+Test ValueObject pickling.
+"""
+
+from pickle import dumps, loads
+from typing import Any
+
+from pytest import mark
+
+from value_object_pattern import ValueObject, validation
+from value_object_pattern.usables import PositiveIntegerValueObject
+from value_object_pattern.usables.internet import Ipv4AddressValueObject
+
+
+class CountingValueObject(ValueObject[int]):
+    """
+    Value object that counts its validations.
+    """
+
+    validations = 0
+
+    @validation(order=0)
+    def _count(self, value: int) -> None:
+        type(self).validations += 1
+
+
+@mark.unit_testing
+@mark.parametrize(
+    'keywords',
+    [
+        {},
+        {'title': 'Age'},
+        {'parameter': 'years'},
+    ],
+)
+def test_value_object_pickle_round_trip_keeps_value_and_metadata(keywords: dict[str, Any]) -> None:
+    """
+    Test that unpickled value objects keep their class, value, title and parameter.
+    """
+    integer = PositiveIntegerValueObject(value=10, **keywords)
+
+    unpickled = loads(dumps(integer))  # noqa: S301
+
+    assert type(unpickled) is PositiveIntegerValueObject
+    assert unpickled == integer
+    assert unpickled.title == integer.title
+    assert unpickled.parameter == integer.parameter
+
+
+@mark.unit_testing
+def test_value_object_pickle_does_not_validate_again() -> None:
+    """
+    Test that unpickling restores the value object through the trusted path.
+    """
+    integer = CountingValueObject(value=1)
+    CountingValueObject.validations = 0
+
+    loads(dumps(integer))  # noqa: S301
+
+    assert CountingValueObject.validations == 0
+
+
+@mark.unit_testing
+def test_value_object_pickle_only_stores_class_value_and_custom_metadata() -> None:
+    """
+    Test that the reduced state is the class, the stored value and the non-default metadata.
+    """
+    _, default_arguments = PositiveIntegerValueObject(value=10).__reduce__()
+    _, custom_arguments = PositiveIntegerValueObject(value=10, title='Age').__reduce__()
+
+    assert default_arguments == (PositiveIntegerValueObject, 10)
+    assert custom_arguments == (PositiveIntegerValueObject, 10, 'Age', 'value')
+
+
+@mark.unit_testing
+def test_value_object_pickle_restores_internal_state() -> None:
+    """
+    Test that `_internal_` attributes are rebuilt when unpickling.
+    """
+    address = loads(dumps(Ipv4AddressValueObject(value='127.0.0.1')))  # noqa: S301
+
+    assert address.is_loopback()
@@ -0,0 +1,68 @@
+"""
+Test ValueObject shared state under concurrent threads.
+"""
+
+from threading import Barrier, Thread
+from typing import Any, Callable
+
+from pytest import mark
+
+from value_object_pattern import ValueObject, validation
+from value_object_pattern.models.collections import DictValueObject, ListValueObject
+
+
+def run_concurrently(*, function: Callable[[], Any], threads: int = 8) -> list[Any]:
+    """
+    Run `function` on `threads` threads released at the same time and return their results.
+    """
+    barrier = Barrier(parties=threads)
+    results: list[Any] = []
+
+    def run() -> None:
+        barrier.wait()
+        results.append(function())
+
+    workers = [Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+
+    return results
+
+
+@mark.unit_testing
+def test_value_object_inline_aliases_publish_one_runtime_class_to_every_thread() -> None:
+    """
+    Test that threads constructing a new inline alias at the same time get instances of the same runtime class.
+    """
+
+    class Point:
+        pass
+
+    lists = run_concurrently(function=lambda: ListValueObject[Point](value=[]))
+    dictionaries = run_concurrently(function=lambda: DictValueObject[str, Point](value={}))
+
+    assert len({type(value) for value in lists}) == 1
+    assert len({type(value) for value in dictionaries}) == 1
+    assert lists[0] == lists[-1]
+
+
+@mark.unit_testing
+def test_value_object_hook_plan_is_resolved_once_by_concurrent_threads() -> None:
+    """
+    Test that threads constructing a class for the first time at the same time share one hook plan.
+    """
+
+    class ThreadedValueObject(ValueObject[int]):
+        @validation()
+        def _ensure_value_is_integer(self, value: int) -> None:
+            if type(value) is not int:  # pragma: no cover
+                raise TypeError(f'ThreadedValueObject value <<<{value}>>> must be an integer.')
+
+    values = run_concurrently(function=lambda: ThreadedValueObject(value=1))
+    plans = run_concurrently(function=ThreadedValueObject._resolve_hook_plan)
+
+    assert {value.value for value in values} == {1}
+    assert len({id(plan) for plan in plans}) == 1
@@ -0,0 +1,84 @@
+"""
+Test that every shipped value object is fully slotted.
+"""
+
+from importlib import import_module
+from inspect import isclass
+from pkgutil import walk_packages
+from typing import Any
+from weakref import ref
+
+from pytest import mark
+
+import value_object_pattern
+from value_object_pattern import ValueObject
+from value_object_pattern.models.collections import DictValueObject, ListValueObject
+from value_object_pattern.usables import StringValueObject
+from value_object_pattern.usables.internet import Ipv4AddressValueObject
+
+
+def _shipped_value_object_classes() -> list[type[ValueObject[Any]]]:
+    """
+    Returns every value object class defined in the package.
+
+    Returns:
+        list[type[ValueObject[Any]]]: The value object classes.
+    """
+    classes: list[type[ValueObject[Any]]] = []
+    for module_info in walk_packages(path=value_object_pattern.__path__, prefix='value_object_pattern.'):
+        module = import_module(name=module_info.name)
+        classes.extend(
+            value
+            for value in vars(module).values()
+            if isclass(object=value) and issubclass(value, ValueObject) and value.__module__ == module.__name__
+        )
+
+    return classes
+
+
+@mark.unit_testing
+def test_shipped_value_objects_do_not_have_instance_dict() -> None:
+    """
+    Test that no shipped value object class gives its instances a `__dict__`.
+    """
+    classes = _shipped_value_object_classes()
+    classes_with_dict = sorted(cls.__qualname__ for cls in classes if cls.__dictoffset__ != 0)
+
+    assert len(classes) > 100
+    assert classes_with_dict == []
+
+
+@mark.unit_testing
+def test_shipped_value_objects_support_weak_references() -> None:
+    """
+    Test that slotted value objects can still be weakly referenced.
+    """
+    string = StringValueObject(value='a')
+    sequence = ListValueObject[int](value=[1])
+
+    assert ref(string)() is string
+    assert ref(sequence)() is sequence
+
+
+@mark.unit_testing
+def test_inline_parameterized_collections_do_not_have_instance_dict() -> None:
+    """
+    Test that runtime classes created for inline parameterized collections are slotted.
+    """
+    sequence = ListValueObject[int](value=[1])
+    dictionary = DictValueObject[str, int](value={'a': 1})
+
+    assert not hasattr(sequence, '__dict__')
+    assert not hasattr(dictionary, '__dict__')
+
+
+@mark.unit_testing
+def test_internal_caches_are_stored_in_slots() -> None:
+    """
+    Test that `_internal_` caches set during validation are stored in slots.
+    """
+    address = Ipv4AddressValueObject(value='127.0.0.1')
+
+    assert '_internal_ip_object' in Ipv4AddressValueObject.__slots__
+    assert not hasattr(address, '__dict__')
+    assert address.is_loopback()
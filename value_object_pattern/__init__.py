@@ -1,14 +1,40 @@
 __version__ = '1.34.0'
 
 from .decorators import process, validation
-from .models import BaseModel, EnumerationValueObject, SecretValueObject, UnionValueObject, ValueObject
+from .models import (
+    BaseModel,
+    BatchResult,
+    EnumerationValueObject,
+    FrozenBaseModel,
+    InstrumentationRegistry,
+    InternPool,
+    SecretValueObject,
+    UnionValueObject,
+    ValidationCache,
+    ValidationFailure,
+    ValueObject,
+    disable_instrumentation,
+    enable_instrumentation,
+    frozen_field,
+    get_instrumentation,
+)
 
 __all__ = (
     'BaseModel',
+    'BatchResult',
     'EnumerationValueObject',
+    'FrozenBaseModel',
+    'InstrumentationRegistry',
+    'InternPool',
     'SecretValueObject',
     'UnionValueObject',
+    'ValidationCache',
+    'ValidationFailure',
     'ValueObject',
+    'disable_instrumentation',
+    'enable_instrumentation',
+    'frozen_field',
+    'get_instrumentation',
     'process',
     'validation',
 )
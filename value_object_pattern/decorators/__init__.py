@@ -1,9 +1,15 @@
+from .cached_classproperty import cached_classproperty
 from .classproperty import classproperty
+from .constraint import Constraint
+from .shared_cache import shared_cache
 from .value_object_process import process
 from .value_object_validation import validation
 
 __all__ = (
+    'Constraint',
+    'cached_classproperty',
     'classproperty',
     'process',
+    'shared_cache',
     'validation',
 )
@@ -0,0 +1,124 @@
+"""
+cached_classproperty module.
+"""
+
+from __future__ import annotations
+
+from contextlib import suppress as suppress_exception
+from threading import RLock
+from typing import Any, Callable, Generic, TypeVar
+from weakref import WeakKeyDictionary
+
+R = TypeVar('R')
+
+
+class cached_classproperty(Generic[R]):  # noqa: N801, UP046
+    """
+    A read-only descriptor that behaves like @classproperty, but computes its value once per owner class. Subclasses
+    get their own value, computed the first time the property is read through them. Owner classes are weakly
+    referenced, so classes created at runtime can still be garbage collected.
+
+    Example:
+    ```python
+    from value_object_pattern.decorators import cached_classproperty
+
+
+    class Foo:
+        _name = 'foo'
+
+        @cached_classproperty
+        def name(cls) -> str:
+            print('computing', cls.__name__)
+            return cls._name.upper()
+
+
+    class Bar(Foo):
+        _name = 'bar'
+
+
+    print(Foo.name, Foo().name, Bar.name)
+    # >>> computing Foo
+    # >>> computing Bar
+    # >>> FOO FOO BAR
+    ```
+    """
+
+    def __init__(self, function: Callable[..., R]) -> None:
+        """
+        Initialize a cached_classproperty.
+
+        Args:
+            function (Callable[..., R]): The getter function for the property.
+
+        Raises:
+            TypeError: If `function` is not callable.
+        """
+        if not callable(function):
+            raise TypeError(f'Wrapped function must be callable. Got <<<{type(function).__name__}>>> instead.')
+
+        self._function = function
+        self._values: WeakKeyDictionary[type[Any], R] = WeakKeyDictionary()
+        self._lock = RLock()
+
+        with suppress_exception(AttributeError):
+            self.__doc__ = getattr(function, '__doc__', None)
+
+    def __get__(self, obj: Any, owner: type[Any]) -> R:
+        """
+        Get the value of the class property, computing it on the first access through `owner`. Concurrent first
+        accesses compute the value only once.
+
+        Args:
+            obj (Any): The instance of the class (ignored).
+            owner (type[Any]): The class itself.
+
+        Returns:
+            R: The value of the class property.
+        """
+        try:
+            return self._values[owner]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if owner not in self._values:
+                self._values[owner] = self._function(owner)
+
+            return self._values[owner]
+
+    def invalidate(self, owner: type[Any] | None = None) -> None:
+        """
+        Discard the computed value of `owner` and its subclasses, or of every class when `owner` is None, so the next
+        access computes it again.
+
+        Args:
+            owner (type[Any] | None, optional): The class whose value is discarded. Defaults to None.
+
+        Example:
+        ```python
+        from value_object_pattern.decorators import cached_classproperty
+
+
+        class Foo:
+            _name = 'foo'
+
+            @cached_classproperty
+            def name(cls) -> str:
+                return cls._name.upper()
+
+
+        print(Foo.name)
+        Foo._name = 'bar'
+        Foo.__dict__['name'].invalidate(owner=Foo)
+        print(Foo.name)
+        # >>> FOO
+        # >>> BAR
+        ```
+        """
+        with self._lock:
+            if owner is None:
+                self._values.clear()
+                return
+
+            for cls in [cls for cls in self._values if issubclass(cls, owner)]:
+                del self._values[cls]
@@ -0,0 +1,238 @@
+"""
+Constraint module.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from sys import version_info
+from typing import Any
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+_CHARACTER_CLASSES = frozenset(('isalnum', 'isalpha', 'isascii', 'isdecimal', 'isdigit', 'islower', 'isnumeric', 'isupper'))  # noqa: E501  # fmt: skip
+_EXPRESSIONS = {'not_empty': 'value', 'printable': 'value.isprintable()', 'trimmed': 'value == value.strip()'}
+
+
+class Constraint:
+    """
+    Declarative description of the check made by a `@validation` method, given with its `constraint` argument.
+
+    Consecutive validation methods of a class that declare a constraint are fused into a single generated validation
+    that evaluates every constraint in one expression. The methods themselves only run when that expression fails, so
+    the first failing method raises its own error. A constraint must therefore never accept a value its method rejects.
+
+    Example:
+    ```python
+    from value_object_pattern import ValueObject, validation
+    from value_object_pattern.decorators import Constraint
+
+
+    class CodeValueObject(ValueObject[str]):
+        @validation(order=0, constraint=Constraint.exact_type(expected=str))
+        def _ensure_value_is_string(self, value: str) -> None:
+            if type(value) is not str:
+                raise TypeError(f'CodeValueObject value <<<{value}>>> must be a string.')
+
+        @validation(order=1, constraint=Constraint.length(minimum=2, maximum=8))
+        def _ensure_value_length(self, value: str) -> None:
+            if not 2 <= len(value) <= 8:
+                raise ValueError(f'CodeValueObject value <<<{value}>>> must have between 2 and 8 characters.')
+
+
+    print(repr(CodeValueObject(value='abc')))
+    # >>> CodeValueObject(value='abc')
+    ```
+    """
+
+    __slots__ = ('argument', 'kind')
+
+    def __init__(self, *, kind: str, argument: Any = None) -> None:
+        """
+        Create a constraint, use the class methods instead.
+
+        Args:
+            kind (str): The constraint kind.
+            argument (Any, optional): The constraint argument. Defaults to None.
+        """
+        self.kind = kind
+        self.argument = argument
+
+    @override
+    def __repr__(self) -> str:
+        """
+        Returns the constraint representation.
+
+        Returns:
+            str: The constraint representation.
+        """
+        return f'Constraint(kind={self.kind!r}, argument={self.argument!r})'
+
+    @classmethod
+    def exact_type(cls, *, expected: type) -> Constraint:
+        """
+        The value type is exactly `expected`, subclasses are rejected.
+
+        Args:
+            expected (type): The expected type.
+
+        Raises:
+            TypeError: If `expected` is not a type.
+
+        Returns:
+            Constraint: The constraint.
+        """
+        if not isinstance(expected, type):
+            raise TypeError(f'Constraint expected <<<{expected}>>> must be a type. Got <<<{type(expected).__name__}>>> type.')  # noqa: E501  # fmt: skip
+
+        return cls(kind='type', argument=expected)
+
+    @classmethod
+    def not_empty(cls) -> Constraint:
+        """
+        The value is not empty.
+
+        Returns:
+            Constraint: The constraint.
+        """
+        return cls(kind='not_empty')
+
+    @classmethod
+    def trimmed(cls) -> Constraint:
+        """
+        The string has no leading or trailing whitespaces.
+
+        Returns:
+            Constraint: The constraint.
+        """
+        return cls(kind='trimmed')
+
+    @classmethod
+    def printable(cls) -> Constraint:
+        """
+        Every character of the string is printable.
+
+        Returns:
+            Constraint: The constraint.
+        """
+        return cls(kind='printable')
+
+    @classmethod
+    def character_class(cls, *, method: str) -> Constraint:
+        """
+        The string satisfies the `str` predicate `method`, such as `isalpha` or `isdigit`.
+
+        Args:
+            method (str): The `str` predicate name.
+
+        Raises:
+            ValueError: If `method` is not a supported `str` predicate.
+
+        Returns:
+            Constraint: The constraint.
+        """
+        if method not in _CHARACTER_CLASSES:
+            raise ValueError(f'Constraint method <<<{method}>>> must be one of <<<{", ".join(sorted(_CHARACTER_CLASSES))}>>>.')  # noqa: E501  # fmt: skip
+
+        return cls(kind='character_class', argument=method)
+
+    @classmethod
+    def charset(cls, *, characters: Iterable[str]) -> Constraint:
+        """
+        Every character of the string belongs to `characters`.
+
+        Args:
+            characters (Iterable[str]): The allowed characters.
+
+        Returns:
+            Constraint: The constraint.
+        """
+        return cls(kind='charset', argument=frozenset(characters))
+
+    @classmethod
+    def length(cls, *, minimum: int | None = None, maximum: int | None = None) -> Constraint:
+        """
+        The value length is between `minimum` and `maximum`, both included.
+
+        Args:
+            minimum (int | None, optional): The minimum length. Defaults to None.
+            maximum (int | None, optional): The maximum length. Defaults to None.
+
+        Raises:
+            TypeError: If `minimum` or `maximum` is not an integer.
+            ValueError: If neither `minimum` nor `maximum` is given.
+
+        Returns:
+            Constraint: The constraint.
+        """
+        if minimum is None and maximum is None:
+            raise ValueError('Constraint length must have a minimum or a maximum.')
+
+        for bound in (minimum, maximum):
+            if bound is not None and type(bound) is not int:
+                raise TypeError(f'Constraint length bound <<<{bound}>>> must be an integer. Got <<<{type(bound).__name__}>>> type.')  # noqa: E501  # fmt: skip
+
+        return cls(kind='length', argument=(minimum, maximum))
+
+    @classmethod
+    def regex(cls, *, attribute: str) -> Constraint:
+        """
+        The string fully matches the compiled pattern stored in the class attribute `attribute`. The attribute is read
+        from the concrete class, so subclasses can override the pattern.
+
+        Args:
+            attribute (str): The class attribute holding the compiled pattern.
+
+        Returns:
+            Constraint: The constraint.
+        """
+        return cls(kind='regex', argument=attribute)
+
+    def render(self, *, owner: type, name: str, namespace: dict[str, Any]) -> str:
+        """
+        Returns the Python expression over `value` that is True when the constraint holds, storing the objects it
+        references in `namespace`.
+
+        Args:
+            owner (type): The class the constraint is rendered for.
+            name (str): A name unique to this constraint in the generated code.
+            namespace (dict[str, Any]): The namespace of the generated code.
+
+        Raises:
+            ValueError: If the constraint kind is not supported.
+
+        Returns:
+            str: The expression.
+        """
+        if self.kind == 'type':
+            namespace[name] = self.argument
+            return f'type(value) is {name}'
+
+        if self.kind in _EXPRESSIONS:
+            return _EXPRESSIONS[self.kind]
+
+        if self.kind == 'character_class':
+            return f'value.{self.argument}()'
+
+        if self.kind == 'charset':
+            namespace[name] = self.argument.issuperset
+            return f'{name}(value)'
+
+        if self.kind == 'length':
+            minimum, maximum = self.argument
+            if maximum is None:
+                return f'len(value) >= {minimum}'
+
+            if minimum is None:
+                return f'len(value) <= {maximum}'
+
+            return f'{minimum} <= len(value) <= {maximum}'
+
+        if self.kind == 'regex':
+            namespace[name] = getattr(owner, self.argument).fullmatch
+            return f'{name}(value) is not None'
+
+        raise ValueError(f'Constraint kind <<<{self.kind}>>> is not supported.')
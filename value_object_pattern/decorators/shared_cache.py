@@ -0,0 +1,185 @@
+"""
+Lock-free cache decorator shared by every thread.
+"""
+
+from __future__ import annotations
+
+from functools import update_wrapper
+from inspect import Parameter, signature
+from typing import Any, Callable, Generic, NamedTuple, ParamSpec, Protocol, TypeVar
+
+P = ParamSpec('P')
+R = TypeVar('R')
+R_co = TypeVar('R_co', covariant=True)
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a `shared_cache` function, with the fields of `functools.lru_cache` statistics.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class _shared_cache_wrapper(Protocol, Generic[P, R_co]):  # noqa: N801, UP046
+    """
+    Function cached by `shared_cache`, like `functools._lru_cache_wrapper`.
+    """
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R_co: ...  # pragma: no cover
+
+    def cache_clear(self) -> None: ...  # pragma: no cover
+
+    def cache_info(self) -> CacheInfo: ...  # pragma: no cover
+
+
+class shared_cache:  # noqa: N801
+    """
+    Cache the results of a pure function in a plain dictionary shared by every thread, a replacement for
+    `functools.lru_cache` on hot paths.
+
+    Cache hits are a dictionary read, without the lock `lru_cache` takes on every call, so they do not contend when
+    many threads validate at once, including on free-threaded builds. Results are published with `setdefault`, so
+    concurrent misses on the same arguments may compute the result more than once but always return the same object.
+    When `maxsize` is reached the cache is cleared instead of evicting the least recently used entry. Like `lru_cache`,
+    the cached function has `cache_clear` and `cache_info` methods, its hit and miss counters are not locked and may
+    miss some calls made at once from several threads.
+
+    Example:
+    ```python
+    from value_object_pattern.decorators import shared_cache
+
+
+    @shared_cache(maxsize=16)
+    def square(number: int) -> int:
+        return number * number
+
+
+    print(square(number=4))
+    # >>> 16
+    ```
+    """
+
+    __slots__ = ('maxsize',)
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        """
+        Create the decorator.
+
+        Args:
+            maxsize (int | None, optional): Maximum number of cached results, None means unbounded. Defaults to None.
+
+        Raises:
+            TypeError: If `maxsize` is not an integer.
+            ValueError: If `maxsize` is not a positive integer.
+        """
+        if maxsize is not None:
+            if type(maxsize) is not int:
+                raise TypeError(f'shared_cache maxsize <<<{maxsize}>>> must be an integer. Got <<<{type(maxsize).__name__}>>> type.')  # noqa: E501  # fmt: skip
+
+            if maxsize <= 0:
+                raise ValueError(f'shared_cache maxsize <<<{maxsize}>>> must be a positive integer.')
+
+        self.maxsize = maxsize
+
+    def __call__(self, function: Callable[P, R]) -> _shared_cache_wrapper[P, R]:
+        """
+        Wrap `function` with the cache.
+
+        Args:
+            function (Callable[P, R]): The pure function to cache, its arguments must be hashable.
+
+        Raises:
+            TypeError: If `function` is not callable.
+            TypeError: If `function` has positional only or variadic parameters.
+
+        Returns:
+            _shared_cache_wrapper[P, R]: The cached function, with `cache_clear` and `cache_info` methods.
+        """
+        if not callable(function):
+            raise TypeError(f'shared_cache function <<<{function}>>> must be callable. Got <<<{type(function).__name__}>>> type.')  # noqa: E501  # fmt: skip
+
+        cache: dict[Any, Any] = {}
+        counters = [0, 0]  # hits and misses
+        namespace: dict[str, Any] = {
+            '_cache': cache,
+            '_counters': counters,
+            '_function': function,
+            '_maxsize': self.maxsize,
+            '_missing': object(),
+        }
+        parameters, arguments = _render_parameters(function=function, namespace=namespace)
+        key = arguments[0] if len(arguments) == 1 else f'({"".join(f"{argument}, " for argument in arguments)})'
+
+        # a wrapper with the exact signature of the function makes a cache hit a single dictionary read
+        source = '\n'.join((
+            f'def cached({", ".join(parameters)}):',
+            f'    result = _cache.get({key}, _missing)',
+            '    if result is not _missing:',
+            '        _counters[0] += 1',
+            '        return result',
+            '',
+            '    _counters[1] += 1',
+            f'    result = _function({", ".join(f"{argument}={argument}" for argument in arguments)})',
+            '    if _maxsize is not None and len(_cache) >= _maxsize:',
+            '        _cache.clear()',
+            '',
+            f'    return _cache.setdefault({key}, result)',
+        ))  # fmt: skip
+        exec(compile(source, f'<shared_cache {function.__module__}.{function.__qualname__}>', 'exec'), namespace)  # noqa: S102
+
+        maxsize = self.maxsize
+
+        def cache_clear() -> None:
+            cache.clear()
+            counters[:] = [0, 0]
+
+        def cache_info() -> CacheInfo:
+            return CacheInfo(hits=counters[0], misses=counters[1], maxsize=maxsize, currsize=len(cache))
+
+        cached: Any = update_wrapper(namespace['cached'], function)
+        cached.cache_clear = cache_clear
+        cached.cache_info = cache_info
+        wrapper: _shared_cache_wrapper[P, R] = cached
+
+        return wrapper
+
+
+def _render_parameters(*, function: Callable[..., Any], namespace: dict[str, Any]) -> tuple[list[str], list[str]]:
+    """
+    Return the parameter declarations and argument names reproducing the signature of `function`, storing the default
+    values in `namespace`.
+
+    Args:
+        function (Callable[..., Any]): The cached function.
+        namespace (dict[str, Any]): The namespace of the generated wrapper.
+
+    Raises:
+        TypeError: If `function` has positional only or variadic parameters.
+
+    Returns:
+        tuple[list[str], list[str]]: The parameter declarations and the argument names.
+    """
+    parameters: list[str] = []
+    arguments: list[str] = []
+    keyword_only = False
+    for index, parameter in enumerate(iterable=signature(function).parameters.values()):
+        if parameter.kind not in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY):
+            raise TypeError(f'shared_cache function <<<{function.__qualname__}>>> parameter <<<{parameter.name}>>> must be a named parameter.')  # noqa: E501  # fmt: skip
+
+        if parameter.kind is Parameter.KEYWORD_ONLY and not keyword_only:
+            keyword_only = True
+            parameters.append('*')
+
+        declaration = parameter.name
+        if parameter.default is not Parameter.empty:
+            namespace[f'_default{index}'] = parameter.default
+            declaration = f'{parameter.name}=_default{index}'
+
+        parameters.append(declaration)
+        arguments.append(parameter.name)
+
+    return parameters, arguments
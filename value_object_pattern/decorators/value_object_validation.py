@@ -2,13 +2,15 @@
 Decorator used to register value-object validation hooks.
 """
 
-from functools import wraps
-from typing import Any, Callable
+from typing import Callable
+
+from .constraint import Constraint
 
 
 def validation(
     order: int | None = None,
     early_process: bool = False,
+    constraint: Constraint | None = None,
 ) -> Callable[[Callable[..., None]], Callable[..., None]]:
     """
     Register a method that validates a value before it is stored.
@@ -17,17 +19,23 @@ def validation(
     `early_process=True`, the value object processes the input first and passes both the raw value and the processed
     value to the validator.
 
+    An optional `constraint` declares what the method checks. Consecutive validation methods with a constraint are fused
+    into a single check per class, and the methods only run to raise their error when that check fails, see
+    `Constraint`.
+
     Args:
         order: Execution order for the validation method.
         early_process: Whether to pass a processed value into the validation method.
+        constraint: Declarative constraint checked by the validation method.
 
     Raises:
         TypeError: If the order is not an integer.
         ValueError: If the order is not equal or greater than 0.
         TypeError: If early_process is not a boolean.
+        TypeError: If constraint is not a Constraint.
 
     Returns:
-        Callable[[Callable[..., None]], Callable[..., None]]: Wrapper function for the validation.
+        Callable[[Callable[..., None]], Callable[..., None]]: Decorator that marks the validation method.
 
     Example:
     ```python
@@ -57,9 +65,10 @@ def validation(
             TypeError: If the order is not an integer.
             ValueError: If the order is not equal or greater than 0.
             TypeError: If early_process is not a boolean.
+            TypeError: If constraint is not a Constraint.
 
         Returns:
-            Callable[..., None]: Wrapper function for the validation.
+            Callable[..., None]: The same validation method, marked in place.
         """
         if order is not None:
             if type(order) is not int:
@@ -71,21 +80,14 @@ def validation(
         if type(early_process) is not bool:
             raise TypeError(f'Validation early_process <<<{early_process}>>> must be a boolean. Got <<<{type(early_process).__name__}>>> type.')  # noqa: E501  # fmt: skip
 
+        if constraint is not None and type(constraint) is not Constraint:
+            raise TypeError(f'Validation constraint <<<{constraint}>>> must be a Constraint. Got <<<{type(constraint).__name__}>>> type.')  # noqa: E501  # fmt: skip
+
         function._is_validation = True  # type: ignore[attr-defined]
         function._order = function.__name__ if order is None else str(order)  # type: ignore[attr-defined]
         function._early_process = early_process  # type: ignore[attr-defined]
+        function._constraint = constraint  # type: ignore[attr-defined]
 
-        @wraps(function)
-        def wrapper(*args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
-            """
-            Execute the wrapped validation method.
-
-            Args:
-                *args (tuple[Any, ...]): The arguments for the function.
-                **kwargs (dict[str, Any]): The keyword arguments for the function.
-            """
-            function(*args, **kwargs)
-
-        return wrapper
+        return function
 
     return decorator
@@ -1,13 +1,34 @@
 from .base_model import BaseModel
+from .batch_result import BatchResult
 from .enumeration_value_object import EnumerationValueObject
+from .frozen_base_model import FrozenBaseModel, frozen_field
+from .instrumentation import (
+    InstrumentationRegistry,
+    disable_instrumentation,
+    enable_instrumentation,
+    get_instrumentation,
+)
+from .intern_pool import InternPool
 from .secret_value_object import SecretValueObject
 from .union_value_object import UnionValueObject
+from .validation_cache import ValidationCache
+from .validation_failure import ValidationFailure
 from .value_object import ValueObject
 
 __all__ = (
     'BaseModel',
+    'BatchResult',
     'EnumerationValueObject',
+    'FrozenBaseModel',
+    'InstrumentationRegistry',
+    'InternPool',
     'SecretValueObject',
     'UnionValueObject',
+    'ValidationCache',
+    'ValidationFailure',
     'ValueObject',
+    'disable_instrumentation',
+    'enable_instrumentation',
+    'frozen_field',
+    'get_instrumentation',
 )
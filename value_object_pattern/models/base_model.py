@@ -12,14 +12,187 @@ else:
     from typing_extensions import override  # pragma: no cover
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from copy import deepcopy
 from inspect import Parameter, _empty, signature
 from types import UnionType
-from typing import Any, NoReturn, Self, Union, get_args, get_origin, get_type_hints
-
-from .primitive_conversion import from_primitive, to_display_primitive, to_primitive
+from typing import Any, Callable, ClassVar, Literal, NoReturn, Self, Union, get_args, get_origin, get_type_hints
+
+from .batch_result import BatchResult
+from .jsonl_reader import JSONL_ERROR_MODES, iter_models, read_mapped_lines
+from .lazy_model import learn_lazy_model, new_lazy_model
+from .parallel_validation import chunk_values
+from .primitive_conversion import (
+    compile_column_from_primitive,
+    compile_from_primitive,
+    compile_to_primitive,
+    to_display_primitive,
+    to_primitive,
+)
 from .type_matching import matches_expected_type
 
+_MISSING = object()
+_MAX_LAYOUT_ORDERS = 64
+
+
+def _restore_model(cls: type[BaseModel], attributes: dict[str, Any]) -> BaseModel:
+    """
+    Rebuild a pickled model without calling its constructor, see `BaseModel.__reduce__`.
+
+    Args:
+        cls (type[BaseModel]): The model class.
+        attributes (dict[str, Any]): The model attributes.
+
+    Returns:
+        BaseModel: The model.
+    """
+    model = cls.__new__(cls)
+    for key, value in attributes.items():
+        object.__setattr__(model, key, value)
+
+    return model
+
+
+class _ModelSchema:
+    """
+    Constructor parameters of a model class and the converter of each one, resolved once for `from_primitives`.
+    """
+
+    __slots__ = ('columns', 'fields', 'names', 'required')
+
+    def __init__(self, *, parameters: dict[str, Parameter], annotations: dict[str, Any]) -> None:
+        """
+        Create a model schema.
+
+        Args:
+            parameters (dict[str, Parameter]): The constructor parameters, without `self`.
+            annotations (dict[str, Any]): The resolved constructor annotations.
+        """
+        self.names = frozenset(parameters)
+        self.required = frozenset(name for name, parameter in parameters.items() if parameter.default is _empty)
+        fields: list[tuple[str, Callable[[Any, bool], Any], Any]] = []
+        columns: list[tuple[str, Callable[[list[Any], bool], tuple[list[Any], dict[int, Exception]]], Any]] = []
+        for name, parameter in parameters.items():
+            expected_type = annotations.get(name, parameter.annotation)
+            union_type = expected_type if get_origin(tp=expected_type) in (Union, UnionType) else None
+            convert = compile_from_primitive(expected_type=expected_type)
+            fields.append((name, convert, union_type))
+            columns.append((name, compile_column_from_primitive(expected_type=expected_type, convert=convert), union_type))  # noqa: E501  # fmt: skip
+
+        # parameter name, converter and, for union annotations, the union the converted value must match
+        self.fields = tuple(fields)
+
+        # the same, with the converter of a whole column of values, see `BaseModel.from_primitives_many`
+        self.columns = tuple(columns)
+
+
+class _ModelLayout:
+    """
+    Public key of each attribute of a model class and the sorted public attributes of each attribute layout, resolved
+    once for `_to_dict`, equality, hashing and representation.
+    """
+
+    __slots__ = ('keys', 'orders', 'private_prefix')
+
+    def __init__(self, *, class_name: str) -> None:
+        """
+        Create a model layout.
+
+        Args:
+            class_name (str): The model class name, used to recognize double-underscore private attributes.
+        """
+        self.private_prefix = f'_{class_name}__'
+        # attribute name to public key and whether the attribute is private
+        self.keys: dict[str, tuple[str, bool]] = {}
+        # attribute names, in instance order, to the public key and name of each public attribute sorted by key
+        self.orders: dict[tuple[str, ...], tuple[tuple[str, str], ...]] = {}
+
+    def resolve(self, *, key: str) -> tuple[str, bool]:
+        """
+        Return the public key of the attribute `key` and whether it is private, resolving and caching them on first use.
+
+        Args:
+            key (str): The attribute name.
+
+        Returns:
+            tuple[str, bool]: The public key and whether the attribute is private.
+        """
+        private = key.startswith(self.private_prefix)
+        public_key = key.replace(self.private_prefix, '')
+        if public_key.startswith('_'):
+            public_key = public_key[1:]
+
+        return self.keys.setdefault(key, (public_key, private))
+
+    def order(self, *, names: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+        """
+        Return the public key and name of each public attribute of an instance with the attribute `names`, sorted by
+        public key, resolving and caching them on first use.
+
+        When several attributes share a public key the last one wins, as in `_to_dict`.
+
+        Args:
+            names (tuple[str, ...]): The instance attribute names, in instance order.
+
+        Returns:
+            tuple[tuple[str, str], ...]: The public key and attribute name of each public attribute.
+        """
+        order = self.orders.get(names)
+        if order is not None:
+            return order
+
+        public: dict[str, str] = {}
+        for name in names:
+            public_key, private = self.keys.get(name) or self.resolve(key=name)
+            if not private:
+                public[public_key] = name
+
+        order = tuple(sorted(public.items()))
+        if len(self.orders) >= _MAX_LAYOUT_ORDERS:
+            return order  # instances with unbounded attribute layouts are not cached
+
+        return self.orders.setdefault(names, order)
+
+
+class _ModelSerializer:
+    """
+    Output key and converter of each attribute of a model class, resolved once per attribute for `to_primitives`.
+    """
+
+    __slots__ = ('annotations', 'fields', 'layout')
+
+    def __init__(self, *, layout: _ModelLayout, annotations: dict[str, Any]) -> None:
+        """
+        Create a model serializer.
+
+        Args:
+            layout (_ModelLayout): The attribute layout of the model class.
+            annotations (dict[str, Any]): The resolved attribute and constructor annotations.
+        """
+        self.layout = layout
+        self.annotations = annotations
+        # attribute name to output key and converter, None for private attributes
+        self.fields: dict[str, tuple[str, Callable[[Any], Any]] | None] = {}
+
+    def resolve(self, *, key: str) -> tuple[str, Callable[[Any], Any]] | None:
+        """
+        Return the output key and converter of the attribute `key`, resolving and caching them on first use.
+
+        Args:
+            key (str): The attribute name.
+
+        Returns:
+            tuple[str, Callable[[Any], Any]] | None: The output key and converter, None if the attribute is private.
+        """
+        output_key, private = self.layout.keys.get(key) or self.layout.resolve(key=key)
+        if private:
+            return self.fields.setdefault(key, None)
+
+        expected_type = self.annotations.get(key, self.annotations.get(output_key, _empty))
+        convert = to_primitive if expected_type is _empty else compile_to_primitive(expected_type=expected_type)
+
+        return self.fields.setdefault(key, (output_key, convert))
+
 
 class BaseModel(ABC):
     """
@@ -56,6 +229,13 @@ class BaseModel(ABC):
     ```
     """
 
+    __slots__ = ()
+
+    _primitives_schema: ClassVar[_ModelSchema | None] = None
+    _primitives_serializer: ClassVar[_ModelSerializer | None] = None
+    _attribute_layout: ClassVar[_ModelLayout | None] = None
+    _lazy_model_class: ClassVar[type | bool | None] = None
+
     @abstractmethod
     def __init__(self) -> None:
         """
@@ -120,8 +300,9 @@ class BaseModel(ABC):
         ```
         """
         attributes = []
-        for key, value in sorted(self._to_dict(ignore_private=True).items()):
-            attributes.append(f'{key}={value!r}')
+        values = self.__dict__
+        for key, name in self._public_attributes():
+            attributes.append(f'{key}={values[name]!r}')
 
         return f'{self.__class__.__name__}({", ".join(attributes)})'
 
@@ -158,8 +339,9 @@ class BaseModel(ABC):
         ```
         """
         attributes = []
-        for key, value in sorted(self._to_dict(ignore_private=True).items()):
-            attributes.append(f'{key}={to_display_primitive(value=value)}')
+        values = self.__dict__
+        for key, name in self._public_attributes():
+            attributes.append(f'{key}={to_display_primitive(value=values[name])}')
 
         return f'{self.__class__.__name__}({", ".join(attributes)})'
 
@@ -195,7 +377,8 @@ class BaseModel(ABC):
         # >>> 4606426846015488538
         ```
         """
-        return hash(tuple(sorted(self._to_dict(ignore_private=True).items())))
+        values = self.__dict__
+        return hash(tuple(values[name] for _, name in self._public_attributes()))
 
     @override
     def __eq__(self, other: object) -> bool:
@@ -237,7 +420,49 @@ class BaseModel(ABC):
         if not isinstance(other, self.__class__):
             return NotImplemented
 
-        return self._to_dict(ignore_private=True) == other._to_dict(ignore_private=True)
+        values = self.__dict__
+        other_values = other.__dict__
+        names = tuple(values)
+        if other.__class__ is not self.__class__ or tuple(other_values) != names:
+            return self._to_dict(ignore_private=True) == other._to_dict(ignore_private=True)
+
+        for _, name in self._resolve_attribute_layout().order(names=names):
+            value = values[name]
+            other_value = other_values[name]
+            if not (value is other_value or value == other_value):
+                return False
+
+        return True
+
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Reduce the model to its class and its attributes.
+
+        Unpickling does not call `__init__`, the attributes are set back directly and nested value objects are restored
+        without being validated again, see `ValueObject.__reduce__`.
+
+        Returns:
+            tuple[Any, ...]: The restore function and its arguments.
+
+        Example:
+        ```python
+        from pickle import dumps, loads
+
+        from value_object_pattern import BaseModel
+
+
+        class User(BaseModel):
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+
+        user = loads(dumps(User(name='John Doe')))
+        print(user)
+        # >>> User(name=John Doe)
+        ```
+        """
+        return _restore_model, (self.__class__, self.__dict__)
 
     def __copy__(self) -> BaseModel:
         """
@@ -311,7 +536,7 @@ class BaseModel(ABC):
         cls = self.__class__
         clone = cls.__new__(cls)
         memo[id(self)] = clone
-        for key, value in self.__dict__.items():
+        for key, value in self._attribute_items():
             object.__setattr__(clone, key, deepcopy(value, memo))
 
         return clone
@@ -330,30 +555,74 @@ class BaseModel(ABC):
         Returns:
             dict[str, Any]: Dictionary representation of the class.
         """
+        layout = self._resolve_attribute_layout()
+        keys = layout.keys
         dictionary: dict[str, Any] = {}
-        for key, value in self.__dict__.items():
-            if ignore_private and key.startswith(f'_{self.__class__.__name__}__'):
+        for key, value in self._attribute_items():
+            public_key, private = keys.get(key) or layout.resolve(key=key)
+            if ignore_private and private:
                 continue  # ignore private attributes
 
-            key = key.replace(f'_{self.__class__.__name__}__', '')
+            dictionary[public_key] = value
 
-            if key.startswith('_'):
-                key = key[1:]
+        return dictionary
 
-            dictionary[key] = value
+    def _attribute_items(self) -> Iterable[tuple[str, Any]]:
+        """
+        Returns the name and value of each instance attribute, private attributes included.
 
-        return dictionary
+        Returns:
+            Iterable[tuple[str, Any]]: The name and value of each attribute.
+        """
+        return self.__dict__.items()
+
+    def _public_attributes(self) -> tuple[tuple[str, str], ...]:
+        """
+        Returns the public key and attribute name of each public attribute, sorted by public key.
+
+        Returns:
+            tuple[tuple[str, str], ...]: The public key and attribute name of each public attribute.
+        """
+        return self._resolve_attribute_layout().order(names=tuple(self.__dict__))
+
+    @classmethod
+    def _resolve_attribute_layout(cls) -> _ModelLayout:
+        """
+        Return the attribute layout of the class, creating and caching it on first use.
+
+        Returns:
+            _ModelLayout: The attribute layout of the class.
+        """
+        layout = cls.__dict__.get('_attribute_layout')
+        if layout is not None:
+            return layout  # type: ignore[no-any-return]
+
+        layout = _ModelLayout(class_name=cls.__name__)
+        cls._attribute_layout = layout
+
+        return layout
 
     @classmethod
-    def from_primitives(cls, primitives: dict[str, Any]) -> Self:
+    def from_primitives(cls, primitives: dict[str, Any], *, trusted: bool = False, lazy: bool = False) -> Self:
         """
         Create an instance from primitive constructor values.
 
         Primitive values are converted according to the constructor annotations, including nested `ValueObject`,
-        `BaseModel`, `Enum`, collection, and union annotations.
+        `BaseModel`, `Enum`, collection, and union annotations. Use `trusted=True` to rehydrate primitives that are
+        known to be valid, such as the output of `to_primitives()`, nested value objects are then created through
+        `ValueObject.from_trusted` without running their validations.
+
+        Use `lazy=True` to keep the primitive of each field and convert it, validations included, the first time the
+        attribute is read. Nested models are then created lazily as well. Equality and `to_primitives()` use the kept
+        primitives as they are, every other method converts the remaining fields first. Lazy instances are instances of
+        a subclass generated from the first instance created with `lazy=True`, which is created eagerly. The
+        constructor of lazy instances is not called, so classes whose constructor does more than storing each parameter
+        as an attribute, or that override the methods of `BaseModel`, are always created eagerly.
 
         Args:
             primitives: Dictionary keyed by constructor parameter name.
+            trusted: Whether the primitives are known to be valid. Defaults to False.
+            lazy: Whether to convert each field on first access. Defaults to False.
 
         Raises:
             TypeError: If the `primitives` is not a dictionary of strings.
@@ -385,41 +654,306 @@ class BaseModel(ABC):
         # >>> {'name': 'John Doe', 'birthdate': '1900-01-01T00:00:00+00:00'}
         ```
         """  # noqa: E501
-        if not isinstance(primitives, dict) or not all(isinstance(key, str) for key in primitives):  # type: ignore[redundant-expr]
+        if not isinstance(primitives, dict):
             cls._raise_value_is_not_dict_of_strings(value=primitives)
 
-        constructor_signature = signature(obj=cls.__init__)
-        parameters: dict[str, Parameter] = {parameter.name: parameter for parameter in constructor_signature.parameters.values() if parameter.name != 'self'}  # noqa: E501  # fmt: skip
-        missing = {name for name, parameter in parameters.items() if parameter.default is _empty and name not in primitives}  # noqa: E501  # fmt: skip
-        extra = set(primitives) - parameters.keys()
+        # the parameter names are strings, so the keys only need checking when they are not all parameters
+        schema = cls._resolve_primitives_schema()
+        keys = primitives.keys()
+        if not keys <= schema.names or not schema.required <= keys:
+            cls._raise_primitives_do_not_match_schema(primitives=primitives, schema=schema)
 
-        if missing or extra:
-            cls._raise_value_constructor_parameters_mismatch(primitives=set(primitives), missing=missing, extra=extra)
+        if lazy:
+            model = new_lazy_model(cls, primitives=primitives, trusted=trusted)
+            if model is not None:
+                return model  # type: ignore[no-any-return]
 
-        constructor_annotations = cls._get_constructor_annotations()
         converted_primitives: dict[str, Any] = {}
-        for parameter_name in parameters:
-            if parameter_name not in primitives:
+        for parameter_name, convert, union_type in schema.fields:
+            value = primitives.get(parameter_name, _MISSING)
+            if value is _MISSING:
                 continue
 
-            expected_type = constructor_annotations.get(parameter_name, parameters[parameter_name].annotation)
-            converted_value = from_primitive(
-                value=primitives[parameter_name],
-                expected_type=expected_type,
-            )
-            if get_origin(tp=expected_type) in (Union, UnionType) and not matches_expected_type(
-                value=converted_value,
-                expected_type=expected_type,
-            ):
+            converted_value = convert(value, trusted)
+            if union_type is not None and not matches_expected_type(value=converted_value, expected_type=union_type):
                 cls._raise_value_is_not_of_type(
                     parameter=parameter_name,
                     value=converted_value,
-                    expected_type=expected_type,
+                    expected_type=union_type,
                 )
 
             converted_primitives[parameter_name] = converted_value
 
-        return cls(**converted_primitives)
+        model = cls(**converted_primitives)
+        if lazy:
+            learn_lazy_model(cls, model=model, schema=schema, arguments=converted_primitives)
+
+        return model
+
+    @classmethod
+    def from_primitives_many(
+        cls,
+        rows: Iterable[dict[str, Any]],
+        *,
+        errors: Literal['raise', 'collect', 'skip'] = 'collect',
+        trusted: bool = False,
+    ) -> BatchResult[Self]:
+        """
+        Create an instance from each of `rows` in one call, returning the valid instances and the rejected rows, see
+        `from_primitives`.
+
+        The rows are converted column by column: the values of each constructor parameter are gathered across the rows
+        and converted together, value objects through `ValueObject.validate_many` and nested models through this same
+        method, so hook plans and schemas are resolved once per column instead of once per row. The instances are
+        created once every column is converted. A row is rejected with the error of its first rejected parameter, in
+        constructor order, with a note telling the parameter name. With `errors='raise'` the error of the first rejected
+        row is raised with a note telling its index, with `errors='collect'` every error is stored by index in the
+        result, and with `errors='skip'` rejected rows are dropped. The rows are read into a list first.
+
+        Args:
+            rows (Iterable[dict[str, Any]]): Dictionaries keyed by constructor parameter name.
+            errors (Literal['raise', 'collect', 'skip'], optional): How rejected rows are handled. Defaults to
+            'collect'.
+            trusted (bool, optional): Whether the primitives are known to be valid. Defaults to False.
+
+        Raises:
+            ValueError: If `errors` is not 'raise', 'collect' or 'skip'.
+            TypeError: If a row is rejected with a TypeError and `errors` is 'raise'.
+            ValueError: If a row is rejected with a ValueError and `errors` is 'raise'.
+
+        Returns:
+            BatchResult[Self]: The valid instances and the errors of the rejected rows.
+
+        Example:
+        ```python
+        from value_object_pattern import BaseModel
+        from value_object_pattern.usables import PositiveIntegerValueObject
+
+
+        class Item(BaseModel):
+            def __init__(self, quantity: PositiveIntegerValueObject) -> None:
+                self.quantity = quantity
+
+
+        result = Item.from_primitives_many(rows=[{'quantity': 1}, {'quantity': -1}])
+        print(result.indexes, result.errors)
+        # >>> [0] {1: ValueError('PositiveIntegerValueObject value <<<-1>>> must be a positive integer.')}
+        ```
+        """
+        if errors not in ('raise', 'collect', 'skip'):
+            raise ValueError(f'{cls.__name__} errors <<<{errors}>>> must be one of <<<raise, collect, skip>>>.')
+
+        rows = rows if type(rows) is list else list(rows)
+        schema = cls._resolve_primitives_schema()
+        failures = cls._reject_malformed_rows(rows=rows, schema=schema)
+        arguments = cls._convert_columns(rows=rows, schema=schema, trusted=trusted, failures=failures)
+
+        result: BatchResult[Self] = BatchResult()
+        instances, indexes, rejected = result.instances, result.indexes, result.errors
+        for index, keyword_arguments in enumerate(arguments):
+            failure = failures.get(index)
+            if failure is None:
+                try:
+                    instance = cls(**keyword_arguments)
+
+                except (TypeError, ValueError) as error:
+                    failure = error
+
+                else:
+                    instances.append(instance)
+                    indexes.append(index)
+                    continue
+
+            if errors == 'raise':
+                failure.add_note(f'{cls.__name__} batch index <<<{index}>>>')
+                raise failure
+
+            if errors == 'collect':
+                rejected[index] = failure.with_traceback(None)
+
+        return result
+
+    @classmethod
+    def _reject_malformed_rows(cls, *, rows: list[Any], schema: _ModelSchema) -> dict[int, Exception]:
+        """
+        Return the error of every row that is not a dictionary keyed by the constructor parameters, by row index.
+
+        Args:
+            rows (list[Any]): The rows.
+            schema (_ModelSchema): The constructor schema of the class.
+
+        Returns:
+            dict[int, Exception]: The error of each malformed row.
+        """
+        names, required = schema.names, schema.required
+        failures: dict[int, Exception] = {}
+        for index, row in enumerate(rows):
+            if type(row) is dict and row.keys() <= names and required <= row.keys():
+                continue
+
+            try:
+                if not isinstance(row, dict):
+                    cls._raise_value_is_not_dict_of_strings(value=row)
+
+                cls._raise_primitives_do_not_match_schema(primitives=row, schema=schema)
+
+            except (TypeError, ValueError) as error:
+                failures[index] = error
+
+        return failures
+
+    @classmethod
+    def _convert_columns(
+        cls,
+        *,
+        rows: list[dict[str, Any]],
+        schema: _ModelSchema,
+        trusted: bool,
+        failures: dict[int, Exception],
+    ) -> list[dict[str, Any]]:
+        """
+        Convert the rows column by column into the constructor arguments of each row.
+
+        The error of the first rejected parameter of each row is added to `failures`, with a note telling its name.
+
+        Args:
+            rows (list[dict[str, Any]]): The rows.
+            schema (_ModelSchema): The constructor schema of the class.
+            trusted (bool): Whether the primitives are known to be valid.
+            failures (dict[int, Exception]): The error of each rejected row, by row index, updated in place.
+
+        Returns:
+            list[dict[str, Any]]: The converted constructor arguments of each row.
+        """
+        valid = [index for index in range(len(rows)) if index not in failures] if failures else range(len(rows))
+        arguments: list[dict[str, Any]] = [{} for _ in rows]
+        for name, convert_column, union_type in schema.columns:
+            present = valid if name in schema.required else [index for index in valid if name in rows[index]]
+            converted, column_errors = convert_column([rows[index][name] for index in present], trusted)
+            for position, error in column_errors.items():
+                index = present[position]
+                if index not in failures:
+                    error.add_note(f'{cls.__name__} parameter <<<{name}>>>')
+                    failures[index] = error
+
+            for index, value in zip(present, converted, strict=True):
+                arguments[index][name] = value
+                if union_type is None or index in failures:
+                    continue
+
+                if not matches_expected_type(value=value, expected_type=union_type):
+                    try:
+                        cls._raise_value_is_not_of_type(parameter=name, value=value, expected_type=union_type)
+
+                    except TypeError as error:
+                        failures[index] = error
+
+        return arguments
+
+    @classmethod
+    def iter_from_jsonl(
+        cls,
+        file: Iterable[Any],
+        *,
+        errors: Literal['raise', 'collect', 'skip'] = 'collect',
+        batch_size: int | None = None,
+        trusted: bool = False,
+        memory_map: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Lazily create an instance from every line of a JSON Lines file, see `from_primitives`.
+
+        Lines are read and parsed one at a time, so memory stays bounded whatever the size of the file, and blank lines
+        are skipped. With `errors='raise'` the first `TypeError` or `ValueError`, invalid JSON included, is raised with
+        a note telling its line number, with `errors='collect'` a `(line_number, error)` tuple is yielded in place of
+        every rejected line, and with `errors='skip'` rejected lines are dropped. Line numbers start at 1.
+
+        Pass `batch_size` to receive lists of at most that many records instead of single records. Pass
+        `memory_map=True` with a file opened in binary mode to read the lines from a read-only memory map of the file.
+
+        Args:
+            file (Iterable[Any]): File object, or any iterable of `str` or `bytes` lines.
+            errors (Literal['raise', 'collect', 'skip'], optional): How rejected lines are handled. Defaults to
+            'collect'.
+            batch_size (int | None, optional): Number of records per yielded list, None yields single records. Defaults
+            to None.
+            trusted (bool, optional): Whether the primitives are known to be valid. Defaults to False.
+            memory_map (bool, optional): Whether to read the lines through a memory map. Defaults to False.
+
+        Raises:
+            ValueError: If `errors` is not 'raise', 'collect' or 'skip'.
+            TypeError: If `batch_size` is not an integer.
+            ValueError: If `batch_size` is not a positive integer.
+            TypeError: If `memory_map` is True and `file` is not backed by a file descriptor.
+            TypeError: If a line is rejected with a TypeError and `errors` is 'raise'.
+            ValueError: If a line is not valid JSON or is rejected with a ValueError and `errors` is 'raise'.
+
+        Returns:
+            Iterator[Any]: The instances and, with `errors='collect'`, the line number and error of each rejected line,
+            or lists of them when `batch_size` is given.
+
+        Example:
+        ```python
+        from value_object_pattern import BaseModel
+        from value_object_pattern.usables import PositiveIntegerValueObject
+
+
+        class Item(BaseModel):
+            def __init__(self, quantity: PositiveIntegerValueObject) -> None:
+                self.quantity = quantity
+
+
+        for record in Item.iter_from_jsonl(['{"quantity": 1}', '{"quantity": -1}']):
+            print(record)
+        # >>> Item(quantity=1)
+        # >>> (2, ValueError('PositiveIntegerValueObject value <<<-1>>> must be a positive integer.'))
+        ```
+        """
+        if errors not in JSONL_ERROR_MODES:
+            raise ValueError(f'{cls.__name__} errors <<<{errors}>>> must be one of <<<raise, collect, skip>>>.')
+
+        if batch_size is not None:
+            if type(batch_size) is not int:
+                raise TypeError(f'{cls.__name__} batch_size <<<{batch_size}>>> must be an integer. Got <<<{type(batch_size).__name__}>>> type.')  # noqa: E501  # fmt: skip
+
+            if batch_size <= 0:
+                raise ValueError(f'{cls.__name__} batch_size <<<{batch_size}>>> must be a positive integer.')
+
+        if memory_map and getattr(file, 'fileno', None) is None:
+            raise TypeError(f'JSON Lines file <<<{file}>>> must be a file object backed by a file descriptor to be memory mapped.')  # noqa: E501  # fmt: skip
+
+        lines = read_mapped_lines(file=file) if memory_map else file
+        records = iter_models(cls, lines=lines, errors=errors, trusted=trusted)
+        if batch_size is None:
+            return records
+
+        return chunk_values(values=records, chunk_size=batch_size)
+
+    @classmethod
+    def _resolve_primitives_schema(cls) -> _ModelSchema:
+        """
+        Return the constructor schema of the class, resolving and caching it on first use.
+
+        The schema is stored on the class itself, delete it after replacing `__init__`. It is only cached once every
+        constructor annotation resolves, so forward references defined later are picked up by the next call.
+
+        Returns:
+            _ModelSchema: The constructor schema of the class.
+        """
+        schema = cls.__dict__.get('_primitives_schema')
+        if schema is not None:
+            return schema  # type: ignore[no-any-return]
+
+        constructor_signature = signature(obj=cls.__init__)
+        parameters: dict[str, Parameter] = {parameter.name: parameter for parameter in constructor_signature.parameters.values() if parameter.name != 'self'}  # noqa: E501  # fmt: skip
+        annotations = cls._get_constructor_annotations()
+        schema = _ModelSchema(parameters=parameters, annotations=annotations)
+        if any(name not in annotations for name, parameter in parameters.items() if parameter.annotation is not _empty):
+            return schema
+
+        cls._primitives_schema = schema
+
+        return schema
 
     @classmethod
     def _get_constructor_annotations(cls) -> dict[str, Any]:
@@ -487,6 +1021,27 @@ class BaseModel(ABC):
         """
         raise TypeError(f'{cls.__name__} primitives <<<{value}>>> must be a dictionary of strings. Got <<<{type(value).__name__}>>> type.')  # noqa: E501  # fmt: skip
 
+    @classmethod
+    def _raise_primitives_do_not_match_schema(cls, *, primitives: dict[Any, Any], schema: _ModelSchema) -> NoReturn:
+        """
+        Raises the error of a primitives dictionary whose keys are not the constructor parameters of the class.
+
+        Args:
+            primitives (dict[Any, Any]): The primitives dictionary.
+            schema (_ModelSchema): The constructor schema of the class.
+
+        Raises:
+            TypeError: If the `primitives` keys are not all strings.
+            ValueError: If the `primitives` does not have all the required attributes or has extra attributes.
+        """
+        if not all(isinstance(key, str) for key in primitives):
+            cls._raise_value_is_not_dict_of_strings(value=primitives)
+
+        keys = primitives.keys()
+        missing = set(schema.required - keys)
+        extra = set(keys - schema.names)
+        cls._raise_value_constructor_parameters_mismatch(primitives=set(primitives), missing=missing, extra=extra)
+
     @classmethod
     def _raise_value_constructor_parameters_mismatch(
         cls,
@@ -544,8 +1099,49 @@ class BaseModel(ABC):
         # >>> {'name': 'John Doe', 'birthdate': '1900-01-01T00:00:00+00:00'}
         ```
         """
-        dictionary = self._to_dict(ignore_private=True)
-        for key, value in dictionary.items():
-            dictionary[key] = to_primitive(value=value)
+        serializer = self._resolve_primitives_serializer()
+        fields = serializer.fields
+        dictionary: dict[str, Any] = {}
+        for key, value in self._attribute_items():
+            try:
+                field = fields[key]
+
+            except KeyError:
+                field = serializer.resolve(key=key)
+
+            if field is None:
+                continue  # ignore private attributes
+
+            output_key, convert = field
+            dictionary[output_key] = convert(value)
 
         return dictionary
+
+    @classmethod
+    def _resolve_primitives_serializer(cls) -> _ModelSerializer:
+        """
+        Return the attribute serializer of the class, resolving and caching it on first use.
+
+        Attribute converters are picked from the class annotations, or from the constructor annotation of the parameter
+        with the same name, and attributes without annotation use `to_primitive`. The serializer is only cached once
+        the class annotations resolve, so forward references defined later are picked up by the next call.
+
+        Returns:
+            _ModelSerializer: The attribute serializer of the class.
+        """
+        serializer = cls.__dict__.get('_primitives_serializer')
+        if serializer is not None:
+            return serializer  # type: ignore[no-any-return]
+
+        try:
+            class_annotations = get_type_hints(cls)
+
+        except Exception:
+            return _ModelSerializer(layout=cls._resolve_attribute_layout(), annotations={})
+
+        annotations = {**cls._get_constructor_annotations(), **class_annotations}
+        annotations.pop('return', None)
+        serializer = _ModelSerializer(layout=cls._resolve_attribute_layout(), annotations=annotations)
+        cls._primitives_serializer = serializer
+
+        return serializer
@@ -0,0 +1,55 @@
+"""
+Outcome of constructing many value objects in one call.
+"""
+
+from __future__ import annotations
+
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+from typing import Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class BatchResult(Generic[T]):  # noqa: UP046
+    """
+    Hold the valid instances and the per-index errors of a batch construction, see `ValueObject.validate_many`.
+
+    `instances` keeps the valid instances in input order and `indexes` the input position of each of them. `errors` maps
+    the input position of every rejected value to its error, whose `validation_failure` attribute is a
+    `ValidationFailure` when a `@validation` method rejected the value. Collected errors do not keep their traceback.
+
+    Example:
+    ```python
+    from value_object_pattern.usables import PositiveIntegerValueObject
+
+    result = PositiveIntegerValueObject.validate_many(values=[1, -2, 3])
+    print(result.instances, result.indexes, result.errors)
+    # >>> [PositiveIntegerValueObject(value=1), PositiveIntegerValueObject(value=3)] [0, 2] {1: ValueError('PositiveIntegerValueObject value <<<-2>>> must be a positive integer.')}
+    ```
+    """  # noqa: E501
+
+    __slots__ = ('errors', 'indexes', 'instances')
+
+    def __init__(self) -> None:
+        """
+        Create an empty batch result.
+        """
+        self.instances: list[T] = []
+        self.indexes: list[int] = []
+        self.errors: dict[int, Exception] = {}
+
+    @override
+    def __repr__(self) -> str:
+        """
+        Returns the number of valid instances and errors of the batch.
+
+        Returns:
+            str: A string representation in the format 'BatchResult(instances=..., errors=...)'.
+        """
+        return f'BatchResult(instances={len(self.instances)}, errors={len(self.errors)})'
@@ -153,18 +153,24 @@ class _DictValueObjectAlias:
         _validate_dict_type_argument(type_argument=key_type)
         _validate_dict_type_argument(type_argument=value_type)
         key = (self.__origin__, key_type, value_type)
-        if key not in self._runtime_classes:
-            self._runtime_classes[key] = type(
-                f'{self.__origin__.__name__}[{self._format_type_argument(type=key_type)}, {self._format_type_argument(type=value_type)}]',  # noqa: E501
-                (self.__origin__,),
-                {
-                    '_is_inline_parameterized_dict_value_object': True,
-                    '_key_type': key_type,
-                    '_value_type': value_type,
-                },
+        runtime_class = self._runtime_classes.get(key)
+        if runtime_class is None:
+            # concurrent first uses may build two classes, setdefault publishes a single one to every thread
+            runtime_class = self._runtime_classes.setdefault(
+                key,
+                type(
+                    f'{self.__origin__.__name__}[{self._format_type_argument(type=key_type)}, {self._format_type_argument(type=value_type)}]',  # noqa: E501
+                    (self.__origin__,),
+                    {
+                        '__slots__': (),
+                        '_is_inline_parameterized_dict_value_object': True,
+                        '_key_type': key_type,
+                        '_value_type': value_type,
+                    },
+                ),
             )
 
-        return self._runtime_classes[key]
+        return runtime_class
 
     @staticmethod
     def _format_type_argument(*, type: Any) -> str:
@@ -213,6 +219,8 @@ class DictValueObject(ValueObject[dict[K, V]], Generic[K, V]):  # noqa: UP046
     ```
     """
 
+    __slots__ = ()
+
     _key_type: K
     _value_type: V
 
@@ -635,12 +643,14 @@ class DictValueObject(ValueObject[dict[K, V]], Generic[K, V]):  # noqa: UP046
         return str(type).replace('typing.', '')
 
     @classmethod
-    def from_primitives(cls, value: dict[Any, Any]) -> Self:
+    def from_primitives(cls, value: dict[Any, Any], *, trusted: bool = False) -> Self:
         """
         Creates a DictValueObject from a dictionary of primitives.
 
         Args:
             value (dict[Any, Any]): The dictionary of primitives.
+            trusted (bool, optional): Whether the primitives are known to be valid, in which case the dictionary and its
+            items are created through `from_trusted`. Defaults to False.
 
         Returns:
             Self: The created DictValueObject.
@@ -673,10 +683,13 @@ class DictValueObject(ValueObject[dict[K, V]], Generic[K, V]):  # noqa: UP046
         dictionary: dict[Any, Any] = {}
 
         for key, item in value.items():
-            primitive_key = from_primitive(value=key, expected_type=cls._key_type)
-            primitive_value = from_primitive(value=item, expected_type=cls._value_type)
+            primitive_key = from_primitive(value=key, expected_type=cls._key_type, trusted=trusted)
+            primitive_value = from_primitive(value=item, expected_type=cls._value_type, trusted=trusted)
             dictionary[primitive_key] = primitive_value
 
+        if trusted:
+            return cls.from_trusted(value=dictionary, process=True)
+
         return cls(value=dictionary)
 
     def to_primitives(self) -> dict[Any, Any]:
@@ -17,10 +17,11 @@ from inspect import isclass
 from types import UnionType
 from typing import Any, ClassVar, Generic, NoReturn, Self, TypeVar, Union, cast, get_args, get_origin
 
-from value_object_pattern.decorators import validation
+from value_object_pattern.decorators import cached_classproperty, validation
 from value_object_pattern.models import ValueObject
 from value_object_pattern.models.primitive_conversion import from_primitive, to_primitive
 from value_object_pattern.models.type_matching import matches_expected_type
+from value_object_pattern.models.value_object import _uses_generic_constructor
 
 T = TypeVar('T', bound=Any)
 
@@ -113,17 +114,23 @@ class _ListValueObjectAlias:
         type_argument, *_ = self.__args__
         _validate_list_type_argument(type_argument=type_argument)
         key = (self.__origin__, type_argument)
-        if key not in self._runtime_classes:
-            self._runtime_classes[key] = type(
-                f'{self.__origin__.__name__}[{self._format_type_argument(type=type_argument)}]',
-                (self.__origin__,),
-                {
-                    '_is_inline_parameterized_list_value_object': True,
-                    '_type': type_argument,
-                },
+        runtime_class = self._runtime_classes.get(key)
+        if runtime_class is None:
+            # concurrent first uses may build two classes, setdefault publishes a single one to every thread
+            runtime_class = self._runtime_classes.setdefault(
+                key,
+                type(
+                    f'{self.__origin__.__name__}[{self._format_type_argument(type=type_argument)}]',
+                    (self.__origin__,),
+                    {
+                        '__slots__': (),
+                        '_is_inline_parameterized_list_value_object': True,
+                        '_type': type_argument,
+                    },
+                ),
             )
 
-        return self._runtime_classes[key]
+        return runtime_class
 
     @staticmethod
     def _format_type_argument(*, type: Any) -> str:
@@ -169,6 +176,8 @@ class ListValueObject(ValueObject[list[T]], Generic[T]):  # noqa: UP046
     ```
     """
 
+    __slots__ = ()
+
     _type: T
 
     @classmethod
@@ -535,7 +544,7 @@ class ListValueObject(ValueObject[list[T]], Generic[T]):  # noqa: UP046
         # >>> False
         ```
         """
-        return self.__class__(value=[*self._value, item])
+        return self._from_trusted_items(value=[*self._value, item], new_items=[item])
 
     def add_from_primitives(self, *, item: Any) -> Self:
         """
@@ -606,7 +615,7 @@ class ListValueObject(ValueObject[list[T]], Generic[T]):  # noqa: UP046
         # >>> False
         ```
         """
-        return self.__class__(value=self._value + items)
+        return self._from_trusted_items(value=self._value + items, new_items=items)
 
     def extend_from_primitives(self, *, items: list[Any]) -> Self:
         """
@@ -685,7 +694,7 @@ class ListValueObject(ValueObject[list[T]], Generic[T]):  # noqa: UP046
         except ValueError:
             self._raise_value_not_found_when_deleting(value=item)
 
-        return self.__class__(value=items)
+        return self._from_trusted_items(value=items, new_items=[])
 
     def _raise_value_not_found_when_deleting(self, value: Any) -> NoReturn:
         """
@@ -774,7 +783,7 @@ class ListValueObject(ValueObject[list[T]], Generic[T]):  # noqa: UP046
             if item not in self._value:
                 self._raise_value_not_found_when_deleting(value=item)
 
-        return self.__class__(value=new_list)
+        return self._from_trusted_items(value=new_list, new_items=[])
 
     def delete_all_from_primitives(self, *, items: list[Any]) -> Self:
         """
@@ -815,6 +824,44 @@ class ListValueObject(ValueObject[list[T]], Generic[T]):  # noqa: UP046
 
         return self.delete_all(items=items)
 
+    def _from_trusted_items(self, *, value: list[T], new_items: list[Any]) -> Self:
+        """
+        Returns a new ListValueObject built from `value`, whose items are already validated except for `new_items`.
+
+        Only `new_items` are type checked and the value object is created through `from_trusted`. Subclasses that add
+        their own validations or constructors are created through the regular constructor instead, which is also used
+        to raise the regular error when a new item is not of type T.
+
+        Args:
+            value (list[T]): The new list value.
+            new_items (list[Any]): The items of `value` that do not come from this list.
+
+        Returns:
+            Self: A new ListValueObject with the given value.
+        """
+        cls = self.__class__
+        if not cls._has_only_list_validations() or not _uses_generic_constructor(cls=cls):
+            return cls(value=value)
+
+        if self._type is not Any:
+            for item in new_items:
+                if not matches_expected_type(value=item, expected_type=self._type):
+                    return cls(value=value)
+
+        return cls.from_trusted(value=value, process=True)
+
+    @classmethod
+    def _has_only_list_validations(cls) -> bool:
+        """
+        Returns True if the only validations of the class are the ListValueObject ones, otherwise False.
+
+        Returns:
+            bool: True if the only validations of the class are the ListValueObject ones, otherwise False.
+        """
+        list_validations = (ListValueObject._ensure_value_is_from_list, ListValueObject._ensure_value_is_of_type)
+
+        return all(method in list_validations for method, _ in cls._resolve_hook_plan().validations)
+
     def _type_label(self) -> str:
         """
         Returns a readable label for the configured type, including unions.
@@ -822,12 +869,22 @@ class ListValueObject(ValueObject[list[T]], Generic[T]):  # noqa: UP046
         Returns:
             str: The type label.
         """
-        origin = get_origin(tp=self._type)
+        return self._resolved_type_label
+
+    @cached_classproperty
+    def _resolved_type_label(cls) -> str:  # noqa: N805
+        """
+        Resolve the type label of `_type_label`, once per class.
+
+        Returns:
+            str: The type label.
+        """
+        origin = get_origin(tp=cls._type)
         if origin in (Union, UnionType):
-            parts = [self._format_single_type(type=type) for type in get_args(self._type)]
+            parts = [cls._format_single_type(type=type) for type in get_args(cls._type)]
             return ' | '.join(parts)
 
-        return self._format_single_type(type=self._type)
+        return cls._format_single_type(type=cls._type)
 
     @staticmethod
     def _format_single_type(*, type: Any) -> str:
@@ -849,12 +906,14 @@ class ListValueObject(ValueObject[list[T]], Generic[T]):  # noqa: UP046
         return str(type).replace('typing.', '')
 
     @classmethod
-    def from_primitives(cls, value: list[Any]) -> Self:
+    def from_primitives(cls, value: list[Any], *, trusted: bool = False) -> Self:
         """
         Creates a ListValueObject from a list of primitives.
 
         Args:
             value (list[Any]): The list of primitives.
+            trusted (bool, optional): Whether the primitives are known to be valid, in which case the list and its items
+            are created through `from_trusted`. Defaults to False.
 
         Returns:
             Self: The created ListValueObject.
@@ -881,7 +940,11 @@ class ListValueObject(ValueObject[list[T]], Generic[T]):  # noqa: UP046
         if not isinstance(cast(Any, value), list):
             return cls(value=value)
 
-        return cls(value=[from_primitive(value=item, expected_type=cls._type) for item in value])
+        items = [from_primitive(value=item, expected_type=cls._type, trusted=trusted) for item in value]
+        if trusted:
+            return cls.from_trusted(value=items, process=True)
+
+        return cls(value=items)
 
     def to_primitives(self) -> list[Any]:
         """
@@ -9,11 +9,12 @@ if version_info >= (3, 12):
 else:
     from typing_extensions import override  # pragma: no cover
 
+from contextlib import suppress as suppress_exception
 from enum import Enum
 from inspect import isclass
 from typing import Any, Generic, NoReturn, TypeVar, get_args, get_origin
 
-from value_object_pattern.decorators import process, validation
+from value_object_pattern.decorators import cached_classproperty, process, validation
 
 from .value_object import ValueObject
 
@@ -54,6 +55,8 @@ class EnumerationValueObject(ValueObject[Any | E], Generic[E]):  # noqa: UP046
     ```
     """
 
+    __slots__ = ()
+
     _enumeration: type[E]
 
     @override
@@ -99,11 +102,11 @@ class EnumerationValueObject(ValueObject[Any | E], Generic[E]):  # noqa: UP046
         if isinstance(value, self._enumeration):
             return value
 
-        for member in self._enumeration:  # pragma: no cover
-            if member.value == value:
-                return member
+        member = self._find_member(value=value)
+        if member is None:  # pragma: no cover
+            self._raise_value_is_not_from_enumeration(value=value)
 
-        self._raise_value_is_not_from_enumeration(value=value)  # pragma: no cover
+        return member
 
     @validation(order=0)
     def _ensure_value_is_from_enumeration(self, value: Any | E) -> None:
@@ -119,10 +122,46 @@ class EnumerationValueObject(ValueObject[Any | E], Generic[E]):  # noqa: UP046
         if isinstance(value, self._enumeration):
             return
 
-        if any(value == member.value for member in self._enumeration):
-            return
+        if self._find_member(value=value) is None:
+            self._raise_value_is_not_from_enumeration(value=value)
+
+    @cached_classproperty
+    def _members_by_value(cls) -> dict[Any, E]:  # noqa: N805
+        """
+        Returns the enumeration members indexed by their hashable values, computed once per class. When several
+        members have equal values, the first one is kept.
+
+        Returns:
+            dict[Any, E]: The members indexed by value.
+        """
+        members: dict[Any, E] = {}
+        for member in cls._enumeration:
+            with suppress_exception(TypeError):
+                members.setdefault(member.value, member)
+
+        return members
+
+    def _find_member(self, *, value: Any) -> E | None:
+        """
+        Returns the first enumeration member whose value is equal to `value`, looking it up in `_members_by_value`
+        and falling back to comparing every member for unhashable values.
+
+        Args:
+            value (Any): The provided value.
+
+        Returns:
+            E | None: The enumeration member, or None if no member has that value.
+        """
+        with suppress_exception(TypeError):
+            member = self._members_by_value.get(value)
+            if member is not None:
+                return member
+
+        for member in self._enumeration:
+            if member.value == value:
+                return member
 
-        self._raise_value_is_not_from_enumeration(value=value)
+        return None
 
     def _raise_value_is_not_from_enumeration(self, value: Any) -> NoReturn:
         """
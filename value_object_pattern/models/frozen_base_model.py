@@ -0,0 +1,625 @@
+"""
+Immutable, slotted base class for declarative domain models.
+"""
+
+from __future__ import annotations
+
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+from abc import ABCMeta, update_abstractmethods
+from collections.abc import Iterable
+from copy import deepcopy
+from keyword import iskeyword
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    ForwardRef,
+    NoReturn,
+    TypeVar,
+    dataclass_transform,
+    get_origin,
+    get_type_hints,
+    overload,
+)
+
+from .base_model import BaseModel, _restore_model
+from .primitive_conversion import to_display_primitive
+
+T = TypeVar('T')
+
+_CLASS_VARIABLE_PREFIXES = ('ClassVar', 'typing.ClassVar', 't.ClassVar')
+_MISSING: Any = object()
+
+
+class _FrozenField:
+    """
+    Field declaration returned by `frozen_field`, read by the frozen model metaclass.
+    """
+
+    __slots__ = ('alias', 'default')
+
+    def __init__(self, *, default: Any, alias: str | None) -> None:
+        """
+        Create a field declaration.
+
+        Args:
+            default (Any): The default value of the field, `_MISSING` if it has none.
+            alias (str | None): The constructor parameter of the field, None to derive it from the field name.
+        """
+        self.default = default
+        self.alias = alias
+
+
+@overload
+def frozen_field(*, alias: str) -> Any: ...  # pragma: no cover
+
+
+@overload
+def frozen_field(*, default: T, alias: str | None = None) -> T: ...  # noqa: UP047  # pragma: no cover
+
+
+def frozen_field(*, default: Any = _MISSING, alias: str | None = None) -> Any:
+    """
+    Declare a `FrozenBaseModel` field with a default value or an explicit constructor parameter.
+
+    The constructor parameter of `_age` and `__password` is `age` and `password` at runtime, but type checkers only
+    know that through `alias`. Declare private fields with `frozen_field(alias=...)` for the generated constructor to
+    type check.
+
+    Args:
+        default (Any, optional): The default value of the field. Defaults to no default.
+        alias (str | None, optional): The constructor parameter of the field. Defaults to the field name without its
+        leading underscores and class name mangling.
+
+    Returns:
+        Any: The field declaration, replaced by the field slot when the class is created.
+
+    Example:
+    ```python
+    from value_object_pattern.models import FrozenBaseModel, frozen_field
+
+
+    class User(FrozenBaseModel):
+        name: str
+        _age: int = frozen_field(alias='age')
+        active: bool = frozen_field(default=True)
+
+
+    print(User(name='John Doe', age=42))
+    # >>> User(active=True, age=42, name=John Doe)
+    ```
+    """
+    return _FrozenField(default=default, alias=alias)
+
+
+def _namespace_annotations(namespace: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return the annotations declared in a class body, without evaluating them.
+
+    Args:
+        namespace (dict[str, Any]): The class namespace.
+
+    Returns:
+        dict[str, Any]: The annotations by attribute name.
+    """
+    annotations = namespace.get('__annotations__')
+    if annotations is not None:
+        return dict(annotations)
+
+    annotate = namespace.get('__annotate__', namespace.get('__annotate_func__'))
+    if annotate is None:
+        return {}
+
+    # Python 3.14 and later evaluate class annotations lazily
+    from annotationlib import Format, call_annotate_function  # type: ignore[import-not-found]  # pragma: no cover
+
+    return dict(call_annotate_function(annotate, Format.FORWARDREF))  # pragma: no cover
+
+
+def _is_class_variable(*, annotation: Any) -> bool:
+    """
+    Return whether an annotation declares a class variable, which is not a model field.
+
+    Args:
+        annotation (Any): The annotation, evaluated or as a string.
+
+    Returns:
+        bool: True if the annotation is `ClassVar`, otherwise False.
+    """
+    if isinstance(annotation, ForwardRef):
+        annotation = annotation.__forward_arg__
+
+    if isinstance(annotation, str):
+        return annotation.startswith(_CLASS_VARIABLE_PREFIXES)
+
+    return annotation is ClassVar or get_origin(tp=annotation) is ClassVar
+
+
+def _compile_values_getter(*, names: tuple[str, ...]) -> Callable[[Any], tuple[Any, ...]]:
+    """
+    Return a function returning the values of the attributes `names` of an instance as a tuple.
+
+    Args:
+        names (tuple[str, ...]): The attribute names.
+
+    Returns:
+        Callable[[Any], tuple[Any, ...]]: The getter.
+    """
+    if not names:
+        return lambda instance: ()
+
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        return lambda instance: (getter(instance),)
+
+    return attrgetter(*names)
+
+
+def _field_parameter(*, name: str, field: str, alias: str | None, private_prefix: str) -> str:
+    """
+    Return the constructor parameter of a field, its alias or its name without leading underscores and mangling.
+
+    Args:
+        name (str): The class name.
+        field (str): The field name.
+        alias (str | None): The field alias, None if it has none.
+        private_prefix (str): The name mangling prefix of the class.
+
+    Raises:
+        TypeError: If the alias is not a valid identifier.
+
+    Returns:
+        str: The constructor parameter.
+    """
+    if alias is not None:
+        if not alias.isidentifier() or iskeyword(alias):
+            raise TypeError(f'FrozenBaseModel <<<{name}>>> field <<<{field}>>> alias <<<{alias}>>> must be a valid identifier.')  # noqa: E501  # fmt: skip
+
+        return alias
+
+    parameter = field.replace(private_prefix, '', 1) if field.startswith(private_prefix) else field
+    return parameter[1:] if parameter.startswith('_') else parameter
+
+
+def _declare_fields(
+    *,
+    name: str,
+    frozen_bases: list[Any],
+    namespace: dict[str, Any],
+) -> tuple[dict[str, str], set[str], dict[str, Any], list[str]]:
+    """
+    Return the fields of a frozen model class, inherited ones first, removing their default values from `namespace`.
+
+    Args:
+        name (str): The class name.
+        frozen_bases (list[Any]): The frozen model bases of the class.
+        namespace (dict[str, Any]): The class namespace.
+
+    Raises:
+        TypeError: If a field alias is not a valid identifier.
+        TypeError: If two fields have the same constructor parameter.
+        TypeError: If a default value is mutable.
+
+    Returns:
+        tuple[dict[str, str], set[str], dict[str, Any], list[str]]: The constructor parameter of each field, the
+        double-underscore private fields, the default value of each field with one and the new slots of the class.
+    """
+    fields: dict[str, str] = {}
+    private_fields: set[str] = set()
+    defaults: dict[str, Any] = {}
+    for base in reversed(frozen_bases):
+        fields.update(zip(base._fields, base._field_parameters, strict=True))
+        private_fields.update(base._private_fields)
+        defaults.update(base._field_defaults)
+
+    slots: list[str] = []
+    private_prefix = f'_{name.lstrip("_")}__'
+    for field, annotation in _namespace_annotations(namespace=namespace).items():
+        if _is_class_variable(annotation=annotation):
+            continue
+
+        default = namespace.pop(field, _MISSING)
+        alias = None
+        if isinstance(default, _FrozenField):
+            default, alias = default.default, default.alias
+
+        parameter = _field_parameter(name=name, field=field, alias=alias, private_prefix=private_prefix)
+        if parameter in fields.values() and fields.get(field) != parameter:
+            raise TypeError(f'FrozenBaseModel <<<{name}>>> field <<<{field}>>> constructor parameter <<<{parameter}>>> is already used by another field.')  # noqa: E501  # fmt: skip
+
+        if default is not _MISSING:
+            if type(default).__hash__ is None:
+                raise TypeError(f'FrozenBaseModel <<<{name}>>> field <<<{field}>>> default <<<{default!r}>>> is mutable, it would be shared between instances.')  # noqa: E501  # fmt: skip
+
+            defaults[field] = default
+
+        if field not in fields:
+            slots.append(field)
+            fields[field] = parameter
+            if field.startswith(private_prefix):
+                private_fields.add(field)
+
+    return fields, private_fields, defaults, slots
+
+
+class _FrozenBaseModelMeta(ABCMeta):
+    """
+    Metaclass that turns the annotations of a frozen model class into slots and a generated constructor.
+    """
+
+    def __new__(mcls, name: str, bases: tuple[type, ...], namespace: dict[str, Any], /, **kwargs: Any) -> Any:  # noqa: N804
+        """
+        Create a frozen model class, declaring a slot for each annotated attribute of its body.
+
+        Args:
+            name (str): The class name.
+            bases (tuple[type, ...]): The class bases.
+            namespace (dict[str, Any]): The class namespace.
+            **kwargs: Class keywords forwarded to `__init_subclass__`.
+
+        Raises:
+            TypeError: If the class declares `__slots__`.
+            TypeError: If a field alias is not a valid identifier, two fields have the same constructor parameter or a
+            default value is mutable.
+
+        Returns:
+            Any: The created class.
+        """
+        frozen_bases = [base for base in bases if isinstance(base, _FrozenBaseModelMeta)]
+        if not frozen_bases:
+            return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+        if '__slots__' in namespace:
+            raise TypeError(f'FrozenBaseModel <<<{name}>>> must not declare __slots__, they are derived from its annotations.')  # noqa: E501  # fmt: skip
+
+        fields, private_fields, defaults, slots = _declare_fields(name=name, frozen_bases=frozen_bases, namespace=namespace)  # noqa: E501  # fmt: skip
+        namespace['__slots__'] = tuple(slots)
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+
+        type.__setattr__(cls, '_fields', tuple(fields))
+        type.__setattr__(cls, '_field_parameters', tuple(fields.values()))
+        type.__setattr__(cls, '_private_fields', frozenset(private_fields))
+        type.__setattr__(cls, '_field_defaults', defaults)
+        type.__setattr__(cls, '_field_values', staticmethod(_compile_values_getter(names=tuple(fields))))
+
+        # private fields of a parent class stay private, their public key is their constructor parameter
+        layout = cls._resolve_attribute_layout()  # type: ignore[attr-defined]
+        for field, parameter in fields.items():
+            layout.keys[field] = (parameter, field in private_fields)
+
+        public_order = layout.order(names=tuple(fields))
+        type.__setattr__(cls, '_public_order', public_order)
+        public_names = tuple(field for _, field in public_order)
+        type.__setattr__(cls, '_public_values', staticmethod(_compile_values_getter(names=public_names)))
+
+        type.__setattr__(cls, '_generated_init', '__init__' not in namespace)
+        if cls._generated_init:  # type: ignore[attr-defined]
+            type.__setattr__(cls, '__init__', _compile_constructor(cls=cls, fields=fields, defaults=defaults))
+            update_abstractmethods(cls)  # type: ignore[arg-type]
+
+        return cls
+
+
+def _compile_constructor(*, cls: type, fields: dict[str, str], defaults: dict[str, Any]) -> Callable[..., None]:
+    """
+    Return a keyword-only constructor that stores each field through its slot.
+
+    Args:
+        cls (type): The frozen model class.
+        fields (dict[str, str]): The constructor parameter of each field.
+        defaults (dict[str, Any]): The default value of each field with one.
+
+    Returns:
+        Callable[..., None]: The constructor.
+    """
+    namespace: dict[str, Any] = {}
+    parameters: list[str] = []
+    lines: list[str] = []
+    for index, (field, parameter) in enumerate(iterable=fields.items()):
+        descriptor = next(klass.__dict__[field] for klass in cls.__mro__ if field in klass.__dict__)
+        namespace[f'_set{index}'] = descriptor.__set__
+        if field in defaults:
+            namespace[f'_default{index}'] = defaults[field]
+            parameters.append(f'{parameter}=_default{index}')
+
+        else:
+            parameters.append(parameter)
+
+        lines.append(f'    _set{index}(self, {parameter})')
+
+    source = '\n'.join((
+        f'def __init__(self{", *, " if parameters else ""}{", ".join(parameters)}):',
+        *(lines or ['    pass']),
+    ))  # fmt: skip
+    exec(compile(source, f'<frozen model {cls.__module__}.{cls.__qualname__}>', 'exec'), namespace)  # noqa: S102
+
+    constructor: Callable[..., None] = namespace['__init__']
+    constructor.__qualname__ = f'{cls.__qualname__}.__init__'
+    constructor.__module__ = cls.__module__
+
+    return constructor
+
+
+@dataclass_transform(kw_only_default=True, field_specifiers=(frozen_field,))
+class FrozenBaseModel(BaseModel, metaclass=_FrozenBaseModelMeta):
+    """
+    Immutable `BaseModel` whose fields are declared as class annotations.
+
+    Every annotated attribute of a subclass becomes a slot, so instances do not allocate a `__dict__`, and a
+    keyword-only `__init__` taking one parameter per field is generated. Parameters are named after the public key of
+    their field, `_age` and `__password` are set with `age` and `password`, and a value assigned in the class body is
+    the default of its parameter. Type checkers see the generated constructor, declare private fields with
+    `frozen_field(alias=...)` for their parameter to type check. Default values are shared between instances, so
+    mutable defaults such as lists are rejected. `ClassVar` annotations are not fields.
+
+    Fields can't be reassigned or deleted after construction and the hash is computed once, on first use. Equality,
+    hashing, string output and primitive conversion exclude double-underscore private attributes, like `BaseModel`.
+    A subclass that defines its own `__init__` must set every field with `object.__setattr__`.
+
+    ***This class is abstract and should not be instantiated directly***.
+
+    Example:
+    ```python
+    from value_object_pattern.models import FrozenBaseModel, frozen_field
+
+
+    class User(FrozenBaseModel):
+        name: str
+        _age: int = frozen_field(alias='age')
+        __password: str = frozen_field(alias='password')
+        active: bool = True
+
+
+    user = User(name='John Doe', age=42, password='password')
+    print(user)
+    print(user.to_primitives())
+    # >>> User(active=True, age=42, name=John Doe)
+    # >>> {'name': 'John Doe', 'age': 42, 'active': True}
+    ```
+    """
+
+    __slots__ = ('_frozen_hash',)
+
+    _frozen_hash: int
+
+    _fields: ClassVar[tuple[str, ...]] = ()
+    _field_parameters: ClassVar[tuple[str, ...]] = ()
+    _private_fields: ClassVar[frozenset[str]] = frozenset()
+    _field_defaults: ClassVar[dict[str, Any]] = {}
+    _field_values: ClassVar[Callable[[Any], tuple[Any, ...]]]
+    _public_order: ClassVar[tuple[tuple[str, str], ...]] = ()
+    _public_values: ClassVar[Callable[[Any], tuple[Any, ...]]]
+    _generated_init: ClassVar[bool] = False
+    _compiled_to_primitives: ClassVar[Callable[[Any], dict[str, Any]] | None] = None
+
+    @override
+    def __repr__(self) -> str:
+        """
+        Returns the class representation as a string. Private attributes that start with "__" are not included.
+
+        Returns:
+            str: String representation of the class.
+        """
+        attributes = []
+        for key, name in self._public_order:
+            attributes.append(f'{key}={getattr(self, name)!r}')
+
+        return f'{self.__class__.__name__}({", ".join(attributes)})'
+
+    @override
+    def __str__(self) -> str:
+        """
+        Returns the class string representation. Private attributes that start with "__" are not included.
+
+        Returns:
+            str: String representation of the class.
+        """
+        attributes = []
+        for key, name in self._public_order:
+            attributes.append(f'{key}={to_display_primitive(value=getattr(self, name))}')
+
+        return f'{self.__class__.__name__}({", ".join(attributes)})'
+
+    @override
+    def __hash__(self) -> int:
+        """
+        Returns the hash of the public attributes, computed on first use and then cached in the instance.
+
+        Returns:
+            int: Hash of the class.
+        """
+        try:
+            return self._frozen_hash
+
+        except AttributeError:
+            model_hash = hash(self._public_values(self))  # type: ignore[call-arg]
+            object.__setattr__(self, '_frozen_hash', model_hash)
+
+            return model_hash
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        """
+        Check if the class is equal to another object, comparing the public attributes one by one. Private attributes
+        that start with "__" are not included.
+
+        Args:
+            other (object): Object to compare.
+
+        Returns:
+            bool: True if the objects are equal, otherwise False.
+        """
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        if other.__class__ is not self.__class__:
+            return self._to_dict(ignore_private=True) == other._to_dict(ignore_private=True)
+
+        return self._public_values(self) == other._public_values(other)  # type: ignore[call-arg]
+
+    @override
+    def __setattr__(self, key: str, value: Any) -> NoReturn:
+        """
+        Prevents modification or addition of attributes in the model.
+
+        Args:
+            key (str): The name of the attribute.
+            value (Any): The value to be assigned to the attribute.
+
+        Raises:
+            AttributeError: If there is an attempt to modify an existing attribute.
+            AttributeError: If there is an attempt to add a new attribute.
+        """
+        if key in self._fields:
+            raise AttributeError(f'Cannot modify attribute "{key}" of immutable instance.')
+
+        raise AttributeError(f'{self.__class__.__name__} object has no attribute "{key}".')
+
+    @override
+    def __delattr__(self, key: str) -> NoReturn:
+        """
+        Prevents deletion of attributes in the model.
+
+        Args:
+            key (str): The name of the attribute.
+
+        Raises:
+            AttributeError: If there is an attempt to delete an attribute.
+        """
+        raise AttributeError(f'Cannot delete attribute "{key}" of immutable instance.')
+
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Reduce the model to its class and fields, unpickling restores them without calling the constructor.
+
+        Returns:
+            tuple[Any, ...]: The restore function and its arguments.
+        """
+        return _restore_model, (self.__class__, dict(self._attribute_items()))
+
+    @override
+    def __copy__(self) -> FrozenBaseModel:
+        """
+        Return the model itself, its fields can't be reassigned.
+
+        Returns:
+            FrozenBaseModel: The same instance.
+        """
+        return self
+
+    @override
+    def __deepcopy__(self, memo: dict[int, Any]) -> FrozenBaseModel:
+        """
+        Return a deep clone, recursively copying the fields.
+
+        Args:
+            memo (dict[int, Any]): Dictionary of id's to already copied objects to avoid infinite recursion.
+
+        Returns:
+            FrozenBaseModel: A deep clone of the instance.
+        """
+        if id(self) in memo:
+            return memo[id(self)]  # type: ignore[no-any-return]
+
+        cls = self.__class__
+        clone = cls.__new__(cls)
+        memo[id(self)] = clone
+        for key, value in self._attribute_items():
+            object.__setattr__(clone, key, deepcopy(value, memo))
+
+        return clone
+
+    @override
+    def to_primitives(self) -> dict[str, Any]:
+        """
+        Convert the public fields to primitive values with a serializer generated for the class on first use.
+
+        Double-underscore private fields are excluded. Value objects, enums, nested models, and collections are
+        converted recursively.
+
+        Returns:
+            dict[str, Any]: Primitive dictionary representation of the model.
+        """
+        serialize = self.__class__.__dict__.get('_compiled_to_primitives')
+        if serialize is None:
+            serialize = self._compile_to_primitives()
+
+        return serialize(self)
+
+    @classmethod
+    def _compile_to_primitives(cls) -> Callable[[Any], dict[str, Any]]:
+        """
+        Return a function building the primitives of an instance in a single dictionary display, caching it on the
+        class once the attribute serializer of the class is cached.
+
+        Returns:
+            Callable[[Any], dict[str, Any]]: The serializer.
+        """
+        serializer = cls._resolve_primitives_serializer()
+        namespace: dict[str, Any] = {}
+        items: list[str] = []
+        for index, field in enumerate(iterable=cls._fields):
+            entry = serializer.fields.get(field) or serializer.resolve(key=field)
+            if entry is None:
+                continue  # ignore private attributes
+
+            output_key, namespace[f'_convert{index}'] = entry
+            items.append(f'{output_key!r}: _convert{index}(self.{field})')
+
+        source = f'def to_primitives(self):\n    return {{{", ".join(items)}}}'
+        exec(compile(source, f'<frozen model serializer {cls.__module__}.{cls.__qualname__}>', 'exec'), namespace)  # noqa: S102
+
+        serialize: Callable[[Any], dict[str, Any]] = namespace['to_primitives']
+        if '_primitives_serializer' in cls.__dict__:
+            type.__setattr__(cls, '_compiled_to_primitives', serialize)
+
+        return serialize
+
+    @override
+    def _attribute_items(self) -> Iterable[tuple[str, Any]]:
+        """
+        Returns the name and value of each field, private fields included.
+
+        Returns:
+            Iterable[tuple[str, Any]]: The name and value of each field.
+        """
+        return zip(self._fields, self._field_values(self), strict=True)  # type: ignore[call-arg]
+
+    @override
+    def _public_attributes(self) -> tuple[tuple[str, str], ...]:
+        """
+        Returns the public key and field name of each public field, sorted by public key.
+
+        Returns:
+            tuple[tuple[str, str], ...]: The public key and field name of each public field.
+        """
+        return self._public_order
+
+    @override
+    @classmethod
+    def _get_constructor_annotations(cls) -> dict[str, Any]:
+        """
+        Returns resolved constructor annotations when available, taken from the field annotations when the constructor
+        is generated.
+
+        Returns:
+            dict[str, Any]: Mapping from constructor parameter names to annotations.
+        """
+        if not cls._generated_init:
+            return super()._get_constructor_annotations()
+
+        try:
+            annotations = get_type_hints(cls)
+
+        except Exception:
+            return {}
+
+        return {parameter: annotations[field] for field, parameter in zip(cls._fields, cls._field_parameters, strict=True)}  # noqa: E501  # fmt: skip
@@ -0,0 +1,466 @@
+"""
+Opt-in instrumentation of value object constructions and hooks.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from functools import wraps
+from math import ceil
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable
+
+from .validation_failure import ValidationFailure
+
+_DEFAULT_SAMPLE_SIZE = 1024
+_QUANTILES = (0.5, 0.9, 0.99)
+
+_active_registry: InstrumentationRegistry | None = None
+
+
+class _TimingStatistics:
+    """
+    Count, cumulative time and the most recent samples of a timed operation.
+    """
+
+    __slots__ = ('count', 'samples', 'total')
+
+    def __init__(self, *, sample_size: int) -> None:
+        """
+        Create empty timing statistics.
+
+        Args:
+            sample_size (int): Number of most recent samples kept to compute the percentiles.
+        """
+        self.count = 0
+        self.total = 0.0
+        self.samples: deque[float] = deque(maxlen=sample_size)
+
+    def record(self, *, elapsed: float) -> None:
+        """
+        Record one timed operation.
+
+        Args:
+            elapsed (float): The operation time in seconds.
+        """
+        self.count += 1
+        self.total += elapsed
+        self.samples.append(elapsed)
+
+    def reset(self) -> None:
+        """
+        Forget every recorded operation.
+        """
+        self.count = 0
+        self.total = 0.0
+        self.samples.clear()
+
+    def quantiles(self) -> dict[float, float]:
+        """
+        Returns the nearest-rank percentiles of the kept samples, 0.0 when there are none.
+
+        Returns:
+            dict[float, float]: The time in seconds of each quantile.
+        """
+        samples = sorted(self.samples)
+        if not samples:
+            return dict.fromkeys(_QUANTILES, 0.0)
+
+        return {quantile: samples[max(ceil(quantile * len(samples)) - 1, 0)] for quantile in _QUANTILES}
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the statistics as a plain dictionary.
+
+        Returns:
+            dict[str, Any]: The count, the cumulative time and the percentiles, in seconds.
+        """
+        statistics: dict[str, Any] = {'count': self.count, 'total_seconds': self.total}
+        for quantile, elapsed in self.quantiles().items():
+            statistics[f'p{round(quantile * 100)}_seconds'] = elapsed
+
+        return statistics
+
+
+class _ClassStatistics:
+    """
+    Construction and hook statistics of one value object class.
+    """
+
+    __slots__ = ('constructions', 'failures', 'failures_by_validator', 'hooks', 'sample_size')
+
+    def __init__(self, *, sample_size: int) -> None:
+        """
+        Create empty class statistics.
+
+        Args:
+            sample_size (int): Number of most recent samples kept to compute the percentiles.
+        """
+        self.sample_size = sample_size
+        self.constructions = _TimingStatistics(sample_size=sample_size)
+        self.failures = 0
+        self.failures_by_validator: dict[str, int] = {}
+        self.hooks: dict[tuple[str, str], _TimingStatistics] = {}
+
+    def hook(self, *, name: str, kind: str) -> _TimingStatistics:
+        """
+        Returns the timing statistics of a hook, creating them on first use.
+
+        Args:
+            name (str): The hook name.
+            kind (str): Either `validation` or `process`.
+
+        Returns:
+            _TimingStatistics: The hook timing statistics.
+        """
+        return self.hooks.setdefault((kind, name), _TimingStatistics(sample_size=self.sample_size))
+
+    def reset(self) -> None:
+        """
+        Forget every recorded construction and hook call.
+        """
+        self.constructions.reset()
+        self.failures = 0
+        self.failures_by_validator.clear()
+        for statistics in self.hooks.values():
+            statistics.reset()
+
+
+class InstrumentationRegistry:
+    """
+    Record, per concrete value object class, the number of constructions, the failures by validator and the time
+    spent constructing and in each `@validation` and `@process` hook.
+
+    Instrumentation is enabled with `enable_instrumentation` and disabled with `disable_instrumentation`. Both drop
+    every cached hook plan, so constructors are generated again with or without the timing calls and a disabled
+    registry costs nothing. Constructions served from an intern pool or a validation cache are not recorded.
+
+    Example:
+    ```python
+    from value_object_pattern import disable_instrumentation, enable_instrumentation
+    from value_object_pattern.usables import PositiveIntegerValueObject
+
+    registry = enable_instrumentation()
+    PositiveIntegerValueObject(value=1)
+    disable_instrumentation()
+
+    statistics = registry.to_dict()[
+        'value_object_pattern.usables.primitives.integer.positive_integer_value_object.PositiveIntegerValueObject'
+    ]
+    print(statistics['constructions'], statistics['failures'])
+    # >>> 1 0
+    ```
+    """
+
+    __slots__ = ('_classes', '_lock', 'sample_size')
+
+    def __init__(self, *, sample_size: int = _DEFAULT_SAMPLE_SIZE) -> None:
+        """
+        Create an empty instrumentation registry.
+
+        Args:
+            sample_size (int, optional): Number of most recent samples kept per class and hook to compute the
+            percentiles. Defaults to 1024.
+
+        Raises:
+            TypeError: If `sample_size` is not an integer.
+            ValueError: If `sample_size` is not a positive integer.
+        """
+        if type(sample_size) is not int:
+            raise TypeError(f'InstrumentationRegistry sample_size <<<{sample_size}>>> must be an integer. Got <<<{type(sample_size).__name__}>>> type.')  # noqa: E501  # fmt: skip
+
+        if sample_size <= 0:
+            raise ValueError(f'InstrumentationRegistry sample_size <<<{sample_size}>>> must be a positive integer.')
+
+        self.sample_size = sample_size
+        self._classes: dict[str, _ClassStatistics] = {}
+        self._lock = Lock()
+
+    def _class_statistics(self, *, cls: type) -> _ClassStatistics:
+        """
+        Returns the statistics of `cls`, creating them on first use.
+
+        Args:
+            cls (type): The value object class.
+
+        Returns:
+            _ClassStatistics: The class statistics.
+        """
+        with self._lock:
+            return self._classes.setdefault(
+                f'{cls.__module__}.{cls.__qualname__}',
+                _ClassStatistics(sample_size=self.sample_size),
+            )
+
+    def _instrument_hook(self, *, cls: type, hook: Callable[..., Any], kind: str) -> Callable[..., Any]:
+        """
+        Returns a hook that records the time spent in `hook` for `cls`.
+
+        Args:
+            cls (type): The value object class.
+            hook (Callable[..., Any]): The hook, called as `hook(instance, value=...)`.
+            kind (str): Either `validation` or `process`.
+
+        Returns:
+            Callable[..., Any]: The timed hook, with the name of `hook`.
+        """
+        statistics = self._class_statistics(cls=cls).hook(name=getattr(hook, '__name__', repr(hook)), kind=kind)
+        lock = self._lock
+
+        @wraps(hook)
+        def timed_hook(instance: Any, **kwargs: Any) -> Any:
+            start = perf_counter()
+            try:
+                return hook(instance, **kwargs)
+
+            finally:
+                elapsed = perf_counter() - start
+                with lock:
+                    statistics.record(elapsed=elapsed)
+
+        return timed_hook
+
+    def _instrument_constructor(self, *, cls: type, constructor: Callable[..., None]) -> Callable[..., None]:
+        """
+        Returns a constructor that records the constructions of `cls`, their time and the failing validator.
+
+        Instances of subclasses that reach the constructor through `super()` are delegated untouched, they are recorded
+        by the constructor of their own class.
+
+        Args:
+            cls (type): The value object class.
+            constructor (Callable[..., None]): The constructor, called as `constructor(instance, value=...)`.
+
+        Returns:
+            Callable[..., None]: The timed constructor.
+        """
+        statistics = self._class_statistics(cls=cls)
+        lock = self._lock
+
+        @wraps(constructor)
+        def timed_constructor(
+            instance: Any, *, value: Any, title: str | None = None, parameter: str | None = None
+        ) -> None:
+            if instance.__class__ is not cls:
+                return constructor(instance, value=value, title=title, parameter=parameter)
+
+            start = perf_counter()
+            try:
+                constructor(instance, value=value, title=title, parameter=parameter)
+
+            except Exception as error:
+                elapsed = perf_counter() - start
+                failure = getattr(error, 'validation_failure', None)
+                code = failure.code if isinstance(failure, ValidationFailure) else None
+                with lock:
+                    statistics.constructions.record(elapsed=elapsed)
+                    statistics.failures += 1
+                    if code is not None:
+                        statistics.failures_by_validator[code] = statistics.failures_by_validator.get(code, 0) + 1
+
+                raise
+
+            elapsed = perf_counter() - start
+            with lock:
+                statistics.constructions.record(elapsed=elapsed)
+
+            return None
+
+        return timed_constructor
+
+    def clear(self) -> None:
+        """
+        Forget every recorded construction and hook call.
+        """
+        with self._lock:
+            for statistics in self._classes.values():
+                statistics.reset()
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """
+        Returns the recorded statistics as plain dictionaries, keyed by the qualified class name. Times are in seconds
+        and `constructions` includes the failed ones.
+
+        Returns:
+            dict[str, dict[str, Any]]: The statistics of every instrumented class.
+
+        Example:
+        ```python
+        from value_object_pattern import InstrumentationRegistry, ValueObject
+
+
+        class Age(ValueObject[int]):
+            pass
+
+
+        registry = InstrumentationRegistry()
+        print(registry.to_dict())
+        # >>> {}
+        ```
+        """
+        with self._lock:
+            return {
+                name: {
+                    'constructions': statistics.constructions.count,
+                    'failures': statistics.failures,
+                    'failures_by_validator': dict(statistics.failures_by_validator),
+                    'construction': statistics.constructions.to_dict(),
+                    'hooks': {
+                        name: {'kind': kind, **timing.to_dict()} for (kind, name), timing in statistics.hooks.items()
+                    },
+                }
+                for name, statistics in self._classes.items()
+                if statistics.constructions.count
+            }
+
+    def to_prometheus(self) -> str:
+        """
+        Returns the recorded statistics in the Prometheus text exposition format.
+
+        Returns:
+            str: The `value_object_constructions_total` and `value_object_failures_total` counters, and the
+            `value_object_construction_seconds` and `value_object_hook_seconds` summaries.
+        """
+        constructions = [
+            '# HELP value_object_constructions_total Value object constructions, including the failed ones.',
+            '# TYPE value_object_constructions_total counter',
+        ]
+        failures = [
+            '# HELP value_object_failures_total Value object constructions rejected by a validator.',
+            '# TYPE value_object_failures_total counter',
+        ]
+        construction_seconds = [
+            '# HELP value_object_construction_seconds Time spent constructing value objects.',
+            '# TYPE value_object_construction_seconds summary',
+        ]
+        hook_seconds = [
+            '# HELP value_object_hook_seconds Time spent in value object validation and process hooks.',
+            '# TYPE value_object_hook_seconds summary',
+        ]
+        with self._lock:
+            for name, statistics in self._classes.items():
+                if not statistics.constructions.count:
+                    continue
+
+                labels = f'class="{_escape_label(value=name)}"'
+                constructions.append(f'value_object_constructions_total{{{labels}}} {statistics.constructions.count}')
+                for code, count in statistics.failures_by_validator.items():
+                    failures.append(f'value_object_failures_total{{{labels},validator="{_escape_label(value=code)}"}} {count}')  # noqa: E501  # fmt: skip
+
+                unknown = statistics.failures - sum(statistics.failures_by_validator.values())
+                if unknown:
+                    failures.append(f'value_object_failures_total{{{labels},validator=""}} {unknown}')
+
+                construction_seconds.extend(_summary_lines(name='value_object_construction_seconds', labels=labels, timing=statistics.constructions))  # noqa: E501  # fmt: skip
+                for (kind, hook), timing in statistics.hooks.items():
+                    hook_labels = f'{labels},hook="{_escape_label(value=hook)}",kind="{kind}"'
+                    hook_seconds.extend(_summary_lines(name='value_object_hook_seconds', labels=hook_labels, timing=timing))  # noqa: E501  # fmt: skip
+
+        return '\n'.join(constructions + failures + construction_seconds + hook_seconds) + '\n'
+
+
+def _escape_label(*, value: str) -> str:
+    """
+    Escape a Prometheus label value.
+
+    Args:
+        value (str): The label value.
+
+    Returns:
+        str: The escaped label value.
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _summary_lines(*, name: str, labels: str, timing: _TimingStatistics) -> list[str]:
+    """
+    Return the Prometheus summary lines of `timing`.
+
+    Args:
+        name (str): The metric name.
+        labels (str): The rendered labels.
+        timing (_TimingStatistics): The timing statistics.
+
+    Returns:
+        list[str]: The quantile, sum and count lines.
+    """
+    lines = [
+        f'{name}{{{labels},quantile="{quantile}"}} {elapsed!r}' for quantile, elapsed in timing.quantiles().items()
+    ]
+    lines.append(f'{name}_sum{{{labels}}} {timing.total!r}')
+    lines.append(f'{name}_count{{{labels}}} {timing.count}')
+
+    return lines
+
+
+def enable_instrumentation(*, sample_size: int = _DEFAULT_SAMPLE_SIZE) -> InstrumentationRegistry:
+    """
+    Start recording value object constructions in a new registry, replacing the active one.
+
+    Every cached hook plan is dropped, together with the intern pools and validation caches, so the next construction
+    of each class generates its instrumented constructor.
+
+    Args:
+        sample_size (int, optional): Number of most recent samples kept per class and hook to compute the
+        percentiles. Defaults to 1024.
+
+    Raises:
+        TypeError: If `sample_size` is not an integer.
+        ValueError: If `sample_size` is not a positive integer.
+
+    Returns:
+        InstrumentationRegistry: The active registry.
+
+    Example:
+    ```python
+    from value_object_pattern import disable_instrumentation, enable_instrumentation
+    from value_object_pattern.usables import PositiveIntegerValueObject
+
+    registry = enable_instrumentation()
+    PositiveIntegerValueObject(value=1)
+    disable_instrumentation()
+
+    print(registry.to_prometheus().splitlines()[2])
+    # >>> value_object_constructions_total{class="value_object_pattern.usables.primitives.integer.positive_integer_value_object.PositiveIntegerValueObject"} 1
+    ```
+    """  # noqa: E501
+    registry = InstrumentationRegistry(sample_size=sample_size)
+    _activate_registry(registry=registry)
+
+    return registry
+
+
+def disable_instrumentation() -> None:
+    """
+    Stop recording value object constructions. The previously active registry keeps its statistics.
+
+    Every cached hook plan is dropped, together with the intern pools and validation caches, so the next construction
+    of each class generates its plain constructor again.
+    """
+    _activate_registry(registry=None)
+
+
+def get_instrumentation() -> InstrumentationRegistry | None:
+    """
+    Returns the active instrumentation registry.
+
+    Returns:
+        InstrumentationRegistry | None: The active registry, None if instrumentation is disabled.
+    """
+    return _active_registry
+
+
+def _activate_registry(*, registry: InstrumentationRegistry | None) -> None:
+    """
+    Make `registry` the active registry and drop every cached hook plan.
+
+    Args:
+        registry (InstrumentationRegistry | None): The registry, None to disable instrumentation.
+    """
+    # imported here, value_object imports this module
+    from .value_object import ValueObject, _invalidate_hook_plans
+
+    global _active_registry
+    _active_registry = registry
+    _invalidate_hook_plans(cls=ValueObject)
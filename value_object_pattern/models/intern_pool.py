@@ -0,0 +1,117 @@
+"""
+Bounded pool of canonical value object instances.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any
+
+
+class InternPool:
+    """
+    Keep the canonical instance of a value object class for each raw input, evicting the least recently used entry
+    when the pool is full.
+
+    Every value object class created with the `intern` class keyword owns a pool. Constructing an instance with a raw
+    input that is already in the pool returns the stored instance without running the hooks again. Lookups and
+    insertions are guarded by a lock, the instance itself is constructed outside of it.
+
+    Example:
+    ```python
+    from value_object_pattern.usables.identifiers.world import Iso3166Alpha2CodeValueObject
+
+
+    class CountryCode(Iso3166Alpha2CodeValueObject, intern=True):
+        pass
+
+
+    first = CountryCode(value='es')
+    second = CountryCode(value='es')
+    print(first is second, CountryCode.intern_pool().statistics())
+    # >>> True {'hits': 1, 'misses': 1, 'size': 1, 'max_size': 4096}
+    ```
+    """
+
+    __slots__ = ('_entries', '_lock', 'hits', 'max_size', 'misses')
+
+    def __init__(self, *, max_size: int) -> None:
+        """
+        Create an empty intern pool.
+
+        Args:
+            max_size (int): Maximum number of instances kept by the pool.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of instances kept by the pool.
+
+        Returns:
+            int: The number of instances kept by the pool.
+        """
+        return len(self._entries)
+
+    def get(self, *, key: Any) -> Any | None:
+        """
+        Returns the instance stored for `key`, counting the lookup as a hit or a miss.
+
+        Args:
+            key (Any): The hashable raw input key.
+
+        Returns:
+            Any | None: The stored instance, None if the key is not in the pool.
+        """
+        with self._lock:
+            instance = self._entries.get(key)
+            if instance is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return instance
+
+    def add(self, *, key: Any, instance: Any) -> Any:
+        """
+        Store `instance` for `key` and return the canonical instance, which is the one already stored if another thread
+        added the same key first.
+
+        Args:
+            key (Any): The hashable raw input key.
+            instance (Any): The newly constructed instance.
+
+        Returns:
+            Any: The canonical instance for `key`.
+        """
+        with self._lock:
+            canonical = self._entries.setdefault(key, instance)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+            return canonical
+
+    def clear(self) -> None:
+        """
+        Drop every stored instance and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def statistics(self) -> dict[str, int]:
+        """
+        Returns the hit, miss, size and maximum size counters of the pool.
+
+        Returns:
+            dict[str, int]: The pool statistics.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries), 'max_size': self.max_size}
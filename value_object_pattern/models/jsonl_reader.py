@@ -0,0 +1,78 @@
+"""
+Helpers to build models from JSON Lines files, see `BaseModel.iter_from_jsonl`.
+"""
+
+from __future__ import annotations
+
+from json import loads
+from mmap import ACCESS_READ, mmap
+from os import fstat
+from typing import Any, Iterable, Iterator
+
+JSONL_ERROR_MODES = ('raise', 'collect', 'skip')
+
+
+def read_mapped_lines(*, file: Any) -> Iterator[bytes]:
+    """
+    Yield the lines of `file` one at a time from a read-only memory map of the file, starting at its current position.
+
+    The lines are copied straight from the mapped pages, skipping the copy into the buffer of the file object.
+
+    Args:
+        file (Any): File object backed by a file descriptor.
+
+    Returns:
+        Iterator[bytes]: The lines, with their line terminator.
+    """
+    descriptor = file.fileno()
+    if fstat(descriptor).st_size == 0:
+        return
+
+    with mmap(descriptor, 0, access=ACCESS_READ) as mapped:
+        mapped.seek(file.tell())
+        yield from iter(mapped.readline, b'')
+
+
+def iter_models(
+    cls: Any,
+    *,
+    lines: Iterable[Any],
+    errors: str,
+    trusted: bool,
+) -> Iterator[Any]:
+    """
+    Yield a model of `cls` for every non-blank JSON line, or a `(line_number, error)` tuple for every rejected line when
+    `errors` is 'collect'.
+
+    Args:
+        cls (Any): The model class.
+        lines (Iterable[Any]): The `str` or `bytes` lines.
+        errors (str): The error mode, 'raise', 'collect' or 'skip'.
+        trusted (bool): Whether the primitives are known to be valid.
+
+    Raises:
+        TypeError: If a line is rejected with a TypeError and `errors` is 'raise'.
+        ValueError: If a line is not valid JSON or is rejected with a ValueError and `errors` is 'raise'.
+
+    Returns:
+        Iterator[Any]: The models and, with `errors='collect'`, the line number and error of each rejected line.
+    """
+    from_primitives = cls.from_primitives
+    for line_number, line in enumerate(lines, start=1):
+        try:
+            model = from_primitives(primitives=loads(line), trusted=trusted)
+
+        except (TypeError, ValueError) as error:
+            if not line.strip():
+                continue  # blank lines are only checked once they fail to parse
+
+            if errors == 'raise':
+                error.add_note(f'{cls.__name__} JSON Lines line <<<{line_number}>>>')
+                raise
+
+            if errors == 'collect':
+                yield line_number, error.with_traceback(None)
+
+            continue
+
+        yield model
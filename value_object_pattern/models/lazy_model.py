@@ -0,0 +1,468 @@
+"""
+Lazily hydrated models, see `BaseModel.from_primitives`.
+"""
+
+from __future__ import annotations
+
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+from collections.abc import Iterable
+from inspect import isclass, signature
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
+
+from .primitive_conversion import _return_value
+from .type_matching import matches_expected_type
+
+if TYPE_CHECKING:
+    from .base_model import BaseModel, _ModelSchema, _ModelSerializer
+
+    # the lazy subclass of a model puts `LazyModel` before the model class in its bases
+    _LazyModelBase = BaseModel
+else:
+    _LazyModelBase = object
+
+_NO_PRIMITIVES: dict[str, Any] = {}
+_LAZY_METHODS = (
+    '__eq__',
+    '__hash__',
+    '__repr__',
+    '__str__',
+    '__reduce__',
+    '__copy__',
+    '__getattr__',
+    'to_primitives',
+    '_to_dict',
+    '_attribute_items',
+    '_public_attributes',
+)
+
+
+class LazyModel(_LazyModelBase):
+    """
+    Mixin of the lazy subclass of a model, whose instances keep the primitive of each field until it is first read.
+
+    The primitives waiting to be converted are stored in the `_lazy_primitives` slot of the generated subclass, keyed by
+    attribute name, and `__getattr__` converts them on first access and stores the result in the instance dictionary,
+    so later reads are plain attribute reads. `to_primitives` uses the stored primitives directly and equality compares
+    them while they are equal, every other method converts the remaining fields first.
+    """
+
+    __slots__ = ()
+
+    # attribute name to parameter name, converter, union annotation and default of every field
+    _lazy_fields: ClassVar[dict[str, tuple[str, Callable[[Any, bool], Any], Any, Any]]]
+    _lazy_base: ClassVar[type[Any]]
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Convert the primitive of the field `name` on first access.
+
+        Args:
+            name (str): The attribute name.
+
+        Raises:
+            AttributeError: If the instance has no attribute `name`.
+
+        Returns:
+            Any: The converted value.
+        """
+        pending = _pending_primitives(model=self)
+        if name not in pending:
+            raise AttributeError(f'{type(self).__name__} object has no attribute "{name}".')
+
+        return self._materialize(name=name, primitive=pending[name])
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        """
+        Check if the model is equal to another object. Fields not converted yet on both sides are equal when their
+        primitives are, otherwise the fields not converted yet are converted and the values compared, so the result
+        does not depend on which fields were read.
+
+        Args:
+            other (object): Object to compare.
+
+        Returns:
+            bool: True if the objects are equal, otherwise False.
+        """
+        if not isinstance(other, self._lazy_base):
+            return NotImplemented
+
+        pending = _pending_primitives(model=self)
+        other_pending = _pending_primitives(model=other)
+        if not pending and not other_pending:
+            return super().__eq__(other)
+
+        values = _public_values(model=self, pending=pending)
+        other_values = _public_values(model=other, pending=other_pending)
+        if values.keys() != other_values.keys():
+            return False
+
+        for key, (name, raw, value) in values.items():
+            other_name, other_raw, other_value = other_values[key]
+            if raw and other_raw and (value is other_value or value == other_value):
+                continue
+
+            if raw:
+                value = self._materialize(name=name, primitive=value)
+
+            if other_raw:
+                other_value = other._materialize(name=other_name, primitive=other_value)
+
+            if not (value is other_value or value == other_value):
+                return False
+
+        return True
+
+    @override
+    def __hash__(self) -> int:
+        """
+        Returns the hash of the model, converting every field first so it matches the hash of an eager instance.
+
+        Returns:
+            int: Hash of the model.
+        """
+        self._materialize_all()
+        return super().__hash__()
+
+    @override
+    def __repr__(self) -> str:
+        """
+        Returns the representation of the model, converting every field first.
+
+        Returns:
+            str: The representation of the model.
+        """
+        self._materialize_all()
+        return super().__repr__()
+
+    @override
+    def __str__(self) -> str:
+        """
+        Returns the string of the model, converting every field first.
+
+        Returns:
+            str: The string of the model.
+        """
+        self._materialize_all()
+        return super().__str__()
+
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Reduce the model to its eager class and its converted attributes.
+
+        Returns:
+            tuple[Any, ...]: The restore function and its arguments.
+        """
+        # imported here, base_model imports this module
+        from .base_model import _restore_model
+
+        self._materialize_all()
+        return _restore_model, (self._lazy_base, self.__dict__)
+
+    @override
+    def __copy__(self) -> Any:
+        """
+        Return a shallow clone of the model, converting every field first.
+
+        Returns:
+            Any: A shallow clone of the model.
+        """
+        self._materialize_all()
+        return super().__copy__()
+
+    @override
+    def to_primitives(self) -> dict[str, Any]:
+        """
+        Returns the model as primitives, the fields not converted yet return their stored primitive.
+
+        Returns:
+            dict[str, Any]: Primitive representation of the model.
+        """
+        pending = _pending_primitives(model=self)
+        if not pending:
+            return super().to_primitives()
+
+        serializer = self._resolve_primitives_serializer()
+        values = self.__dict__
+        dictionary: dict[str, Any] = {}
+        for name in self._lazy_fields:
+            field = serializer.fields.get(name) or serializer.resolve(key=name)
+            if field is None:
+                continue  # ignore private attributes
+
+            output_key, convert = field
+            dictionary[output_key] = convert(values[name]) if name in values else pending[name]
+
+        return dictionary
+
+    @override
+    @classmethod
+    def _resolve_primitives_serializer(cls) -> _ModelSerializer:
+        """
+        Return the attribute serializer of the eager class.
+
+        Returns:
+            _ModelSerializer: The attribute serializer of the eager class.
+        """
+        serializer: _ModelSerializer = cls._lazy_base._resolve_primitives_serializer()
+        return serializer
+
+    @override
+    def _to_dict(self, *, ignore_private: bool = True) -> dict[str, Any]:
+        """
+        Returns the model as a dictionary, converting every field first.
+
+        Args:
+            ignore_private (bool, optional): Whether to ignore private attributes. Defaults to True.
+
+        Returns:
+            dict[str, Any]: Dictionary representation of the model.
+        """
+        self._materialize_all()
+        return super()._to_dict(ignore_private=ignore_private)
+
+    @override
+    def _attribute_items(self) -> Iterable[tuple[str, Any]]:
+        """
+        Returns the name and value of each attribute, converting every field first.
+
+        Returns:
+            Iterable[tuple[str, Any]]: The name and value of each attribute.
+        """
+        self._materialize_all()
+        return super()._attribute_items()
+
+    @override
+    def _public_attributes(self) -> tuple[tuple[str, str], ...]:
+        """
+        Returns the public key and attribute name of each public attribute, converting every field first.
+
+        Returns:
+            tuple[tuple[str, str], ...]: The public key and attribute name of each public attribute.
+        """
+        self._materialize_all()
+        return super()._public_attributes()
+
+    def _materialize(self, *, name: str, primitive: Any) -> Any:
+        """
+        Convert the primitive of the field `name`, store it in the instance dictionary and return it.
+
+        Args:
+            name (str): The attribute name.
+            primitive (Any): The stored primitive.
+
+        Raises:
+            TypeError: If the converted value does not match the union annotation of the field.
+
+        Returns:
+            Any: The converted value.
+        """
+        parameter, convert, union_type, _ = self._lazy_fields[name]
+        value = convert(primitive, object.__getattribute__(self, '_lazy_trusted'))
+        if union_type is not None and not matches_expected_type(value=value, expected_type=union_type):
+            self._raise_value_is_not_of_type(parameter=parameter, value=value, expected_type=union_type)
+
+        object.__setattr__(self, name, value)
+        _pending_primitives(model=self).pop(name, None)
+
+        return value
+
+    def _materialize_all(self) -> None:
+        """
+        Convert every field not converted yet, keeping the attributes in constructor order.
+        """
+        pending = _pending_primitives(model=self)
+        if not pending:
+            return
+
+        values = self.__dict__
+        for name, primitive in tuple(pending.items()):
+            if name not in values:
+                self._materialize(name=name, primitive=primitive)
+
+        pending.clear()
+        ordered = {name: values[name] for name in self._lazy_fields}
+        values.clear()
+        values.update(ordered)
+
+
+def _pending_primitives(*, model: Any) -> dict[str, Any]:
+    """
+    Returns the primitives of `model` waiting to be converted, keyed by attribute name.
+
+    Args:
+        model (Any): The model.
+
+    Returns:
+        dict[str, Any]: The primitives waiting to be converted, empty for eager models and copies of lazy models.
+    """
+    try:
+        return object.__getattribute__(model, '_lazy_primitives')  # type: ignore[no-any-return]
+
+    except AttributeError:
+        return _NO_PRIMITIVES
+
+
+def _public_values(*, model: Any, pending: dict[str, Any]) -> dict[str, tuple[str, bool, Any]]:
+    """
+    Returns the attribute name of each public field of `model`, whether it is still a primitive and its value, by
+    public key.
+
+    Args:
+        model (Any): The model.
+        pending (dict[str, Any]): The primitives waiting to be converted.
+
+    Returns:
+        dict[str, tuple[str, bool, Any]]: The attribute name, whether the field is still a primitive and its primitive
+        or value, by public key.
+    """
+    attributes = model.__dict__
+    items = [(name, True, primitive) for name, primitive in pending.items() if name not in attributes]
+    items.extend((name, False, value) for name, value in attributes.items())
+
+    layout = model._resolve_attribute_layout()
+    values: dict[str, tuple[str, bool, Any]] = {}
+    for name, raw, value in items:
+        public_key, private = layout.keys.get(name) or layout.resolve(key=name)
+        if not private:
+            values[public_key] = (name, raw, value)
+
+    return values
+
+
+def new_lazy_model(cls: type[BaseModel], *, primitives: dict[str, Any], trusted: bool) -> Any:
+    """
+    Create a lazy instance of `cls` from `primitives`, or return None when `cls` has no lazy subclass yet.
+
+    Fields whose annotation needs no conversion and missing fields, which take their default, are stored at once.
+
+    Args:
+        cls (type[BaseModel]): The model class.
+        primitives (dict[str, Any]): Primitives keyed by constructor parameter name, already checked.
+        trusted (bool): Whether the primitives are known to be valid.
+
+    Returns:
+        Any: The lazy instance, or None.
+    """
+    lazy_class = cls.__dict__.get('_lazy_model_class')
+    if not lazy_class:
+        return None
+
+    model = object.__new__(lazy_class)
+    values = model.__dict__
+    pending: dict[str, Any] = {}
+    for name, (parameter, convert, _, default) in lazy_class._lazy_fields.items():
+        primitive = primitives.get(parameter, default)
+        if convert is _return_value or parameter not in primitives:
+            values[name] = primitive
+
+        else:
+            pending[name] = primitive
+
+    object.__setattr__(model, '_lazy_primitives', pending)
+    object.__setattr__(model, '_lazy_trusted', trusted)
+
+    return model
+
+
+def learn_lazy_model(
+    cls: type[BaseModel],
+    *,
+    model: BaseModel,
+    schema: _ModelSchema,
+    arguments: dict[str, Any],
+) -> None:
+    """
+    Create the lazy subclass of `cls` from an eager instance and its constructor arguments, or mark `cls` as not lazy.
+
+    The attribute of each parameter is the one whose public key is the parameter name. A lazy subclass is only created
+    when the constructor stores every parameter, and nothing else, as an attribute holding the same object, and when
+    `cls` does not override the methods of `LazyModel`. Frozen models and models without instance dictionary are never
+    lazy.
+
+    Args:
+        cls (type[BaseModel]): The model class.
+        model (BaseModel): An instance created by the constructor from `arguments`.
+        schema (_ModelSchema): The constructor schema of the class.
+        arguments (dict[str, Any]): The converted constructor arguments.
+    """
+    # imported here, base_model imports this module
+    from .base_model import BaseModel
+    from .frozen_base_model import FrozenBaseModel
+
+    if '_lazy_model_class' in cls.__dict__ or cls.__dict__.get('_primitives_schema') is not schema:
+        return
+
+    values = getattr(model, '__dict__', None)
+    if (
+        values is None
+        or issubclass(cls, FrozenBaseModel)
+        or any(getattr(cls, method, None) is not getattr(BaseModel, method, None) for method in _LAZY_METHODS)
+    ):
+        cls._lazy_model_class = False
+        return
+
+    layout = cls._resolve_attribute_layout()
+    annotations = cls._get_constructor_annotations()
+    converters = {
+        name: (_compile_lazy_converter(expected_type=annotations.get(name), convert=convert), union_type)
+        for name, convert, union_type in schema.fields
+    }
+    defaults = {name: parameter.default for name, parameter in signature(obj=cls.__init__).parameters.items()}
+    fields: dict[str, tuple[str, Callable[[Any, bool], Any], Any, Any]] = {}
+    for name, value in values.items():
+        parameter = (layout.keys.get(name) or layout.resolve(key=name))[0]
+        if parameter not in converters or value is not arguments.get(parameter, defaults[parameter]):
+            cls._lazy_model_class = False
+            return
+
+        fields[name] = (parameter, *converters[parameter], defaults[parameter])
+
+    if len(fields) != len(converters):
+        cls._lazy_model_class = False
+        return
+
+    namespace = {
+        '__slots__': ('_lazy_primitives', '_lazy_trusted'),
+        '__module__': cls.__module__,
+        '__qualname__': cls.__qualname__,
+        '__doc__': cls.__doc__,
+        '_lazy_fields': fields,
+        '_lazy_base': cls,
+        '_attribute_layout': layout,
+        '_primitives_schema': schema,
+    }
+    cls._lazy_model_class = type(cls)(cls.__name__, (LazyModel, cls), namespace)  # type: ignore[misc]
+
+
+def _compile_lazy_converter(*, expected_type: Any, convert: Callable[[Any, bool], Any]) -> Callable[[Any, bool], Any]:
+    """
+    Return the converter of a lazy field, nested models are created lazily as well.
+
+    Args:
+        expected_type (Any): The parameter annotation.
+        convert (Callable[[Any, bool], Any]): The converter of the parameter.
+
+    Returns:
+        Callable[[Any, bool], Any]: The converter.
+    """
+    # imported here, base_model imports this module
+    from .base_model import BaseModel
+
+    if not (isclass(object=expected_type) and issubclass(expected_type, BaseModel) and expected_type.from_primitives.__func__ is BaseModel.from_primitives.__func__):  # type: ignore[attr-defined]  # noqa: E501  # fmt: skip
+        return convert
+
+    def convert_lazily(value: Any, trusted: bool) -> Any:
+        if type(value) is dict:
+            return expected_type.from_primitives(value, trusted=trusted, lazy=True)
+
+        return convert(value, trusted)
+
+    return convert_lazily
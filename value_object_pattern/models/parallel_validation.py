@@ -0,0 +1,68 @@
+"""
+Helpers to validate batches of raw values in worker processes, see `ValueObject.validate_many_parallel`.
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from .primitive_conversion import to_primitive
+
+
+def chunk_values(*, values: Iterable[Any], chunk_size: int) -> Iterator[list[Any]]:
+    """
+    Split `values` into consecutive lists of at most `chunk_size` values.
+
+    Args:
+        values (Iterable[Any]): Values to split.
+        chunk_size (int): Maximum number of values per chunk.
+
+    Returns:
+        Iterator[list[Any]]: The chunks, in input order.
+    """
+    iterator = iter(values)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def validate_chunk(
+    cls: Any,
+    values: list[Any],
+    title: str | None,
+    parameter: str | None,
+    errors: str,
+    payload: str,
+) -> tuple[list[Any], list[int], dict[int, Exception]]:
+    """
+    Validate a chunk of raw values in a worker and return what the parent process needs to rebuild the batch.
+
+    Instances are not sent back: `payload='value'` returns the processed values, which the parent turns into instances
+    with `from_trusted`, `payload='primitive'` returns their primitives and `payload='instance'` the instances
+    themselves, for classes that can not be rebuilt with `from_trusted`. The first error of a chunk is reported like the
+    others, so the parent can raise the first error in input order.
+
+    Args:
+        cls (Any): The value object class, pickled by reference.
+        values (list[Any]): Raw values of the chunk.
+        title (str | None): Name used in validation errors.
+        parameter (str | None): Parameter name used in validation errors.
+        errors (str): The batch error mode.
+        payload (str): What to return for each valid value, 'value', 'primitive' or 'instance'.
+
+    Returns:
+        tuple[list[Any], list[int], dict[int, Exception]]: The payloads of the valid values, their indexes in the chunk
+        and the errors by index in the chunk.
+    """
+    result = cls.validate_many(values=values, title=title, parameter=parameter, errors='skip' if errors == 'skip' else 'collect')  # noqa: E501  # fmt: skip
+
+    if payload == 'value':
+        payloads = [instance._value for instance in result.instances]
+
+    elif payload == 'primitive':
+        payloads = [to_primitive(value=instance) for instance in result.instances]
+
+    else:
+        payloads = result.instances
+
+    return payloads, result.indexes, result.errors
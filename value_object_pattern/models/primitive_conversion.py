@@ -4,16 +4,20 @@ Utilities for recursive primitive conversion.
 
 from __future__ import annotations
 
+from contextlib import suppress as suppress_exception
 from enum import Enum
-from inspect import _empty, isclass
+from inspect import Parameter, _empty, isclass, signature
 from types import UnionType
-from typing import Any, Union, get_args, get_origin
+from typing import Any, Callable, Union, get_args, get_origin
+from weakref import WeakKeyDictionary
 
 from .type_matching import matches_expected_type
 from .value_object import ValueObject
 
 PRIMITIVE_TYPES: tuple[type, ...] = (int, float, str, bool, bytes, bytearray, memoryview, type(None))
 _MISSING = object()
+_EXACT_PRIMITIVE_TYPES = frozenset((bool, bytes, float, int, str, type(None)))
+_ACCEPTS_TRUSTED: WeakKeyDictionary[Any, bool] = WeakKeyDictionary()
 
 
 def to_primitive(value: Any) -> Any:
@@ -49,6 +53,144 @@ def to_primitive(value: Any) -> Any:
     return str(object=value)
 
 
+def compile_to_primitive(*, expected_type: Any) -> Callable[[Any], Any]:
+    """
+    Return a converter equivalent to `to_primitive` for values annotated as `expected_type`, resolving the conversion
+    path once.
+
+    Value objects are unwrapped directly, enums return their `.value`, models use their own serializer and typed
+    collections convert their items with the converter of the item annotation. Every converter checks the exact type of
+    the value first and falls back to `to_primitive` for anything else, so a value that does not match its annotation
+    is converted as before.
+
+    Args:
+        expected_type (Any): The attribute annotation.
+
+    Returns:
+        Callable[[Any], Any]: The converter.
+    """
+    origin = get_origin(tp=expected_type)
+    arguments = get_args(expected_type)
+    if origin in (Union, UnionType):
+        candidates = [argument for argument in arguments if argument is not type(None)]
+        if len(candidates) == 1 and len(arguments) == 2:
+            return _compile_optional_to_primitive(convert=compile_to_primitive(expected_type=candidates[0]))
+
+        return to_primitive
+
+    if origin in (list, set, frozenset, tuple, dict):
+        return _compile_collection_to_primitive(origin=origin, arguments=arguments)
+
+    if not isclass(object=expected_type) or origin is not None:
+        return to_primitive
+
+    return _compile_class_to_primitive(expected_type=expected_type)
+
+
+def _compile_class_to_primitive(*, expected_type: type) -> Callable[[Any], Any]:
+    """
+    Return a converter for a class annotation, unwrapping value objects and enums and serializing models directly.
+
+    Args:
+        expected_type (type): The annotated class.
+
+    Returns:
+        Callable[[Any], Any]: The converter.
+    """
+    # imported here, base_model imports this module
+    from .base_model import BaseModel
+    from .frozen_base_model import FrozenBaseModel
+
+    # instances of primitive subclasses, such as StrEnum members, are returned as they are by to_primitive
+    if issubclass(expected_type, PRIMITIVE_TYPES):
+        return to_primitive
+
+    if issubclass(expected_type, Enum) or (issubclass(expected_type, ValueObject) and not callable(getattr(expected_type, 'to_primitives', None))):  # noqa: E501  # fmt: skip
+
+        def unwrap(value: Any) -> Any:
+            if type(value) is not expected_type:
+                return to_primitive(value=value)
+
+            nested_value = value.value
+            if type(nested_value) in _EXACT_PRIMITIVE_TYPES:
+                return nested_value
+
+            return to_primitive(value=value)
+
+        return unwrap
+
+    if issubclass(expected_type, BaseModel) and expected_type.to_primitives in (BaseModel.to_primitives, FrozenBaseModel.to_primitives):  # noqa: E501  # fmt: skip
+
+        def serialize(value: Any) -> Any:
+            if type(value) is not expected_type:
+                return to_primitive(value=value)
+
+            return value.to_primitives()
+
+        return serialize
+
+    return to_primitive
+
+
+def _compile_optional_to_primitive(*, convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    Return a converter for an optional annotation from the converter of its non-None type.
+
+    Args:
+        convert (Callable[[Any], Any]): The converter of the non-None type.
+
+    Returns:
+        Callable[[Any], Any]: The converter.
+    """
+
+    def convert_optional(value: Any) -> Any:
+        return None if value is None else convert(value)
+
+    return convert_optional
+
+
+def _compile_collection_to_primitive(*, origin: type[Any], arguments: tuple[Any, ...]) -> Callable[[Any], Any]:
+    """
+    Return a converter for a typed collection annotation, converting its items with the converters of their
+    annotations.
+
+    Args:
+        origin (type[Any]): The collection type, one of list, set, frozenset, tuple or dict.
+        arguments (tuple[Any, ...]): The collection type arguments.
+
+    Returns:
+        Callable[[Any], Any]: The converter.
+    """
+    if origin is dict:
+        convert_key = compile_to_primitive(expected_type=arguments[0]) if arguments else to_primitive
+        convert_item = compile_to_primitive(expected_type=arguments[1]) if len(arguments) == 2 else to_primitive
+
+        def convert_dict(value: Any) -> Any:
+            if type(value) is not dict:
+                return to_primitive(value=value)
+
+            return {convert_key(key): convert_item(item) for key, item in value.items()}
+
+        return convert_dict
+
+    convert: Callable[[Any], Any]
+    if origin is tuple and not (len(arguments) == 2 and arguments[1] is Ellipsis):
+        convert = to_primitive
+    else:
+        convert = compile_to_primitive(expected_type=arguments[0]) if arguments else to_primitive
+
+    def convert_collection(value: Any) -> Any:
+        if type(value) is not origin:
+            return to_primitive(value=value)
+
+        if origin is list:
+            return [convert(item) for item in value]
+
+        return origin(convert(item) for item in value)
+
+    return convert_collection
+
+
 def to_display_primitive(value: Any) -> Any:
     """
     Recursively convert a value for display while honoring value-object redaction.
@@ -125,16 +267,21 @@ def _convert_collection_for_display(*, value: Any) -> Any:
     return {to_display_primitive(value=key): to_display_primitive(value=item) for key, item in value.items()}
 
 
-def from_primitive(*, value: Any, expected_type: Any) -> Any:
+def from_primitive(*, value: Any, expected_type: Any, trusted: bool = False) -> Any:
     """
     Recursively convert a primitive value into `expected_type` when possible.
 
     Conversion supports value-object classes, model classes, enums, unions, and typed collections. If no conversion path
     applies, the original value is returned so the caller can perform final type validation.
 
+    When `trusted` is True the primitives are known to be valid, for example because they were produced by
+    `to_primitives()`, and value objects are created through `from_trusted` without running their validations. Union
+    candidates are always validated, since validation is what selects the matching candidate.
+
     Args:
         value (Any): Primitive value to convert.
         expected_type (Any): Target type annotation or class.
+        trusted (bool, optional): Whether the primitives are known to be valid. Defaults to False.
 
     Returns:
         Any: Converted value.
@@ -147,9 +294,304 @@ def from_primitive(*, value: Any, expected_type: Any) -> Any:
         return _convert_union_from_primitive(value=value, expected_type=expected_type)
 
     if origin is not None:
-        return _convert_collection_from_primitive(value=value, expected_type=expected_type)
+        return _convert_collection_from_primitive(value=value, expected_type=expected_type, trusted=trusted)
+
+    return _convert_single_from_primitive(value=value, expected_type=expected_type, trusted=trusted)
+
+
+def compile_from_primitive(*, expected_type: Any) -> Callable[[Any, bool], Any]:
+    """
+    Return a converter equivalent to `from_primitive` for `expected_type`, resolving the conversion path once.
+
+    The converter is called as `converter(value, trusted)`. Annotations that need no conversion get a converter that
+    returns the value, enums and value objects without `from_primitives` get a direct conversion, and every other
+    annotation keeps the generic conversion path.
+
+    Args:
+        expected_type (Any): Target type annotation or class.
+
+    Returns:
+        Callable[[Any, bool], Any]: The converter.
+    """
+    if expected_type in (_empty, Any, type(None)) or (get_origin(tp=expected_type) is None and not isclass(object=expected_type)):  # noqa: E501  # fmt: skip
+        return _return_value
+
+    if isclass(object=expected_type) and issubclass(expected_type, Enum):
+
+        def convert_enum(value: Any, trusted: bool) -> Any:
+            return value if isinstance(value, expected_type) else expected_type(value)
+
+        return convert_enum
+
+    if isclass(object=expected_type) and issubclass(expected_type, ValueObject) and not callable(getattr(expected_type, 'from_primitives', None)):  # noqa: E501  # fmt: skip
+
+        def convert_value_object(value: Any, trusted: bool) -> Any:
+            if isinstance(value, expected_type):
+                return value
+
+            if trusted:
+                return expected_type.from_trusted(value=value, process=True)
+
+            return expected_type(value=value)
+
+        return convert_value_object
+
+    def convert(value: Any, trusted: bool) -> Any:
+        return from_primitive(value=value, expected_type=expected_type, trusted=trusted)
+
+    return convert
+
+
+def compile_column_from_primitive(
+    *,
+    expected_type: Any,
+    convert: Callable[[Any, bool], Any],
+) -> Callable[[list[Any], bool], tuple[list[Any], dict[int, Exception]]]:
+    """
+    Return a converter for a whole column of primitives of `expected_type`, see `BaseModel.from_primitives_many`.
+
+    The converter is called as `converter(values, trusted)` and returns the converted values and the `TypeError` or
+    `ValueError` raised by each rejected position, a rejected position keeps its primitive value. Value objects without
+    `from_primitives` are built through `ValueObject.validate_many` and dictionaries of models through
+    `BaseModel.from_primitives_many`, so their hooks and schemas are resolved once per column. Every other value goes
+    through `convert`, the converter of `compile_from_primitive`.
+
+    Args:
+        expected_type (Any): Target type annotation or class.
+        convert (Callable[[Any, bool], Any]): The converter of a single value for `expected_type`.
+
+    Returns:
+        Callable[[list[Any], bool], tuple[list[Any], dict[int, Exception]]]: The column converter.
+    """
+    if convert is _return_value:
+        return _return_column
+
+    convert_list_column = _compile_list_column(expected_type=expected_type)
+    if convert_list_column is not None:
+        return convert_list_column
+
+    batch, batches_type = _compile_column_batch(expected_type=expected_type)
+    if batches_type is _never_batched:
+        return _compile_unbatched_column(convert=convert)
+
+    return _compile_batched_column(batch=batch, batches_type=batches_type, convert=convert)
+
+
+def _compile_unbatched_column(
+    *,
+    convert: Callable[[Any, bool], Any],
+) -> Callable[[list[Any], bool], tuple[list[Any], dict[int, Exception]]]:
+    """
+    Return a column converter converting every value with `convert`.
+
+    Args:
+        convert (Callable[[Any, bool], Any]): The converter of a single value.
+
+    Returns:
+        Callable[[list[Any], bool], tuple[list[Any], dict[int, Exception]]]: The column converter.
+    """
+
+    def convert_column(values: list[Any], trusted: bool) -> tuple[list[Any], dict[int, Exception]]:
+        converted = list(values)
+        errors: dict[int, Exception] = {}
+        for position, value in enumerate(values):
+            try:
+                converted[position] = convert(value, trusted)
+
+            except (TypeError, ValueError) as error:
+                errors[position] = error
+
+        return converted, errors
 
-    return _convert_single_from_primitive(value=value, expected_type=expected_type)
+    return convert_column
+
+
+def _compile_batched_column(
+    *,
+    batch: Callable[[list[Any], bool], Any],
+    batches_type: Callable[[type, bool], bool],
+    convert: Callable[[Any, bool], Any],
+) -> Callable[[list[Any], bool], tuple[list[Any], dict[int, Exception]]]:
+    """
+    Return a column converter building the values whose type `batches_type` accepts with `batch` in one call and
+    converting every other value with `convert`.
+
+    Args:
+        batch (Callable[[list[Any], bool], Any]): The batch constructor, returning a `BatchResult`.
+        batches_type (Callable[[type, bool], bool]): The predicate telling the types of the values built by `batch`.
+        convert (Callable[[Any, bool], Any]): The converter of a single value.
+
+    Returns:
+        Callable[[list[Any], bool], tuple[list[Any], dict[int, Exception]]]: The column converter.
+    """
+
+    def convert_column(values: list[Any], trusted: bool) -> tuple[list[Any], dict[int, Exception]]:
+        converted = list(values)
+        errors: dict[int, Exception] = {}
+
+        # the batch is chosen by value type, a column usually holds a single type
+        value_types = set(map(type, values))
+        batched_types = {value_type for value_type in value_types if batches_type(value_type, trusted)}
+        if len(batched_types) == len(value_types):
+            positions: range | list[int] = range(len(values))
+            batched_values = values
+
+        else:
+            positions = []
+            for position, value in enumerate(values):
+                if type(value) in batched_types:
+                    positions.append(position)
+                    continue
+
+                try:
+                    converted[position] = convert(value, trusted)
+
+                except (TypeError, ValueError) as error:
+                    errors[position] = error
+
+            batched_values = [values[position] for position in positions]
+
+        if not positions:
+            return converted, errors
+
+        result = batch(batched_values, trusted)
+        for index, instance in zip(result.indexes, result.instances, strict=True):
+            converted[positions[index]] = instance
+
+        for index, batch_error in result.errors.items():
+            errors[positions[index]] = batch_error
+
+        return converted, errors
+
+    return convert_column
+
+
+def _compile_list_column(
+    *,
+    expected_type: Any,
+) -> Callable[[list[Any], bool], tuple[list[Any], dict[int, Exception]]] | None:
+    """
+    Return a column converter for a list of value objects or models, converting the items of every list of the column
+    as one column, or None for any other annotation.
+
+    A list is rejected with the error of its first rejected item, and values that are not lists are kept as they are.
+
+    Args:
+        expected_type (Any): Target type annotation.
+
+    Returns:
+        Callable[[list[Any], bool], tuple[list[Any], dict[int, Exception]]] | None: The column converter.
+    """
+    arguments = get_args(expected_type)
+    if get_origin(tp=expected_type) is not list or not arguments:
+        return None
+
+    item_type = arguments[0]
+    if _compile_column_batch(expected_type=item_type)[1] is _never_batched:
+        return None
+
+    convert_items = compile_column_from_primitive(expected_type=item_type, convert=compile_from_primitive(expected_type=item_type))  # noqa: E501  # fmt: skip
+
+    def convert_list_column(values: list[Any], trusted: bool) -> tuple[list[Any], dict[int, Exception]]:
+        converted = list(values)
+        positions = [position for position, value in enumerate(values) if isinstance(value, list)]
+        owners = [position for position in positions for _ in values[position]]
+        items, item_errors = convert_items([item for position in positions for item in values[position]], trusted)
+
+        start = 0
+        for position in positions:
+            end = start + len(values[position])
+            converted[position] = items[start:end]
+            start = end
+
+        errors: dict[int, Exception] = {}
+        for item_position in sorted(item_errors):
+            errors.setdefault(owners[item_position], item_errors[item_position])
+
+        return converted, errors
+
+    return convert_list_column
+
+
+def _compile_column_batch(*, expected_type: Any) -> tuple[Callable[[list[Any], bool], Any], Callable[[type, bool], bool]]:  # noqa: E501  # fmt: skip
+    """
+    Return the batch constructor of a column of `expected_type` and the predicate telling the types of the values it
+    builds.
+
+    Args:
+        expected_type (Any): Target type annotation or class.
+
+    Returns:
+        tuple[Callable[[list[Any], bool], Any], Callable[[type, bool], bool]]: The batch constructor, returning a
+        `BatchResult`, and the predicate called as `predicate(value_type, trusted)`.
+    """
+    # imported here, base_model imports this module
+    from .base_model import BaseModel
+
+    if isclass(object=expected_type) and issubclass(expected_type, ValueObject) and not callable(getattr(expected_type, 'from_primitives', None)):  # noqa: E501  # fmt: skip
+
+        def validate_many(values: list[Any], trusted: bool) -> Any:
+            return expected_type.validate_many(values=values)
+
+        # trusted values skip validation, they are built one by one with from_trusted
+        def is_untrusted_primitive(value_type: type, trusted: bool) -> bool:
+            return not trusted and not issubclass(value_type, expected_type)
+
+        return validate_many, is_untrusted_primitive
+
+    if isclass(object=expected_type) and issubclass(expected_type, BaseModel) and expected_type.from_primitives.__func__ is BaseModel.from_primitives.__func__:  # type: ignore[attr-defined]  # noqa: E501  # fmt: skip
+
+        def from_primitives_many(values: list[Any], trusted: bool) -> Any:
+            return expected_type.from_primitives_many(rows=values, trusted=trusted)
+
+        def is_dictionary(value_type: type, trusted: bool) -> bool:
+            return issubclass(value_type, dict)
+
+        return from_primitives_many, is_dictionary
+
+    return _return_value, _never_batched
+
+
+def _never_batched(value_type: type, trusted: bool) -> bool:
+    """
+    Return False, the batch predicate of annotations without a batch constructor.
+
+    Args:
+        value_type (type): Type of a primitive value.
+        trusted (bool): Whether the primitives are known to be valid.
+
+    Returns:
+        bool: Always False.
+    """
+    return False
+
+
+def _return_column(values: list[Any], trusted: bool) -> tuple[list[Any], dict[int, Exception]]:
+    """
+    Return `values` unchanged and no errors, the column converter of annotations that need no conversion.
+
+    Args:
+        values (list[Any]): Primitive values.
+        trusted (bool): Whether the primitives are known to be valid.
+
+    Returns:
+        tuple[list[Any], dict[int, Exception]]: The same values and no errors.
+    """
+    return values, {}
+
+
+def _return_value(value: Any, trusted: bool) -> Any:
+    """
+    Return `value` unchanged, the converter of annotations that need no conversion.
+
+    Args:
+        value (Any): Primitive value.
+        trusted (bool): Whether the primitives are known to be valid.
+
+    Returns:
+        Any: The same value.
+    """
+    return value
 
 
 def _convert_with_to_primitives(*, value: Any) -> Any:
@@ -252,13 +694,14 @@ def _convert_union_from_primitive(*, value: Any, expected_type: Any) -> Any:
     return value
 
 
-def _convert_collection_from_primitive(*, value: Any, expected_type: Any) -> Any:
+def _convert_collection_from_primitive(*, value: Any, expected_type: Any, trusted: bool) -> Any:
     """
     Converts collection primitives recursively.
 
     Args:
         value (Any): Primitive value.
         expected_type (Any): Collection annotation.
+        trusted (bool): Whether the primitives are known to be valid.
 
     Returns:
         Any: Converted collection.
@@ -277,16 +720,17 @@ def _convert_collection_from_primitive(*, value: Any, expected_type: Any) -> Any
     if handler is None:
         return value
 
-    return handler(value=value, arguments=arguments)
+    return handler(value=value, arguments=arguments, trusted=trusted)
 
 
-def _convert_list_from_primitive(*, value: Any, arguments: tuple[Any, ...]) -> Any:
+def _convert_list_from_primitive(*, value: Any, arguments: tuple[Any, ...], trusted: bool) -> Any:
     """
     Converts list primitives recursively.
 
     Args:
         value (Any): Primitive value.
         arguments (tuple[Any, ...]): List type arguments.
+        trusted (bool): Whether the primitives are known to be valid.
 
     Returns:
         Any: Converted list or raw value.
@@ -295,16 +739,17 @@ def _convert_list_from_primitive(*, value: Any, arguments: tuple[Any, ...]) -> A
         return value
 
     item_type = arguments[0] if arguments else Any
-    return [from_primitive(value=item, expected_type=item_type) for item in value]
+    return [from_primitive(value=item, expected_type=item_type, trusted=trusted) for item in value]
 
 
-def _convert_tuple_from_primitive(*, value: Any, arguments: tuple[Any, ...]) -> Any:
+def _convert_tuple_from_primitive(*, value: Any, arguments: tuple[Any, ...], trusted: bool) -> Any:
     """
     Converts tuple primitives recursively.
 
     Args:
         value (Any): Primitive value.
         arguments (tuple[Any, ...]): Tuple type arguments.
+        trusted (bool): Whether the primitives are known to be valid.
 
     Returns:
         Any: Converted tuple or raw value.
@@ -315,24 +760,25 @@ def _convert_tuple_from_primitive(*, value: Any, arguments: tuple[Any, ...]) ->
     sequence = tuple(value)
     if len(arguments) == 2 and arguments[1] is Ellipsis:
         item_type = arguments[0]
-        return tuple(from_primitive(value=item, expected_type=item_type) for item in sequence)
+        return tuple(from_primitive(value=item, expected_type=item_type, trusted=trusted) for item in sequence)
 
     if len(arguments) != len(sequence):
         return sequence
 
     return tuple(
-        from_primitive(value=item, expected_type=item_type)
+        from_primitive(value=item, expected_type=item_type, trusted=trusted)
         for item, item_type in zip(sequence, arguments, strict=False)
     )
 
 
-def _convert_set_from_primitive(*, value: Any, arguments: tuple[Any, ...]) -> Any:
+def _convert_set_from_primitive(*, value: Any, arguments: tuple[Any, ...], trusted: bool) -> Any:
     """
     Converts set primitives recursively.
 
     Args:
         value (Any): Primitive value.
         arguments (tuple[Any, ...]): Set type arguments.
+        trusted (bool): Whether the primitives are known to be valid.
 
     Returns:
         Any: Converted set or raw value.
@@ -341,16 +787,17 @@ def _convert_set_from_primitive(*, value: Any, arguments: tuple[Any, ...]) -> An
         return value
 
     item_type = arguments[0] if arguments else Any
-    return {from_primitive(value=item, expected_type=item_type) for item in value}
+    return {from_primitive(value=item, expected_type=item_type, trusted=trusted) for item in value}
 
 
-def _convert_frozenset_from_primitive(*, value: Any, arguments: tuple[Any, ...]) -> Any:
+def _convert_frozenset_from_primitive(*, value: Any, arguments: tuple[Any, ...], trusted: bool) -> Any:
     """
     Converts frozenset primitives recursively.
 
     Args:
         value (Any): Primitive value.
         arguments (tuple[Any, ...]): Frozenset type arguments.
+        trusted (bool): Whether the primitives are known to be valid.
 
     Returns:
         Any: Converted frozenset or raw value.
@@ -359,16 +806,17 @@ def _convert_frozenset_from_primitive(*, value: Any, arguments: tuple[Any, ...])
         return value
 
     item_type = arguments[0] if arguments else Any
-    return frozenset(from_primitive(value=item, expected_type=item_type) for item in value)
+    return frozenset(from_primitive(value=item, expected_type=item_type, trusted=trusted) for item in value)
 
 
-def _convert_dict_from_primitive(*, value: Any, arguments: tuple[Any, ...]) -> Any:
+def _convert_dict_from_primitive(*, value: Any, arguments: tuple[Any, ...], trusted: bool) -> Any:
     """
     Converts dict primitives recursively.
 
     Args:
         value (Any): Primitive value.
         arguments (tuple[Any, ...]): Dict type arguments.
+        trusted (bool): Whether the primitives are known to be valid.
 
     Returns:
         Any: Converted dict or raw value.
@@ -379,18 +827,23 @@ def _convert_dict_from_primitive(*, value: Any, arguments: tuple[Any, ...]) -> A
     key_type = arguments[0] if len(arguments) >= 1 else Any
     value_type = arguments[1] if len(arguments) >= 2 else Any
     return {
-        from_primitive(value=key, expected_type=key_type): from_primitive(value=item, expected_type=value_type)
+        from_primitive(value=key, expected_type=key_type, trusted=trusted): from_primitive(
+            value=item,
+            expected_type=value_type,
+            trusted=trusted,
+        )
         for key, item in value.items()
     }
 
 
-def _convert_single_from_primitive(*, value: Any, expected_type: Any) -> Any:
+def _convert_single_from_primitive(*, value: Any, expected_type: Any, trusted: bool) -> Any:
     """
     Converts non-collection primitive values.
 
     Args:
         value (Any): Primitive value.
         expected_type (Any): Target class/type.
+        trusted (bool): Whether the primitives are known to be valid.
 
     Returns:
         Any: Converted value.
@@ -401,20 +854,21 @@ def _convert_single_from_primitive(*, value: Any, expected_type: Any) -> Any:
     if not isclass(object=expected_type):
         return value
 
-    converted = _convert_single_class_from_primitive(value=value, expected_type=expected_type)
+    converted = _convert_single_class_from_primitive(value=value, expected_type=expected_type, trusted=trusted)
     if converted is not _MISSING:
         return converted
 
     return value
 
 
-def _convert_single_class_from_primitive(*, value: Any, expected_type: type[Any]) -> Any:
+def _convert_single_class_from_primitive(*, value: Any, expected_type: type[Any], trusted: bool) -> Any:
     """
     Converts class-based values from primitives.
 
     Args:
         value (Any): Primitive value.
         expected_type (type[Any]): Target class type.
+        trusted (bool): Whether the primitives are known to be valid.
 
     Returns:
         Any: Converted value or sentinel when no conversion applies.
@@ -423,9 +877,9 @@ def _convert_single_class_from_primitive(*, value: Any, expected_type: type[Any]
         return _convert_enum_class_from_primitive(value=value, expected_type=expected_type)
 
     if issubclass(expected_type, ValueObject):
-        return _convert_value_object_class_from_primitive(value=value, expected_type=expected_type)
+        return _convert_value_object_class_from_primitive(value=value, expected_type=expected_type, trusted=trusted)
 
-    converted = _convert_from_primitives_class_from_primitive(value=value, expected_type=expected_type)
+    converted = _convert_from_primitives_class_from_primitive(value=value, expected_type=expected_type, trusted=trusted)
     if converted is not _MISSING:
         return converted
 
@@ -455,13 +909,14 @@ def _convert_enum_class_from_primitive(*, value: Any, expected_type: type[Any])
     return expected_type(value)
 
 
-def _convert_value_object_class_from_primitive(*, value: Any, expected_type: type[Any]) -> Any:
+def _convert_value_object_class_from_primitive(*, value: Any, expected_type: type[Any], trusted: bool) -> Any:
     """
     Converts values to ValueObject instances.
 
     Args:
         value (Any): Primitive value.
         expected_type (type[Any]): ValueObject class.
+        trusted (bool): Whether the primitives are known to be valid.
 
     Returns:
         Any: Converted ValueObject.
@@ -471,18 +926,22 @@ def _convert_value_object_class_from_primitive(*, value: Any, expected_type: typ
 
     from_primitives_method = getattr(expected_type, 'from_primitives', None)
     if callable(from_primitives_method):
-        return from_primitives_method(value)
+        return _call_from_primitives(from_primitives_method=from_primitives_method, value=value, trusted=trusted)
+
+    if trusted:
+        return expected_type.from_trusted(value=value, process=True)
 
     return expected_type(value=value)
 
 
-def _convert_from_primitives_class_from_primitive(*, value: Any, expected_type: type[Any]) -> Any:
+def _convert_from_primitives_class_from_primitive(*, value: Any, expected_type: type[Any], trusted: bool) -> Any:
     """
     Converts values using `from_primitives` for non-ValueObject classes.
 
     Args:
         value (Any): Primitive value.
         expected_type (type[Any]): Target class type.
+        trusted (bool): Whether the primitives are known to be valid.
 
     Returns:
         Any: Converted value or sentinel when conversion does not apply.
@@ -495,10 +954,11 @@ def _convert_from_primitives_class_from_primitive(*, value: Any, expected_type:
         value=value,
         expected_type=expected_type,
         from_primitives_method=from_primitives_method,
+        trusted=trusted,
     )
 
 
-def _convert_with_from_primitives(*, value: Any, expected_type: Any, from_primitives_method: Any) -> Any:
+def _convert_with_from_primitives(*, value: Any, expected_type: Any, from_primitives_method: Any, trusted: bool) -> Any:
     """
     Converts values using a `from_primitives` classmethod when compatible.
 
@@ -506,6 +966,7 @@ def _convert_with_from_primitives(*, value: Any, expected_type: Any, from_primit
         value (Any): Primitive value.
         expected_type (Any): Target type.
         from_primitives_method (Any): Method to perform conversion.
+        trusted (bool): Whether the primitives are known to be valid.
 
     Returns:
         Any: Converted value or raw value when not compatible.
@@ -514,7 +975,7 @@ def _convert_with_from_primitives(*, value: Any, expected_type: Any, from_primit
         return value
 
     if isinstance(value, dict):
-        return from_primitives_method(value)
+        return _call_from_primitives(from_primitives_method=from_primitives_method, value=value, trusted=trusted)
 
     to_primitives_method = getattr(value, 'to_primitives', None)
     if callable(to_primitives_method):
@@ -525,3 +986,56 @@ def _convert_with_from_primitives(*, value: Any, expected_type: Any, from_primit
             return _MISSING
 
     return _MISSING
+
+
+def _call_from_primitives(*, from_primitives_method: Any, value: Any, trusted: bool) -> Any:
+    """
+    Call a `from_primitives` method, forwarding `trusted` only when the method accepts it, so overrides written without
+    the `trusted` keyword keep working in trusted mode.
+
+    Args:
+        from_primitives_method (Any): Method to perform conversion.
+        value (Any): Primitive value.
+        trusted (bool): Whether the primitives are known to be valid.
+
+    Returns:
+        Any: Converted value.
+    """
+    if trusted and _accepts_trusted(method=from_primitives_method):
+        return from_primitives_method(value, trusted=True)
+
+    return from_primitives_method(value)
+
+
+def _accepts_trusted(*, method: Any) -> bool:
+    """
+    Returns whether `method` accepts a `trusted` keyword argument, caching the answer per function.
+
+    Args:
+        method (Any): The `from_primitives` method.
+
+    Returns:
+        bool: Whether `method` accepts `trusted`.
+    """
+    function = getattr(method, '__func__', method)
+    try:
+        return _ACCEPTS_TRUSTED[function]
+
+    except (KeyError, TypeError):  # not cached yet, or not weakly referenceable
+        pass
+
+    try:
+        parameters = signature(method).parameters.values()
+
+    except (TypeError, ValueError):  # no signature available
+        return False
+
+    accepts = any(
+        parameter.kind is Parameter.VAR_KEYWORD
+        or (parameter.name == 'trusted' and parameter.kind is not Parameter.POSITIONAL_ONLY)
+        for parameter in parameters
+    )
+    with suppress_exception(TypeError):  # not weakly referenceable
+        _ACCEPTS_TRUSTED[function] = accepts
+
+    return accepts
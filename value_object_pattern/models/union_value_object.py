@@ -16,7 +16,7 @@ from inspect import isclass
 from types import UnionType
 from typing import Any, ClassVar, Generic, NoReturn, Self, TypeVar, Union, get_args, get_origin
 
-from value_object_pattern.decorators import process, validation
+from value_object_pattern.decorators import cached_classproperty, process, validation
 
 from .base_model import BaseModel
 from .primitive_conversion import from_primitive
@@ -114,17 +114,23 @@ class _UnionValueObjectAlias:
         type_argument, *_ = self.__args__
         _validate_union_type_argument(type_argument=type_argument)
         key = (self.__origin__, type_argument)
-        if key not in self._runtime_classes:
-            self._runtime_classes[key] = type(
-                f'{self.__origin__.__name__}[{self._format_type_argument(type=type_argument)}]',
-                (self.__origin__,),
-                {
-                    '_is_inline_parameterized_union_value_object': True,
-                    '_type': type_argument,
-                },
+        runtime_class = self._runtime_classes.get(key)
+        if runtime_class is None:
+            # concurrent first uses may build two classes, setdefault publishes a single one to every thread
+            runtime_class = self._runtime_classes.setdefault(
+                key,
+                type(
+                    f'{self.__origin__.__name__}[{self._format_type_argument(type=type_argument)}]',
+                    (self.__origin__,),
+                    {
+                        '__slots__': (),
+                        '_is_inline_parameterized_union_value_object': True,
+                        '_type': type_argument,
+                    },
+                ),
             )
 
-        return self._runtime_classes[key]
+        return runtime_class
 
     @staticmethod
     def _format_type_argument(*, type: Any) -> str:
@@ -185,6 +191,8 @@ class UnionValueObject(ValueObject[T], Generic[T]):  # noqa: UP046
     ```
     """
 
+    __slots__ = ()
+
     _type: T
 
     @classmethod
@@ -387,14 +395,25 @@ class UnionValueObject(ValueObject[T], Generic[T]):  # noqa: UP046
         Returns:
             str: The type label.
         """
-        origin = get_origin(tp=self._type)
+        return self._resolved_type_label
+
+    @cached_classproperty
+    def _resolved_type_label(cls) -> str:  # noqa: N805
+        """
+        Resolve the type label of `_type_label`, once per class.
+
+        Returns:
+            str: The type label.
+        """
+        origin = get_origin(tp=cls._type)
         if origin in (Union, UnionType):
-            parts = [self._format_single_type(type=allowed) for allowed in get_args(self._type)]
+            parts = [cls._format_single_type(type=allowed) for allowed in get_args(cls._type)]
             return ' | '.join(parts)
 
-        return self._format_single_type(type=self._type)
+        return cls._format_single_type(type=cls._type)
 
-    def _format_single_type(self, *, type: Any) -> str:
+    @staticmethod
+    def _format_single_type(*, type: Any) -> str:
         """
         Formats a single type for error messages.
 
@@ -413,14 +432,20 @@ class UnionValueObject(ValueObject[T], Generic[T]):  # noqa: UP046
         return str(type).replace('typing.', '')
 
     @classmethod
-    def from_primitives(cls, value: Any) -> Self:
+    def from_primitives(cls, value: Any, *, trusted: bool = False) -> Self:
         """
         Creates the value object from primitives.
 
         Args:
             value (Any): Primitive value.
+            trusted (bool, optional): Whether the primitive is known to be valid, in which case the value object is
+            created through `from_trusted`. The union member is still selected by validation. Defaults to False.
 
         Returns:
             Self: The created value object.
         """
-        return cls(value=from_primitive(value=value, expected_type=cls._type))
+        value = from_primitive(value=value, expected_type=cls._type)
+        if trusted:
+            return cls.from_trusted(value=value, process=True)
+
+        return cls(value=value)
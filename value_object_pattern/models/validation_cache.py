@@ -0,0 +1,138 @@
+"""
+Bounded cache of validation outcomes for value object raw inputs.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+
+class ValidationCache:
+    """
+    Remember the processed value, or the validation error, of each raw input of a value object class, evicting the
+    least recently used entry when the cache is full and dropping entries older than `ttl` seconds.
+
+    Every value object class created with the `memoize` class keyword owns a cache. Constructing an instance with a raw
+    input that is already cached builds it with `from_trusted` from the cached processed value, or raises a copy of the
+    cached error, without running the hooks again. Lookups and insertions are guarded by a lock, the instance itself is
+    constructed outside of it.
+
+    Example:
+    ```python
+    from value_object_pattern.usables.internet import UrlValueObject
+
+
+    class Url(UrlValueObject, memoize=True):
+        pass
+
+
+    Url(value='https://example.com')
+    Url(value='https://example.com')
+    print(Url.validation_cache().statistics())
+    # >>> {'hits': 1, 'misses': 1, 'evictions': 0, 'expirations': 0, 'size': 1, 'max_size': 4096, 'ttl': None}
+    ```
+    """
+
+    __slots__ = ('_entries', '_lock', 'evictions', 'expirations', 'hits', 'max_size', 'misses', 'ttl')
+
+    def __init__(self, *, max_size: int, ttl: float | None = None) -> None:
+        """
+        Create an empty validation cache.
+
+        Args:
+            max_size (int): Maximum number of raw inputs kept by the cache.
+            ttl (float | None, optional): Seconds an entry is kept. Defaults to None, which keeps entries until they
+            are evicted.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: OrderedDict[Any, tuple[float | None, Any, BaseException | None]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of raw inputs kept by the cache.
+
+        Returns:
+            int: The number of raw inputs kept by the cache.
+        """
+        return len(self._entries)
+
+    def get(self, *, key: Any) -> tuple[Any, BaseException | None] | None:
+        """
+        Returns the processed value and error cached for `key`, counting the lookup as a hit or a miss.
+
+        Args:
+            key (Any): The hashable raw input key.
+
+        Returns:
+            tuple[Any, BaseException | None] | None: The processed value and the validation error, None if the key is
+            not cached or its entry expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] <= monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1], entry[2]
+
+    def add(self, *, key: Any, value: Any = None, error: BaseException | None = None) -> None:
+        """
+        Cache the processed `value`, or the validation `error`, of `key`.
+
+        Args:
+            key (Any): The hashable raw input key.
+            value (Any, optional): The processed value. Defaults to None.
+            error (BaseException | None, optional): The validation error. Defaults to None.
+        """
+        expires_at = None if self.ttl is None else monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value, error)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drop every cached entry and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def statistics(self) -> dict[str, Any]:
+        """
+        Returns the hit, miss, eviction, expiration, size, maximum size and time to live of the cache.
+
+        Returns:
+            dict[str, Any]: The cache statistics.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+            }
@@ -0,0 +1,90 @@
+"""
+Structured description of a rejected value object value.
+"""
+
+from __future__ import annotations
+
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+from typing import Any
+
+
+class ValidationFailure:
+    """
+    Describe why a value object rejected a value.
+
+    When a `@validation` method fails, the value object attaches a `ValidationFailure` to the raised exception as its
+    `validation_failure` attribute. The exception arguments are left as plain strings, `error.args[0]` and `str(error)`
+    return the usual message, with the class names replaced by the value object `title` and the first `"value"`
+    replaced by its `parameter`.
+
+    Example:
+    ```python
+    from value_object_pattern.usables import PositiveIntegerValueObject
+
+    try:
+        PositiveIntegerValueObject(value=-1, title='Age')
+
+    except ValueError as error:
+        failure = error.validation_failure
+        print(failure.value_object_class.__name__, failure.title, failure.value, failure.code)
+        print(error)
+    # >>> PositiveIntegerValueObject Age -1 _ensure_value_is_positive_integer
+    # >>> Age value <<<-1>>> must be a positive integer.
+    ```
+    """
+
+    __slots__ = ('code', 'message', 'parameter', 'title', 'value', 'value_object_class')
+
+    def __init__(
+        self,
+        *,
+        value_object_class: type,
+        title: str,
+        parameter: str,
+        value: Any,
+        code: str | None,
+        message: str,
+    ) -> None:
+        """
+        Create a validation failure.
+
+        Args:
+            value_object_class (type): The value object class that rejected the value.
+            title (str): The value object title.
+            parameter (str): The value object parameter.
+            value (Any): The raw value that was rejected.
+            code (str | None): The name of the failing `@validation` method, None if it can not be determined.
+            message (str): The rendered message, also the first argument of the raised exception.
+        """
+        self.value_object_class = value_object_class
+        self.title = title
+        self.parameter = parameter
+        self.value = value
+        self.code = code
+        self.message = message
+
+    @override
+    def __str__(self) -> str:
+        """
+        Returns the rendered message.
+
+        Returns:
+            str: The rendered message.
+        """
+        return self.message
+
+    @override
+    def __repr__(self) -> str:
+        """
+        Returns the representation of the failure.
+
+        Returns:
+            str: The representation of the failure.
+        """
+        return f'ValidationFailure(value_object_class={self.value_object_class.__name__}, code={self.code!r}, message={self.message!r})'  # noqa: E501  # fmt: skip
@@ -11,15 +11,859 @@ if version_info >= (3, 12):
 else:
     from typing_extensions import override  # pragma: no cover
 
-from abc import ABC
+from abc import ABC, ABCMeta
 from collections import deque
-from copy import deepcopy
-from typing import Any, Callable, Generic, TypeVar, get_args
+from concurrent.futures import Executor
+from copy import copy, deepcopy
+from datetime import date, datetime, time, timedelta, tzinfo
+from enum import Enum
+from linecache import cache as linecache_cache
+from re import Pattern, compile as re_compile, escape as re_escape
+from threading import RLock, local
+from types import FunctionType
+from typing import Any, Callable, ClassVar, Generic, Iterable, Literal, Self, TypeVar, cast, get_args
+from uuid import UUID
+
+from value_object_pattern.decorators import Constraint, cached_classproperty
+
+from .batch_result import BatchResult
+from .instrumentation import get_instrumentation
+from .intern_pool import InternPool
+from .validation_cache import ValidationCache
+from .validation_failure import ValidationFailure
 
 T = TypeVar('T')
 
 
-class ValueObject(ABC, Generic[T]):  # noqa: UP046
+class _EarlyProcessedValues(local):
+    """
+    Early processed values of the instances being constructed by the generic constructor in the current thread, keyed
+    by instance id. An instance is always constructed by a single thread, so threads never share this dictionary.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create the dictionary of the current thread.
+        """
+        self.values: dict[int, object] = {}
+
+
+_early_processed = _EarlyProcessedValues()
+_hook_plan_lock = RLock()
+_NOT_PROCESSED = object()
+_NOT_CONSTRUCTING = object()
+_IMMUTABLE_PUBLIC_ATTRIBUTES = frozenset(('metadata', 'parameter', 'title', 'value'))
+_shared_metadata: dict[tuple[str, str], tuple[str, str]] = {}
+_SHARED_METADATA_MAX_SIZE = 4096
+_INTERN_POOL_DEFAULT_MAX_SIZE = 4096
+_MEMOIZE_CACHE_DEFAULT_MAX_SIZE = 4096
+_CACHE_KEYWORDS = frozenset(('parameter', 'title', 'value'))
+_BATCH_ERROR_MODES = ('raise', 'collect', 'skip')
+_PARALLEL_DEFAULT_CHUNK_SIZE = 1000
+_IMMUTABLE_TYPES = frozenset(
+    (bool, bytes, complex, date, datetime, float, int, range, str, time, timedelta, type(None), UUID)
+)
+
+
+class _HookPlan:
+    """
+    Ordered validation and process hooks resolved once for a concrete value object class.
+
+    Validation hooks are stored together with their `early_process` flag, so the constructor does not need to probe
+    decorator attributes on every instance.
+    """
+
+    __slots__ = ('constructor', 'error_pattern', 'owner', 'processes', 'validation_names', 'validations')
+
+    def __init__(
+        self,
+        *,
+        owner: type,
+        validations: tuple[tuple[Callable[..., None], bool], ...],
+        processes: tuple[Callable[..., Any], ...],
+    ) -> None:
+        """
+        Create a hook plan.
+
+        Args:
+            owner (type): The class the plan was resolved for.
+            validations (tuple[tuple[Callable[..., None], bool], ...]): Validation hooks and their early process flag.
+            processes (tuple[Callable[..., Any], ...]): Process hooks.
+        """
+        self.owner = owner
+        self.validations = validations
+        self.processes = processes
+        self.validation_names = frozenset(
+            name
+            for hook, _ in validations
+            for name in getattr(hook, '_fused_names', (getattr(hook, '__name__', None),))
+        )
+        self.constructor: Callable[..., None] | None = None
+        self.error_pattern: Pattern[str] | None = None
+
+
+class _ValueObjectMeta(ABCMeta):
+    """
+    Metaclass that keeps cached hook plans consistent when a class is modified after its creation.
+
+    Any class attribute assignment or deletion, for example monkeypatching a `@validation` method, drops the cached
+    plan of that class and of all its subclasses, so the next construction resolves the hooks again.
+    """
+
+    def __new__(mcls, name: str, bases: tuple[type, ...], namespace: dict[str, Any], /, **kwargs: Any) -> Any:  # noqa: N804
+        """
+        Create a value object class, using `_CachingValueObjectMeta` when the class opts in with `intern` or `memoize`.
+
+        Only those classes pay for the cached construction path, every other class keeps the plain `type.__call__`.
+
+        Args:
+            name (str): The class name.
+            bases (tuple[type, ...]): The class bases.
+            namespace (dict[str, Any]): The class namespace.
+            **kwargs: Class keywords forwarded to `__init_subclass__`.
+
+        Returns:
+            Any: The created class.
+        """
+        caching = kwargs.get('intern', False) is not False or kwargs.get('memoize', False) is not False
+        if caching and not issubclass(mcls, _CachingValueObjectMeta):
+            mcls = _CachingValueObjectMeta
+
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+    @override
+    def __setattr__(cls, name: str, value: Any) -> None:
+        """
+        Set a class attribute and invalidate the affected hook plans.
+
+        Args:
+            name (str): The attribute name.
+            value (Any): The attribute value.
+        """
+        super().__setattr__(name, value)
+        if name != '_hook_plan':
+            _invalidate_hook_plans(cls=cls)
+
+    @override
+    def __delattr__(cls, name: str) -> None:
+        """
+        Delete a class attribute and invalidate the affected hook plans.
+
+        Args:
+            name (str): The attribute name.
+        """
+        super().__delattr__(name)
+        _invalidate_hook_plans(cls=cls)
+
+
+class _CachingValueObjectMeta(_ValueObjectMeta):
+    """
+    Metaclass of value object classes created with the `intern` or `memoize` class keywords.
+
+    Constructions passing only `value`, `title` and `parameter` with a hashable value are keyed by the value type, the
+    value, the title and the parameter. The value type is part of the key, so inputs that compare equal across types,
+    such as `1` and `True`, are validated separately. The class `InternPool` is looked up first, then the class
+    `ValidationCache`, and only on a miss in both the hooks run.
+    """
+
+    @override
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        """
+        Return the canonical or memoized instance for the raw input, constructing it on a miss.
+
+        Args:
+            *args (Any): Positional constructor arguments, which bypass the caches.
+            **kwargs (Any): Keyword constructor arguments.
+
+        Raises:
+            TypeError: A copy of the cached validation error.
+            ValueError: A copy of the cached validation error.
+
+        Returns:
+            Any: The value object.
+        """
+        pool = cls.__dict__.get('_intern_pool')
+        cache = cls.__dict__.get('_validation_cache')
+        if (pool is None and cache is None) or args or not kwargs.keys() <= _CACHE_KEYWORDS:
+            return super().__call__(*args, **kwargs)
+
+        value = kwargs.get('value')
+        key = (type(value), value, kwargs.get('title'), kwargs.get('parameter'))
+        try:
+            hash(key)
+
+        except TypeError:  # unhashable value
+            return super().__call__(**kwargs)
+
+        if pool is not None:
+            instance = pool.get(key=key)
+            if instance is not None:
+                return instance
+
+        if cache is None:
+            instance = super().__call__(**kwargs)
+
+        else:
+            entry = cache.get(key=key)
+            if entry is None:
+                try:
+                    instance = super().__call__(**kwargs)
+
+                except (TypeError, ValueError) as error:
+                    _cache_error(cache=cache, key=key, error=error)
+                    raise
+
+                cache.add(key=key, value=instance._value)
+
+            elif entry[1] is not None:
+                raise copy(entry[1])
+
+            else:
+                title, parameter = kwargs.get('title'), kwargs.get('parameter')
+                instance = cls.from_trusted(value=entry[0], title=title, parameter=parameter)  # type: ignore[attr-defined]
+
+        return instance if pool is None else pool.add(key=key, instance=instance)
+
+
+def _cache_error(*, cache: ValidationCache, key: Any, error: Exception) -> None:
+    """
+    Store a copy of a validation error in the validation cache, the raised error keeps its traceback and the frames it
+    references. Errors that can not be copied are not cached, so the original error is always raised.
+
+    Args:
+        cache (ValidationCache): The validation cache of the value object class.
+        key (Any): The cache key of the construction arguments.
+        error (Exception): The raised validation error.
+    """
+    try:
+        cached_error = copy(error)
+
+    except Exception:  # the error can not be rebuilt from its arguments
+        return
+
+    cache.add(key=key, error=cached_error)
+
+
+def _intern_parallel_payload(
+    *,
+    cls: type,
+    value: Any,
+    payload: Any,
+    trusted: bool,
+    title: str | None,
+    parameter: str | None,
+) -> Any:
+    """
+    Turn the payload a worker sent back for the raw `value` into an instance, returning the canonical instance of the
+    class `InternPool` like a regular construction does. The instance is only rebuilt on a pool miss.
+
+    Args:
+        cls (type): The value object class.
+        value (Any): The raw value validated by the worker.
+        payload (Any): The processed value, or the instance itself if `trusted` is False.
+        trusted (bool): Whether the instance is rebuilt from the processed value with `from_trusted`.
+        title (str | None): Name used in validation errors.
+        parameter (str | None): Parameter name used in validation errors.
+
+    Returns:
+        Any: The value object.
+    """
+    pool = cls.__dict__.get('_intern_pool')
+    key = (type(value), value, title, parameter)
+    if pool is not None:
+        try:
+            hash(key)
+
+        except TypeError:  # unhashable value
+            pool = None
+
+    if pool is not None:
+        instance = pool.get(key=key)
+        if instance is not None:
+            return instance
+
+    instance = cls.from_trusted(value=payload, title=title, parameter=parameter) if trusted else payload  # type: ignore[attr-defined]  # noqa: E501
+    return instance if pool is None else pool.add(key=key, instance=instance)
+
+
+def _invalidate_hook_plans(*, cls: type) -> None:
+    """
+    Drop the cached hook plan of `cls` and of every subclass, and empty their intern pools and validation caches.
+
+    Args:
+        cls (type): The modified class.
+    """
+    # holding the plan lock keeps a plan resolved concurrently from being published after it was invalidated
+    with _hook_plan_lock:
+        pending = [cls]
+        while pending:
+            current = pending.pop()
+            if current.__dict__.get('_hook_plan') is not None:
+                type.__setattr__(current, '_hook_plan', None)
+
+            if getattr(current.__dict__.get('__init__'), '_is_compiled_constructor', False):
+                type.__delattr__(current, '__init__')
+
+            for cache_name in ('_intern_pool', '_validation_cache'):
+                cache = current.__dict__.get(cache_name)
+                if cache is not None:
+                    cache.clear()
+
+            pending.extend(current.__subclasses__())
+
+
+def _bind_hook(*, hook: Any) -> Callable[..., Any]:
+    """
+    Return a callable that receives the instance as its first positional argument.
+
+    Plain functions are returned untouched. Other descriptors, such as `staticmethod` objects, are bound through the
+    descriptor protocol at call time to keep the previous method resolution semantics.
+
+    Args:
+        hook (Any): The class attribute registered as a hook.
+
+    Returns:
+        Callable[..., Any]: Callable invoked as `hook(instance, value=...)`.
+    """
+    if type(hook) is FunctionType:
+        return hook
+
+    def bound_hook(instance: Any, **kwargs: Any) -> Any:
+        """
+        Bind the hook to `instance` and call it.
+
+        Args:
+            instance (Any): The value object instance.
+            **kwargs (Any): The keyword arguments for the hook.
+
+        Returns:
+            Any: The return value of the hook.
+        """
+        return hook.__get__(instance, instance.__class__)(**kwargs)
+
+    return bound_hook
+
+
+def _post_order_dfs_mro(*, cls: type, visited: set[type] | None = None, cut_off: type = object) -> list[type]:
+    """
+    Computes the Post-Order Depth-First Search (DFS) Method Resolution Order (MRO) of a class.
+
+    Args:
+        cls (type): The class to process.
+        visited (set[type] | None, optional): A set of already visited classes (to prevent duplicates). Defaults to
+        None.
+        cut_off (type, optional): The class to stop the search. Defaults to object.
+
+    Returns:
+        list[type]: A list of classes type sorted by post-order DFS MRO.
+
+    References:
+        DFS: https://en.wikipedia.org/wiki/Depth-first_search
+        MRO: https://docs.python.org/3/howto/mro.html
+    """
+    if cls is cut_off:
+        return []
+
+    if visited is None:
+        visited = set()
+
+    result = []
+    for parent in cls.__bases__:
+        if parent not in visited and parent is not object:  # pragma: no cover
+            result.extend(_post_order_dfs_mro(cls=parent, visited=visited, cut_off=cut_off))
+
+    if cls not in visited:  # pragma: no cover
+        visited.add(cls)
+        result.append(cls)
+
+    return result
+
+
+def _gather_hooks(*, cls: type, attribute_name: str) -> list[Any]:
+    """
+    Gathers decorated methods from `cls` and its parent classes following the post-order DFS MRO, returning them sorted
+    by class hierarchy, method order, and method name.
+
+    Args:
+        cls (type): The class whose hierarchy is inspected.
+        attribute_name (str): The attribute name used to identify the methods.
+
+    Returns:
+        list[Any]: A list of methods sorted by class hierarchy, method order, and method name.
+
+    References:
+        DFS: https://en.wikipedia.org/wiki/Depth-first_search
+        MRO: https://docs.python.org/3/howto/mro.html
+    """
+
+    def sort_key(item: tuple[str, str, Callable[..., Any]]) -> tuple[int, str, str]:
+        """
+        Sorts the methods by class hierarchy, method order attribute, and method name.
+        The only global variable used is classes_names.
+
+        Args:
+            item (tuple[str, str, Callable[..., Any]]): The item to sort.
+
+        Returns:
+            tuple[int, str, str]: A tuple with the class index, method order, and method name.
+        """
+        class_name, method_name, method = item
+        class_index = classes_names.get(class_name, 999)
+        order = getattr(method, '_order', method_name)
+
+        return int(class_index), order, method_name
+
+    classes = _post_order_dfs_mro(cls=cls, cut_off=ValueObject)
+    classes_names = {cls.__name__: index for index, cls in enumerate(iterable=classes)}
+
+    classes_methods: list[tuple[str, str, Callable[..., Any]]] = []
+    for current in classes:
+        for method_name, method in current.__dict__.items():
+            if not callable(method):
+                continue
+
+            if not getattr(method, attribute_name, False):
+                continue  # only methods with the attribute
+
+            classes_methods.append((method.__qualname__.split('.')[0], method_name, method))
+
+    # sort by class hierarchy, method order attribute, and method name
+    return [method for _, _, method in sorted(classes_methods, key=sort_key)]
+
+
+def _failed_hook_name(*, error: Exception, plan: _HookPlan) -> str | None:
+    """
+    Return the name of the validation hook that raised `error`, walking its traceback.
+
+    Args:
+        error (Exception): The error raised while validating.
+        plan (_HookPlan): The hook plan of the value object class.
+
+    Returns:
+        str | None: The name of the failing validation hook, None if it is not in the traceback.
+    """
+    traceback = error.__traceback__
+    while traceback is not None:
+        name = traceback.tb_frame.f_code.co_name
+        if name in plan.validation_names:
+            return name
+
+        traceback = traceback.tb_next
+
+    return None
+
+
+def _resolve_metadata(*, cls: type, title: str | None, parameter: str | None) -> tuple[str, str]:
+    """
+    Resolve and validate the `title` and `parameter` metadata of a value object.
+
+    Args:
+        cls (type): The value object class, used for the default title.
+        title (str | None): The provided title, None means the class name.
+        parameter (str | None): The provided parameter, None means `"value"`.
+
+    Raises:
+        TypeError: If the title is not a string.
+        ValueError: If the title is an empty string.
+        ValueError: If the title contains leading or trailing whitespaces.
+        TypeError: If the parameter is not a string.
+        ValueError: If the parameter is an empty string.
+        ValueError: If the parameter contains leading or trailing whitespaces.
+
+    Returns:
+        tuple[str, str]: The resolved title and parameter.
+    """
+    if title is None:
+        title = cls.__name__
+
+    if type(title) is not str:
+        raise TypeError(f'ValueObject title <<<{title}>>> must be a string. Got <<<{type(title).__name__}>>> instead.')  # noqa: E501  # fmt: skip
+
+    if title == '':
+        raise ValueError(f'ValueObject title <<<{title}>>> must not be an empty string.')  # noqa: E501  # fmt: skip
+
+    if title.strip() != title:
+        raise ValueError(f'ValueObject title <<<{title}>>> contains leading or trailing whitespaces. Only trimmed values are allowed.')  # noqa: E501  # fmt: skip
+
+    if parameter is None:
+        parameter = 'value'
+
+    if type(parameter) is not str:
+        raise TypeError(f'ValueObject parameter <<<{parameter}>>> must be a string. Got <<<{type(parameter).__name__}>>> instead.')  # noqa: E501  # fmt: skip
+
+    if parameter == '':
+        raise ValueError(f'ValueObject parameter <<<{parameter}>>> must not be an empty string.')  # noqa: E501  # fmt: skip
+
+    if parameter.strip() != parameter:
+        raise ValueError(f'ValueObject parameter <<<{parameter}>>> contains leading or trailing whitespaces. Only trimmed values are allowed.')  # noqa: E501  # fmt: skip
+
+    return title, parameter
+
+
+def _instance_metadata(*, cls: type, title: str | None, parameter: str | None) -> tuple[str, str] | None:
+    """
+    Resolve the `title` and `parameter` metadata to store on a value object instance.
+
+    Instances using the default class name title and `"value"` parameter store None, so only custom metadata takes
+    memory per instance. Custom metadata tuples are shared between instances using the same title and parameter.
+
+    Args:
+        cls (type): The value object class, used for the default title.
+        title (str | None): The provided title, None means the class name.
+        parameter (str | None): The provided parameter, None means `"value"`.
+
+    Raises:
+        TypeError: If the title is not a string.
+        ValueError: If the title is an empty string.
+        ValueError: If the title contains leading or trailing whitespaces.
+        TypeError: If the parameter is not a string.
+        ValueError: If the parameter is an empty string.
+        ValueError: If the parameter contains leading or trailing whitespaces.
+
+    Returns:
+        tuple[str, str] | None: The resolved title and parameter, None if both are the defaults.
+    """
+    if title is None and parameter is None:
+        return None
+
+    title, parameter = _resolve_metadata(cls=cls, title=title, parameter=parameter)
+    if title == cls.__name__ and parameter == 'value':
+        return None
+
+    metadata = (title, parameter)
+    shared = _shared_metadata.get(metadata)
+    if shared is not None:
+        return shared
+
+    if len(_shared_metadata) >= _SHARED_METADATA_MAX_SIZE:
+        return metadata
+
+    return _shared_metadata.setdefault(metadata, metadata)
+
+
+def _resolve_cache_max_size(*, name: str, setting: bool | int, default: int) -> int | None:
+    """
+    Return the maximum size selected by the `intern` or `memoize` class keywords.
+
+    Args:
+        name (str): The class keyword name.
+        setting (bool | int): The class keyword value.
+        default (int): The maximum size used for True.
+
+    Raises:
+        TypeError: If `setting` is not a boolean or an integer.
+        ValueError: If `setting` is not a positive integer.
+
+    Returns:
+        int | None: The maximum size, None if the class opted out.
+    """
+    if type(setting) is bool:
+        return default if setting else None
+
+    if type(setting) is not int:
+        raise TypeError(f'ValueObject {name} <<<{setting}>>> must be a boolean or an integer. Got <<<{type(setting).__name__}>>> type.')  # noqa: E501  # fmt: skip
+
+    if setting <= 0:
+        raise ValueError(f'ValueObject {name} <<<{setting}>>> must be a positive integer.')
+
+    return setting
+
+
+def _is_immutable(*, value: Any) -> bool:
+    """
+    Return whether `value` is known to be immutable, so value objects wrapping it can be shared instead of copied.
+
+    Unknown types are considered mutable.
+
+    Args:
+        value (Any): The wrapped value.
+
+    Returns:
+        bool: True if `value` is immutable, otherwise False.
+    """
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return True
+
+    if value_type is tuple or value_type is frozenset:
+        return all(_is_immutable(value=item) for item in value)
+
+    if isinstance(value, ValueObject):
+        return _is_immutable(value=value._value)
+
+    return isinstance(value, (Enum, tzinfo))
+
+
+def _restore_value_object(
+    cls: type[ValueObject[Any]],
+    value: Any,
+    title: str | None = None,
+    parameter: str | None = None,
+) -> Any:
+    """
+    Rebuild a pickled value object with `from_trusted`, see `ValueObject.__reduce__`.
+
+    Args:
+        cls (type[ValueObject[Any]]): The value object class.
+        value (Any): The stored value.
+        title (str | None, optional): The custom title. Defaults to None.
+        parameter (str | None, optional): The custom parameter. Defaults to None.
+
+    Returns:
+        Any: The value object.
+    """
+    return cls.from_trusted(value=value, title=title, parameter=parameter)
+
+
+def _supports_compiled_constructor(*, cls: type[ValueObject[Any]]) -> bool:
+    """
+    Return whether a straight-line constructor can be generated for `cls`.
+
+    Classes that opted out with `compiled=False`, override `_validate`, `_process` or define their own `__init__`
+    (directly or through a parent) keep the generic constructor, so their customizations are honored.
+
+    Args:
+        cls (type[ValueObject[Any]]): The value object class.
+
+    Returns:
+        bool: True if a constructor can be generated, otherwise False.
+    """
+    if cls is ValueObject or not cls._compiled:
+        return False
+
+    return _uses_generic_constructor(cls=cls)
+
+
+def _uses_generic_constructor(*, cls: type[ValueObject[Any]]) -> bool:
+    """
+    Return whether instances of `cls` are built only by the `ValueObject` constructor and its decorated hooks.
+
+    Args:
+        cls (type[ValueObject[Any]]): The value object class.
+
+    Returns:
+        bool: False if `cls` overrides `_validate`, `_process` or `__init__` (directly or through a parent), otherwise
+        True.
+    """
+    if cls._validate is not ValueObject._validate or cls._process is not ValueObject._process:
+        return False
+
+    return not _defines_custom_constructor(cls=cls)
+
+
+def _defines_custom_constructor(*, cls: type[ValueObject[Any]]) -> bool:
+    """
+    Return whether `cls` or one of its parents defines its own `__init__`.
+
+    Args:
+        cls (type[ValueObject[Any]]): The value object class.
+
+    Returns:
+        bool: True if an `__init__` other than the `ValueObject` or a compiled constructor is found, otherwise False.
+    """
+    for base in cls.__mro__:
+        init = base.__dict__.get('__init__')
+        if init is None or getattr(init, '_is_compiled_constructor', False):
+            continue
+
+        return init is not ValueObject.__init__
+
+    return True  # pragma: no cover
+
+
+def _generic_construct(instance: ValueObject[Any], *, value: Any, title: str | None, parameter: str | None) -> None:
+    """
+    Build `instance` through its `_validate` and `_process` methods, used by classes without a compiled constructor.
+
+    Args:
+        instance (ValueObject[Any]): The value object instance.
+        value (Any): Value to validate, process, and store.
+        title (str | None): Name used in validation errors.
+        parameter (str | None): Parameter name used in validation errors.
+    """
+    object.__setattr__(instance, '_metadata', _instance_metadata(cls=instance.__class__, title=title, parameter=parameter))  # noqa: E501  # fmt: skip
+
+    key = id(instance)
+    early_processed_values = _early_processed.values
+    early_processed_values[key] = _NOT_PROCESSED
+    try:
+        instance._validate(value=value)
+        processed_value = early_processed_values[key]
+
+    finally:
+        del early_processed_values[key]
+
+    value = instance._process(value=value) if processed_value is _NOT_PROCESSED else processed_value
+
+    object.__setattr__(instance, '_value', value)
+
+
+def _fuse_validations(*, cls: type, methods: list[Any]) -> tuple[tuple[Callable[..., None], bool], ...]:
+    """
+    Bind the validation hooks of `cls`, fusing every run of consecutive hooks that declare a `constraint` into a single
+    generated hook.
+
+    Args:
+        cls (type): The value object class.
+        methods (list[Any]): The validation hooks of the class, in execution order.
+
+    Returns:
+        tuple[tuple[Callable[..., None], bool], ...]: Validation hooks and their early process flag.
+    """
+    validations: list[tuple[Callable[..., None], bool]] = []
+    run: list[Any] = []
+    for method in [*methods, None]:
+        early_process = getattr(method, '_early_process', False)
+        if method is not None and not early_process and getattr(method, '_constraint', None) is not None:
+            run.append(method)
+            continue
+
+        if len(run) > 1:
+            validations.append((_compile_fused_validation(cls=cls, methods=run), False))
+        else:
+            validations.extend((_bind_hook(hook=hook), False) for hook in run)
+
+        run = []
+        if method is not None:
+            validations.append((_bind_hook(hook=method), early_process))
+
+    return tuple(validations)
+
+
+def _compile_fused_validation(*, cls: type, methods: list[Any]) -> Callable[..., None]:
+    """
+    Generate one validation hook evaluating the constraints of `methods` in a single expression.
+
+    The hooks themselves only run when the expression is false or raises, so the first failing hook raises its usual
+    error. A value rejected by a constraint but accepted by its hook is still accepted, only through the slower path.
+
+    Args:
+        cls (type): The value object class.
+        methods (list[Any]): Consecutive validation hooks declaring a constraint.
+
+    Returns:
+        Callable[..., None]: The generated validation hook.
+    """
+    namespace: dict[str, Any] = {}
+    expressions: list[str] = []
+    fallback_lines: list[str] = []
+    for index, method in enumerate(iterable=methods):
+        constraint: Constraint = method._constraint
+        expressions.append(f'({constraint.render(owner=cls, name=f"_c{index}", namespace=namespace)})')
+        namespace[f'_h{index}'] = _bind_hook(hook=method)
+        fallback_lines.append(f'    _h{index}(self, value=value)')
+
+    lines = [
+        'def _fused_validation(self, value):',
+        '    try:',
+        f'        if {" and ".join(expressions)}:',
+        '            return',
+        '    except Exception:',
+        '        pass',
+        '',
+        *fallback_lines,
+    ]
+
+    filename = f'<fused validation {cls.__module__}.{cls.__qualname__}>'
+    source = '\n'.join(lines) + '\n'
+    exec(compile(source, filename, 'exec'), namespace)  # noqa: S102
+    linecache_cache[filename] = (len(source), None, source.splitlines(keepends=True), filename)
+
+    fused: Callable[..., None] = namespace['_fused_validation']
+    fused.__qualname__ = f'{cls.__qualname__}._fused_validation'
+    fused._fused_names = tuple(getattr(method, '__name__', None) for method in methods)  # type: ignore[attr-defined]
+
+    return fused
+
+
+def _compile_constructor(*, cls: type[ValueObject[Any]], plan: _HookPlan) -> Callable[..., None]:
+    """
+    Generate a straight-line `__init__` for `cls` from its hook plan.
+
+    The generated constructor calls every validation and process hook directly in the resolved order. The early process
+    wiring is resolved here: hooks are processed once, right before the first `early_process=True` validator, and the
+    processed value is reused as the final value. Instances of subclasses that reach this constructor through `super()`
+    are delegated to the generic `ValueObject.__init__`.
+
+    Args:
+        cls (type[ValueObject[Any]]): The value object class.
+        plan (_HookPlan): The hook plan of the class.
+
+    Returns:
+        Callable[..., None]: The generated constructor.
+    """
+    namespace: dict[str, Any] = {
+        '_owner': cls,
+        '_generic_init': ValueObject.__init__,
+        '_instance_metadata': _instance_metadata,
+        '_set_metadata': ValueObject.__dict__['_metadata'].__set__,
+        '_set_value': ValueObject.__dict__['_value'].__set__,
+    }
+    custom_early_process = cls.early_process is not ValueObject.early_process
+
+    process_lines: list[str] = []
+    for index, method in enumerate(iterable=plan.processes):
+        namespace[f'_p{index}'] = method
+        process_lines.append(f'processed = _p{index}(self, value=processed)')
+
+    validation_lines: list[str] = []
+    is_processed = False
+    for index, (method, early_process) in enumerate(iterable=plan.validations):
+        namespace[f'_v{index}'] = method
+        if not early_process:
+            validation_lines.append(f'_v{index}(self, value=value)')
+            continue
+
+        if not is_processed:
+            is_processed = True
+            if custom_early_process:
+                validation_lines.append('processed = self.early_process(value=value)')
+            else:
+                validation_lines.append('processed = value')
+                validation_lines.extend(process_lines)
+
+        validation_lines.append(f'_v{index}(self, value=value, processed_value=processed)')
+
+    lines = [
+        'def __init__(self, *, value, title=None, parameter=None):',
+        '    if self.__class__ is not _owner:',
+        '        return _generic_init(self, value=value, title=title, parameter=parameter)',
+        '',
+        '    if title is None and parameter is None:',
+        '        _set_metadata(self, None)',
+        '    else:',
+        '        _set_metadata(self, _instance_metadata(cls=_owner, title=title, parameter=parameter))',
+        '',
+    ]
+    if validation_lines:
+        lines.append('    try:')
+        lines.extend(f'        {line}' for line in validation_lines)
+        lines.append('    except Exception as error:')
+        lines.append('        self._rewrite_validation_error(error=error, value=value)')
+        lines.append('        raise')
+        lines.append('')
+
+    if not is_processed:
+        lines.append('    processed = value')
+        lines.extend(f'    {line}' for line in process_lines)
+
+    lines.append('    _set_value(self, processed)')
+
+    filename = f'<compiled constructor {cls.__module__}.{cls.__qualname__}>'
+    source = '\n'.join(lines) + '\n'
+    exec(compile(source, filename, 'exec'), namespace)  # noqa: S102
+    linecache_cache[filename] = (len(source), None, source.splitlines(keepends=True), filename)
+
+    constructor: Callable[..., None] = namespace['__init__']
+    constructor.__qualname__ = f'{cls.__qualname__}.__init__'
+    constructor.__module__ = cls.__module__
+    constructor.__doc__ = ValueObject.__init__.__doc__
+    constructor._is_compiled_constructor = True  # type: ignore[attr-defined]
+
+    return constructor
+
+
+class ValueObject(ABC, Generic[T], metaclass=_ValueObjectMeta):  # noqa: UP046
     """
     Store a single immutable value after running validation and processing hooks.
 
@@ -45,13 +889,98 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
     ```
     """
 
-    __slots__ = ('_early_processed', '_parameter', '_title', '_value')
-    __match_args__ = ('_early_processed', '_parameter', '_title', '_value')
+    __slots__ = ('__weakref__', '_metadata', '_value')
+    __match_args__ = ('_metadata', '_value')
 
     _value: T
-    _title: str
-    _parameter: str
-    _early_processed: T | None
+    _metadata: tuple[str, str] | None
+    _hook_plan: ClassVar[_HookPlan | None] = None
+    _compiled: ClassVar[bool] = True
+    _intern_max_size: ClassVar[int | None] = None
+    _intern_pool: ClassVar[InternPool | None] = None
+    _memoize_max_size: ClassVar[int | None] = None
+    _memoize_ttl: ClassVar[float | None] = None
+    _validation_cache: ClassVar[ValidationCache | None] = None
+
+    @override
+    def __init_subclass__(
+        cls,
+        *,
+        compiled: bool | None = None,
+        intern: bool | int | None = None,
+        memoize: bool | int | None = None,
+        memoize_ttl: float | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Configure how the subclass is constructed.
+
+        By default every value object class gets a generated straight-line constructor that calls its hooks directly,
+        see `_compile_constructor`. Pass `compiled=False` to keep the generic constructor for a class and its
+        subclasses.
+
+        Pass `intern=True`, or the maximum number of instances to keep, to return a canonical instance for repeated raw
+        inputs without running the hooks again, see `InternPool`. Subclasses inherit the setting and get their own
+        pool, pass `intern=False` to opt out.
+
+        Pass `memoize=True`, or the maximum number of raw inputs to remember, to cache the processed value or the
+        validation error of each raw input, see `ValidationCache`. Cached values are turned into new instances with
+        `from_trusted`, so classes that define their own `__init__` do not memoize. `memoize_ttl` expires entries after
+        that many seconds. Subclasses inherit both settings and get their own cache, pass `memoize=False` to opt out.
+
+        Args:
+            compiled (bool | None, optional): Whether to generate a specialized constructor. Defaults to None, which
+            inherits the parent class setting.
+            intern (bool | int | None, optional): Whether to intern instances, or the maximum number of interned
+            instances. Defaults to None, which inherits the parent class setting.
+            memoize (bool | int | None, optional): Whether to memoize validation outcomes, or the maximum number of
+            memoized raw inputs. Defaults to None, which inherits the parent class setting.
+            memoize_ttl (float | None, optional): Seconds a memoized outcome is kept. Defaults to None, which inherits
+            the parent class setting.
+            **kwargs: Keyword arguments forwarded to the parent class hook.
+
+        Raises:
+            TypeError: If `compiled` is not a boolean.
+            TypeError: If `intern` is not a boolean or an integer.
+            ValueError: If `intern` is not a positive integer.
+            TypeError: If `memoize` is not a boolean or an integer.
+            ValueError: If `memoize` is not a positive integer.
+            TypeError: If `memoize_ttl` is not a number.
+            ValueError: If `memoize_ttl` is not positive.
+        """
+        super().__init_subclass__(**kwargs)
+
+        if intern is not None:
+            max_size = _resolve_cache_max_size(name='intern', setting=intern, default=_INTERN_POOL_DEFAULT_MAX_SIZE)
+            type.__setattr__(cls, '_intern_max_size', max_size)
+
+        if memoize is not None:
+            max_size = _resolve_cache_max_size(name='memoize', setting=memoize, default=_MEMOIZE_CACHE_DEFAULT_MAX_SIZE)
+            type.__setattr__(cls, '_memoize_max_size', max_size)
+
+        if memoize_ttl is not None:
+            if type(memoize_ttl) not in (int, float):
+                raise TypeError(f'ValueObject memoize_ttl <<<{memoize_ttl}>>> must be a number. Got <<<{type(memoize_ttl).__name__}>>> type.')  # noqa: E501  # fmt: skip
+
+            if memoize_ttl <= 0:
+                raise ValueError(f'ValueObject memoize_ttl <<<{memoize_ttl}>>> must be a positive number.')
+
+            type.__setattr__(cls, '_memoize_ttl', float(memoize_ttl))
+
+        if cls._intern_max_size is not None:
+            type.__setattr__(cls, '_intern_pool', InternPool(max_size=cls._intern_max_size))
+
+        if cls._memoize_max_size is not None and not _defines_custom_constructor(cls=cls):
+            cache = ValidationCache(max_size=cls._memoize_max_size, ttl=cls._memoize_ttl)
+            type.__setattr__(cls, '_validation_cache', cache)
+
+        if compiled is None:
+            return
+
+        if type(compiled) is not bool:
+            raise TypeError(f'ValueObject compiled <<<{compiled}>>> must be a boolean. Got <<<{type(compiled).__name__}>>> type.')  # noqa: E501  # fmt: skip
+
+        cls._compiled = compiled
 
     def __init__(self, *, value: T, title: str | None = None, parameter: str | None = None) -> None:
         """
@@ -88,38 +1017,12 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
         # >>> IntegerValueObject(value=10)
         ```
         """
-        if title is None:
-            title = self.__class__.__name__
-
-        if type(title) is not str:
-            raise TypeError(f'ValueObject title <<<{title}>>> must be a string. Got <<<{type(title).__name__}>>> instead.')  # noqa: E501  # fmt: skip
-
-        if title == '':
-            raise ValueError(f'ValueObject title <<<{title}>>> must not be an empty string.')  # noqa: E501  # fmt: skip
-
-        if title.strip() != title:
-            raise ValueError(f'ValueObject title <<<{title}>>> contains leading or trailing whitespaces. Only trimmed values are allowed.')  # noqa: E501  # fmt: skip
-
-        if parameter is None:
-            parameter = 'value'
-
-        if type(parameter) is not str:
-            raise TypeError(f'ValueObject parameter <<<{parameter}>>> must be a string. Got <<<{type(parameter).__name__}>>> instead.')  # noqa: E501  # fmt: skip
-
-        if parameter == '':
-            raise ValueError(f'ValueObject parameter <<<{parameter}>>> must not be an empty string.')  # noqa: E501  # fmt: skip
-
-        if parameter.strip() != parameter:
-            raise ValueError(f'ValueObject parameter <<<{parameter}>>> contains leading or trailing whitespaces. Only trimmed values are allowed.')  # noqa: E501  # fmt: skip
-
-        object.__setattr__(self, '_title', title)
-        object.__setattr__(self, '_parameter', parameter)
-        object.__setattr__(self, '_early_processed', None)
-
-        self._validate(value=value)
-        value = self._process(value=value) if self._early_processed is None else self._early_processed
+        constructor = self.__class__._resolve_hook_plan().constructor
+        if constructor is not None:
+            constructor(self, value=value, title=title, parameter=parameter)
+            return
 
-        object.__setattr__(self, '_value', value)
+        _generic_construct(self, value=value, title=title, parameter=parameter)
 
     @override
     def __repr__(self) -> str:
@@ -238,7 +1141,6 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
             AttributeError: If there is an attempt to add a new attribute.
         """
         public_key = key.replace('_', '')
-        public_slots1 = [slot.replace('_', '') for slot in self.__slots__]
 
         if key.startswith('_internal_'):
             # Allow internal attributes to be set, but not modified, those attributes should not be used outside the
@@ -246,20 +1148,49 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
             object.__setattr__(self, key, value)
             return
 
-        if key in self.__slots__:
+        if key in ValueObject.__slots__:
             raise AttributeError(f'Cannot modify attribute "{key}" of immutable instance.')
 
-        if public_key in public_slots1:
+        if public_key in _IMMUTABLE_PUBLIC_ATTRIBUTES:
             raise AttributeError(f'Cannot modify attribute "{public_key}" of immutable instance.')
 
         raise AttributeError(f'{self.__class__.__name__} object has no attribute "{key}".')
 
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Reduce the value object to its class, its stored value and its custom title and parameter, if any.
+
+        Unpickling rebuilds the instance with `from_trusted`, so the value is not validated again and `_internal_`
+        attributes are restored by `_restore_internal_state`. Subclasses that keep other state must override this
+        method.
+
+        Returns:
+            tuple[Any, ...]: The restore function and its arguments.
+
+        Example:
+        ```python
+        from pickle import dumps, loads
+
+        from value_object_pattern.usables import PositiveIntegerValueObject
+
+        integer = loads(dumps(PositiveIntegerValueObject(value=10, title='Age')))
+        print(repr(integer), integer.title)
+        # >>> PositiveIntegerValueObject(value=10) Age
+        ```
+        """
+        if self._metadata is None:
+            return _restore_value_object, (self.__class__, self._value)
+
+        return _restore_value_object, (self.__class__, self._value, *self._metadata)
+
     def __copy__(self) -> ValueObject[T]:
         """
-        Return a new instance of the same subclass with the same value.
+        Return the value object itself when its value is immutable, otherwise a new instance of the same subclass
+        sharing the same value, without running the hooks again.
 
         Returns:
-            ValueObject[T]: A shallow clone of the value object.
+            ValueObject[T]: The value object or a shallow clone of it.
 
         Example:
         ```python
@@ -277,19 +1208,19 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
 
         print(clone is value_object)
         print(clone == value_object)
-        # >>> False
+        # >>> True
         # >>> True
         ```
         """
-        return self.__class__(
-            value=self._value,
-            title=self._title,
-            parameter=self._parameter,
-        )
+        if _is_immutable(value=self._value):
+            return self
+
+        return self._clone(value=self._value)
 
     def __deepcopy__(self, memo: dict[int, Any]) -> ValueObject[T]:
         """
-        Return a deep clone, recursively copying the wrapped value.
+        Return the value object itself when its value is immutable, otherwise a deep clone recursively copying the
+        wrapped value, without running the hooks again.
 
         Args:
             memo (dict[str, Any]): Dictionary of id's to already copied objects to avoid infinite recursion.
@@ -299,7 +1230,7 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
 
         Example:
         ```python
-        from copy import deepcopy
+        from copy import copy, deepcopy
 
         from value_object_pattern import ValueObject
 
@@ -320,15 +1251,390 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
         if id(self) in memo:
             return memo[id(self)]  # type: ignore[no-any-return]
 
-        clone = self.__class__(
-            value=deepcopy(self._value, memo),
-            title=deepcopy(self._title, memo),
-            parameter=deepcopy(self._parameter, memo),
-        )
+        if _is_immutable(value=self._value):
+            return self
+
+        clone = self._clone(value=deepcopy(self._value, memo))
         memo[id(self)] = clone
 
         return clone
 
+    def _clone(self, *, value: T) -> Self:
+        """
+        Return a new instance of the same class storing `value` with the same metadata, without running the hooks.
+
+        Classes that define their own `__init__` are constructed again, so their custom state is rebuilt.
+
+        Args:
+            value (T): The value to store.
+
+        Returns:
+            Self: The clone.
+        """
+        cls = self.__class__
+        if _defines_custom_constructor(cls=cls):
+            return cls(value=value, title=self.title, parameter=self.parameter)
+
+        clone = cls.__new__(cls)
+        object.__setattr__(clone, '_metadata', self._metadata)
+        clone._restore_internal_state(value=value)
+        object.__setattr__(clone, '_value', value)
+
+        return clone
+
+    @classmethod
+    def from_trusted(
+        cls,
+        value: T,
+        *,
+        title: str | None = None,
+        parameter: str | None = None,
+        process: bool = False,
+    ) -> Self:
+        """
+        Create a value object from a `value` that is already known to be valid, without running `@validation` methods.
+
+        This is meant for values that come from a trusted source, such as another instance of the same class or
+        primitives produced by `to_primitives()`. By default the value is stored as-is, use `process=True` to still run
+        the `@process` methods, for example to turn a raw enum value back into its member. Custom constructors are not
+        called. Passing an invalid value leaves the value object in an undefined state.
+
+        Args:
+            value (T): Already validated value.
+            title (str | None, optional): Name used in validation errors. Defaults to the concrete class name.
+            parameter (str | None, optional): Parameter name used in validation errors. Defaults to `"value"`.
+            process (bool, optional): Whether to run the `@process` methods on `value`. Defaults to False.
+
+        Raises:
+            TypeError: If the title is not a string.
+            ValueError: If the title is an empty string.
+            ValueError: If the title contains leading or trailing whitespaces.
+            TypeError: If the parameter is not a string.
+            ValueError: If the parameter is an empty string.
+            ValueError: If the parameter contains leading or trailing whitespaces.
+
+        Returns:
+            Self: The value object.
+
+        Example:
+        ```python
+        from value_object_pattern.usables import PositiveIntegerValueObject
+
+        integer = PositiveIntegerValueObject.from_trusted(value=10)
+        print(repr(integer))
+        # >>> PositiveIntegerValueObject(value=10)
+        ```
+        """
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, '_metadata', _instance_metadata(cls=cls, title=title, parameter=parameter))
+
+        instance._restore_internal_state(value=value)
+        if process:
+            value = instance._process(value=value)
+
+        object.__setattr__(instance, '_value', value)
+
+        return instance
+
+    @classmethod
+    def intern_pool(cls) -> InternPool | None:
+        """
+        Returns the intern pool of the class, None if the class does not intern its instances.
+
+        Returns:
+            InternPool | None: The intern pool of the class.
+
+        Example:
+        ```python
+        from value_object_pattern.usables import IntegerValueObject
+
+
+        class Port(IntegerValueObject, intern=256):
+            pass
+
+
+        Port(value=443)
+        Port(value=443)
+        print(Port.intern_pool().statistics())
+        # >>> {'hits': 1, 'misses': 1, 'size': 1, 'max_size': 256}
+        ```
+        """
+        return cls.__dict__.get('_intern_pool')
+
+    @classmethod
+    def validation_cache(cls) -> ValidationCache | None:
+        """
+        Returns the validation cache of the class, None if the class does not memoize its validation outcomes.
+
+        Returns:
+            ValidationCache | None: The validation cache of the class.
+
+        Example:
+        ```python
+        from value_object_pattern.usables.internet import DomainValueObject
+
+
+        class Domain(DomainValueObject, memoize=1024, memoize_ttl=60):
+            pass
+
+
+        Domain(value='example.com')
+        Domain(value='example.com')
+        print(Domain.validation_cache().statistics())
+        # >>> {'hits': 1, 'misses': 1, 'evictions': 0, 'expirations': 0, 'size': 1, 'max_size': 1024, 'ttl': 60.0}
+        ```
+        """
+        return cls.__dict__.get('_validation_cache')
+
+    @classmethod
+    def from_many(
+        cls,
+        values: Iterable[Any],
+        *,
+        title: str | None = None,
+        parameter: str | None = None,
+        errors: Literal['raise', 'skip'] = 'raise',
+    ) -> list[Self]:
+        """
+        Create a value object from each of `values`, see `validate_many`.
+
+        Args:
+            values (Iterable[Any]): Values to validate, process, and store.
+            title (str | None, optional): Name used in validation errors. Defaults to the concrete class name.
+            parameter (str | None, optional): Parameter name used in validation errors. Defaults to `"value"`.
+            errors (Literal['raise', 'skip'], optional): Whether to raise the first validation error or to drop the
+            rejected values. Defaults to 'raise'.
+
+        Raises:
+            ValueError: If `errors` is not 'raise' or 'skip'.
+            TypeError: If a value is rejected with a TypeError and `errors` is 'raise'.
+            ValueError: If a value is rejected with a ValueError and `errors` is 'raise'.
+
+        Returns:
+            list[Self]: The valid value objects, in input order.
+
+        Example:
+        ```python
+        from value_object_pattern.usables import PositiveIntegerValueObject
+
+        integers = PositiveIntegerValueObject.from_many(values=[1, -2, 3], errors='skip')
+        print(integers)
+        # >>> [PositiveIntegerValueObject(value=1), PositiveIntegerValueObject(value=3)]
+        ```
+        """
+        if errors not in ('raise', 'skip'):
+            raise ValueError(f'ValueObject errors <<<{errors}>>> must be one of <<<raise, skip>>>.')
+
+        return cls.validate_many(values=values, title=title, parameter=parameter, errors=errors).instances
+
+    @classmethod
+    def validate_many(
+        cls,
+        values: Iterable[Any],
+        *,
+        title: str | None = None,
+        parameter: str | None = None,
+        errors: Literal['raise', 'collect', 'skip'] = 'collect',
+    ) -> BatchResult[Self]:
+        """
+        Create a value object from each of `values` in one call, returning the valid instances and the rejected values.
+
+        The hook plan, the constructor and the metadata are resolved once for the whole batch. With `errors='raise'`
+        the first `TypeError` or `ValueError` is raised with a note telling its index, with `errors='collect'` every
+        error is stored by index in the result, and with `errors='skip'` rejected values are dropped. Interned and
+        memoized classes keep using their caches.
+
+        Args:
+            values (Iterable[Any]): Values to validate, process, and store.
+            title (str | None, optional): Name used in validation errors. Defaults to the concrete class name.
+            parameter (str | None, optional): Parameter name used in validation errors. Defaults to `"value"`.
+            errors (Literal['raise', 'collect', 'skip'], optional): How rejected values are handled. Defaults to
+            'collect'.
+
+        Raises:
+            ValueError: If `errors` is not 'raise', 'collect' or 'skip'.
+            TypeError: If the title is not a string.
+            ValueError: If the title is an empty string.
+            ValueError: If the title contains leading or trailing whitespaces.
+            TypeError: If the parameter is not a string.
+            ValueError: If the parameter is an empty string.
+            ValueError: If the parameter contains leading or trailing whitespaces.
+            TypeError: If a value is rejected with a TypeError and `errors` is 'raise'.
+            ValueError: If a value is rejected with a ValueError and `errors` is 'raise'.
+
+        Returns:
+            BatchResult[Self]: The valid value objects and the errors of the rejected values.
+
+        Example:
+        ```python
+        from value_object_pattern.usables import PositiveIntegerValueObject
+
+        result = PositiveIntegerValueObject.validate_many(values=[1, -2, 3])
+        print(result.indexes, result.errors)
+        # >>> [0, 2] {1: ValueError('PositiveIntegerValueObject value <<<-2>>> must be a positive integer.')}
+        ```
+        """
+        if errors not in _BATCH_ERROR_MODES:
+            raise ValueError(f'ValueObject errors <<<{errors}>>> must be one of <<<raise, collect, skip>>>.')
+
+        # invalid metadata is reported once, not for every value
+        _instance_metadata(cls=cls, title=title, parameter=parameter)
+
+        constructor = cls._resolve_hook_plan().constructor
+        if (
+            '_intern_pool' in cls.__dict__
+            or '_validation_cache' in cls.__dict__
+            or _defines_custom_constructor(cls=cls)
+        ):
+            constructor = None
+
+        new = cls.__new__
+        result: BatchResult[Self] = BatchResult()
+        instances, indexes, failures = result.instances, result.indexes, result.errors
+        for index, value in enumerate(values):
+            try:
+                if constructor is None:
+                    instance = cls(value=value, title=title, parameter=parameter)
+
+                else:
+                    instance = new(cls)
+                    constructor(instance, value=value, title=title, parameter=parameter)
+
+            except (TypeError, ValueError) as error:
+                if errors == 'raise':
+                    error.add_note(f'{cls.__name__} batch index <<<{index}>>>')
+                    raise
+
+                if errors == 'collect':
+                    failures[index] = error.with_traceback(None)
+
+                continue
+
+            instances.append(instance)
+            indexes.append(index)
+
+        return result
+
+    @classmethod
+    def validate_many_parallel(
+        cls,
+        values: Iterable[Any],
+        *,
+        title: str | None = None,
+        parameter: str | None = None,
+        errors: Literal['raise', 'collect', 'skip'] = 'collect',
+        primitives: bool = False,
+        chunk_size: int = _PARALLEL_DEFAULT_CHUNK_SIZE,
+        executor: Executor | None = None,
+        max_workers: int | None = None,
+    ) -> BatchResult[Any]:
+        """
+        Validate `values` like `validate_many`, sharding them in chunks across worker processes.
+
+        Each chunk is validated with `validate_many` in a worker, which sends back the processed values instead of the
+        instances, and the parent process rebuilds the instances with `from_trusted`, returning the canonical instances
+        of classes created with `intern`. Pass `primitives=True` to get the primitives of the valid values instead of
+        instances. Results and errors keep the input order and indexes, and with `errors='raise'` the first error in
+        input order is raised. By default a `ProcessPoolExecutor` with `max_workers` processes is created and shut down
+        for the call, pass `executor` to reuse your own. The class must be importable by the workers, so classes defined
+        inside functions can not be validated in parallel.
+
+        Args:
+            values (Iterable[Any]): Values to validate, process, and store.
+            title (str | None, optional): Name used in validation errors. Defaults to the concrete class name.
+            parameter (str | None, optional): Parameter name used in validation errors. Defaults to `"value"`.
+            errors (Literal['raise', 'collect', 'skip'], optional): How rejected values are handled. Defaults to
+            'collect'.
+            primitives (bool, optional): Whether to return the primitives of the valid values. Defaults to False.
+            chunk_size (int, optional): Number of values sent to a worker at once. Defaults to 1000.
+            executor (Executor | None, optional): Executor running the chunks. Defaults to None, which creates a
+            `ProcessPoolExecutor`.
+            max_workers (int | None, optional): Number of processes of the created executor. Defaults to None, which
+            uses the number of processors.
+
+        Raises:
+            ValueError: If `errors` is not 'raise', 'collect' or 'skip'.
+            TypeError: If `chunk_size` is not an integer.
+            ValueError: If `chunk_size` is not a positive integer.
+            TypeError: If a value is rejected with a TypeError and `errors` is 'raise'.
+            ValueError: If a value is rejected with a ValueError and `errors` is 'raise'.
+
+        Returns:
+            BatchResult[Any]: The valid value objects, or their primitives, and the errors of the rejected values.
+
+        Example:
+        ```python
+        from value_object_pattern.usables.money import IbanValueObject
+
+        if __name__ == '__main__':
+            result = IbanValueObject.validate_many_parallel(values=['ES9121000418450200051332', 'ES00'], chunk_size=1)
+            print(result.instances, sorted(result.errors))
+            # >>> [IbanValueObject(value='ES9121000418450200051332')] [1]
+        ```
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        from .parallel_validation import chunk_values, validate_chunk
+
+        if errors not in _BATCH_ERROR_MODES:
+            raise ValueError(f'ValueObject errors <<<{errors}>>> must be one of <<<raise, collect, skip>>>.')
+
+        if type(chunk_size) is not int:
+            raise TypeError(f'ValueObject chunk_size <<<{chunk_size}>>> must be an integer. Got <<<{type(chunk_size).__name__}>>> type.')  # noqa: E501  # fmt: skip
+
+        if chunk_size <= 0:
+            raise ValueError(f'ValueObject chunk_size <<<{chunk_size}>>> must be a positive integer.')
+
+        _instance_metadata(cls=cls, title=title, parameter=parameter)
+
+        if primitives:
+            payload = 'primitive'
+
+        elif _defines_custom_constructor(cls=cls):
+            payload = 'instance'
+
+        else:
+            payload = 'value'
+
+        pool = executor if executor is not None else ProcessPoolExecutor(max_workers=max_workers)
+        result: BatchResult[Any] = BatchResult()
+        try:
+            chunks = chunk_values(values=values, chunk_size=chunk_size)
+            futures = [(chunk, pool.submit(validate_chunk, cls, chunk, title, parameter, errors, payload)) for chunk in chunks]  # noqa: E501  # fmt: skip
+
+            offset = 0
+            for chunk, future in futures:
+                payloads, indexes, failures = future.result()
+                if errors == 'raise' and failures:
+                    index = min(failures)
+                    error = failures[index]
+                    error.add_note(f'{cls.__name__} batch index <<<{offset + index}>>>')
+                    raise error
+
+                if payload != 'primitive':
+                    payloads = [
+                        _intern_parallel_payload(
+                            cls=cls,
+                            value=chunk[index],
+                            payload=item,
+                            trusted=payload == 'value',
+                            title=title,
+                            parameter=parameter,
+                        )
+                        for index, item in zip(indexes, payloads, strict=True)
+                    ]
+
+                result.instances.extend(payloads)
+                result.indexes.extend(offset + index for index in indexes)
+                result.errors.update((offset + index, error) for index, error in failures.items())
+                offset += chunk_size
+
+        finally:
+            if executor is None:
+                pool.shutdown(cancel_futures=True)
+
+        return result
+
     def _process(self, value: T) -> T:
         """
         Process a validated value by executing `@process` methods in configured order.
@@ -342,10 +1648,8 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
         Returns:
             T: Processed value.
         """
-        methods = self._gather_decorated_methods(instance=self, attribute_name='_is_process')
-        while methods:
-            method: Callable[..., T] = methods.popleft().__get__(self, self.__class__)
-            value = method(value=value)
+        for method in self._resolve_hook_plan().processes:
+            value = method(self, value=value)
 
         return value
 
@@ -360,23 +1664,121 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
             value (T): Value to validate.
         """
         try:
-            methods = self._gather_decorated_methods(instance=self, attribute_name='_is_validation')
-            while methods:
-                method: Callable[..., T] = methods.popleft().__get__(self, self.__class__)
-                if getattr(method, '_early_process', False):
-                    method(value=value, processed_value=self.early_process(value=value))
+            for method, early_process in self._resolve_hook_plan().validations:
+                if early_process:
+                    method(self, value=value, processed_value=self.early_process(value=value))
                     continue
 
-                method(value=value)
+                method(self, value=value)
 
         except Exception as error:
-            classes = self._post_order_dfs_mro(cls=self.__class__, cut_off=ValueObject)
-            for class_name in {cls.__name__ for cls in classes}:
-                error.args = (str(object=error.args[0]).replace(class_name, self.title),)
+            self._rewrite_validation_error(error=error, value=value)
+            raise
+
+    def _rewrite_validation_error(self, *, error: Exception, value: Any) -> None:
+        """
+        Replace the validation error message in place by the message rendered with this instance's `title` and
+        `parameter`, and attach a `ValidationFailure` describing it as the `validation_failure` attribute of the error.
+
+        Args:
+            error (Exception): The error raised by a validation hook.
+            value (Any): The raw value being validated.
+        """
+        if not error.args:
+            return
+
+        plan = self._resolve_hook_plan()
+        if plan.error_pattern is None:
+            class_names = {cls.__name__ for cls in _post_order_dfs_mro(cls=self.__class__, cut_off=ValueObject)}
+            plan.error_pattern = re_compile(
+                pattern='|'.join(re_escape(pattern=name) for name in sorted(class_names, key=len, reverse=True)),
+            )
+
+        # backslashes are the only special characters of a replacement string
+        message = plan.error_pattern.sub(self.title.replace('\\', '\\\\'), str(object=error.args[0]))
+        message = message.replace('value', self.parameter, 1)
+        error.args = (message,)
+        error.validation_failure = ValidationFailure(  # type: ignore[attr-defined]
+            value_object_class=self.__class__,
+            title=self.title,
+            parameter=self.parameter,
+            value=value,
+            code=_failed_hook_name(error=error, plan=plan),
+            message=message,
+        )
+
+    def _restore_internal_state(self, value: T) -> None:
+        """
+        Rebuild the `_internal_` attributes that validation methods normally set, used by `from_trusted`.
+
+        Value objects whose `@validation` methods cache derived objects for later use override this method. It receives
+        the trusted value before any `@process` method runs.
+
+        Args:
+            value (T): Trusted value.
+        """
+
+    @classmethod
+    def _resolve_hook_plan(cls) -> _HookPlan:
+        """
+        Return the ordered hook plan of the class, resolving and caching it on first use.
+
+        The plan is stored on the class itself and reused by every instance. It is dropped automatically when the class
+        or any of its parents is modified, see `_ValueObjectMeta`.
+
+        Returns:
+            _HookPlan: The hook plan of the class.
+        """
+        plan = cls._hook_plan
+        if plan is not None and plan.owner is cls:
+            return plan
+
+        with _hook_plan_lock:
+            plan = cls._hook_plan
+            if plan is not None and plan.owner is cls:
+                return plan
+
+            return cls._build_hook_plan()
 
-            error.args = (str(object=error.args[0]).replace('value', self.parameter, 1),)
+    @classmethod
+    def _build_hook_plan(cls) -> _HookPlan:
+        """
+        Resolve the hook plan of the class, compile its constructor and publish both on the class.
 
-            raise error
+        Returns:
+            _HookPlan: The hook plan of the class.
+        """
+        methods = _gather_hooks(cls=cls, attribute_name='_is_validation')
+        processes = tuple(_bind_hook(hook=method) for method in _gather_hooks(cls=cls, attribute_name='_is_process'))
+
+        registry = get_instrumentation()
+        if registry is None:
+            validations = _fuse_validations(cls=cls, methods=methods)
+        else:
+            # hooks are timed one by one, so they are never fused while instrumentation is enabled
+            validations = tuple(
+                (
+                    registry._instrument_hook(cls=cls, hook=_bind_hook(hook=method), kind='validation'),
+                    getattr(method, '_early_process', False),
+                )
+                for method in methods
+            )
+            processes = tuple(registry._instrument_hook(cls=cls, hook=method, kind='process') for method in processes)
+
+        plan = _HookPlan(owner=cls, validations=validations, processes=processes)
+        compiled = _supports_compiled_constructor(cls=cls)
+        if compiled:
+            plan.constructor = _compile_constructor(cls=cls, plan=plan)
+
+        if registry is not None:
+            plan.constructor = registry._instrument_constructor(cls=cls, constructor=plan.constructor or _generic_construct)  # noqa: E501  # fmt: skip
+
+        if compiled:
+            type.__setattr__(cls, '__init__', plan.constructor)
+
+        type.__setattr__(cls, '_hook_plan', plan)
+
+        return plan
 
     def _value_for_display(self) -> Any:
         """
@@ -426,22 +1828,7 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
             DFS: https://en.wikipedia.org/wiki/Depth-first_search
             MRO: https://docs.python.org/3/howto/mro.html
         """
-        if cls is cut_off:
-            return []
-
-        if visited is None:
-            visited = set()
-
-        result = []
-        for parent in cls.__bases__:
-            if parent not in visited and parent is not object:  # pragma: no cover
-                result.extend(self._post_order_dfs_mro(cls=parent, visited=visited, cut_off=cut_off))
-
-        if cls not in visited:  # pragma: no cover
-            visited.add(cls)
-            result.append(cls)
-
-        return result
+        return _post_order_dfs_mro(cls=cls, visited=visited, cut_off=cut_off)
 
     def _gather_decorated_methods(self, instance: object, attribute_name: str) -> deque[Callable[..., Any]]:
         """
@@ -454,52 +1841,16 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
 
         Returns
             deque[Callable[..., Any]]: A deque of methods sorted by class hierarchy, method order, and method name.
-
-        References:
-            DFS: https://en.wikipedia.org/wiki/Depth-first_search
-            MRO: https://docs.python.org/3/howto/mro.html
         """
-
-        def sort_key(item: tuple[str, str, Callable[..., Any]]) -> tuple[int, str, str]:
-            """
-            Sorts the methods by class hierarchy, method order attribute, and method name.
-            The only global variable used is classes_names.
-
-            Args:
-                item (tuple[str, str, Callable[..., Any]]): The item to sort.
-
-            Returns:
-                tuple[int, str, str]: A tuple with the class index, method order, and method name.
-            """
-            class_name, method_name, method = item
-            class_index = classes_names.get(class_name, 999)
-            order = getattr(method, '_order', method_name)
-
-            return int(class_index), order, method_name
-
-        classes = self._post_order_dfs_mro(cls=instance.__class__, cut_off=ValueObject)
-        classes_names = {cls.__name__: index for index, cls in enumerate(iterable=classes)}
-
-        classes_methods: deque[tuple[str, str, Callable[..., Any]]] = deque()
-        for cls in classes:
-            for method_name, method in cls.__dict__.items():
-                if not callable(method):
-                    continue
-
-                if not getattr(method, attribute_name, False):
-                    continue  # only methods with the attribute
-
-                classes_methods.append((method.__qualname__.split('.')[0], method_name, method))
-
-        # sort by class hierarchy, method order attribute, and method name
-        return deque([method for _, _, method in sorted(classes_methods, key=sort_key)])
+        return deque(_gather_hooks(cls=instance.__class__, attribute_name=attribute_name))
 
     def early_process(self, value: T) -> T:
         """
         Process a value before validation and cache the result for the constructor.
 
         This supports validators that need to inspect normalized input before the value is finally stored, for example
-        union conversion or enum conversion. Repeated calls return the cached early-processed value.
+        union conversion or enum conversion. Repeated calls during construction return the cached early-processed
+        value, the cache only lives while the instance is being constructed.
 
         Args:
             value (T): Value to process.
@@ -507,13 +1858,17 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
         Returns:
             T: Early-processed value.
         """
-        if self._early_processed is not None:
-            return self._early_processed
+        key = id(self)
+        early_processed_values = _early_processed.values
+        processed_value = early_processed_values.get(key, _NOT_CONSTRUCTING)
+        if processed_value is _NOT_CONSTRUCTING:
+            return self._process(value=value)
 
-        processed_value = self._process(value=value)
-        object.__setattr__(self, '_early_processed', processed_value)
+        if processed_value is _NOT_PROCESSED:
+            processed_value = self._process(value=value)
+            early_processed_values[key] = processed_value
 
-        return processed_value
+        return cast(T, processed_value)
 
     @property
     def value(self) -> T:
@@ -561,7 +1916,11 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
         # >>> IntegerValueObject
         ```
         """
-        return self._title
+        metadata = self._metadata
+        if metadata is None:
+            return self.__class__.__name__
+
+        return metadata[0]
 
     @property
     def parameter(self) -> str:
@@ -585,7 +1944,11 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
         # >>> value
         ```
         """
-        return self._parameter
+        metadata = self._metadata
+        if metadata is None:
+            return 'value'
+
+        return metadata[1]
 
     @classmethod
     def type(cls) -> type[T]:
@@ -595,6 +1958,16 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
         Returns:
             type[T]: Declared wrapped type, or `Any` when it cannot be resolved.
         """
+        return cls._declared_type  # type: ignore[no-any-return]
+
+    @cached_classproperty
+    def _declared_type(cls) -> Any:  # noqa: N805
+        """
+        Resolve the wrapped type declared by the `ValueObject[T]` subclass, once per class.
+
+        Returns:
+            Any: Declared wrapped type, or `Any` when it cannot be resolved.
+        """
         for base in cls.__orig_bases__:  # type: ignore[attr-defined]
             if hasattr(base, '__origin__') and base.__origin__ is Generic:
                 continue
@@ -602,6 +1975,6 @@ class ValueObject(ABC, Generic[T]):  # noqa: UP046
             if hasattr(base, '__origin__') and issubclass(base.__origin__, ValueObject):
                 args = get_args(base)
                 if args:
-                    return args[0]  # type: ignore[no-any-return]
+                    return args[0]
 
-        return Any  # type: ignore[return-value]
+        return Any
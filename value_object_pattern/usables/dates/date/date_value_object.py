@@ -29,6 +29,8 @@ class DateValueObject(ValueObject[date]):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_date(self, value: date) -> None:
         """
@@ -2,6 +2,13 @@
 StringDateValueObject value object.
 """
 
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
 from datetime import date
 from typing import NoReturn
 
@@ -30,6 +37,8 @@ class StringDateValueObject(NotEmptyStringValueObject, TrimmedStringValueObject)
     ```
     """
 
+    __slots__ = ('_internal_date_object',)
+
     _internal_date_object: date
 
     @process(order=0)
@@ -45,6 +54,20 @@ class StringDateValueObject(NotEmptyStringValueObject, TrimmedStringValueObject)
         """
         return self._internal_date_object.isoformat()
 
+    @override
+    def _restore_internal_state(self, value: str) -> None:
+        """
+        Restores the date object of a trusted value, normalized values are parsed without `dateutil`.
+
+        Args:
+            value (str): Trusted value.
+        """
+        try:
+            self._internal_date_object = date.fromisoformat(value)
+
+        except ValueError:
+            self._internal_date_object = parse(timestr=value).date()
+
     @validation(order=0)
     def _ensure_value_is_date(self, value: str) -> None:
         """
@@ -29,6 +29,8 @@ class DatetimeValueObject(ValueObject[datetime]):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_datetime(self, value: datetime) -> None:
         """
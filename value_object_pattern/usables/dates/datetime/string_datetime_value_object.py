@@ -2,6 +2,13 @@
 StringDatetimeValueObject value object.
 """
 
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
 from datetime import UTC, datetime
 from typing import NoReturn
 
@@ -30,6 +37,8 @@ class StringDatetimeValueObject(NotEmptyStringValueObject, TrimmedStringValueObj
     ```
     """
 
+    __slots__ = ('_internal_datetime_object',)
+
     _internal_datetime_object: datetime
 
     @process(order=0)
@@ -45,6 +54,20 @@ class StringDatetimeValueObject(NotEmptyStringValueObject, TrimmedStringValueObj
         """
         return self._internal_datetime_object.isoformat()
 
+    @override
+    def _restore_internal_state(self, value: str) -> None:
+        """
+        Restores the datetime object of a trusted value, normalized values are parsed without `dateutil`.
+
+        Args:
+            value (str): Trusted value.
+        """
+        try:
+            self._internal_datetime_object = datetime.fromisoformat(value).astimezone(tz=UTC)
+
+        except ValueError:
+            self._internal_datetime_object = parse(timestr=value).astimezone(tz=UTC)
+
     @validation(order=0)
     def _ensure_value_is_date(self, value: str) -> None:
         """
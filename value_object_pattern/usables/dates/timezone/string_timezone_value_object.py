@@ -24,6 +24,8 @@ class StringTimezoneValueObject(NotEmptyStringValueObject, TrimmedStringValueObj
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_timezone(self, value: str) -> None:
         """
@@ -26,6 +26,8 @@ class TimezoneValueObject(ValueObject[tzinfo]):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_timezone(self, value: tzinfo) -> None:
         """
@@ -24,6 +24,8 @@ class StringUuidV4ValueObject(StringUuidValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=1)
     def _ensure_value_is_uuid4(self, value: str) -> None:
         """
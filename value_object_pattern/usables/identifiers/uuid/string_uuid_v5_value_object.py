@@ -24,6 +24,8 @@ class StringUuidV5ValueObject(StringUuidValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=1)
     def _ensure_value_is_uuid5(self, value: str) -> None:
         """
@@ -25,6 +25,8 @@ class StringUuidV6ValueObject(StringUuidValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=1)
     def _ensure_value_is_uuid6(self, value: str) -> None:
         """
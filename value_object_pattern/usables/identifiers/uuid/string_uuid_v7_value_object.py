@@ -24,6 +24,8 @@ class StringUuidV7ValueObject(StringUuidValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=1)
     def _ensure_value_is_uuid7(self, value: str) -> None:
         """
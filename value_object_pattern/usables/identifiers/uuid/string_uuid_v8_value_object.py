@@ -25,6 +25,8 @@ class StringUuidV8ValueObject(StringUuidValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=1)
     def _ensure_value_is_uuid8(self, value: str) -> None:
         """
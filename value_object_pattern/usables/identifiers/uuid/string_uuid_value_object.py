@@ -23,6 +23,8 @@ class StringUuidValueObject(NotEmptyStringValueObject, TrimmedStringValueObject)
     ```
     """
 
+    __slots__ = ()
+
     @process(order=0)
     def _ensure_value_is_lower(self, value: str) -> str:
         """
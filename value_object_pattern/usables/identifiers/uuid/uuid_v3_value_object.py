@@ -26,6 +26,8 @@ class UuidV3ValueObject(UuidValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=1)
     def _ensure_value_is_uuid3(self, value: UUID) -> None:
         """
@@ -26,6 +26,8 @@ class UuidV5ValueObject(UuidValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=1)
     def _ensure_value_is_uuid5(self, value: UUID) -> None:
         """
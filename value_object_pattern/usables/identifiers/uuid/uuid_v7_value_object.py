@@ -26,6 +26,8 @@ class UuidV7ValueObject(UuidValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=1)
     def _ensure_value_is_uuid7(self, value: UUID) -> None:
         """
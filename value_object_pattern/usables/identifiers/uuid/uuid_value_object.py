@@ -25,6 +25,8 @@ class UuidValueObject(ValueObject[UUID]):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_uuid(self, value: UUID) -> None:
         """
@@ -39,6 +39,8 @@ class CountryTldValueObject(NotEmptyStringValueObject, TrimmedStringValueObject)
     ```
     """
 
+    __slots__ = ()
+
     @process(order=0)
     def _ensure_value_is_lower(self, value: str) -> str:
         """
@@ -26,6 +26,8 @@ class DniValueObject(NotEmptyStringValueObject, TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     _DNI_LETTERS: str = 'TRWAGMYFPDXBNJZSQVHLCKE'
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'[0-9]{8}[TRWAGMYFPDXBNJZSQVHLCKE]')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([0-9]{8})[-\s]?([trwagmyfpdxbnjzsqvhlckeTRWAGMYFPDXBNJZSQVHLCKE])')  # noqa: E501  # fmt: skip
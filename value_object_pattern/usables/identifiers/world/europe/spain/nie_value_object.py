@@ -27,6 +27,8 @@ class NieValueObject(NotEmptyStringValueObject, TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     _NIE_LETTERS: str = 'TRWAGMYFPDXBNJZSQVHLCKE'
     _NIE_LETTER_TO_NUMBER: ClassVar[dict[str, str]] = {'X': '0', 'Y': '1', 'Z': '2'}
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'[XYZ][0-9]{7}[TRWAGMYFPDXBNJZSQVHLCKE]')
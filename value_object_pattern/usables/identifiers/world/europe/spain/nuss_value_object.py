@@ -28,6 +28,8 @@ class NussValueObject(NotEmptyStringValueObject, TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'([0-9]{2})([0-9]{7,8})([0-9]{2})')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([0-9]{2})[-\s/]?([0-9]{7,8})[-\s/]?([0-9]{2})')  # noqa: E501  # fmt: skip
 
@@ -26,6 +26,8 @@ class PassportValueObject(NotEmptyStringValueObject, TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'[A-Z]{2,3}[0-9]{6}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([a-zA-Z]{2,3})([0-9]{6})')
 
@@ -32,6 +32,8 @@ class PhoneNumberValueObject(NotEmptyStringValueObject, TrimmedStringValueObject
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'(?:34|\+34|0034)?(\s)?[6789][0-9]{8}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'(?:34|\+34|0034)?[\s-]?([6789](?:[\s-]?[0-9]){8})')  # noqa: E501  # fmt: skip
 
@@ -29,6 +29,8 @@ class AdministrativeTechnicianVehiclePlateValueObject(NotEmptyStringValueObject,
     ```
     """  # noqa: E501  # fmt: skip
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'TA[0-9]{1,3}[0-9]{3}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([tT][aA])[-\s]?([0-9]{1,3})[-\s]?([0-9]{3})')  # noqa: E501  # fmt: skip
 
@@ -28,6 +28,8 @@ class AirForceVehiclePlateValueObject(NotEmptyStringValueObject, TrimmedStringVa
     ```
     """  # noqa: E501  # fmt: skip
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'EA[0-9]{4}(3|31)')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([eE][aA])[-\s]?([0-9]{4}[-\s]?(3|31))')
 
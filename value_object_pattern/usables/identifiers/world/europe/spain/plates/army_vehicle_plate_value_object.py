@@ -28,6 +28,8 @@ class ArmyVehiclePlateValueObject(NotEmptyStringValueObject, TrimmedStringValueO
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'ET[0-9]{5,6}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([eE][tT])[-\s]?([0-9]{5,6})')
 
@@ -28,6 +28,8 @@ class CanariasPoliceVehiclePlateValueObject(NotEmptyStringValueObject, TrimmedSt
     ```
     """  # noqa: E501  # fmt: skip
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'CGPC[0-9]{4}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([cC][gG][pP][cC])[\s-]?([0-9]{4})')  # noqa: E501  # fmt: skip
 
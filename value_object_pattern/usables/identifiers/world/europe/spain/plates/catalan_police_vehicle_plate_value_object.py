@@ -28,6 +28,8 @@ class CatalanPoliceVehiclePlateValueObject(NotEmptyStringValueObject, TrimmedStr
     ```
     """  # noqa: E501  # fmt: skip
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'CME[0-9]{4}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([cC][mM][eE])[\s-]?([0-9]{4})')
 
@@ -29,6 +29,8 @@ class CivilGuardVehiclePlateValueObject(NotEmptyStringValueObject, TrimmedString
     ```
     """  # noqa: E501  # fmt: skip
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'PGC[0-9]{5}[A-Z]{1}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([pP][gG][cC])[-\s]?([0-9]{5})[-\s]?([a-zA-Z]{1})')  # noqa: E501  # fmt: skip
 
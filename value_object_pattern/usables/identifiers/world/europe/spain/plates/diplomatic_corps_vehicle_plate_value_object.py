@@ -29,6 +29,8 @@ class DiplomaticCorpsVehiclePlateValueObject(NotEmptyStringValueObject, TrimmedS
     ```
     """  # noqa: E501  # fmt: skip
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'CD[0-9]{1,3}[0-9]{3}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([cC][dD])[-\s]?([0-9]{1,3})[-\s]?([0-9]{3})')  # noqa: E501  # fmt: skip
 
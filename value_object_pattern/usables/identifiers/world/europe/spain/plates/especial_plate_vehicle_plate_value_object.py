@@ -29,6 +29,8 @@ class EspecialVehiclePlateValueObject(NotEmptyStringValueObject, TrimmedStringVa
     ```
     """  # noqa: E501  # fmt: skip
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'E[0-9]{4}[A-Z]{3}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([eE])[\s-]?([0-9]{4})[\s-]?([a-zA-Z]{3})')  # noqa: E501  # fmt: skip
 
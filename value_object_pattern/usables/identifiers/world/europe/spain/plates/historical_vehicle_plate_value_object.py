@@ -29,6 +29,8 @@ class HistoricalVehiclePlateValueObject(NotEmptyStringValueObject, TrimmedString
     ```
     """  # noqa: E501  # fmt: skip
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'H[0-9]{4}[A-Z]{3}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([hH])[\s-]?([0-9]{4})[\s-]?([a-zA-Z]{3})')  # noqa: E501  # fmt: skip
 
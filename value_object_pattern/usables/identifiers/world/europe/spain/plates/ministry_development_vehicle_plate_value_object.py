@@ -29,6 +29,8 @@ class MinistryDevelopmentVehiclePlateValueObject(NotEmptyStringValueObject, Trim
     ```
     """  # noqa: E501  # fmt: skip
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'MMA[0-9]{5}[A-Z]')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([mM][mM][aA])[\s-]?([0-9]{5})[\s-]?([a-zA-Z])')  # noqa: E501  # fmt: skip
 
@@ -29,6 +29,8 @@ class NationalPoliceVehiclePlateValueObject(NotEmptyStringValueObject, TrimmedSt
     ```
     """  # noqa: E501  # fmt: skip
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'CNP[0-9]{4}[A-Z]{2}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([cC][nN][pP])[\s-]?([0-9]{4})[\s-]?([a-zA-Z]{2})')  # noqa: E501  # fmt: skip
 
@@ -28,6 +28,8 @@ class NavyVehiclePlateValueObject(NotEmptyStringValueObject, TrimmedStringValueO
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'FN[0-9]{4,5}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([fF][nN])[-\s]?([0-9]{4,5})')
 
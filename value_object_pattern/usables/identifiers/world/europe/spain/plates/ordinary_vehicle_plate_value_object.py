@@ -28,6 +28,8 @@ class OrdinaryVehiclePlateValueObject(NotEmptyStringValueObject, TrimmedStringVa
     ```
     """  # noqa: E501  # fmt: skip
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'[0-9]{4}[BCDFGHJKLMNPQRSTVWXYZ]{3}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([0-9]{4})[-\s]?([bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ]{3})')  # noqa: E501  # fmt: skip
 
@@ -31,6 +31,8 @@ class ProvincialSystemVehiclePlateValueObject(NotEmptyStringValueObject, Trimmed
     ```
     """  # noqa: E501  # fmt: skip
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'[A-Z]{1,2}[0-9]{4}[A-Z]{1,2}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([a-zA-Z]{1,2})[-\s]?([0-9]{4})[-\s]?([a-zA-Z]{1,2})')  # noqa: E501  # fmt: skip
 
@@ -28,6 +28,8 @@ class StateMotorPoolVehiclePlateValueObject(NotEmptyStringValueObject, TrimmedSt
     ```
     """  # noqa: E501  # fmt: skip
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'PME[0-9]{4}[A-Z]')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([pP][mM][eE])[\s-]?([0-9]{4})[\s-]?([a-zA-Z])')  # noqa: E501  # fmt: skip
 
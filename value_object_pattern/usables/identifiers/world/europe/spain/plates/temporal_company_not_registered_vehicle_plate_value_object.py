@@ -29,6 +29,8 @@ class TemporalCompanyNotRegisteredVehiclePlateValueObject(NotEmptyStringValueObj
     ```
     """  # noqa: E501  # fmt: skip
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'S[0-9]{4}[BCDFGHJKLMNPQRSTVWXYZ]{3}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([sS])[-\s]?([0-9]{4})[-\s]?([bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ]{3})')  # noqa: E501  # fmt: skip
 
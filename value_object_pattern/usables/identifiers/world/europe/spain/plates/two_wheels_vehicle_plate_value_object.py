@@ -29,6 +29,8 @@ class TwoWheelsVehiclePlateValueObject(NotEmptyStringValueObject, TrimmedStringV
     ```
     """  # noqa: E501  # fmt: skip
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'C[0-9]{4}[A-Z]{3}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([cC])[\s-]?([0-9]{4})[\s-]?([a-zA-Z]{3})')  # noqa: E501  # fmt: skip
 
@@ -1,8 +1,9 @@
-from functools import lru_cache
 from importlib.resources import files
 
+from value_object_pattern.decorators import shared_cache
 
-@lru_cache(maxsize=1)
+
+@shared_cache()
 def get_provincial_plate_codes() -> tuple[str, ...]:
     """
     Get provincial plate codes from the official Spanish vehicle registration documentation.
@@ -53,6 +53,8 @@ class VehiclePlateValueObject(NotEmptyStringValueObject, TrimmedStringValueObjec
     ```
     """
 
+    __slots__ = ()
+
     _VEHICLE_PLATE_VARIATIONS: tuple[type[ValueObject[str]], ...] = (
         AdministrativeTechnicianVehiclePlateValueObject,
         AirForceVehiclePlateValueObject,
@@ -40,6 +40,8 @@ class Iso3166Alpha3CodeValueObject(NotEmptyStringValueObject, TrimmedStringValue
     ```
     """
 
+    __slots__ = ()
+
     @process(order=0)
     def _ensure_value_is_upper(self, value: str) -> str:
         """
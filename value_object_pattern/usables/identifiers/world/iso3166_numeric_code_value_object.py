@@ -40,6 +40,8 @@ class Iso3166NumericCodeValueObject(PositiveIntegerValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_iso3166_numeric(self, value: int) -> None:
         """
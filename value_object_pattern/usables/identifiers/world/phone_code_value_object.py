@@ -39,6 +39,8 @@ class PhoneCodeValueObject(NotEmptyStringValueObject, TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @process(order=0)
     def _ensure_value_starts_without_plus(self, value: str) -> str:
         """
@@ -1,8 +1,9 @@
-from functools import lru_cache
 from importlib.resources import files
 
+from value_object_pattern.decorators import shared_cache
 
-@lru_cache(maxsize=1)
+
+@shared_cache()
 def get_iso3166_alpha2_codes() -> tuple[str, ...]:
     """
     Get ISO 3166-1 alpha-2 country codes.
@@ -24,7 +25,7 @@ def get_iso3166_alpha2_codes() -> tuple[str, ...]:
     return filtered_lines
 
 
-@lru_cache(maxsize=1)
+@shared_cache()
 def get_iso3166_alpha2_to_alpha3_mapping() -> tuple[dict[str, str], dict[str, str]]:
     """
     Get a mapping of ISO 3166-1 alpha-2 codes to alpha-3 codes and vice versa.
@@ -54,7 +55,7 @@ def get_iso3166_alpha2_to_alpha3_mapping() -> tuple[dict[str, str], dict[str, st
     return alpha2_to_alpha3, alpha3_to_alpha2
 
 
-@lru_cache(maxsize=1)
+@shared_cache()
 def get_iso3166_alpha2_to_numeric_mapping() -> tuple[dict[str, int], dict[int, str]]:
     """
     Get a mapping of ISO 3166-1 alpha-2 codes to numeric codes and vice versa.
@@ -84,7 +85,7 @@ def get_iso3166_alpha2_to_numeric_mapping() -> tuple[dict[str, int], dict[int, s
     return alpha2_to_numeric, numeric_to_alpha2
 
 
-@lru_cache(maxsize=1)
+@shared_cache()
 def get_iso3166_alpha2_to_phone_code_mapping() -> tuple[dict[str, str], dict[str, str]]:
     """
     Get a mapping of ISO 3166-1 alpha-2 codes to phone codes and vice versa.
@@ -114,7 +115,7 @@ def get_iso3166_alpha2_to_phone_code_mapping() -> tuple[dict[str, str], dict[str
     return alpha2_to_phone_code, phone_code_to_alpha2
 
 
-@lru_cache(maxsize=1)
+@shared_cache()
 def get_iso3166_alpha2_to_tld_mapping() -> tuple[dict[str, str], dict[str, str]]:
     """
     Get a mapping of ISO 3166-1 alpha-2 codes to TLDs and vice versa.
@@ -146,7 +147,7 @@ def get_iso3166_alpha2_to_tld_mapping() -> tuple[dict[str, str], dict[str, str]]
     return alpha2_to_tld, tld_to_alpha2
 
 
-@lru_cache(maxsize=1)
+@shared_cache()
 def get_iso3166_alpha3_codes() -> tuple[str, ...]:
     """
     Get ISO 3166-1 alpha-3 country codes.
@@ -168,7 +169,7 @@ def get_iso3166_alpha3_codes() -> tuple[str, ...]:
     return filtered_lines
 
 
-@lru_cache(maxsize=1)
+@shared_cache()
 def get_iso3166_numeric_codes() -> tuple[int, ...]:
     """
     Get ISO 3166-1 numeric country codes.
@@ -26,6 +26,8 @@ class VinValueObject(NotEmptyStringValueObject, TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'[0-9ABCDEFGHJKLMNPRSTUVWXYZ]{17}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'[0-9abcdefghjklmnprstuvwxyzABCDEFGHJKLMNPRSTUVWXYZ]{17}')  # noqa: E501  # fmt: skip
 
@@ -27,6 +27,8 @@ class AwsCloudRegionValueObject(NotEmptyStringValueObject, TrimmedStringValueObj
     ```
     """
 
+    __slots__ = ()
+
     @process(order=0)
     def _ensure_region_is_in_lowercase(self, value: str) -> str:
         """
@@ -19,4 +19,6 @@ class DomainOrLocalhostValueObject(DomainValueObject):
     ```
     """
 
+    __slots__ = ()
+
     _DOMAIN_VALID_SINGLE_LABELS: frozenset[str] = frozenset({'localhost'})
@@ -28,6 +28,8 @@ class DomainValueObject(NotEmptyStringValueObject, TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     _DOMAIN_MIN_LABEL_LENGTH: int = 1
     _DOMAIN_MAX_LABEL_LENGTH: int = 63
     _DOMAIN_MAX_DOMAIN_LENGTH: int = 253
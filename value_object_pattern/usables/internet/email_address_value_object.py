@@ -2,6 +2,13 @@
 EmailAddressValueObject value object.
 """
 
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
 from re import Pattern, compile as re_compile
 from typing import NoReturn
 
@@ -29,6 +36,8 @@ class EmailAddressValueObject(NotEmptyStringValueObject, TrimmedStringValueObjec
     ```
     """
 
+    __slots__ = ('_internal_domain_part', '_internal_local_part')
+
     _EMAIL_ADDRESS_MIN_LENGTH: int = 6
     _EMAIL_ADDRESS_MAX_LENGTH: int = 320
     _EMAIL_ADDRESS_LOCAL_PART_MIN_LENGTH: int = 1
@@ -52,6 +61,16 @@ class EmailAddressValueObject(NotEmptyStringValueObject, TrimmedStringValueObjec
         """
         return f'{self._internal_local_part.lower()}@{self._internal_domain_part}'
 
+    @override
+    def _restore_internal_state(self, value: str) -> None:
+        """
+        Restores the local and domain parts of a trusted email address.
+
+        Args:
+            value (str): Trusted value.
+        """
+        self._internal_local_part, self._internal_domain_part = value.rsplit(sep='@', maxsplit=1)
+
     @validation(order=0)
     def _validate_email_length(self, value: str) -> None:
         """
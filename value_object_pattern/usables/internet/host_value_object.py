@@ -26,6 +26,8 @@ class HostValueObject(NotEmptyStringValueObject, TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @process(order=0)
     def _ensure_host_stored_respective_format(self, value: str) -> str:
         """
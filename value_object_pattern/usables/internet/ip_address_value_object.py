@@ -25,6 +25,8 @@ class IpAddressValueObject(NotEmptyStringValueObject, TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @process(order=0)
     def _ensure_ip_address_stored_respective_format(self, value: str) -> str:
         """
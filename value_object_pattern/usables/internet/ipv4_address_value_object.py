@@ -5,6 +5,13 @@ Ipv4AddressValueObject value object.
 
 from __future__ import annotations
 
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
 from ipaddress import IPv4Address
 
 from value_object_pattern.decorators import process, validation
@@ -25,6 +32,8 @@ class Ipv4AddressValueObject(NotEmptyStringValueObject, TrimmedStringValueObject
     ```
     """
 
+    __slots__ = ('_internal_ip_object',)
+
     _internal_ip_object: IPv4Address
 
     @process(order=0)
@@ -43,6 +52,16 @@ class Ipv4AddressValueObject(NotEmptyStringValueObject, TrimmedStringValueObject
 
         return str(object=IPv4Address(address=value))
 
+    @override
+    def _restore_internal_state(self, value: str) -> None:
+        """
+        Restores the IPv4 address object of a trusted value.
+
+        Args:
+            value (str): Trusted value.
+        """
+        self._internal_ip_object = IPv4Address(address=self._ensure_value_is_normalized(value=value))
+
     @validation(order=0)
     def _ensure_value_is_valid_ipv4_address(self, value: str) -> None:
         """
@@ -3,6 +3,13 @@
 Ipv4NetworkValueObject value object.
 """
 
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
 from ipaddress import IPv4Network, NetmaskValueError
 from typing import Generator, NoReturn
 
@@ -26,6 +33,8 @@ class Ipv4NetworkValueObject(NotEmptyStringValueObject, TrimmedStringValueObject
     ```
     """
 
+    __slots__ = ('_internal_network_object',)
+
     _internal_network_object: IPv4Network
 
     @process(order=0)
@@ -41,6 +50,16 @@ class Ipv4NetworkValueObject(NotEmptyStringValueObject, TrimmedStringValueObject
         """
         return str(object=IPv4Network(address=value))
 
+    @override
+    def _restore_internal_state(self, value: str) -> None:
+        """
+        Restores the IPv4 network object of a trusted value.
+
+        Args:
+            value (str): Trusted value.
+        """
+        self._internal_network_object = IPv4Network(address=value)
+
     @validation(order=0)
     def _ensure_value_is_valid_ipv4_network(self, value: str) -> None:
         """
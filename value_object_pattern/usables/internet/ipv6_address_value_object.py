@@ -5,6 +5,13 @@ Ipv6AddressValueObject value object.
 
 from __future__ import annotations
 
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
 from ipaddress import AddressValueError, IPv6Address
 from typing import NoReturn
 
@@ -26,6 +33,8 @@ class Ipv6AddressValueObject(NotEmptyStringValueObject, TrimmedStringValueObject
     ```
     """
 
+    __slots__ = ('_internal_ip_object',)
+
     _internal_ip_object: IPv6Address
 
     @process(order=0)
@@ -47,6 +56,16 @@ class Ipv6AddressValueObject(NotEmptyStringValueObject, TrimmedStringValueObject
 
         return str(object=IPv6Address(address=value))
 
+    @override
+    def _restore_internal_state(self, value: str) -> None:
+        """
+        Restores the IPv6 address object of a trusted value.
+
+        Args:
+            value (str): Trusted value.
+        """
+        self._internal_ip_object = IPv6Address(address=self._ensure_value_is_normalized(value=value))
+
     @validation(order=0)
     def _ensure_value_is_valid_ipv6_address(self, value: str) -> None:
         """
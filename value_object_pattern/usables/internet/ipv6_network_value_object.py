@@ -3,6 +3,13 @@
 Ipv6NetworkValueObject value object.
 """
 
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
 from ipaddress import IPv6Network, NetmaskValueError
 from typing import Generator, NoReturn
 
@@ -26,6 +33,8 @@ class Ipv6NetworkValueObject(NotEmptyStringValueObject, TrimmedStringValueObject
     ```
     """
 
+    __slots__ = ('_internal_network_object',)
+
     _internal_network_object: IPv6Network
 
     @process(order=0)
@@ -41,6 +50,16 @@ class Ipv6NetworkValueObject(NotEmptyStringValueObject, TrimmedStringValueObject
         """
         return str(object=IPv6Network(address=value))
 
+    @override
+    def _restore_internal_state(self, value: str) -> None:
+        """
+        Restores the IPv6 network object of a trusted value.
+
+        Args:
+            value (str): Trusted value.
+        """
+        self._internal_network_object = IPv6Network(address=value)
+
     @validation(order=0)
     def _ensure_value_is_valid_ipv6_network(self, value: str) -> None:
         """
@@ -24,6 +24,8 @@ class KebabCaseKeyValueObject(NotEmptyStringValueObject, TrimmedStringValueObjec
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'^[a-z0-9]+(?:-[a-z0-9]+)*(?:\.[a-z0-9]+(?:-[a-z0-9]+)*)*$')
 
     @validation(order=0)
@@ -24,6 +24,8 @@ class SnakeCaseKeyValueObject(NotEmptyStringValueObject, TrimmedStringValueObjec
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'^[a-z0-9]+(?:_[a-z0-9]+)*(?:\.[a-z0-9]+(?:_[a-z0-9]+)*)*$')
 
     @validation(order=0)
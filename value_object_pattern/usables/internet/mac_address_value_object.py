@@ -41,6 +41,8 @@ class MacAddressValueObject(NotEmptyStringValueObject, TrimmedStringValueObject)
     ```
     """
 
+    __slots__ = ()
+
     _MAC_ADDRESS_VARIATIONS: tuple[type[ValueObject[str]], ...] = (
         RawMacAddressValueObject,
         UniversalMacAddressValueObject,
@@ -32,6 +32,8 @@ class CiscoMacAddressValueObject(NotEmptyStringValueObject, TrimmedStringValueOb
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'([0-9A-F]{4}\.){2}[0-9A-F]{4}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([0-9a-fA-F]{4}\.){2}[0-9a-fA-F]{4}')
 
@@ -32,6 +32,8 @@ class RawMacAddressValueObject(NotEmptyStringValueObject, TrimmedStringValueObje
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'[0-9A-F]{12}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'[0-9a-fA-F]{12}')
 
@@ -32,6 +32,8 @@ class SpaceMacAddressValueObject(NotEmptyStringValueObject, TrimmedStringValueOb
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'([0-9A-F]{2}\s){5}[0-9A-F]{2}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([0-9a-fA-F]{2}\s){5}[0-9a-fA-F]{2}')
 
@@ -25,6 +25,8 @@ class PortValueObject(IntegerValueObject):
     ```
     """
 
+    __slots__ = ()
+
     _PORT_MIN_PORT: int = 0
     _PORT_MAX_PORT: int = 65535
 
@@ -24,6 +24,8 @@ class HttpHttpsUrlValueObject(UrlValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _validate_url_is_http_https(self, value: str) -> None:
         """
@@ -22,6 +22,8 @@ class HttpUrlValueObject(UrlValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _validate_url_is_http(self, value: str) -> None:
         """
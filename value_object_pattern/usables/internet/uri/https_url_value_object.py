@@ -24,6 +24,8 @@ class HttpsUrlValueObject(UrlValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _validate_url_is_https(self, value: str) -> None:
         """
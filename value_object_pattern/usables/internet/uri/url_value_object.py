@@ -2,18 +2,18 @@
 UrlValueObject value object.
 """
 
-from functools import lru_cache
 from re import Pattern, compile as re_compile
 from typing import NoReturn
 from urllib.parse import parse_qs, urlsplit
 
 from value_object_pattern import process, validation
+from value_object_pattern.decorators import shared_cache
 from value_object_pattern.usables import NotEmptyStringValueObject, TrimmedStringValueObject
 from value_object_pattern.usables.internet.host_value_object import HostValueObject
 from value_object_pattern.usables.internet.port_value_object import PortValueObject
 
 
-@lru_cache(maxsize=16)
+@shared_cache(maxsize=16)
 def join_url(
     scheme: str,
     host: str,
@@ -60,7 +60,7 @@ def join_url(
     return f'{scheme}://{netloc}{path}{query}{fragment}'
 
 
-@lru_cache(maxsize=16)
+@shared_cache(maxsize=16)
 def split_url(value: str) -> tuple[str, str, str, str, str]:
     """
     Split the URL in scheme, netloc, path, query and fragment.
@@ -74,7 +74,7 @@ def split_url(value: str) -> tuple[str, str, str, str, str]:
     return urlsplit(url=value)
 
 
-@lru_cache(maxsize=16)
+@shared_cache(maxsize=16)
 def split_netloc(value: str) -> tuple[str | None, str, int | None]:
     """
     Split the netloc in user_information, host and port.
@@ -132,6 +132,8 @@ class UrlValueObject(NotEmptyStringValueObject, TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     _URL_SCHEME_REGEX: Pattern[str] = re_compile(pattern=r'^[a-zA-Z][a-zA-Z0-9\+\-\.]+$')
     _URL_USER_INFORMATION_REGEX: Pattern[str] = re_compile(pattern=r'^[a-zA-Z0-9\-\.\_\~\!\$\&\'\(\)\*\+\,\;\=\:\@]+$')  # noqa: E501  # fmt: skip
     _URL_PATH_REGEX: Pattern[str] = re_compile(pattern=r'^\/(?:[a-zA-Z0-9\/\-\.\_\~\!\$\&\'\(\)\*\+\,\;\=\:\@]|%[a-fA-F0-9]{2})*$')  # noqa: E501  # fmt: skip
@@ -19,3 +19,5 @@ class UserAgentValueObject(NotEmptyStringValueObject, PrintableStringValueObject
     # >>> UserAgentValueObject(value='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15')
     ```
     """
+
+    __slots__ = ()
@@ -1,8 +1,9 @@
-from functools import lru_cache
 from importlib.resources import files
 
+from value_object_pattern.decorators import shared_cache
 
-@lru_cache(maxsize=1)
+
+@shared_cache()
 def get_aws_cloud_regions() -> tuple[str, ...]:
     """
     Get AWS cloud regions from the official AWS documentation.
@@ -24,7 +25,7 @@ def get_aws_cloud_regions() -> tuple[str, ...]:
     return filtered_lines
 
 
-@lru_cache(maxsize=1)
+@shared_cache()
 def get_tld_dict() -> tuple[str, ...]:
     """
     Get top level domains from IANA in a dictionary.
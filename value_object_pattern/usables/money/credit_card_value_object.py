@@ -31,6 +31,8 @@ class CreditCardValueObject(NotEmptyStringValueObject, TrimmedStringValueObject)
     ```
     """
 
+    __slots__ = ()
+
     _CREDIT_CARD_VARIATIONS: tuple[type[ValueObject[str]], ...] = (
         AmexCreditCardValueObject,
         DiscoverCreditCardValueObject,
@@ -26,6 +26,8 @@ class AmexCreditCardValueObject(NotEmptyStringValueObject, TrimmedStringValueObj
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'(34|37)[0-9]{13}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'(3(?:[\s\-]*(4|7)))((?:[\s\-]*[0-9]){13})')
 
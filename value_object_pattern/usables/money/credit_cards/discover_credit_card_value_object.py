@@ -26,6 +26,8 @@ class DiscoverCreditCardValueObject(NotEmptyStringValueObject, TrimmedStringValu
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'(?:6011|622(?:1(?:2[6-9]|[3-9][0-9])|[2-8][0-9]{2}|9(?:[01][0-9]|2[0-5]))|64[4-9]|65)[0-9]{10,13}')  # noqa: E501  # fmt: skip
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'(?:6011|622(?:1(?:2[6-9]|[3-9][0-9])|[2-8][0-9]{2}|9(?:[01][0-9]|2[0-5]))|64[4-9]|65)(?:[\s-]?[0-9]){10,13}')  # noqa: E501  # fmt: skip
 
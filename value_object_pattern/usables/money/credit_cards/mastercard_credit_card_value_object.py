@@ -26,6 +26,8 @@ class MastercardCreditCardValueObject(NotEmptyStringValueObject, TrimmedStringVa
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'(?:5[1-5][0-9]{14}|(?:222[1-9]|22[3-9][0-9]|2[3-6][0-9]{2}|27[01][0-9]|2720)[0-9]{12})')  # noqa: E501  # fmt: skip
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'(?:5[1-5](?:[\s-]?[0-9]{2}){7}|(?:222[1-9]|22[3-9][0-9]|2[3-6][0-9]{2}|27[01][0-9]|2720)(?:[\s-]?[0-9]{2}){6})')  # noqa: E501  # fmt: skip
 
@@ -26,6 +26,8 @@ class VisaCreditCardValueObject(NotEmptyStringValueObject, TrimmedStringValueObj
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'4[0-9]{12}|4[0-9]{15}|4[0-9]{18}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'(4)((?:[\s-]*[0-9]){12}|(?:[\s-]*[0-9]){15}|(?:[\s-]*[0-9]){18})')  # noqa: E501  # fmt: skip
 
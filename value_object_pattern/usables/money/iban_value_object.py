@@ -30,6 +30,8 @@ class IbanValueObject(NotEmptyStringValueObject, TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'[A-Z]{2}[0-9]{2}[0-9A-Z]{1,30}')
     _IDENTIFICATION_REGEX: Pattern[str] = re_compile(pattern=r'([a-zA-Z]{2})[\s\-]*([0-9]{2})[\s\-]*([0-9a-zA-Z](?:[\s\-]*[0-9a-zA-Z]){0,29})')  # noqa: E501  # fmt: skip
     _ALPHA_MAP: ClassVar[dict[str, str]] = {character: str(10 + i) for i, character in enumerate(iterable=ascii_uppercase)}  # noqa: E501  # fmt: skip
@@ -23,6 +23,8 @@ class BooleanValueObject(ValueObject[bool]):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_boolean(self, value: bool) -> None:
         """
@@ -24,6 +24,8 @@ class FalseValueObject(BooleanValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_false(self, value: bool) -> None:
         """
@@ -24,6 +24,8 @@ class TrueValueObject(BooleanValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_true(self, value: bool) -> None:
         """
@@ -23,6 +23,8 @@ class BytesValueObject(ValueObject[bytes]):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_bytes(self, value: bytes) -> None:
         """
@@ -23,6 +23,8 @@ class FloatValueObject(ValueObject[float]):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_float(self, value: float) -> None:
         """
@@ -24,6 +24,8 @@ class NegativeFloatValueObject(FloatValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_negative_float(self, value: float) -> None:
         """
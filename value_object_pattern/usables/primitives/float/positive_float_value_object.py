@@ -24,6 +24,8 @@ class PositiveFloatValueObject(FloatValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_positive_float(self, value: float) -> None:
         """
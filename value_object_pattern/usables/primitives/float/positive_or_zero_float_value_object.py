@@ -24,6 +24,8 @@ class PositiveOrZeroFloatValueObject(FloatValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_positive_or_zero_float(self, value: float) -> None:
         """
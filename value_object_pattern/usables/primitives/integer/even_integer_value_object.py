@@ -24,6 +24,8 @@ class EvenIntegerValueObject(IntegerValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_even_number(self, value: int) -> None:
         """
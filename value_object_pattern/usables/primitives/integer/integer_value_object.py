@@ -26,6 +26,8 @@ class IntegerValueObject(ValueObject[int]):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_integer(self, value: int) -> None:
         """
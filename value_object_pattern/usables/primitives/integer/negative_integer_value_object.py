@@ -24,6 +24,8 @@ class NegativeIntegerValueObject(IntegerValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_negative_integer(self, value: int) -> None:
         """
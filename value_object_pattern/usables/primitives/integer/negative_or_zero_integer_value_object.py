@@ -24,6 +24,8 @@ class NegativeOrZeroIntegerValueObject(IntegerValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_negative_or_zero_integer(self, value: int) -> None:
         """
@@ -24,6 +24,8 @@ class OddIntegerValueObject(IntegerValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_odd_number(self, value: int) -> None:
         """
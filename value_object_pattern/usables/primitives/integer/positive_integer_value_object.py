@@ -24,6 +24,8 @@ class PositiveIntegerValueObject(IntegerValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_positive_integer(self, value: int) -> None:
         """
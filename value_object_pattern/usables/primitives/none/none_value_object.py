@@ -23,6 +23,8 @@ class NoneValueObject(ValueObject[None]):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_none(self, value: None) -> None:
         """
@@ -23,6 +23,8 @@ class NotNoneValueObject(ValueObject[Any]):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_not_none(self, value: Any) -> None:
         """
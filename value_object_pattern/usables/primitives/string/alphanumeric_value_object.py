@@ -4,7 +4,7 @@ AlphanumericStringValueObject value object.
 
 from typing import NoReturn
 
-from value_object_pattern.decorators import validation
+from value_object_pattern.decorators import Constraint, validation
 
 from .string_value_object import StringValueObject
 
@@ -24,7 +24,9 @@ class AlphanumericStringValueObject(StringValueObject):
     ```
     """
 
-    @validation(order=0)
+    __slots__ = ()
+
+    @validation(order=0, constraint=Constraint.character_class(method='isalnum'))
     def _ensure_value_is_alphanumeric(self, value: str) -> None:
         """
         Ensures the value object `value` is alphanumeric.
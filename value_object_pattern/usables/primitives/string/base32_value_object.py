@@ -27,6 +27,8 @@ class Base32StringValueObject(TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_base32(self, value: str) -> None:
         """
@@ -4,7 +4,7 @@ Base36StringValueObject value object.
 
 from typing import NoReturn
 
-from value_object_pattern.decorators import validation
+from value_object_pattern.decorators import Constraint, validation
 
 from .trimmed_string_value_object import TrimmedStringValueObject
 
@@ -24,9 +24,11 @@ class Base36StringValueObject(TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     __BASE36_ALPHABET: frozenset[str] = frozenset('0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ')
 
-    @validation(order=0)
+    @validation(order=0, constraint=Constraint.charset(characters=__BASE36_ALPHABET))
     def _ensure_value_is_base36(self, value: str) -> None:
         """
         Ensure the value uses only Base36 characters.
@@ -4,7 +4,7 @@ Base58StringValueObject value object.
 
 from typing import NoReturn
 
-from value_object_pattern.decorators import validation
+from value_object_pattern.decorators import Constraint, validation
 
 from .trimmed_string_value_object import TrimmedStringValueObject
 
@@ -24,9 +24,11 @@ class Base58StringValueObject(TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     __BASE58_ALPHABET: frozenset[str] = frozenset('123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz')
 
-    @validation(order=0)
+    @validation(order=0, constraint=Constraint.charset(characters=__BASE58_ALPHABET))
     def _ensure_value_is_base58(self, value: str) -> None:
         """
         Ensure the value uses only Base58 characters.
@@ -27,6 +27,8 @@ class Base64StringValueObject(TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_base64(self, value: str) -> None:
         """
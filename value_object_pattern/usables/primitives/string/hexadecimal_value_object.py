@@ -27,6 +27,8 @@ class HexadecimalStringValueObject(TrimmedStringValueObject):
     ```
     """
 
+    __slots__ = ()
+
     @validation(order=0)
     def _ensure_value_is_hexadecimal(self, value: str) -> None:
         """
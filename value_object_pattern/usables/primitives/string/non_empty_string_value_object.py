@@ -4,7 +4,7 @@ NotEmptyStringValueObject value object.
 
 from typing import NoReturn
 
-from value_object_pattern.decorators import validation
+from value_object_pattern.decorators import Constraint, validation
 
 from .string_value_object import StringValueObject
 
@@ -24,7 +24,9 @@ class NotEmptyStringValueObject(StringValueObject):
     ```
     """
 
-    @validation(order=0)
+    __slots__ = ()
+
+    @validation(order=0, constraint=Constraint.not_empty())
     def _ensure_value_is_not_empty_string(self, value: str) -> None:
         """
         Ensures the value object `value` is not an empty string.
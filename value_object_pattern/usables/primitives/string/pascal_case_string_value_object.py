@@ -5,7 +5,7 @@ PascalCaseStringValueObject value object.
 from re import Pattern, compile as re_compile
 from typing import NoReturn
 
-from value_object_pattern.decorators import validation
+from value_object_pattern.decorators import Constraint, validation
 
 from .non_empty_string_value_object import NotEmptyStringValueObject
 from .trimmed_string_value_object import TrimmedStringValueObject
@@ -26,9 +26,11 @@ class PascalCaseStringValueObject(NotEmptyStringValueObject, TrimmedStringValueO
     ```
     """
 
+    __slots__ = ()
+
     _VALIDATION_REGEX: Pattern[str] = re_compile(pattern=r'^[A-Z][a-z0-9]*(?:[A-Z][a-z0-9]*)*$')
 
-    @validation(order=0)
+    @validation(order=0, constraint=Constraint.regex(attribute='_VALIDATION_REGEX'))
     def _ensure_value_is_pascal_case(self, value: str) -> None:
         """
         Ensures the value object `value` is PascalCase.
@@ -4,7 +4,7 @@ Reusable value object for plain string validation.
 
 from typing import Any, NoReturn
 
-from value_object_pattern.decorators import validation
+from value_object_pattern.decorators import Constraint, validation
 from value_object_pattern.models import ValueObject
 
 
@@ -26,7 +26,9 @@ class StringValueObject(ValueObject[str]):
     ```
     """
 
-    @validation(order=0)
+    __slots__ = ()
+
+    @validation(order=0, constraint=Constraint.exact_type(expected=str))
     def _ensure_value_is_string(self, value: str) -> None:
         """
         Ensures the value object `value` is a string.